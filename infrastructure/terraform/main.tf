@@ -778,7 +778,10 @@ module "sse_streaming_lambda" {
     SSE_HEARTBEAT_INTERVAL = tostring(var.sse_heartbeat_interval)
     SSE_MAX_CONNECTIONS    = "100"
     SSE_POLL_INTERVAL      = tostring(var.sse_poll_interval)
-    ENVIRONMENT            = var.environment
+    # Incremental polling misses late-analyzed backfill until the next resync:
+    # by_sentiment is ordered by publish time, not analysis time (see polling.py)
+    SSE_INCREMENTAL_POLL = "false"
+    ENVIRONMENT          = var.environment
     # Feature 1219/T051: OTel SDK env vars for ADOT Extension tracing
     OTEL_SERVICE_NAME                 = "sentiment-analyzer-sse"
     OTEL_EXPORTER_OTLP_ENDPOINT       = "http://localhost:4318"
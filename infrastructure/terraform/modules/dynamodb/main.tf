@@ -54,8 +54,8 @@ resource "aws_dynamodb_table" "sentiment_items" {
   # Query pattern: Get items by individual tag
   # KNOWN GAP: no writer sets a
   # scalar `tag` attribute (ingestion writes the `matched_tickers` list), so this GSI
-  # is never populated and GET /api/v2/sentiment?tags= returns empty with a 200.
-  # Tracked as a behavioral bug; do not rely on this index until a writer exists.
+  # is never populated. GET /api/v2/sentiment and /api/v2/trends read TAG#{tag}#{res}
+  # buckets in the timeseries table instead; only /api/v2/articles still queries here.
   global_secondary_index {
     name            = "by_tag"
     hash_key        = "tag"
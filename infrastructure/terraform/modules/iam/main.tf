@@ -41,7 +41,8 @@ resource "aws_iam_role_policy" "ingestion_dynamodb" {
         Action = [
           "dynamodb:PutItem",
           "dynamodb:GetItem",
-          "dynamodb:UpdateItem" # Feature 1227: Required for Feature 1010 dedup upsert
+          "dynamodb:UpdateItem", # Feature 1227: Required for Feature 1010 dedup upsert
+          "dynamodb:BatchGetItem" # Bulk dedup existence lookup
         ]
         Resource = var.dynamodb_table_arn
       },
@@ -677,7 +678,8 @@ resource "aws_iam_role_policy" "dashboard_timeseries" {
         Effect = "Allow"
         Action = [
           "dynamodb:Query",
-          "dynamodb:GetItem"
+          "dynamodb:GetItem",
+          "dynamodb:BatchGetItem" # Latest-bucket batch reads for sentiment overview
         ]
         Resource = var.timeseries_table_arn
       }
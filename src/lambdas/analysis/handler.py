@@ -39,6 +39,13 @@ For Developers:
     4. Update DynamoDB (conditional: status=pending)
     5. Emit CloudWatch metrics
 
+    Batch mode:
+    Events with more than one record (SQS batches, or SNS delivered via
+    SQS) run every record through analyze_sentiment_batch in padded
+    mini-batches (INFERENCE_BATCH_SIZE) and return a partial-batch-failure
+    response ({"batchItemFailures": [{"itemIdentifier": ...}]}) so only
+    failed records are redelivered.
+
 Security Notes:
     - Model downloaded from S3 to /tmp/model (no Lambda layer)
     - Conditional updates prevent duplicate processing
@@ -66,16 +73,18 @@ from src.lambdas.analysis.sentiment import (
     InferenceError,
     ModelLoadError,
     analyze_sentiment,
+    analyze_sentiment_batch,
     get_model_load_time_ms,
     load_model,
 )
 from src.lambdas.shared.dynamodb import get_table
+from src.lambdas.shared.metric_counters import CounterBatch, get_counters_table
 from src.lib.metrics import (
     emit_metric,
     emit_metrics_batch,
     log_structured,
 )
-from src.lib.timeseries import SentimentScore, write_fanout
+from src.lib.timeseries import SentimentScore, write_fanout, write_tag_fanout
 
 # Structured logging
 logger = logging.getLogger(__name__)
@@ -116,6 +125,10 @@ def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
     start_time = time.perf_counter()
     request_id = getattr(context, "aws_request_id", "unknown")
 
+    records = event.get("Records") or []
+    if len(records) > 1 or (records and "Sns" not in records[0]):
+        return _process_batch(records, request_id, start_time)
+
     try:
         # Parse SNS message
         record = event["Records"][0]
@@ -170,16 +183,23 @@ def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
             model_version=model_version,
         )
 
+        if updated:
+            counters = CounterBatch()
+            counters.record_analyzed(timestamp, sentiment)
+            counters.flush(get_counters_table())
+
         # Feature 1009: Write fanout to time-series table for real-time streaming
         # Canonical: [CS-001] "Pre-aggregate at write time for known query patterns"
         # Canonical: [CS-003] "Write amplification acceptable when reads >> writes"
-        if updated and matched_tickers:
+        tags = message.get("tags", [])
+        if updated and (matched_tickers or tags):
             _write_timeseries_fanout(
                 tickers=matched_tickers,
                 score=score,
                 sentiment=sentiment,
                 timestamp=timestamp,
                 source_id=source_id,
+                tags=tags,
             )
 
         # Calculate total execution time
@@ -285,6 +305,185 @@ def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
         }
 
 
+def _record_id(record: dict[str, Any]) -> str:
+    """Identifier Lambda expects in batchItemFailures for this record."""
+    if "messageId" in record:
+        return record["messageId"]
+    return record.get("Sns", {}).get("MessageId", "unknown")
+
+
+def _parse_record(record: dict[str, Any]) -> dict[str, Any]:
+    """
+    Extract the analysis message from an SNS or SQS record.
+
+    SQS bodies may carry the raw message or an SNS envelope (SNS → SQS
+    subscription without raw delivery); both are supported.
+
+    Raises:
+        KeyError: If the record or message is missing required fields
+        ValueError: If the message is not valid JSON
+    """
+    if "Sns" in record:
+        message = json.loads(record["Sns"]["Message"])
+    else:
+        message = json.loads(record["body"])
+        if message.get("Type") == "Notification" and "Message" in message:
+            message = json.loads(message["Message"])
+
+    # Fail fast on missing fields before spending inference on the record
+    for field in ("source_id", "timestamp", "text_for_analysis", "model_version"):
+        if field not in message:
+            raise KeyError(field)
+    return message
+
+
+@tracer.capture_method
+def _process_batch(
+    records: list[dict[str, Any]], request_id: str, start_time: float
+) -> dict[str, Any]:
+    """
+    Analyze every record in a multi-record event with batched inference.
+
+    Each record succeeds or fails independently: malformed messages and
+    per-record DynamoDB errors are reported in batchItemFailures, while
+    model load or inference errors fail every record in the batch so the
+    whole batch is redelivered.
+
+    Args:
+        records: SNS or SQS records
+        request_id: Lambda request ID for logging
+        start_time: perf_counter() at handler entry
+
+    Returns:
+        Partial batch response with per-record results
+    """
+    failures: list[str] = []
+    parsed: list[tuple[str, dict[str, Any]]] = []
+
+    for record in records:
+        record_id = _record_id(record)
+        try:
+            parsed.append((record_id, _parse_record(record)))
+        except (KeyError, ValueError, TypeError) as e:
+            logger.error(
+                f"Invalid message format in batch: {e}",
+                extra={"record_id": record_id},
+            )
+            failures.append(record_id)
+
+    log_structured(
+        "INFO",
+        "Batch analysis started",
+        request_id=request_id,
+        record_count=len(records),
+        valid_count=len(parsed),
+    )
+
+    results: list[dict[str, Any]] = []
+    inference_time_ms = 0.0
+
+    if parsed:
+        try:
+            load_model()
+            model_load_time = get_model_load_time_ms()
+            if model_load_time > 0:
+                emit_metric("ModelLoadTimeMs", model_load_time, unit="Milliseconds")
+
+            inference_start = time.perf_counter()
+            predictions = analyze_sentiment_batch(
+                [message["text_for_analysis"] for _, message in parsed]
+            )
+            inference_time_ms = (time.perf_counter() - inference_start) * 1000
+        except (ModelLoadError, InferenceError) as e:
+            logger.error(f"Batch inference error: {e}")
+            if isinstance(e, ModelLoadError):
+                emit_metric("ModelLoadErrors", 1)
+            failures.extend(record_id for record_id, _ in parsed)
+            parsed, predictions = [], []
+
+        table = None
+        if parsed:
+            try:
+                table = get_table()
+            except Exception as e:
+                logger.error(f"Failed to open table for batch: {e}")
+                failures.extend(record_id for record_id, _ in parsed)
+                parsed, predictions = [], []
+        counters = CounterBatch()
+        for (record_id, message), (sentiment, score) in zip(
+            parsed, predictions, strict=True
+        ):
+            try:
+                updated = _update_item_with_sentiment(
+                    table=table,
+                    source_id=message["source_id"],
+                    timestamp=message["timestamp"],
+                    sentiment=sentiment,
+                    score=score,
+                    model_version=message["model_version"],
+                )
+                if updated:
+                    counters.record_analyzed(message["timestamp"], sentiment)
+                matched_tickers = message.get("matched_tickers", [])
+                tags = message.get("tags", [])
+                if updated and (matched_tickers or tags):
+                    _write_timeseries_fanout(
+                        tickers=matched_tickers,
+                        score=score,
+                        sentiment=sentiment,
+                        timestamp=message["timestamp"],
+                        source_id=message["source_id"],
+                        tags=tags,
+                    )
+            except Exception as e:
+                logger.error(
+                    f"Failed to store batch record: {e}",
+                    extra={"record_id": record_id, "source_id": message["source_id"]},
+                )
+                failures.append(record_id)
+                continue
+
+            results.append(
+                {
+                    "source_id": message["source_id"],
+                    "sentiment": sentiment,
+                    "score": round(score, 4),
+                    "updated": updated,
+                }
+            )
+
+        if counters:
+            counters.flush(get_counters_table())
+
+    if results:
+        _emit_batch_metrics(results, inference_time_ms)
+    if failures:
+        emit_metric("AnalysisErrors", len(failures))
+
+    execution_time_ms = (time.perf_counter() - start_time) * 1000
+    log_structured(
+        "INFO",
+        "Batch analysis completed",
+        request_id=request_id,
+        record_count=len(records),
+        processed=len(results),
+        failed=len(failures),
+        inference_time_ms=round(inference_time_ms, 2),
+        execution_time_ms=round(execution_time_ms, 2),
+    )
+
+    return {
+        "statusCode": 200,
+        "batchItemFailures": [{"itemIdentifier": rid} for rid in failures],
+        "body": {
+            "processed": len(results),
+            "failed": len(failures),
+            "inference_time_ms": round(inference_time_ms, 2),
+            "results": results,
+        },
+    }
+
+
 @tracer.capture_method
 def _update_item_with_sentiment(
     table: Any,
@@ -407,6 +606,48 @@ def _emit_analysis_metrics(
     emit_metrics_batch(metrics)
 
 
+def _emit_batch_metrics(
+    results: list[dict[str, Any]], inference_time_ms: float
+) -> None:
+    """
+    Emit the _emit_analysis_metrics set once for a whole batch.
+
+    InferenceLatencyMs is reported per article (batch time / articles) so
+    the existing latency alarm keeps its meaning.
+    """
+    sentiment_counts: dict[str, int] = {}
+    for result in results:
+        sentiment_counts[result["sentiment"]] = (
+            sentiment_counts.get(result["sentiment"], 0) + 1
+        )
+
+    metrics = [
+        {"name": "SentimentAnalysisCount", "value": len(results), "unit": "Count"},
+        {
+            "name": "InferenceLatencyMs",
+            "value": inference_time_ms / len(results),
+            "unit": "Milliseconds",
+        },
+        {"name": "InferenceBatchSize", "value": len(results), "unit": "Count"},
+    ]
+    for sentiment, count in sentiment_counts.items():
+        metrics.append(
+            {
+                "name": f"{sentiment.capitalize()}SentimentCount",
+                "value": count,
+                "unit": "Count",
+            }
+        )
+
+    updated_count = sum(1 for result in results if result["updated"])
+    if updated_count:
+        metrics.append(
+            {"name": "ItemsAnalyzed", "value": updated_count, "unit": "Count"}
+        )
+
+    emit_metrics_batch(metrics)
+
+
 # Global DynamoDB client for time-series writes (Lambda global scope caching [CS-005])
 _dynamodb_client: Any = None
 
@@ -430,10 +671,13 @@ def _write_timeseries_fanout(
     sentiment: str,
     timestamp: str,
     source_id: str,
+    tags: list[str] | None = None,
 ) -> None:
     """Write sentiment score to time-series table for all matched tickers.
 
     Feature 1009: Write fanout for multi-resolution sentiment time-series.
+    The article's tags are also counted into TAG#{tag}#{resolution} label
+    buckets, which back the /api/v2/trends and /api/v2/sentiment views.
 
     Canonical: [CS-001] "Pre-aggregate at write time for known query patterns"
     Canonical: [CS-003] "Write amplification acceptable when reads >> writes"
@@ -444,6 +688,7 @@ def _write_timeseries_fanout(
         sentiment: Sentiment label (positive/negative/neutral)
         timestamp: ISO8601 timestamp of the original article
         source_id: Source ID for tracking
+        tags: Article tags for the tag label buckets
 
     Note:
         Failures are logged but don't fail the Lambda - time-series is
@@ -490,6 +735,23 @@ def _write_timeseries_fanout(
                 },
             )
 
+    if tags:
+        try:
+            emit_metric(
+                "TimeseriesTagFanoutCount",
+                write_tag_fanout(dynamodb, timeseries_table, tags, ts, sentiment),
+            )
+        except Exception as e:
+            fanout_errors += 1
+            logger.warning(
+                "Time-series tag fanout failed",
+                extra={
+                    "tag_count": len(tags),
+                    "error": str(e),
+                    "table": timeseries_table,
+                },
+            )
+
     if fanout_count > 0:
         emit_metric("TimeseriesFanoutCount", fanout_count)
         log_structured(
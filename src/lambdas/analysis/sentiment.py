@@ -60,6 +60,8 @@ DEFAULT_MODEL_S3_KEY = "distilbert/v1.0.0/model.tar.gz"
 LOCAL_MODEL_PATH = "/tmp/model"
 MAX_TEXT_LENGTH = 512  # DistilBERT token limit
 NEUTRAL_THRESHOLD = 0.6  # Below this confidence → neutral
+# Texts per padded forward pass in analyze_sentiment_batch
+INFERENCE_BATCH_SIZE = int(os.environ.get("INFERENCE_BATCH_SIZE", "16"))
 
 # Global variable for model caching
 # On-Call Note: This persists across warm Lambda invocations
@@ -269,21 +271,12 @@ def analyze_sentiment(text: str) -> tuple[str, float]:
         # Run inference
         # DistilBERT returns: [{'label': 'POSITIVE'|'NEGATIVE', 'score': 0.95}]
         result = pipeline_instance(truncated_text)[0]
-
-        label = result["label"].lower()
-        score = result["score"]
-
-        # Map to three-way classification
-        # On-Call Note: Low confidence → neutral (model is uncertain)
-        if score < NEUTRAL_THRESHOLD:
-            sentiment = "neutral"
-        else:
-            sentiment = label  # 'positive' or 'negative'
+        sentiment, score = _map_prediction(result)
 
         logger.debug(
             "Sentiment analysis complete",
             extra={
-                "raw_label": label,
+                "raw_label": result["label"].lower(),
                 "score": round(score, 4),
                 "mapped_sentiment": sentiment,
                 "text_length": len(truncated_text),
@@ -300,6 +293,82 @@ def analyze_sentiment(text: str) -> tuple[str, float]:
         raise InferenceError(f"Sentiment inference failed: {e}") from e
 
 
+def analyze_sentiment_batch(
+    texts: list[str], batch_size: int | None = None
+) -> list[tuple[str, float]]:
+    """
+    Run sentiment inference on many texts in padded mini-batches.
+
+    Same per-text semantics as analyze_sentiment (truncation, empty text →
+    neutral, neutral threshold), but non-empty texts go through the pipeline
+    ``batch_size`` at a time so each forward pass amortizes tokenizer and
+    model overhead across the batch.
+
+    Args:
+        texts: Texts to analyze
+        batch_size: Texts per forward pass (default: INFERENCE_BATCH_SIZE)
+
+    Returns:
+        List of (sentiment, score) tuples in the same order as texts
+
+    Raises:
+        ModelLoadError: If model is not loaded
+        InferenceError: If inference fails
+
+    On-Call Note:
+        Larger batches raise throughput per GB-second but also peak memory.
+        If the Lambda OOMs on large batches, lower INFERENCE_BATCH_SIZE.
+    """
+    pipeline_instance = load_model()
+    batch_size = batch_size or INFERENCE_BATCH_SIZE
+
+    results: list[tuple[str, float]] = [("neutral", 0.5)] * len(texts)
+    pending = [(i, text[:MAX_TEXT_LENGTH]) for i, text in enumerate(texts) if text]
+    if len(pending) < len(texts):
+        logger.warning(
+            "Empty texts for analysis, returning neutral",
+            extra={"empty_count": len(texts) - len(pending)},
+        )
+    if not pending:
+        return results
+
+    try:
+        predictions = pipeline_instance(
+            [text for _, text in pending], batch_size=batch_size
+        )
+    except Exception as e:
+        logger.error(
+            f"Batch inference failed: {e}",
+            extra={"batch_count": len(pending), "error": str(e)},
+        )
+        raise InferenceError(f"Sentiment inference failed: {e}") from e
+
+    for (i, _), prediction in zip(pending, predictions, strict=True):
+        results[i] = _map_prediction(prediction)
+
+    logger.debug(
+        "Batch sentiment analysis complete",
+        extra={"text_count": len(texts), "batch_size": batch_size},
+    )
+
+    return results
+
+
+def _map_prediction(result: dict[str, Any]) -> tuple[str, float]:
+    """
+    Map a raw pipeline prediction to (sentiment, score).
+
+    On-Call Note: Low confidence → neutral (model is uncertain)
+    """
+    label = result["label"].lower()
+    score = result["score"]
+
+    # Map to three-way classification
+    if score < NEUTRAL_THRESHOLD:
+        return "neutral", score
+    return label, score  # 'positive' or 'negative'
+
+
 def get_model_load_time_ms() -> float:
     """
     Get the time taken to load the model.
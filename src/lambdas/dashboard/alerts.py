@@ -29,6 +29,7 @@ from boto3.dynamodb.conditions import Key
 from pydantic import BaseModel, Field
 
 from src.lambdas.dashboard.quota import get_daily_quota
+from src.lambdas.shared.alert_index import invalidate_alert_index
 from src.lambdas.shared.logging_utils import get_safe_error_info, sanitize_for_log
 from src.lambdas.shared.models.alert_rule import (
     ALERT_LIMITS,
@@ -173,6 +174,7 @@ def create_alert(
 
     try:
         table.put_item(Item=alert.to_dynamodb_item())
+        invalidate_alert_index()
 
         logger.info(
             "Created alert",
@@ -384,6 +386,7 @@ def update_alert(
         if attr_names:
             update_kwargs["ExpressionAttributeNames"] = attr_names
         response = table.update_item(**update_kwargs)
+        invalidate_alert_index()
 
         logger.info(
             "Updated alert",
@@ -438,6 +441,7 @@ def delete_alert(
                 "SK": f"ALERT#{alert_id}",
             }
         )
+        invalidate_alert_index()
 
         logger.info(
             "Deleted alert",
@@ -491,6 +495,7 @@ def toggle_alert(
             ExpressionAttributeNames={"#status": "status"},
             ExpressionAttributeValues={":enabled": new_enabled, ":status": new_status},
         )
+        invalidate_alert_index()
 
         message = "Alert enabled" if new_enabled else "Alert disabled"
 
@@ -16,8 +16,10 @@ For On-Call Engineers:
 
 For Developers:
     - All endpoints require API key authentication
-    - Tag-based queries require the by_tag GSI
-    - Trend data is aggregated in memory for small datasets
+    - Tag sentiment and trends read TAG#{tag}#{resolution} label buckets
+      from the time-series table through tag_windows: concurrent per tag,
+      one row per bucket, with finished windows cached
+    - Tag article listings still query the by_tag GSI
     - Backfill uses async pattern with job tracking
 
 Security Notes:
@@ -27,11 +29,16 @@ Security Notes:
 """
 
 import logging
-from datetime import UTC, datetime, timedelta
+from datetime import UTC, datetime
 from typing import Any
 
-from boto3.dynamodb.conditions import Key
+from boto3.dynamodb.conditions import Attr, Key
 
+from src.lambdas.dashboard.tag_windows import (
+    count_tag_labels,
+    map_tags,
+    read_tag_bins,
+)
 from src.lambdas.shared.logging_utils import get_safe_error_info, sanitize_for_log
 
 # Structured logging
@@ -55,7 +62,7 @@ def get_sentiment_by_tags(
     Used by the mobile dashboard's Mood Ring and tag comparison views.
 
     Args:
-        table: DynamoDB Table resource
+        table: DynamoDB time-series Table resource (tag buckets)
         tags: List of topic tags to query (max 5)
         start_time: ISO8601 start timestamp
         end_time: ISO8601 end timestamp
@@ -74,8 +81,8 @@ def get_sentiment_by_tags(
 
     On-Call Note:
         If all counts are 0, verify:
-        1. by_tag GSI exists with tag as partition key
-        2. Items have been analyzed with sentiment field
+        1. TAG#{tag}#1h buckets exist in the time-series table
+        2. Ingestion SNS messages carry the article's tags
         3. Time range covers existing data
     """
     if len(tags) > MAX_TAGS:
@@ -84,69 +91,9 @@ def get_sentiment_by_tags(
     if not tags:
         raise ValueError("At least one tag is required")
 
-    tag_results: dict[str, dict[str, Any]] = {}
-    overall_sentiment = {"positive": 0, "neutral": 0, "negative": 0}
-    total_count = 0
-
-    for tag in tags:
+    def read(tag: str) -> tuple[int, int, int]:
         try:
-            # Query by_tag GSI for this tag within time range
-            response = table.query(
-                IndexName="by_tag",
-                KeyConditionExpression=(
-                    Key("tag").eq(tag) & Key("timestamp").between(start_time, end_time)
-                ),
-            )
-
-            items = response.get("Items", [])
-
-            # Handle pagination for large result sets
-            while "LastEvaluatedKey" in response:
-                response = table.query(
-                    IndexName="by_tag",
-                    KeyConditionExpression=(
-                        Key("tag").eq(tag)
-                        & Key("timestamp").between(start_time, end_time)
-                    ),
-                    ExclusiveStartKey=response["LastEvaluatedKey"],
-                )
-                items.extend(response.get("Items", []))
-
-            # Calculate sentiment distribution for this tag
-            tag_sentiment = {"positive": 0, "neutral": 0, "negative": 0}
-            for item in items:
-                sentiment = item.get("sentiment", "").lower()
-                if sentiment in tag_sentiment:
-                    tag_sentiment[sentiment] += 1
-                    overall_sentiment[sentiment] += 1
-
-            tag_count = sum(tag_sentiment.values())
-            total_count += tag_count
-
-            # Convert to percentages if we have data
-            if tag_count > 0:
-                tag_results[tag] = {
-                    "positive": round(tag_sentiment["positive"] / tag_count, 2),
-                    "neutral": round(tag_sentiment["neutral"] / tag_count, 2),
-                    "negative": round(tag_sentiment["negative"] / tag_count, 2),
-                    "count": tag_count,
-                }
-            else:
-                tag_results[tag] = {
-                    "positive": 0.0,
-                    "neutral": 0.0,
-                    "negative": 0.0,
-                    "count": 0,
-                }
-
-            logger.debug(
-                "Queried sentiment for tag",
-                extra={
-                    "tag": sanitize_for_log(tag),
-                    "count": tag_count,
-                },
-            )
-
+            return count_tag_labels(table, tag, start_time, end_time)
         except Exception as e:
             logger.error(
                 "Failed to query sentiment for tag",
@@ -157,6 +104,44 @@ def get_sentiment_by_tags(
             )
             raise
 
+    tag_counts = map_tags(tags, read)
+
+    tag_results: dict[str, dict[str, Any]] = {}
+    overall_sentiment = {"positive": 0, "neutral": 0, "negative": 0}
+    total_count = 0
+
+    for tag in tags:
+        tag_sentiment = dict(zip(SENTIMENT_VALUES, tag_counts[tag], strict=True))
+        for sentiment, count in tag_sentiment.items():
+            overall_sentiment[sentiment] += count
+
+        tag_count = sum(tag_sentiment.values())
+        total_count += tag_count
+
+        # Convert to percentages if we have data
+        if tag_count > 0:
+            tag_results[tag] = {
+                "positive": round(tag_sentiment["positive"] / tag_count, 2),
+                "neutral": round(tag_sentiment["neutral"] / tag_count, 2),
+                "negative": round(tag_sentiment["negative"] / tag_count, 2),
+                "count": tag_count,
+            }
+        else:
+            tag_results[tag] = {
+                "positive": 0.0,
+                "neutral": 0.0,
+                "negative": 0.0,
+                "count": 0,
+            }
+
+        logger.debug(
+            "Queried sentiment for tag",
+            extra={
+                "tag": sanitize_for_log(tag),
+                "count": tag_count,
+            },
+        )
+
     # Calculate overall percentages
     if total_count > 0:
         overall_pct = {
@@ -207,7 +192,7 @@ def get_trend_data(
     Get time-series trend data for sparkline visualizations.
 
     Args:
-        table: DynamoDB Table resource
+        table: DynamoDB time-series Table resource (tag buckets)
         tags: List of topic tags to query (max 5)
         interval: Time interval for aggregation ("1h", "6h", "1d")
         range_hours: Number of hours to look back
@@ -227,7 +212,7 @@ def get_trend_data(
         If trend data is empty or sparse:
         1. Verify ingestion is running (check EventBridge schedule)
         2. Check time range covers data ingestion period
-        3. Verify by_tag GSI exists
+        3. Verify the analysis Lambda writes TAG#{tag}#{resolution} buckets
     """
     if len(tags) > MAX_TAGS:
         raise ValueError(f"Maximum {MAX_TAGS} tags allowed, got {len(tags)}")
@@ -246,111 +231,16 @@ def get_trend_data(
             extra={"requested": range_hours, "max": max_range},
         )
 
-    now = datetime.now(UTC)
-    start_time = now - timedelta(hours=range_hours)
-
-    # Generate time buckets
-    buckets: list[datetime] = []
-    bucket_start = start_time.replace(minute=0, second=0, microsecond=0)
-    while bucket_start < now:
-        buckets.append(bucket_start)
-        bucket_start += timedelta(hours=interval_hours)
+    # Time buckets, aligned to the interval on epoch seconds (UTC)
+    bin_seconds = interval_hours * 3600
+    now = int(datetime.now(UTC).timestamp())
+    start = now - range_hours * 3600
+    buckets = list(range(start - start % bin_seconds, now, bin_seconds))
+    bucket_keys = [datetime.fromtimestamp(b, UTC).isoformat() for b in buckets]
 
-    result: dict[str, list[dict[str, Any]]] = {}
-
-    for tag in tags:
+    def read(tag: str) -> dict[int, tuple[int, int, int]]:
         try:
-            # Query all items for this tag in the time range
-            response = table.query(
-                IndexName="by_tag",
-                KeyConditionExpression=(
-                    Key("tag").eq(tag) & Key("timestamp").gte(start_time.isoformat())
-                ),
-            )
-
-            items = response.get("Items", [])
-
-            # Handle pagination
-            while "LastEvaluatedKey" in response:
-                response = table.query(
-                    IndexName="by_tag",
-                    KeyConditionExpression=(
-                        Key("tag").eq(tag)
-                        & Key("timestamp").gte(start_time.isoformat())
-                    ),
-                    ExclusiveStartKey=response["LastEvaluatedKey"],
-                )
-                items.extend(response.get("Items", []))
-
-            # Group items into time buckets
-            bucket_data: dict[str, dict[str, Any]] = {}
-            for bucket in buckets:
-                bucket_key = bucket.isoformat()
-                bucket_data[bucket_key] = {
-                    "positive": 0,
-                    "neutral": 0,
-                    "negative": 0,
-                    "total": 0,
-                }
-
-            for item in items:
-                item_ts = item.get("timestamp", "")
-                sentiment = item.get("sentiment", "").lower()
-
-                if not item_ts or sentiment not in SENTIMENT_VALUES:
-                    continue
-
-                # Find the bucket this item belongs to
-                try:
-                    item_dt = datetime.fromisoformat(item_ts.replace("Z", "+00:00"))
-                    bucket_dt = item_dt.replace(minute=0, second=0, microsecond=0)
-                    # Align to interval
-                    if interval_hours > 1:
-                        bucket_hour = (
-                            bucket_dt.hour // interval_hours
-                        ) * interval_hours
-                        bucket_dt = bucket_dt.replace(hour=bucket_hour)
-
-                    bucket_key = bucket_dt.isoformat()
-
-                    if bucket_key in bucket_data:
-                        bucket_data[bucket_key][sentiment] += 1
-                        bucket_data[bucket_key]["total"] += 1
-                except (ValueError, KeyError):
-                    continue
-
-            # Convert to list of data points with sentiment score
-            tag_trend: list[dict[str, Any]] = []
-            for bucket_key in sorted(bucket_data.keys()):
-                data = bucket_data[bucket_key]
-                total = data["total"]
-
-                # Calculate sentiment score: 1.0 = all positive, 0.0 = all negative
-                # Formula: (positive - negative + total) / (2 * total) to normalize to 0-1
-                if total > 0:
-                    score = (data["positive"] - data["negative"] + total) / (2 * total)
-                    score = round(max(0.0, min(1.0, score)), 2)
-                else:
-                    score = 0.5  # Neutral when no data
-
-                tag_trend.append(
-                    {
-                        "timestamp": bucket_key,
-                        "sentiment": score,
-                        "count": total,
-                    }
-                )
-
-            result[tag] = tag_trend
-
-            logger.debug(
-                "Generated trend data for tag",
-                extra={
-                    "tag": sanitize_for_log(tag),
-                    "points": len(tag_trend),
-                },
-            )
-
+            return read_tag_bins(table, tag, bin_seconds, start, now)
         except Exception as e:
             logger.error(
                 "Failed to get trend data for tag",
@@ -361,6 +251,45 @@ def get_trend_data(
             )
             raise
 
+    tag_bins = map_tags(tags, read)
+
+    result: dict[str, list[dict[str, Any]]] = {}
+
+    for tag in tags:
+        bins = tag_bins[tag]
+
+        # Convert to list of data points with sentiment score
+        tag_trend: list[dict[str, Any]] = []
+        for bucket, bucket_key in zip(buckets, bucket_keys, strict=True):
+            positive, neutral, negative = bins.get(bucket, (0, 0, 0))
+            total = positive + neutral + negative
+
+            # Calculate sentiment score: 1.0 = all positive, 0.0 = all negative
+            # Formula: (positive - negative + total) / (2 * total) to normalize to 0-1
+            if total > 0:
+                score = (positive - negative + total) / (2 * total)
+                score = round(max(0.0, min(1.0, score)), 2)
+            else:
+                score = 0.5  # Neutral when no data
+
+            tag_trend.append(
+                {
+                    "timestamp": bucket_key,
+                    "sentiment": score,
+                    "count": total,
+                }
+            )
+
+        result[tag] = tag_trend
+
+        logger.debug(
+            "Generated trend data for tag",
+            extra={
+                "tag": sanitize_for_log(tag),
+                "points": len(tag_trend),
+            },
+        )
+
     logger.info(
         "Generated trend data",
         extra={
@@ -407,9 +336,7 @@ def get_articles_by_tags(
             f"Use: {', '.join(SENTIMENT_VALUES)}"
         )
 
-    all_articles: list[dict[str, Any]] = []
-
-    for tag in tags[:MAX_TAGS]:  # Limit to max tags
+    def read(tag: str) -> list[dict[str, Any]]:
         try:
             # Build query
             key_condition = Key("tag").eq(tag)
@@ -426,15 +353,12 @@ def get_articles_by_tags(
 
             # Add sentiment filter if specified
             if sentiment_filter:
-                from boto3.dynamodb.conditions import Attr
-
                 query_params["FilterExpression"] = Attr("sentiment").eq(
                     sentiment_filter.lower()
                 )
 
             response = table.query(**query_params)
-            items = response.get("Items", [])
-            all_articles.extend(items)
+            return response.get("Items", [])
 
         except Exception as e:
             logger.error(
@@ -446,6 +370,11 @@ def get_articles_by_tags(
             )
             raise
 
+    # Limit to max tags
+    all_articles = [
+        item for items in map_tags(tags[:MAX_TAGS], read).values() for item in items
+    ]
+
     # Sort all articles by timestamp descending and limit
     all_articles.sort(key=lambda x: x.get("timestamp", ""), reverse=True)
     all_articles = all_articles[:limit]
@@ -34,6 +34,7 @@ Security Notes:
     - OAuth tokens come from Cognito (verified via userinfo)
 """
 
+import dataclasses
 import hashlib
 import logging
 import os
@@ -49,6 +50,7 @@ from aws_lambda_powertools import Tracer
 from botocore.exceptions import ClientError
 from pydantic import BaseModel, EmailStr, Field
 
+from src.lambdas.shared.auth import session_activity
 from src.lambdas.shared.auth.cognito import (
     CognitoConfig,
     TokenError,
@@ -83,7 +85,11 @@ from src.lambdas.shared.errors.session_errors import (
     TokenExpiredError,
 )
 from src.lambdas.shared.logging_utils import get_safe_error_info, sanitize_for_log
-from src.lambdas.shared.middleware.auth_middleware import _get_jwt_config
+from src.lambdas.shared.middleware.auth_middleware import (
+    JWTClaim,
+    _get_jwt_config,
+    check_revocation_id,
+)
 from src.lambdas.shared.models.magic_link_token import MagicLinkToken
 from src.lambdas.shared.models.user import ProviderMetadata, User
 from src.lambdas.shared.models.webhook_event import WebhookEvent
@@ -224,16 +230,22 @@ def validate_session(
     table: Any,
     anonymous_id: str | None,
     extend_on_valid: bool = False,
+    jwt_claim: JWTClaim | None = None,
 ) -> ValidateSessionResponse | InvalidSessionResponse:
     """Validate an anonymous session.
 
     Feature 014 (T052, T055): Checks for revocation and optionally extends
     session expiry on valid sessions (sliding window).
 
+    Valid sessions are cached briefly per environment and their activity
+    is written behind; see session_activity.
+
     Args:
         table: DynamoDB Table resource
         anonymous_id: User ID from X-Anonymous-ID header
         extend_on_valid: If True, extend session expiry when session is valid (FR-011)
+        jwt_claim: Validated JWT claim; its rev is checked against the
+            user's revocation_id (Feature 1186, A14)
 
     Returns:
         ValidateSessionResponse if valid, InvalidSessionResponse if not
@@ -267,6 +279,18 @@ def validate_session(
         )
 
     try:
+        rev = jwt_claim.rev if jwt_claim is not None else None
+        now = datetime.now(UTC)
+
+        # Recently validated in this environment: skip the GetItem
+        cached = session_activity.get_cached_session(table, anonymous_id, rev)
+        if cached is not None and cached.session_expires_at >= now:
+            if jwt_claim is not None and not check_revocation_id(
+                jwt_claim, cached.revocation_id
+            ):
+                raise SessionRevokedException(reason="Token revoked")
+            return _session_validated(table, cached, extend_on_valid, rev)
+
         # Look up user in DynamoDB
         response = table.get_item(
             Key={
@@ -311,8 +335,13 @@ def validate_session(
                 revoked_at=user.revoked_at,
             )
 
+        # Feature 1186 (A14): Reject tokens minted before a revocation_id bump
+        if jwt_claim is not None and not check_revocation_id(
+            jwt_claim, user.revocation_id
+        ):
+            raise SessionRevokedException(reason="Token revoked")
+
         # Check if session has expired
-        now = datetime.now(UTC)
         if user.session_expires_at < now:
             logger.info(
                 "Session expired",
@@ -327,24 +356,15 @@ def validate_session(
                 message="Session has expired. Please create a new session.",
             )
 
-        # Update last_active_at
-        _update_last_active(table, user)
-
-        # Feature 014 (T052): Extend session expiry on valid session (sliding window)
-        if extend_on_valid:
-            _extend_session_expiry_on_validation(table, user)
-
-        logger.debug(
-            "Session validated",
-            extra={"user_id_prefix": sanitize_for_log(anonymous_id[:8])},
-        )
-
-        return ValidateSessionResponse(
-            valid=True,
+        session = session_activity.CachedSession(
             user_id=user.user_id,
+            pk=user.pk,
+            sk=user.sk,
             auth_type=user.auth_type,
-            expires_at=user.session_expires_at.isoformat().replace("+00:00", "Z"),
+            session_expires_at=user.session_expires_at,
+            revocation_id=user.revocation_id,
         )
+        return _session_validated(table, session, extend_on_valid, rev)
 
     except Exception as e:
         logger.error(
@@ -354,64 +374,38 @@ def validate_session(
         raise
 
 
-def _update_last_active(table: Any, user: User) -> None:
-    """Update user's last_active_at timestamp.
-
-    Silent failure - don't break validation on update failure.
-    """
-    try:
-        now = datetime.now(UTC)
-        table.update_item(
-            Key={
-                "PK": user.pk,
-                "SK": user.sk,
-            },
-            UpdateExpression="SET last_active_at = :now",
-            ExpressionAttributeValues={
-                ":now": now.isoformat(),
-            },
-        )
-    except Exception as e:
-        # Log but don't fail the validation
-        logger.warning(
-            "Failed to update last_active_at",
-            extra=get_safe_error_info(e),
-        )
-
-
-def _extend_session_expiry_on_validation(table: Any, user: User) -> None:
-    """Extend session expiry during validation (FR-011, T052).
-
-    Called when extend_on_valid=True in validate_session.
-    Silent failure - don't break validation on extension failure.
+def _session_validated(
+    table: Any,
+    session: session_activity.CachedSession,
+    extend_on_valid: bool,
+    rev: int | None,
+) -> ValidateSessionResponse:
+    """Record activity for a valid session and build the response.
+
+    last_active_at and, with extend_on_valid, the sliding expiry (FR-011,
+    T052) are written behind by session_activity: at most once per user
+    per SESSION_WRITE_INTERVAL_SECONDS instead of on every request.
     """
-    try:
-        now = datetime.now(UTC)
-        new_expiry = now + timedelta(days=SESSION_DURATION_DAYS)
+    new_expiry = None
+    if extend_on_valid:
+        new_expiry = datetime.now(UTC) + timedelta(days=SESSION_DURATION_DAYS)
+        session = dataclasses.replace(session, session_expires_at=new_expiry)
 
-        table.update_item(
-            Key={"PK": user.pk, "SK": user.sk},
-            UpdateExpression="SET session_expires_at = :expires, #ttl = :ttl",
-            ExpressionAttributeNames={"#ttl": "ttl_timestamp"},
-            ExpressionAttributeValues={
-                ":expires": new_expiry.isoformat(),
-                ":ttl": int(new_expiry.timestamp()) + (90 * 24 * 3600),
-            },
-        )
+    # Cache before touching so a failed conditional extension evicts it
+    session_activity.cache_session(table, session, rev)
+    session_activity.record_touch(table, session, new_expiry)
 
-        # Update the user object in place
-        user.session_expires_at = new_expiry
+    logger.debug(
+        "Session validated",
+        extra={"user_id_prefix": sanitize_for_log(session.user_id[:8])},
+    )
 
-        logger.debug(
-            "Extended session during validation",
-            extra={"user_id_prefix": sanitize_for_log(user.user_id[:8])},
-        )
-    except Exception as e:
-        # Log but don't fail the validation
-        logger.warning(
-            "Failed to extend session during validation",
-            extra=get_safe_error_info(e),
-        )
+    return ValidateSessionResponse(
+        valid=True,
+        user_id=session.user_id,
+        auth_type=session.auth_type,
+        expires_at=session.session_expires_at.isoformat().replace("+00:00", "Z"),
+    )
 
 
 def get_user_by_id(table: Any, user_id: str) -> User | None:
@@ -1551,6 +1545,8 @@ def revoke_user_session(
             },
         )
 
+        session_activity.invalidate_session(user_id)
+
         logger.info(
             "Revoked user session",
             extra={
@@ -3578,6 +3574,10 @@ def sign_out(
     Returns:
         SignOutResponse
     """
+    # Drop this environment's cached validation and pending touches first,
+    # so no deferred write races the sign-out
+    session_activity.invalidate_session(user_id)
+
     # Invalidate the session by setting expiry to past
     try:
         now = datetime.now(UTC)
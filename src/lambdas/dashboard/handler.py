@@ -112,6 +112,8 @@ tracer = Tracer(service="dashboard")
 # CRITICAL: These must be set - no defaults to prevent wrong-environment data corruption
 USERS_TABLE = os.environ["USERS_TABLE"]
 SENTIMENTS_TABLE = os.environ["SENTIMENTS_TABLE"]
+# Tag buckets for the v2 sentiment and trend endpoints live here
+TIMESERIES_TABLE = os.environ.get("TIMESERIES_TABLE", "sentiment-timeseries")
 CHAOS_EXPERIMENTS_TABLE = os.environ.get("CHAOS_EXPERIMENTS_TABLE", "")
 ENVIRONMENT = os.environ["ENVIRONMENT"]
 SSE_LAMBDA_URL = os.environ["SSE_LAMBDA_URL"]
@@ -251,7 +253,9 @@ def _get_user_id_from_event(event: dict, validate_session: bool = True) -> str:
         try:
             table = get_table(USERS_TABLE)
             validation = auth_service.validate_session(
-                table=table, anonymous_id=user_id
+                table=table,
+                anonymous_id=user_id,
+                jwt_claim=auth_context.get("jwt_claim"),
             )
             if not validation.valid:
                 return ""
@@ -774,7 +778,7 @@ def get_sentiment_v2():
     start_time = start if start else (now - timedelta(hours=24)).isoformat()
 
     try:
-        table = get_table(SENTIMENTS_TABLE)
+        table = get_table(TIMESERIES_TABLE)
         result = get_sentiment_by_tags(table, tag_list, start_time, end_time)
         return Response(
             status_code=200,
@@ -882,7 +886,7 @@ def get_trends_v2():
         range_hours = 168
 
     try:
-        table = get_table(SENTIMENTS_TABLE)
+        table = get_table(TIMESERIES_TABLE)
         result = get_trend_data(table, tag_list, interval, range_hours)
         return Response(
             status_code=200,
@@ -1912,6 +1916,26 @@ def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
     # headers already set by @app.not_found handler.
     response = _inject_cors_headers(response, event)
 
+    # Write session activity (last_active_at, sliding expiry) held back by
+    # validate_session whose per-user write interval has passed
+    try:
+        from src.lambdas.shared.auth.session_activity import flush_session_activity
+
+        flush_session_activity()
+    except Exception:
+        logger.warning("Session activity flush failed", exc_info=True)
+
+    # Write rate limit counters still pending: the background flush thread
+    # is frozen between invocations
+    try:
+        from src.lambdas.shared.middleware.rate_limit import (
+            flush_rate_limit_counters,
+        )
+
+        flush_rate_limit_counters()
+    except Exception:
+        logger.warning("Rate limit counter flush failed", exc_info=True)
+
     # Feature 1224: Flush cache metrics to CloudWatch if interval elapsed
     try:
         from src.lib.cache_utils import get_global_emitter
@@ -9,6 +9,9 @@ For On-Call Engineers:
     1. Verify DynamoDB GSIs exist (by_sentiment, by_tag, by_status)
     2. Check GSI propagation delay (can take up to 1 second)
     3. Verify items have correct status field for by_status GSI
+    4. Counts and rates come from COUNTER# rows in the timeseries table
+       (shared/metric_counters.py); look for "Failed to flush metric
+       counters" in ingestion/analysis logs
 
     See SC-05 in ON_CALL_SOP.md for dashboard-related incidents.
 
@@ -16,7 +19,8 @@ For Developers:
     - All queries use eventually consistent reads (acceptable for dashboard)
     - GSI queries are more efficient than table scans
     - Recent items limited to 20 for performance
-    - Rate calculations use timestamp filtering
+    - Counts and rates sum materialized per-minute/per-hour counter rows
+      (BatchGetItem on O(window) keys) instead of COUNT-querying GSIs
 
 Performance optimization (C7, Feature 1085):
     - In-memory cache with 300s TTL for GSI query results
@@ -33,12 +37,18 @@ Security Notes:
 import logging
 import os
 import time
-from datetime import UTC, datetime, timedelta
+from datetime import timedelta
 from typing import Any
 
 from boto3.dynamodb.conditions import Key
 
 from src.lambdas.shared.logging_utils import get_safe_error_info, sanitize_for_log
+from src.lambdas.shared.metric_counters import (
+    INGESTED,
+    get_counters_table,
+    read_window_counts,
+    ticker_counts,
+)
 from src.lib.cache_utils import CacheStats, get_global_emitter
 
 # Structured logging
@@ -113,78 +123,6 @@ def clear_metrics_cache() -> None:
     _metrics_cache_stats = {"hits": 0, "misses": 0, "evictions": 0}
 
 
-def calculate_sentiment_distribution(items: list[dict[str, Any]]) -> dict[str, int]:
-    """
-    Calculate sentiment distribution from a list of items.
-
-    Args:
-        items: List of DynamoDB items with 'sentiment' field
-
-    Returns:
-        Dict with counts for positive, neutral, negative
-
-    Example:
-        >>> items = [{"sentiment": "positive"}, {"sentiment": "negative"}]
-        >>> calculate_sentiment_distribution(items)
-        {'positive': 1, 'neutral': 0, 'negative': 1}
-
-    On-Call Note:
-        If all counts are 0, verify items have 'sentiment' field populated.
-        Items with status='pending' won't have sentiment yet.
-    """
-    distribution = dict.fromkeys(SENTIMENT_VALUES, 0)
-
-    for item in items:
-        sentiment = item.get("sentiment", "").lower()
-        if sentiment in distribution:
-            distribution[sentiment] += 1
-        elif sentiment:
-            # Log unexpected sentiment values (sanitize to prevent log injection)
-            logger.warning(
-                "Unexpected sentiment value",
-                extra={
-                    "sentiment": sanitize_for_log(sentiment),
-                    "source_id": sanitize_for_log(item.get("source_id", "unknown")),
-                },
-            )
-
-    return distribution
-
-
-def calculate_tag_distribution(items: list[dict[str, Any]]) -> dict[str, int]:
-    """
-    Calculate tag distribution from a list of items.
-
-    Args:
-        items: List of DynamoDB items with 'tags' field (list of strings)
-
-    Returns:
-        Dict with counts per tag, sorted by count descending
-
-    Example:
-        >>> items = [{"tags": ["tech", "ai"]}, {"tags": ["tech"]}]
-        >>> calculate_tag_distribution(items)
-        {'tech': 2, 'ai': 1}
-
-    On-Call Note:
-        Tags come from the watch list configured in ingestion Lambda.
-        If tags are missing, check WATCH_TAGS environment variable.
-    """
-    tag_counts: dict[str, int] = {}
-
-    for item in items:
-        tags = item.get("tags", [])
-        if isinstance(tags, list):
-            for tag in tags:
-                if isinstance(tag, str) and tag:
-                    tag_counts[tag] = tag_counts.get(tag, 0) + 1
-
-    # Sort by count descending
-    sorted_tags = dict(sorted(tag_counts.items(), key=lambda x: x[1], reverse=True))
-
-    return sorted_tags
-
-
 def get_recent_items(
     table: Any,
     limit: int = MAX_RECENT_ITEMS,
@@ -244,75 +182,6 @@ def get_recent_items(
         raise
 
 
-def get_items_by_sentiment(
-    table: Any,
-    sentiment: str,
-    hours: int = 24,
-) -> list[dict[str, Any]]:
-    """
-    Get items by sentiment from the last N hours using by_sentiment GSI.
-
-    Args:
-        table: DynamoDB Table resource
-        sentiment: Sentiment value (positive, neutral, negative)
-        hours: Number of hours to look back
-
-    Returns:
-        List of items with the specified sentiment
-
-    On-Call Note:
-        If counts seem low, verify:
-        1. by_sentiment GSI exists
-        2. Analysis Lambda is populating sentiment field
-        3. Time window covers expected data
-    """
-    if sentiment.lower() not in SENTIMENT_VALUES:
-        raise ValueError(f"Invalid sentiment: {sentiment}")
-
-    # Calculate time window
-    now = datetime.now(UTC)
-    start_time = (now - timedelta(hours=hours)).isoformat()
-
-    try:
-        response = table.query(
-            IndexName="by_sentiment",
-            KeyConditionExpression=(
-                Key("sentiment").eq(sentiment.lower())
-                & Key("timestamp").gte(start_time)
-            ),
-        )
-
-        items = response.get("Items", [])
-
-        # Security: Sanitize user-provided values for logging (CodeQL: py/log-injection)
-        sentiment_safe = sentiment.replace("\r", "").replace("\n", "").replace("\t", "")
-        hours_safe = str(hours).replace("\r", "").replace("\n", "").replace("\t", "")
-        logger.debug(
-            "Retrieved items by sentiment",
-            extra={
-                "sentiment": sentiment_safe,
-                "hours": hours_safe,
-                "count": len(items),
-            },
-        )
-
-        return items
-
-    except Exception as e:
-        # Security: Sanitize user-provided values for logging (CodeQL: py/log-injection)
-        sentiment_safe = sentiment.replace("\r", "").replace("\n", "").replace("\t", "")
-        hours_safe = str(hours).replace("\r", "").replace("\n", "").replace("\t", "")
-        logger.error(
-            "Failed to get items by sentiment",
-            extra={
-                "sentiment": sentiment_safe,
-                "hours": hours_safe,
-                **get_safe_error_info(e),
-            },
-        )
-        raise
-
-
 def calculate_ingestion_rate(
     table: Any,
     hours: int = 24,
@@ -327,61 +196,22 @@ def calculate_ingestion_rate(
     Returns:
         Dict with rate_last_hour and rate_last_24h
 
+    Rates count every item created in the window (pending or analyzed),
+    from the ingestion counters.
+
     On-Call Note:
         If rates seem low:
         1. Check EventBridge schedule is running (every 5 min)
         2. Verify ingestion Lambda is not erroring
         3. Check article source is returning articles
     """
-    now = datetime.now(UTC)
-
-    # Calculate time boundaries
-    one_hour_ago = (now - timedelta(hours=1)).isoformat()
-    twenty_four_hours_ago = (now - timedelta(hours=hours)).isoformat()
-
     try:
-        # Count items in last hour (use by_status GSI to count all)
-        # We query for all statuses and filter by timestamp
-        response_1h = table.query(
-            IndexName="by_status",
-            KeyConditionExpression=(
-                Key("status").eq("analyzed") & Key("timestamp").gte(one_hour_ago)
-            ),
-            Select="COUNT",
-        )
-        rate_last_hour = response_1h.get("Count", 0)
-
-        # Also count pending items in last hour
-        response_1h_pending = table.query(
-            IndexName="by_status",
-            KeyConditionExpression=(
-                Key("status").eq("pending") & Key("timestamp").gte(one_hour_ago)
-            ),
-            Select="COUNT",
-        )
-        rate_last_hour += response_1h_pending.get("Count", 0)
-
-        # Count items in last 24 hours
-        response_24h = table.query(
-            IndexName="by_status",
-            KeyConditionExpression=(
-                Key("status").eq("analyzed")
-                & Key("timestamp").gte(twenty_four_hours_ago)
-            ),
-            Select="COUNT",
-        )
-        rate_last_24h = response_24h.get("Count", 0)
-
-        # Also count pending items in last 24 hours
-        response_24h_pending = table.query(
-            IndexName="by_status",
-            KeyConditionExpression=(
-                Key("status").eq("pending")
-                & Key("timestamp").gte(twenty_four_hours_ago)
-            ),
-            Select="COUNT",
+        counts = read_window_counts(
+            get_counters_table(),
+            {"1h": timedelta(hours=1), "window": timedelta(hours=hours)},
         )
-        rate_last_24h += response_24h_pending.get("Count", 0)
+        rate_last_hour = counts["1h"][INGESTED]
+        rate_last_24h = counts["window"][INGESTED]
 
         logger.info(
             "Calculated ingestion rates",
@@ -427,7 +257,7 @@ def aggregate_dashboard_metrics(
         - positive: Positive count
         - neutral: Neutral count
         - negative: Negative count
-        - by_tag: Tag distribution
+        - by_tag: Items per matched ticker
         - rate_last_hour: Items in last hour
         - rate_last_24h: Items in last 24 hours
         - recent_items: Recent analyzed items
@@ -435,7 +265,8 @@ def aggregate_dashboard_metrics(
     On-Call Note:
         If this fails or returns zeros:
         1. Check DynamoDB table and GSIs exist
-        2. Verify Lambda has dynamodb:Query permission on GSIs
+        2. Verify Lambda has dynamodb:Query permission on GSIs and
+           dynamodb:BatchGetItem on the timeseries table (counter rows)
         3. Check recent items exist with status='analyzed'
     """
     # C7 FIX: Check cache first
@@ -453,21 +284,16 @@ def aggregate_dashboard_metrics(
         # Get recent items (for display and distribution calculation)
         recent_items = get_recent_items(table, limit=MAX_RECENT_ITEMS)
 
-        # For distribution calculations, we need more items
-        # Query all analyzed items in time window
-
-        # Get all analyzed items for accurate distribution
-        all_items: list[dict[str, Any]] = []
-        for sentiment in SENTIMENT_VALUES:
-            items = get_items_by_sentiment(table, sentiment, hours)
-            all_items.extend(items)
-
-        # Calculate distributions
-        sentiment_dist = calculate_sentiment_distribution(all_items)
-        tag_dist = calculate_tag_distribution(all_items)
-
-        # Calculate ingestion rates
-        rates = calculate_ingestion_rate(table, hours)
+        # Distributions and rates from materialized counters: one batch
+        # read of O(window) rows however many items the window holds
+        counts = read_window_counts(
+            get_counters_table(),
+            {"1h": timedelta(hours=1), "window": timedelta(hours=hours)},
+        )
+        window = counts["window"]
+        sentiment_dist = {
+            sentiment: window[sentiment] for sentiment in SENTIMENT_VALUES
+        }
 
         # Calculate total
         total = sum(sentiment_dist.values())
@@ -477,9 +303,9 @@ def aggregate_dashboard_metrics(
             "positive": sentiment_dist["positive"],
             "neutral": sentiment_dist["neutral"],
             "negative": sentiment_dist["negative"],
-            "by_tag": tag_dist,
-            "rate_last_hour": rates["rate_last_hour"],
-            "rate_last_24h": rates["rate_last_24h"],
+            "by_tag": ticker_counts(window),
+            "rate_last_hour": counts["1h"][INGESTED],
+            "rate_last_24h": window[INGESTED],
             "recent_items": recent_items,
         }
 
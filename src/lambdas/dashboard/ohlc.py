@@ -17,7 +17,6 @@ Security Notes:
 
 import logging
 import os
-import time
 from datetime import date, datetime, timedelta
 
 import orjson
@@ -26,9 +25,14 @@ from aws_lambda_powertools.event_handler.router import Router
 
 from src.lambdas.shared.cache.ohlc_cache import (
     candles_to_cached,
-    get_cached_candles,
+    get_cached_candle_columns,
     put_cached_candles,
 )
+from src.lambdas.shared.cache.response_cache import (
+    CachedResponse,
+    ResponseCache,
+    cached_json_response,
+)
 from src.lambdas.shared.dependencies import get_tiingo_adapter
 from src.lambdas.shared.logging_utils import get_safe_error_info
 from src.lambdas.shared.middleware.auth_middleware import extract_auth_context
@@ -45,7 +49,6 @@ from src.lambdas.shared.models import (
 from src.lambdas.shared.utils.event_helpers import get_query_params
 from src.lambdas.shared.utils.market import get_cache_expiration
 from src.lambdas.shared.utils.response_builder import error_response
-from src.lib.cache_utils import CacheStats, get_global_emitter
 
 logger = logging.getLogger(__name__)
 
@@ -67,14 +70,26 @@ OHLC_CACHE_TTLS: dict[str, int] = {
 }
 OHLC_CACHE_DEFAULT_TTL = 300  # 5 minutes fallback
 OHLC_CACHE_MAX_ENTRIES = int(os.environ.get("OHLC_CACHE_MAX_ENTRIES", "256"))
+# Bound on summed body and payload size; a 1Y intraday body alone is ~2 MB
+OHLC_CACHE_MAX_BYTES = int(os.environ.get("OHLC_CACHE_MAX_BYTES", str(64 * 1024**2)))
 
-# Cache storage: {cache_key: (timestamp, response_dict)}
-_ohlc_cache: dict[str, tuple[float, dict]] = {}
 _ohlc_cache_stats: dict[str, int] = {"hits": 0, "misses": 0, "evictions": 0}
 
-# Feature 1224: CacheStats for CloudWatch metric emission
-_ohlc_cw_stats = CacheStats(name="ohlc_response")
-get_global_emitter().register(_ohlc_cw_stats)
+
+def _record_ohlc_eviction(_cache_key: str) -> None:
+    _ohlc_cache_stats["evictions"] += 1
+
+
+# Cache storage: serialized OHLCResponse bodies with ETags (LRU + TTL)
+_ohlc_cache = ResponseCache(
+    name="ohlc_response",
+    max_entries=OHLC_CACHE_MAX_ENTRIES,
+    max_bytes=OHLC_CACHE_MAX_BYTES,
+    on_evict=_record_ohlc_eviction,
+)
+
+# Feature 1224: CacheStats for CloudWatch metric emission (registered by cache)
+_ohlc_cw_stats = _ohlc_cache.stats
 
 
 def _get_ohlc_cache_key(
@@ -114,6 +129,25 @@ def _get_ohlc_cache_key(
         return f"ohlc:{ticker_upper}:{resolution}:{time_range}:{date_anchor}"
 
 
+def _get_cached_ohlc_entry(cache_key: str) -> CachedResponse | None:
+    """Get a cached OHLC response (body, ETag and payload) if valid.
+
+    TTL is stored per entry, so no resolution is needed.
+
+    Args:
+        cache_key: The cache key to look up
+
+    Returns:
+        Cache entry if valid, None if expired or missing
+    """
+    entry = _ohlc_cache.get(cache_key)
+    if entry is not None:
+        _ohlc_cache_stats["hits"] += 1
+        return entry
+    _ohlc_cache_stats["misses"] += 1
+    return None
+
+
 def _get_cached_ohlc(cache_key: str, resolution: str) -> dict | None:
     """Get OHLC response from cache if valid.
 
@@ -124,43 +158,25 @@ def _get_cached_ohlc(cache_key: str, resolution: str) -> dict | None:
     Returns:
         Cached response dict if valid, None if expired or missing
     """
-    if cache_key in _ohlc_cache:
-        entry = _ohlc_cache[cache_key]
-        timestamp, response = entry[0], entry[1]
-        # Feature 1224: Use stored jittered TTL if available
-        if len(entry) > 2:
-            effective_ttl = entry[2]
-        else:
-            effective_ttl = OHLC_CACHE_TTLS.get(resolution, OHLC_CACHE_DEFAULT_TTL)
-        if time.time() - timestamp < effective_ttl:
-            _ohlc_cache_stats["hits"] += 1
-            _ohlc_cw_stats.record_hit()
-            return response
-        # Expired, remove it
-        del _ohlc_cache[cache_key]
-    _ohlc_cache_stats["misses"] += 1
-    _ohlc_cw_stats.record_miss()
-    return None
+    entry = _get_cached_ohlc_entry(cache_key)
+    return entry.payload if entry is not None else None
 
 
-def _set_cached_ohlc(cache_key: str, response: dict, resolution: str = "D") -> None:
-    """Store OHLC response in cache with jittered TTL and LRU eviction.
+def _set_cached_ohlc(
+    cache_key: str, response: dict, resolution: str = "D"
+) -> CachedResponse:
+    """Serialize and store OHLC response with jittered TTL and LRU eviction.
 
     Args:
         cache_key: The cache key
         response: Response dict to cache
         resolution: OHLC resolution for TTL selection
+
+    Returns:
+        The stored entry, whose body can be returned as-is
     """
-    from src.lib.cache_utils import jittered_ttl
-
-    global _ohlc_cache
-    if len(_ohlc_cache) >= OHLC_CACHE_MAX_ENTRIES:
-        # Evict oldest entry by timestamp (LRU)
-        oldest_key = min(_ohlc_cache.keys(), key=lambda k: _ohlc_cache[k][0])
-        del _ohlc_cache[oldest_key]
-        _ohlc_cache_stats["evictions"] += 1
     base_ttl = OHLC_CACHE_TTLS.get(resolution, OHLC_CACHE_DEFAULT_TTL)
-    _ohlc_cache[cache_key] = (time.time(), response, jittered_ttl(base_ttl))
+    return _ohlc_cache.put(cache_key, response, base_ttl)
 
 
 def get_ohlc_cache_stats() -> dict[str, int]:
@@ -178,16 +194,9 @@ def invalidate_ohlc_cache(ticker: str | None = None) -> int:
     Returns:
         Number of entries invalidated
     """
-    global _ohlc_cache
     if ticker is None:
-        count = len(_ohlc_cache)
-        _ohlc_cache = {}
-        return count
-    prefix = f"ohlc:{ticker.upper()}:"
-    keys_to_remove = [k for k in _ohlc_cache if k.startswith(prefix)]
-    for key in keys_to_remove:
-        del _ohlc_cache[key]
-    return len(keys_to_remove)
+        return _ohlc_cache.invalidate()
+    return _ohlc_cache.invalidate(f"ohlc:{ticker.upper()}:")
 
 
 # ============================================================================
@@ -284,7 +293,7 @@ def _read_from_dynamodb(
     start_time = datetime.combine(start_date, dt_time.min, tzinfo=UTC)
     end_time = datetime.combine(end_date, dt_time.max, tzinfo=UTC)
 
-    result = get_cached_candles(
+    columns = get_cached_candle_columns(
         ticker=ticker,
         source=source,
         resolution=resolution.value,
@@ -292,32 +301,30 @@ def _read_from_dynamodb(
         end_time=end_time,
     )
 
-    if not result.cache_hit or not result.candles:
+    if not len(columns):
         logger.debug(
             "DynamoDB cache miss",
             extra={"ticker": ticker, "resolution": resolution.value},
         )
         return None
 
-    # Convert CachedCandle to PriceCandle
-    price_candles = [
-        PriceCandle.from_cached_candle(c, resolution) for c in result.candles
-    ]
-
-    # Validate we have reasonable coverage (80% threshold)
+    # Validate we have reasonable coverage (80% threshold) before building
+    # response models, so partial hits cost no per-candle conversion
     expected_candles = _estimate_expected_candles(start_date, end_date, resolution)
-    if len(price_candles) < expected_candles * 0.8:
+    if len(columns) < expected_candles * 0.8:
         # Less than 80% coverage - treat as miss, fetch fresh
         logger.info(
             "DynamoDB cache partial hit, fetching fresh",
             extra={
                 "ticker": ticker,
-                "found": len(price_candles),
+                "found": len(columns),
                 "expected": expected_candles,
             },
         )
         return None
 
+    price_candles = PriceCandle.from_cached_columns(columns, resolution)
+
     logger.info(
         "OHLC cache hit (DynamoDB)",
         extra={
@@ -630,8 +637,8 @@ def get_ohlc_data(ticker: str) -> Response:
     cache_key = _get_ohlc_cache_key(
         ticker, resolution.value, time_range_str, start_date, end_date
     )
-    cached_response = _get_cached_ohlc(cache_key, resolution.value)
-    if cached_response:
+    cached_entry = _get_cached_ohlc_entry(cache_key)
+    if cached_entry:
         safe_cache_key = (
             str(cache_key)
             .replace("\r\n", " ")
@@ -642,16 +649,10 @@ def get_ohlc_data(ticker: str) -> Response:
             "OHLC cache hit (in-memory)",
             extra={"cache_key": safe_cache_key, "stats": get_ohlc_cache_stats()},
         )
-        # Calculate in-memory cache age
-        if cache_key in _ohlc_cache:
-            cache_age = int(time.time() - _ohlc_cache[cache_key][0])
-        cache_headers = _build_cache_headers("in-memory", cache_age, None, False)
-        # Return cached OHLCResponse directly
-        return Response(
-            status_code=200,
-            content_type="application/json",
-            body=orjson.dumps(cached_response).decode(),
-            headers=cache_headers,
+        cache_headers = _build_cache_headers("in-memory", cached_entry.age, None, False)
+        # Return the pre-serialized body (or 304 if the client's ETag matches)
+        return cached_json_response(
+            cached_entry, router.current_event.raw_event, cache_headers
         )
 
     # =========================================================================
@@ -693,16 +694,15 @@ def get_ohlc_data(ticker: str) -> Response:
         )
 
         # Populate in-memory cache for subsequent requests
-        _set_cached_ohlc(cache_key, response.model_dump(mode="json"), resolution.value)
+        entry = _set_cached_ohlc(
+            cache_key, response.model_dump(mode="json"), resolution.value
+        )
 
         # Calculate persistent cache age from fetched_at (approximate)
         # Use 0 as default since we don't have fetched_at in the response model
         cache_headers = _build_cache_headers("persistent-cache", 0, None, False)
-        return Response(
-            status_code=200,
-            content_type="application/json",
-            body=orjson.dumps(response.model_dump(mode="json")).decode(),
-            headers=cache_headers,
+        return cached_json_response(
+            entry, router.current_event.raw_event, cache_headers
         )
 
     # Track fallback state
@@ -892,7 +892,7 @@ def get_ohlc_data(ticker: str) -> Response:
         end_date_value,
     )
     response_dict = response.model_dump(mode="json")
-    _set_cached_ohlc(actual_cache_key, response_dict, actual_resolution.value)
+    entry = _set_cached_ohlc(actual_cache_key, response_dict, actual_resolution.value)
     safe_actual_cache_key = (
         str(actual_cache_key)
         .replace("\r\n", " ")
@@ -909,12 +909,7 @@ def get_ohlc_data(ticker: str) -> Response:
         cache_source, cache_age, cache_error, cache_write_error
     )
 
-    return Response(
-        status_code=200,
-        content_type="application/json",
-        body=orjson.dumps(response_dict).decode(),
-        headers=cache_headers,
-    )
+    return cached_json_response(entry, router.current_event.raw_event, cache_headers)
 
 
 @router.get("/api/v2/tickers/<ticker>/sentiment/history")
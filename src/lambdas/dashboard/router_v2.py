@@ -44,8 +44,11 @@ from src.lambdas.shared.auth.csrf import (
     CSRF_COOKIE_NAME,
     generate_csrf_token,
 )
+from src.lambdas.shared.cache.response_cache import cached_json_response
 from src.lambdas.shared.dependencies import (
+    get_finnhub_adapter,
     get_ticker_cache_dependency,
+    get_tiingo_adapter,
     get_users_table,
 )
 from src.lambdas.shared.errors import (
@@ -321,7 +324,9 @@ def get_user_id_from_event(
     if validate_session and table is not None:
         try:
             validation = auth_service.validate_session(
-                table=table, anonymous_id=user_id
+                table=table,
+                anonymous_id=user_id,
+                jwt_claim=auth_context.get("jwt_claim"),
             )
             if not validation.valid:
                 return None
@@ -348,7 +353,9 @@ def _require_user_id(
     if validate_session and table is not None:
         try:
             validation = auth_service.validate_session(
-                table=table, anonymous_id=user_id
+                table=table,
+                anonymous_id=user_id,
+                jwt_claim=auth_context.get("jwt_claim"),
             )
             if not validation.valid:
                 return None, error_response(401, "Session expired or invalid")
@@ -503,13 +510,18 @@ def validate_session():
     event = auth_router.current_event.raw_event
     table = get_users_table()
 
-    user_id = get_user_id_from_event(event)
+    auth_context = extract_auth_context(event)
+    user_id = auth_context.get("user_id")
     if not user_id:
         return json_response(
             200, {"valid": False, "reason": "missing_user_id"}, _get_no_cache_headers()
         )
 
-    result = auth_service.validate_session(table=table, anonymous_id=user_id)
+    result = auth_service.validate_session(
+        table=table,
+        anonymous_id=user_id,
+        jwt_claim=auth_context.get("jwt_claim"),
+    )
     return json_response(200, result.model_dump(), _get_no_cache_headers())
 
 
@@ -1333,12 +1345,12 @@ def get_sentiment(config_id: str):
         return err
     _, tickers = config_data
 
-    result = sentiment_service.get_sentiment_by_configuration(
+    entry = sentiment_service.get_sentiment_entry(
         config_id=config_id,
         tickers=tickers,
         resolution=resolution,
     )
-    return json_response(200, result.model_dump())
+    return cached_json_response(entry, event)
 
 
 @config_router.get("/api/v2/configurations/<config_id>/heatmap")
@@ -1375,6 +1387,18 @@ def get_heatmap(config_id: str):
     return json_response(200, result.model_dump())
 
 
+def _get_optional_adapter(getter):
+    """Return a market data adapter, or None if it is not configured.
+
+    The getters log the missing credentials; views then fall back to the
+    other source, cached data or placeholders instead of failing.
+    """
+    try:
+        return getter()
+    except RuntimeError:
+        return None
+
+
 @config_router.get("/api/v2/configurations/<config_id>/volatility")
 def get_volatility(config_id: str):
     """Get volatility data (T058)."""
@@ -1393,6 +1417,8 @@ def get_volatility(config_id: str):
     result = volatility_service.get_volatility_by_configuration(
         config_id=config_id,
         tickers=tickers,
+        tiingo_adapter=_get_optional_adapter(get_tiingo_adapter),
+        finnhub_adapter=_get_optional_adapter(get_finnhub_adapter),
     )
     return json_response(200, result.model_dump())
 
@@ -1400,6 +1426,8 @@ def get_volatility(config_id: str):
 @config_router.get("/api/v2/configurations/<config_id>/correlation")
 def get_correlation(config_id: str):
     """Get correlation data (T059)."""
+    from src.lib.timeseries.models import Resolution
+
     event = config_router.current_event.raw_event
     table = get_users_table()
 
@@ -1407,6 +1435,17 @@ def get_correlation(config_id: str):
     if err:
         return err
 
+    # Parse optional resolution parameter (sentiment buckets vs. candles)
+    query_params = get_query_params(event)
+    resolution_str = query_params.get("resolution", "24h")
+    try:
+        resolution = Resolution(resolution_str)
+    except ValueError:
+        return error_response(
+            400,
+            f"Invalid resolution: {resolution_str}. Valid: {', '.join(r.value for r in Resolution)}",
+        )
+
     config_data, err = _get_config_with_tickers(table, user_id, config_id)
     if err:
         return err
@@ -1415,6 +1454,7 @@ def get_correlation(config_id: str):
     result = volatility_service.get_correlation_data(
         config_id=config_id,
         tickers=tickers,
+        resolution=resolution,
     )
     return json_response(200, result.model_dump())
 
@@ -24,14 +24,14 @@ Security Notes:
 import hashlib
 import logging
 import os
-import time
 from datetime import UTC, datetime, timedelta
 from typing import Any, Literal
 
+import orjson
 from pydantic import BaseModel, Field
 
+from src.lambdas.shared.cache.response_cache import CachedResponse, ResponseCache
 from src.lambdas.shared.logging_utils import get_safe_error_info, sanitize_for_log
-from src.lib.cache_utils import CacheStats, get_global_emitter
 from src.lib.timeseries.models import Resolution
 
 logger = logging.getLogger(__name__)
@@ -45,15 +45,18 @@ SENTIMENT_CACHE_TTL = int(os.environ.get("SENTIMENT_CACHE_TTL", "300"))
 # Max cache entries to prevent unbounded memory growth
 SENTIMENT_CACHE_MAX_ENTRIES = int(os.environ.get("SENTIMENT_CACHE_MAX_ENTRIES", "50"))
 
-# In-memory cache: {cache_key: (timestamp, SentimentResponse)}
-_sentiment_cache: dict[str, tuple[float, "SentimentResponse"]] = {}
+# In-memory cache: SentimentResponse plus its serialized body and ETag
+_sentiment_cache = ResponseCache(
+    name="sentiment",
+    max_entries=SENTIMENT_CACHE_MAX_ENTRIES,
+    ttl=SENTIMENT_CACHE_TTL,
+)
 
 # Cache statistics
 _sentiment_cache_stats = {"hits": 0, "misses": 0}
 
-# Feature 1224: CacheStats for CloudWatch metric emission
-_sentiment_cw_stats = CacheStats(name="sentiment")
-get_global_emitter().register(_sentiment_cw_stats)
+# Feature 1224: CacheStats for CloudWatch metric emission (registered by cache)
+_sentiment_cw_stats = _sentiment_cache.stats
 
 
 def _get_sentiment_cache_key(
@@ -73,38 +76,32 @@ def _get_sentiment_cache_key(
     return f"sentiment:{config_id}:{tickers_hash}:{resolution}"
 
 
-def _get_cached_sentiment(cache_key: str) -> "SentimentResponse | None":
-    """Get sentiment response from cache if not expired."""
-    if cache_key in _sentiment_cache:
-        entry = _sentiment_cache[cache_key]
-        timestamp, response = entry[0], entry[1]
-        # Feature 1224: Use jittered TTL if stored
-        effective_ttl = entry[2] if len(entry) > 2 else SENTIMENT_CACHE_TTL
-        if time.time() - timestamp < effective_ttl:
-            _sentiment_cache_stats["hits"] += 1
-            _sentiment_cw_stats.record_hit()
-            return response
-        # Expired - remove from cache
-        del _sentiment_cache[cache_key]
+def _get_cached_sentiment_entry(cache_key: str) -> CachedResponse | None:
+    """Get cached sentiment entry (response, body, ETag) if not expired."""
+    entry = _sentiment_cache.get(cache_key)
+    if entry is not None:
+        _sentiment_cache_stats["hits"] += 1
+        return entry
     _sentiment_cache_stats["misses"] += 1
-    _sentiment_cw_stats.record_miss()
     return None
 
 
-def _set_cached_sentiment(cache_key: str, response: "SentimentResponse") -> None:
-    """Store sentiment response in cache with jittered TTL."""
-    from src.lib.cache_utils import jittered_ttl
+def _get_cached_sentiment(cache_key: str) -> "SentimentResponse | None":
+    """Get sentiment response from cache if not expired."""
+    entry = _get_cached_sentiment_entry(cache_key)
+    return entry.payload if entry is not None else None
+
 
-    global _sentiment_cache
-    # Evict oldest entries if cache is full
-    if len(_sentiment_cache) >= SENTIMENT_CACHE_MAX_ENTRIES:
-        oldest_key = min(_sentiment_cache.keys(), key=lambda k: _sentiment_cache[k][0])
-        del _sentiment_cache[oldest_key]
-    _sentiment_cache[cache_key] = (
-        time.time(),
-        response,
-        jittered_ttl(SENTIMENT_CACHE_TTL),
-    )
+def _set_cached_sentiment(
+    cache_key: str, response: "SentimentResponse"
+) -> CachedResponse:
+    """Serialize and store sentiment response in cache with jittered TTL.
+
+    The body is serialized as json_response() would, with orjson over
+    model_dump(), so cached and uncached responses format datetimes alike.
+    """
+    body = orjson.dumps(response.model_dump()).decode()
+    return _sentiment_cache.put(cache_key, response, body=body)
 
 
 def get_sentiment_cache_stats() -> dict[str, int]:
@@ -114,8 +111,8 @@ def get_sentiment_cache_stats() -> dict[str, int]:
 
 def clear_sentiment_cache() -> None:
     """Clear cache and reset stats. Used in tests."""
-    global _sentiment_cache, _sentiment_cache_stats
-    _sentiment_cache = {}
+    global _sentiment_cache_stats
+    _sentiment_cache.clear()
     _sentiment_cache_stats = {"hits": 0, "misses": 0}
 
 
@@ -129,18 +126,9 @@ def invalidate_sentiment_cache(config_id: str | None = None) -> int:
     Returns:
         Number of entries invalidated
     """
-    global _sentiment_cache
     if config_id is None:
-        count = len(_sentiment_cache)
-        _sentiment_cache = {}
-        return count
-
-    # Remove entries matching config_id
-    prefix = f"sentiment:{config_id}:"
-    keys_to_remove = [k for k in _sentiment_cache if k.startswith(prefix)]
-    for key in keys_to_remove:
-        del _sentiment_cache[key]
-    return len(keys_to_remove)
+        return _sentiment_cache.invalidate()
+    return _sentiment_cache.invalidate(f"sentiment:{config_id}:")
 
 
 # Response schemas
@@ -273,16 +261,39 @@ def get_sentiment_by_configuration(
     Returns:
         SentimentResponse with sentiment data
     """
-    from src.lambdas.dashboard.timeseries import query_timeseries
+    entry = get_sentiment_entry(config_id, tickers, resolution, skip_cache)
+    return entry.payload.model_copy()
+
+
+def get_sentiment_entry(
+    config_id: str,
+    tickers: list[str],
+    resolution: Resolution | None = None,
+    skip_cache: bool = False,
+) -> CachedResponse:
+    """Get the cached sentiment entry for configuration tickers.
+
+    Same data as get_sentiment_by_configuration(), but returns the cache
+    entry so the endpoint can send the pre-serialized body and answer
+    If-None-Match with 304 without re-serializing.
+
+    Args:
+        config_id: Configuration ID
+        tickers: List of ticker symbols
+        resolution: Time resolution for sentiment buckets (default: 24h)
+        skip_cache: If True, bypass cache and fetch fresh data
 
+    Returns:
+        CachedResponse whose payload is the SentimentResponse
+    """
     if resolution is None:
         resolution = Resolution.TWENTY_FOUR_HOURS
 
     # Check cache first (C4 optimization)
     cache_key = _get_sentiment_cache_key(config_id, tickers, resolution.value)
     if not skip_cache:
-        cached_response = _get_cached_sentiment(cache_key)
-        if cached_response is not None:
+        cached_entry = _get_cached_sentiment_entry(cache_key)
+        if cached_entry is not None:
             logger.debug(
                 "Sentiment cache hit",
                 extra={
@@ -290,57 +301,59 @@ def get_sentiment_by_configuration(
                     "ticker_count": len(tickers),
                 },
             )
-            return SentimentResponse(
-                config_id=cached_response.config_id,
-                tickers=cached_response.tickers,
-                last_updated=cached_response.last_updated,
-                next_refresh_at=cached_response.next_refresh_at,
-                cache_status="fresh",
-            )
+            return cached_entry
+
+    response = _query_sentiment(config_id, tickers, resolution)
+
+    # Store in cache (C4 optimization)
+    return _set_cached_sentiment(cache_key, response)
+
+
+def _query_sentiment(
+    config_id: str, tickers: list[str], resolution: Resolution
+) -> SentimentResponse:
+    """Build a SentimentResponse from the latest timeseries bucket per ticker."""
+    from src.lambdas.dashboard.timeseries import query_latest_timeseries
 
     now = datetime.now(UTC)
     next_refresh = now + timedelta(seconds=REFRESH_INTERVAL_SECONDS)
 
+    # One batched read for every ticker: the current/previous bucket keys are
+    # known, so only tickers without a recent complete bucket cost a Query.
+    try:
+        ts_responses = query_latest_timeseries(tickers, resolution)
+    except Exception as e:
+        logger.warning(
+            "Failed to query timeseries for sentiment",
+            extra={
+                "ticker_count": len(tickers),
+                "resolution": resolution.value,
+                **get_safe_error_info(e),
+            },
+        )
+        ts_responses = {}
+
     ticker_sentiments = []
 
     for symbol in tickers:
         sentiment_data: dict[str, SourceSentiment] = {}
+        ts_response = ts_responses.get(symbol)
 
-        try:
-            # latest=True is load-bearing, not a hint. Without it this query scans
-            # ascending with the small DEFAULT_LIMITS fallback, so it returns the
-            # OLDEST buckets ever recorded for the ticker and the bucket[-1] pick
-            # below reports the 7th-oldest day as the current sentiment -- a value
-            # that never changes as new data arrives.
-            ts_response = query_timeseries(
-                ticker=symbol,
-                resolution=resolution,
-                latest=True,
-            )
-
-            # Use the latest complete bucket or partial bucket
-            bucket = None
+        # Use the latest complete bucket or partial bucket
+        bucket = None
+        if ts_response is not None:
             if ts_response.buckets:
                 bucket = ts_response.buckets[-1]
             elif ts_response.partial_bucket:
                 bucket = ts_response.partial_bucket
 
-            if bucket and bucket.count > 0:
-                score = round(bucket.avg, 4)
-                sentiment_data["aggregated"] = SourceSentiment(
-                    score=score,
-                    label=_score_to_label(score),
-                    confidence=0.8,
-                    updated_at=bucket.timestamp,
-                )
-        except Exception as e:
-            logger.warning(
-                "Failed to query timeseries for sentiment",
-                extra={
-                    "symbol": sanitize_for_log(symbol),
-                    "resolution": resolution.value,
-                    **get_safe_error_info(e),
-                },
+        if bucket and bucket.count > 0:
+            score = round(bucket.avg, 4)
+            sentiment_data["aggregated"] = SourceSentiment(
+                score=score,
+                label=_score_to_label(score),
+                confidence=0.8,
+                updated_at=bucket.timestamp,
             )
 
         ticker_sentiments.append(
@@ -358,9 +371,6 @@ def get_sentiment_by_configuration(
         cache_status="fresh",
     )
 
-    # Store in cache (C4 optimization)
-    _set_cached_sentiment(cache_key, response)
-
     logger.info(
         "Retrieved sentiment data",
         extra={
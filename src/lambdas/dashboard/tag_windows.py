@@ -0,0 +1,301 @@
+"""Shared tag-window reader for the API v2 tag endpoints.
+
+get_sentiment_by_tags and get_trend_data only need sentiment label counts
+per tag and time window. Analysis pre-aggregates those into
+TAG#{tag}#{resolution} buckets in the time-series table
+(src.lib.timeseries.write_tag_fanout), and this module reads them:
+
+- Per-tag queries run concurrently (map_tags), one paginated query each
+- A window reads one row per bucket, projecting only SK and label_counts
+- Hourly buckets serve windows within their 7-day TTL, daily buckets serve
+  1d trend bins and anything older
+- Trend bins are computed arithmetically on epoch seconds, with one
+  calendar conversion per distinct bucket start
+- Finished windows are cached: label counts for windows that ended in the
+  past, and per tag+interval the bins that have closed. A trend request
+  then only queries the still-open bin and anything newer than the cache.
+
+For On-Call Engineers:
+    Windows are resolved to whole buckets: a mood-ring window counts every
+    article in the hours (or days) it touches. Cached windows live for
+    TAG_WINDOW_CACHE_TTL_SECONDS (default 300s); set it to 0 to read
+    DynamoDB on every request. Empty tags usually mean the analysis Lambda
+    is not receiving "tags" in its SNS messages.
+
+Security Notes:
+    - Tags are only used in DynamoDB key values, never in expressions
+"""
+
+import calendar
+import logging
+import os
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
+
+from boto3.dynamodb.conditions import Key
+
+from src.lib.cache_utils import TTLCache
+from src.lib.timeseries import Resolution, tag_bucket_pk
+
+logger = logging.getLogger(__name__)
+
+SENTIMENT_LABELS = ("positive", "neutral", "negative")
+_LABEL_INDEX = {label: i for i, label in enumerate(SENTIMENT_LABELS)}
+
+# Label counts in SENTIMENT_LABELS order
+LabelCounts = tuple[int, int, int]
+
+TAG_WINDOW_CACHE_TTL_SECONDS = float(
+    os.environ.get("TAG_WINDOW_CACHE_TTL_SECONDS", "300")
+)
+TAG_WINDOW_CACHE_MAX_ENTRIES = 1024
+
+# Finished bins kept per tag+interval: the 7-day trend range plus a day
+MAX_CACHED_WINDOW_SECONDS = 8 * 24 * 3600
+
+_PROJECTION = {"ProjectionExpression": "SK, label_counts"}
+
+_windows = TTLCache(
+    name="tag_windows",
+    max_entries=TAG_WINDOW_CACHE_MAX_ENTRIES,
+    ttl=TAG_WINDOW_CACHE_TTL_SECONDS,
+)
+
+
+@dataclass(frozen=True)
+class _FinishedBins:
+    """Closed bins for one tag and interval.
+
+    Covers [start, end); bins with no articles are absent.
+    """
+
+    start: int
+    end: int
+    bins: dict[int, LabelCounts]
+
+
+def map_tags(tags: list[str], read: Callable[[str], Any]) -> dict[str, Any]:
+    """Run read(tag) for every tag concurrently.
+
+    Args:
+        tags: Tags to read
+        read: Per-tag reader
+
+    Returns:
+        Dict of tag -> result, in tag order
+
+    Raises:
+        The first tag's exception (in tag order), after all reads finish
+    """
+    unique = list(dict.fromkeys(tags))
+    if len(unique) <= 1:
+        return {tag: read(tag) for tag in unique}
+    with ThreadPoolExecutor(max_workers=len(unique)) as executor:
+        futures = {tag: executor.submit(read, tag) for tag in unique}
+        return {tag: future.result() for tag, future in futures.items()}
+
+
+def count_tag_labels(
+    table: Any, tag: str, start_time: str, end_time: str
+) -> LabelCounts:
+    """Count sentiment labels for a tag between two ISO8601 timestamps.
+
+    The window is widened to whole hours, or to whole days when it starts
+    before the hourly buckets' retention. Windows that ended in the past
+    are cached.
+
+    Args:
+        table: DynamoDB time-series Table resource
+        tag: Topic tag
+        start_time: ISO8601 start timestamp (inclusive)
+        end_time: ISO8601 end timestamp (inclusive)
+
+    Returns:
+        (positive, neutral, negative) counts
+
+    Raises:
+        ValueError: If a timestamp is not ISO8601
+    """
+    cache_key = f"counts#{_table_name(table)}#{tag}#{start_time}#{end_time}"
+    start = _epoch(start_time)
+    end = _epoch(end_time)
+    now = int(datetime.now(UTC).timestamp())
+    finished = end < now
+    if finished:
+        cached = _windows.get(cache_key)
+        if cached is not None:
+            return cached
+
+    resolution = Resolution.ONE_HOUR
+    if start < now - resolution.ttl_seconds:
+        resolution = Resolution.TWENTY_FOUR_HOURS
+    width = resolution.duration_seconds
+
+    counts = [0, 0, 0]
+
+    def on_bucket(bucket: dict[str, Any]) -> None:
+        for label, count in bucket.get("label_counts", {}).items():
+            index = _LABEL_INDEX.get(label)
+            if index is not None:
+                counts[index] += int(count)
+
+    _query_buckets(
+        table,
+        Key("PK").eq(tag_bucket_pk(tag, resolution))
+        & Key("SK").between(_iso(start - start % width), _iso(end - end % width)),
+        on_bucket,
+    )
+    result: LabelCounts = (counts[0], counts[1], counts[2])
+    if finished:
+        _windows.set(cache_key, result)
+    return result
+
+
+def read_tag_bins(
+    table: Any, tag: str, bin_seconds: int, start: int, now: int
+) -> dict[int, LabelCounts]:
+    """Sentiment label counts per time bin for a tag.
+
+    Bins are aligned to multiples of bin_seconds since the epoch (UTC), so
+    6h bins start at 00/06/12/18 and 1d bins at midnight.
+
+    Args:
+        table: DynamoDB time-series Table resource
+        tag: Topic tag
+        bin_seconds: Bin width in seconds, a multiple of 3600 (read from
+            daily buckets when a multiple of a day, hourly ones otherwise)
+        start: Epoch seconds; the first bin is the one containing it
+        now: Epoch seconds; the last bin is the open one containing it
+
+    Returns:
+        Dict of bin start (epoch seconds) -> (positive, neutral, negative),
+        for bins with at least one article
+    """
+    resolution = Resolution.ONE_HOUR
+    if bin_seconds % Resolution.TWENTY_FOUR_HOURS.duration_seconds == 0:
+        resolution = Resolution.TWENTY_FOUR_HOURS
+    first = start - start % bin_seconds
+    current = now - now % bin_seconds
+    cache_key = f"bins#{_table_name(table)}#{tag}#{bin_seconds}"
+
+    bins: dict[int, list[int]] = {}
+    cache_start = first
+    query_from = first
+    cached: _FinishedBins | None = _windows.get(cache_key)
+    if cached is not None and cached.start <= first <= cached.end:
+        cache_start = cached.start
+        query_from = cached.end
+        for bin_start, counts in cached.bins.items():
+            bins[bin_start] = list(counts)
+
+    bucket_epochs: dict[str, int] = {}
+
+    def on_bucket(bucket: dict[str, Any]) -> None:
+        epoch = _hour_epoch(bucket.get("SK", ""), bucket_epochs)
+        if epoch is None:
+            return
+        bin_start = epoch - epoch % bin_seconds
+        if bin_start > current:
+            return  # Clock skew: newer than now
+        counts = bins.get(bin_start)
+        for label, count in bucket.get("label_counts", {}).items():
+            index = _LABEL_INDEX.get(label)
+            if index is None:
+                continue
+            if counts is None:
+                counts = bins[bin_start] = [0, 0, 0]
+            counts[index] += int(count)
+
+    _query_buckets(
+        table,
+        Key("PK").eq(tag_bucket_pk(tag, resolution)) & Key("SK").gte(_iso(query_from)),
+        on_bucket,
+    )
+
+    # Everything before the open bin is final
+    cache_start = max(cache_start, current - MAX_CACHED_WINDOW_SECONDS)
+    if current > cache_start:
+        _windows.set(
+            cache_key,
+            _FinishedBins(
+                start=cache_start,
+                end=current,
+                bins={
+                    b: (c[0], c[1], c[2])
+                    for b, c in bins.items()
+                    if cache_start <= b < current
+                },
+            ),
+        )
+
+    return {b: (c[0], c[1], c[2]) for b, c in bins.items() if b >= first}
+
+
+def clear_tag_window_cache() -> None:
+    """Clear cached tag windows. Used in tests."""
+    _windows.clear()
+
+
+def _query_buckets(
+    table: Any,
+    key_condition: Any,
+    on_bucket: Callable[[dict[str, Any]], None],
+) -> None:
+    """Page through a projected tag bucket query, passing each row to on_bucket."""
+    params: dict[str, Any] = {
+        "KeyConditionExpression": key_condition,
+        **_PROJECTION,
+    }
+    while True:
+        response = table.query(**params)
+        for bucket in response.get("Items", []):
+            on_bucket(bucket)
+        last_key = response.get("LastEvaluatedKey")
+        if not last_key:
+            return
+        params["ExclusiveStartKey"] = last_key
+
+
+def _hour_epoch(timestamp: str, memo: dict[str, int]) -> int | None:
+    """Epoch seconds of the UTC hour an ISO8601 timestamp falls in.
+
+    Bucket SKs are UTC; one conversion per distinct hour.
+    """
+    hour = timestamp[:13]
+    epoch = memo.get(hour)
+    if epoch is None:
+        if len(hour) != 13 or hour[4] != "-" or hour[10] != "T":
+            return None
+        try:
+            epoch = calendar.timegm(
+                (
+                    int(hour[0:4]),
+                    int(hour[5:7]),
+                    int(hour[8:10]),
+                    int(hour[11:13]),
+                    0,
+                    0,
+                )
+            )
+        except ValueError:
+            return None
+        memo[hour] = epoch
+    return epoch
+
+
+def _epoch(timestamp: str) -> int:
+    moment = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=UTC)
+    return int(moment.timestamp())
+
+
+def _iso(epoch: int) -> str:
+    return datetime.fromtimestamp(epoch, UTC).isoformat()
+
+
+def _table_name(table: Any) -> str:
+    return str(getattr(table, "name", ""))
@@ -19,6 +19,10 @@ time-series data from DynamoDB with caching support.
 
 Feature 1009 Phase 6 additions:
 - T050: query_batch() for multi-ticker queries in parallel
+
+query_latest_batch() reads the current and previous bucket of many tickers
+with BatchGetItem, for "current value" readers such as the configuration
+sentiment overview.
 """
 
 from __future__ import annotations
@@ -28,16 +32,26 @@ import os
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from decimal import Decimal
 from typing import TYPE_CHECKING, Any
 
 import boto3
+from botocore.exceptions import ClientError
 
-from src.lib.timeseries import Resolution, ResolutionCache, get_global_cache
+from src.lib.timeseries import (
+    Resolution,
+    ResolutionCache,
+    floor_to_bucket,
+    get_global_cache,
+)
 
 logger = logging.getLogger(__name__)
 
+# BatchGetItem accepts at most 100 keys per request
+BATCH_GET_MAX_KEYS = 100
+BATCH_GET_MAX_RETRIES = 3
+
 if TYPE_CHECKING:
     pass
 
@@ -504,11 +518,191 @@ class TimeseriesQueryService:
 
         return results
 
+    def query_latest_batch(
+        self,
+        tickers: list[str],
+        resolution: Resolution,
+    ) -> dict[str, TimeseriesResponse]:
+        """Read the newest buckets for many tickers with BatchGetItem.
+
+        Bucket SKs are wall-clock aligned, so the current and previous bucket
+        keys of every ticker are known up front and can be fetched together
+        (two keys per ticker, chunked to 100 keys per request) instead of one
+        reverse Query per ticker.
+
+        Any complete bucket found this way is the newest complete bucket, so the
+        result matches ``query(latest=True)`` for ``buckets[-1]`` and
+        ``partial_bucket``. Tickers with no complete bucket among the two (no
+        activity yet, or only the open bucket) fall back to a reverse Query,
+        run in parallel like query_batch(). So do the tickers of a chunk whose
+        BatchGetItem fails, so one error does not blank the whole batch.
+
+        Args:
+            tickers: List of stock ticker symbols.
+            resolution: Time resolution for data.
+
+        Returns:
+            Dict mapping ticker symbol to TimeseriesResponse (ascending buckets).
+            Tickers whose fallback query fails return empty buckets.
+        """
+        if not tickers:
+            return {}
+
+        query_start = time.time()
+        current = floor_to_bucket(datetime.now(UTC), resolution)
+        previous = current - timedelta(seconds=resolution.duration_seconds)
+        sks = (previous.isoformat(), current.isoformat())
+
+        keys = [
+            {"PK": f"{ticker}#{resolution.value}", "SK": sk}
+            for ticker in dict.fromkeys(tickers)
+            for sk in sks
+        ]
+        found: dict[str, list[dict[str, Any]]] = {}
+        for i in range(0, len(keys), BATCH_GET_MAX_KEYS):
+            try:
+                items = self._batch_get(keys[i : i + BATCH_GET_MAX_KEYS])
+            except ClientError as e:
+                # Throttled or denied: this chunk's tickers fall back to Query
+                logger.warning(
+                    "BatchGetItem failed for timeseries keys",
+                    extra={
+                        "key_count": len(keys[i : i + BATCH_GET_MAX_KEYS]),
+                        "error_code": e.response.get("Error", {}).get("Code"),
+                    },
+                )
+                continue
+            for item in items:
+                found.setdefault(item["PK"], []).append(item)
+
+        results: dict[str, TimeseriesResponse] = {}
+        fallback: list[str] = []
+        for ticker in dict.fromkeys(tickers):
+            items = sorted(
+                found.get(f"{ticker}#{resolution.value}", []), key=lambda i: i["SK"]
+            )
+            buckets: list[SentimentBucketResponse] = []
+            partial_bucket: SentimentBucketResponse | None = None
+            for item in items:
+                bucket = _item_to_bucket(item)
+                if not bucket.is_partial or _is_bucket_complete(
+                    bucket.timestamp, resolution
+                ):
+                    buckets.append(bucket)
+                else:
+                    partial_bucket = bucket
+
+            if not buckets:
+                fallback.append(ticker)
+                continue
+
+            results[ticker] = TimeseriesResponse(
+                ticker=ticker,
+                resolution=resolution.value,
+                buckets=buckets,
+                partial_bucket=partial_bucket,
+                cache_hit=False,
+                query_time_ms=(time.time() - query_start) * 1000,
+                next_cursor=None,
+                has_more=False,
+            )
+
+        if fallback:
+            results.update(self._query_latest_each(fallback, resolution))
+
+        return results
+
+    def _batch_get(self, keys: list[dict[str, str]]) -> list[dict[str, Any]]:
+        """BatchGetItem one chunk of keys, retrying UnprocessedKeys.
+
+        Keys still unprocessed after BATCH_GET_MAX_RETRIES are dropped; their
+        tickers then fall back to a per-ticker query.
+        """
+        items: list[dict[str, Any]] = []
+        request: dict[str, Any] = {self.table_name: {"Keys": keys}}
+        retry_count = 0
+
+        while request:
+            response = self._dynamodb.batch_get_item(RequestItems=request)
+            items.extend(response.get("Responses", {}).get(self.table_name, []))
+            request = response.get("UnprocessedKeys") or {}
+            if request:
+                retry_count += 1
+                if retry_count > BATCH_GET_MAX_RETRIES:
+                    logger.warning(
+                        "BatchGetItem left unprocessed timeseries keys",
+                        extra={
+                            "unprocessed": len(
+                                request.get(self.table_name, {}).get("Keys", [])
+                            ),
+                        },
+                    )
+                    break
+                time.sleep(0.05 * 2**retry_count)
+
+        return items
+
+    def _query_latest_each(
+        self, tickers: list[str], resolution: Resolution
+    ) -> dict[str, TimeseriesResponse]:
+        """Reverse-query each ticker in parallel (query_latest_batch fallback)."""
+
+        def query_ticker(ticker: str) -> tuple[str, TimeseriesResponse]:
+            try:
+                return ticker, self.query(ticker, resolution, latest=True)
+            except Exception as e:
+                logger.warning(
+                    "Failed to query ticker",
+                    extra={
+                        "ticker": ticker,
+                        "resolution": resolution.value,
+                        "error": str(e),
+                    },
+                )
+                return ticker, TimeseriesResponse(
+                    ticker=ticker,
+                    resolution=resolution.value,
+                    buckets=[],
+                    partial_bucket=None,
+                    cache_hit=False,
+                    query_time_ms=0.0,
+                    next_cursor=None,
+                    has_more=False,
+                )
+
+        with ThreadPoolExecutor(max_workers=min(len(tickers), 10)) as executor:
+            return dict(executor.map(query_ticker, tickers))
+
 
 # Global service instance for Lambda warm invocations
 _global_service: TimeseriesQueryService | None = None
 
 
+def _get_global_service() -> TimeseriesQueryService:
+    """Return the warm-invocation service, creating it on first use.
+
+    Table name is read from TIMESERIES_TABLE environment variable.
+    """
+    global _global_service
+
+    if _global_service is None:
+        table_name = os.environ.get("TIMESERIES_TABLE", "sentiment-timeseries")
+        region = os.environ.get("AWS_REGION", "us-east-1")
+        _global_service = TimeseriesQueryService(
+            table_name=table_name,
+            use_cache=True,
+            region=region,
+        )
+
+    return _global_service
+
+
+def reset_global_service() -> None:
+    """Drop the warm-invocation service. Used in tests."""
+    global _global_service
+    _global_service = None
+
+
 def query_timeseries(
     ticker: str,
     resolution: Resolution,
@@ -536,17 +730,44 @@ def query_timeseries(
     Returns:
         TimeseriesResponse with buckets, metadata, and pagination info.
     """
-    global _global_service
-
-    if _global_service is None:
-        table_name = os.environ.get("TIMESERIES_TABLE", "sentiment-timeseries")
-        region = os.environ.get("AWS_REGION", "us-east-1")
-        _global_service = TimeseriesQueryService(
-            table_name=table_name,
-            use_cache=True,
-            region=region,
-        )
-
-    return _global_service.query(
+    return _get_global_service().query(
         ticker, resolution, start, end, limit, cursor, latest=latest
     )
+
+
+def query_latest_timeseries(
+    tickers: list[str],
+    resolution: Resolution,
+) -> dict[str, TimeseriesResponse]:
+    """Convenience function for TimeseriesQueryService.query_latest_batch().
+
+    Args:
+        tickers: Stock ticker symbols.
+        resolution: Time resolution.
+
+    Returns:
+        Dict mapping ticker symbol to TimeseriesResponse with the newest buckets.
+    """
+    return _get_global_service().query_latest_batch(tickers, resolution)
+
+
+def query_timeseries_batch(
+    tickers: list[str],
+    resolution: Resolution,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    limit: int | None = None,
+) -> dict[str, TimeseriesResponse]:
+    """Convenience function for TimeseriesQueryService.query_batch().
+
+    Args:
+        tickers: Stock ticker symbols.
+        resolution: Time resolution.
+        start: Optional start time.
+        end: Optional end time.
+        limit: Maximum number of buckets per ticker.
+
+    Returns:
+        Dict mapping ticker symbol to TimeseriesResponse (empty buckets on error).
+    """
+    return _get_global_service().query_batch(tickers, resolution, start, end, limit)
@@ -10,6 +10,13 @@ For On-Call Engineers:
     1. Check OHLC data availability for the ticker
     2. Verify enough historical data exists (14+ days)
     3. Check API adapters for rate limits
+    4. Check the "OHLC batch fetch" log for tickers missing at the deadline
+
+    Correlation statistics join the sentiment-timeseries buckets with
+    candles from the persistent OHLC cache at the same resolution, over
+    the sentiment retention window. Null pearson/spearman values mean
+    fewer than MIN_SAMPLES buckets had both sentiment and a price return;
+    check that OHLC candles were cached for that resolution.
 
 Security Notes:
     - OHLC data is public market data
@@ -17,13 +24,26 @@ Security Notes:
 """
 
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
 from pydantic import BaseModel, Field
 
+from src.lambdas.dashboard.timeseries import query_timeseries_batch
+from src.lambdas.shared.cache.ohlc_cache import get_cached_candle_columns
+from src.lambdas.shared.correlation import (
+    AlignedSeries,
+    CorrelationStats,
+    align_sentiment_returns,
+    correlate_batch,
+)
 from src.lambdas.shared.logging_utils import get_safe_error_info, sanitize_for_log
-from src.lambdas.shared.volatility import calculate_atr_result
+from src.lambdas.shared.ohlc_fetcher import fetch_daily_ohlc_batch
+from src.lambdas.shared.volatility import calculate_atr_results
+from src.lib.cache_utils import TTLCache
+from src.lib.timeseries import Resolution
 
 logger = logging.getLogger(__name__)
 
@@ -66,6 +86,15 @@ class CorrelationData(BaseModel):
     interpretation: str
     description: str
 
+    # Sentiment vs. price-return statistics (only when a resolution is requested)
+    resolution: str | None = None
+    sample_size: int = Field(default=0, ge=0)
+    pearson: float | None = Field(default=None, ge=-1.0, le=1.0)
+    spearman: float | None = Field(default=None, ge=-1.0, le=1.0)
+    rolling_pearson: float | None = Field(default=None, ge=-1.0, le=1.0)
+    best_lag: int | None = None  # buckets; > 0 means sentiment leads price
+    best_lag_correlation: float | None = Field(default=None, ge=-1.0, le=1.0)
+
 
 class TickerCorrelation(BaseModel):
     """Correlation data for a single ticker."""
@@ -83,6 +112,26 @@ class CorrelationResponse(BaseModel):
 
 # Constants
 
+# Sentiment resolution -> OHLC cache resolution
+OHLC_RESOLUTIONS = {
+    Resolution.ONE_MINUTE: "1",
+    Resolution.FIVE_MINUTES: "5",
+    Resolution.FIFTEEN_MINUTES: "15",
+    Resolution.THIRTY_MINUTES: "30",
+    Resolution.ONE_HOUR: "60",
+    Resolution.TWENTY_FOUR_HOURS: "D",
+}
+
+# Correlation stats are cached per ticker+resolution for one bucket (a new
+# bucket is the earliest the inputs change), capped for coarse resolutions
+CORRELATION_CACHE_MAX_TTL = int(os.environ.get("CORRELATION_CACHE_MAX_TTL", "3600"))
+CORRELATION_CACHE_MAX_ENTRIES = int(
+    os.environ.get("CORRELATION_CACHE_MAX_ENTRIES", "512")
+)
+_correlation_cache = TTLCache(
+    name="correlation", max_entries=CORRELATION_CACHE_MAX_ENTRIES
+)
+
 TREND_ARROW_MAP = {
     "increasing": "↑",
     "decreasing": "↓",
@@ -111,6 +160,11 @@ def get_volatility_by_configuration(
 ) -> VolatilityResponse:
     """Get ATR volatility data for configuration tickers.
 
+    OHLC for all tickers is fetched concurrently (see
+    shared.ohlc_fetcher): persistent cache first, then Tiingo hedged with
+    Finnhub, within one deadline. Tickers without enough data get a
+    placeholder.
+
     Args:
         config_id: Configuration ID
         tickers: List of ticker symbols
@@ -123,122 +177,44 @@ def get_volatility_by_configuration(
         VolatilityResponse with ATR data
     """
     now = datetime.now(UTC)
+    updated_at = now.isoformat().replace("+00:00", "Z")
     ticker_volatilities = []
 
     # Need at least atr_period + 1 days of data
     days_needed = atr_period + 5
     start_date = now - timedelta(days=days_needed)
 
-    for symbol in tickers:
-        try:
-            # Try Tiingo first, fall back to Finnhub
-            ohlc_data = None
-
-            if tiingo_adapter:
-                try:
-                    ohlc_data = tiingo_adapter.get_ohlc(
-                        symbol,
-                        start_date=start_date,
-                        end_date=now,
-                    )
-                except Exception as e:
-                    logger.warning(
-                        "Failed to get Tiingo OHLC",
-                        extra={
-                            "symbol": sanitize_for_log(symbol),
-                            **get_safe_error_info(e),
-                        },
-                    )
-
-            if not ohlc_data and finnhub_adapter:
-                try:
-                    ohlc_data = finnhub_adapter.get_ohlc(
-                        symbol,
-                        start_date=start_date,
-                        end_date=now,
-                    )
-                except Exception as e:
-                    logger.warning(
-                        "Failed to get Finnhub OHLC",
-                        extra={
-                            "symbol": sanitize_for_log(symbol),
-                            **get_safe_error_info(e),
-                        },
-                    )
-
-            calculated = False
-            if ohlc_data and len(ohlc_data) >= atr_period:
-                # Calculate ATR
-                atr_result = calculate_atr_result(symbol, ohlc_data, period=atr_period)
-
-                if atr_result is not None:
-                    # Get previous ATR for trend calculation
-                    if len(ohlc_data) > atr_period:
-                        previous_ohlc = ohlc_data[:-1]
-                        previous_result = calculate_atr_result(
-                            symbol, previous_ohlc, period=atr_period
-                        )
-                        previous_value = (
-                            previous_result.atr if previous_result else atr_result.atr
-                        )
-                    else:
-                        previous_value = atr_result.atr
-
-                    # Determine trend
-                    trend = _determine_trend(atr_result.atr, previous_value)
-
-                    # Calculate ATR percent (ATR / current price * 100)
-                    current_price = ohlc_data[-1].close
-                    atr_percent = (
-                        (atr_result.atr / current_price) * 100
-                        if current_price > 0
-                        else 0.0
-                    )
-
-                    ticker_volatilities.append(
-                        TickerVolatility(
-                            symbol=symbol,
-                            atr=ATRData(
-                                value=round(atr_result.atr, 2),
-                                percent=round(atr_percent, 2),
-                                period=atr_period,
-                                trend=trend,
-                                trend_arrow=TREND_ARROW_MAP[trend],
-                                previous_value=round(previous_value, 2),
-                            ),
-                            includes_extended_hours=include_extended_hours,
-                            updated_at=now.isoformat().replace("+00:00", "Z"),
-                        )
-                    )
-                    calculated = True
-
-            if not calculated:
-                # Insufficient data or failed calculation, return placeholder
-                ticker_volatilities.append(
-                    TickerVolatility(
-                        symbol=symbol,
-                        atr=ATRData(
-                            value=0.0,
-                            percent=0.0,
-                            period=atr_period,
-                            trend="stable",
-                            trend_arrow="→",
-                            previous_value=0.0,
-                        ),
-                        includes_extended_hours=include_extended_hours,
-                        updated_at=now.isoformat().replace("+00:00", "Z"),
-                    )
-                )
+    # Cache first, then Tiingo hedged with Finnhub, all tickers concurrently
+    ohlc_by_ticker = fetch_daily_ohlc_batch(
+        tickers,
+        start_date=start_date,
+        end_date=now,
+        tiingo_adapter=tiingo_adapter,
+        finnhub_adapter=finnhub_adapter,
+        min_candles=atr_period,
+    )
+    ohlc_by_ticker = {
+        symbol: candles
+        for symbol, candles in ohlc_by_ticker.items()
+        if len(candles) >= atr_period
+    }
+
+    try:
+        atr_results = calculate_atr_results(ohlc_by_ticker, period=atr_period)
+    except Exception as e:
+        logger.error(
+            "Failed to calculate volatility",
+            extra={
+                "ticker_count": len(ohlc_by_ticker),
+                **get_safe_error_info(e),
+            },
+        )
+        atr_results = {}
 
-        except Exception as e:
-            logger.error(
-                "Failed to calculate volatility",
-                extra={
-                    "symbol": sanitize_for_log(symbol),
-                    **get_safe_error_info(e),
-                },
-            )
-            # Add placeholder on error
+    for symbol in tickers:
+        atr_result = atr_results.get(symbol)
+        if atr_result is None:
+            # Insufficient data or failed calculation, return placeholder
             ticker_volatilities.append(
                 TickerVolatility(
                     symbol=symbol,
@@ -251,9 +227,42 @@ def get_volatility_by_configuration(
                         previous_value=0.0,
                     ),
                     includes_extended_hours=include_extended_hours,
-                    updated_at=now.isoformat().replace("+00:00", "Z"),
+                    updated_at=updated_at,
                 )
             )
+            continue
+
+        # Previous ATR comes from the same rolling series
+        previous_value = (
+            atr_result.previous_atr
+            if atr_result.previous_atr is not None
+            else atr_result.atr
+        )
+
+        # Determine trend
+        trend = _determine_trend(atr_result.atr, previous_value)
+
+        # Calculate ATR percent (ATR / current price * 100)
+        current_price = ohlc_by_ticker[symbol][-1].close
+        atr_percent = (
+            (atr_result.atr / current_price) * 100 if current_price > 0 else 0.0
+        )
+
+        ticker_volatilities.append(
+            TickerVolatility(
+                symbol=symbol,
+                atr=ATRData(
+                    value=round(atr_result.atr, 2),
+                    percent=round(atr_percent, 2),
+                    period=atr_period,
+                    trend=trend,
+                    trend_arrow=TREND_ARROW_MAP[trend],
+                    previous_value=round(previous_value, 2),
+                ),
+                includes_extended_hours=include_extended_hours,
+                updated_at=updated_at,
+            )
+        )
 
     logger.info(
         "Retrieved volatility data",
@@ -274,37 +283,44 @@ def get_correlation_data(
     tickers: list[str],
     sentiment_trends: dict[str, str] | None = None,
     volatility_trends: dict[str, str] | None = None,
+    resolution: Resolution | None = None,
 ) -> CorrelationResponse:
     """Get sentiment-volatility correlation data.
 
+    With a resolution, sentiment buckets are aligned with price returns at
+    that resolution and the response carries Pearson/Spearman, rolling and
+    lagged correlation; trend arrows then come from the same data unless
+    given explicitly.
+
     Args:
         config_id: Configuration ID
         tickers: List of ticker symbols
-        sentiment_trends: Dict of symbol -> trend arrow
-        volatility_trends: Dict of symbol -> trend arrow
+        sentiment_trends: Dict of symbol -> trend arrow (overrides computed)
+        volatility_trends: Dict of symbol -> trend arrow (overrides computed)
+        resolution: Resolution to correlate at (None: trend arrows only)
 
     Returns:
         CorrelationResponse with correlation data
     """
-    # Warn if trends are not provided - this causes all tickers to show "stable" which is misleading
-    if sentiment_trends is None:
+    stats: dict[str, CorrelationStats] = {}
+    if resolution is not None:
+        stats = get_correlation_stats(tickers, resolution)
+    elif sentiment_trends is None or volatility_trends is None:
         logger.warning(
-            "get_correlation_data called without sentiment_trends - all tickers will show stable trend",
-            extra={"config_id": sanitize_for_log(config_id[:8] if config_id else "")},
-        )
-    if volatility_trends is None:
-        logger.warning(
-            "get_correlation_data called without volatility_trends - all tickers will show stable trend",
+            "get_correlation_data called without trends or resolution - tickers will show stable trend",
             extra={"config_id": sanitize_for_log(config_id[:8] if config_id else "")},
         )
 
     ticker_correlations = []
 
     for symbol in tickers:
-        # Get trends (default to stable if not provided)
-        # NOTE: Default "→" is a fallback pattern - if you see this in logs, caller should provide real data
-        sentiment_arrow = (sentiment_trends or {}).get(symbol, "→")
-        volatility_arrow = (volatility_trends or {}).get(symbol, "→")
+        ticker_stats = stats.get(symbol)
+        sentiment_arrow = (sentiment_trends or {}).get(symbol) or (
+            TREND_ARROW_MAP[ticker_stats.sentiment_trend] if ticker_stats else "→"
+        )
+        volatility_arrow = (volatility_trends or {}).get(symbol) or (
+            TREND_ARROW_MAP[ticker_stats.volatility_trend] if ticker_stats else "→"
+        )
 
         # Determine interpretation
         interpretation = _get_interpretation(sentiment_arrow, volatility_arrow)
@@ -313,16 +329,26 @@ def get_correlation_data(
             "Analyzing sentiment and volatility trends",
         )
 
-        ticker_correlations.append(
-            TickerCorrelation(
-                symbol=symbol,
-                correlation=CorrelationData(
-                    sentiment_trend=sentiment_arrow,
-                    volatility_trend=volatility_arrow,
-                    interpretation=interpretation,
-                    description=description,
-                ),
+        correlation = CorrelationData(
+            sentiment_trend=sentiment_arrow,
+            volatility_trend=volatility_arrow,
+            interpretation=interpretation,
+            description=description,
+        )
+        if ticker_stats is not None:
+            rolling = [r for r in ticker_stats.rolling_pearson if r is not None]
+            correlation.resolution = resolution.value
+            correlation.sample_size = ticker_stats.sample_size
+            correlation.pearson = _round_corr(ticker_stats.pearson)
+            correlation.spearman = _round_corr(ticker_stats.spearman)
+            correlation.rolling_pearson = _round_corr(rolling[-1] if rolling else None)
+            correlation.best_lag = ticker_stats.best_lag
+            correlation.best_lag_correlation = _round_corr(
+                ticker_stats.best_lag_correlation
             )
+
+        ticker_correlations.append(
+            TickerCorrelation(symbol=symbol, correlation=correlation)
         )
 
     logger.debug(
@@ -339,6 +365,102 @@ def get_correlation_data(
     )
 
 
+def get_correlation_stats(
+    tickers: list[str], resolution: Resolution
+) -> dict[str, CorrelationStats]:
+    """Correlation statistics per ticker, cached per ticker and resolution.
+
+    Tickers missing from the cache are loaded in parallel and computed
+    together in one correlate_batch() pass.
+
+    Args:
+        tickers: Ticker symbols
+        resolution: Resolution of sentiment buckets and candles
+
+    Returns:
+        Ticker -> CorrelationStats (tickers whose data failed to load are
+        omitted; tickers with no aligned buckets are returned but not cached)
+    """
+    results: dict[str, CorrelationStats] = {}
+    missing: list[str] = []
+    for ticker in dict.fromkeys(tickers):
+        cached = _correlation_cache.get(f"{ticker}#{resolution.value}")
+        if cached is not None:
+            results[ticker] = cached
+        else:
+            missing.append(ticker)
+
+    if not missing:
+        return results
+
+    aligned = _load_aligned_series(missing, resolution)
+    ttl = min(resolution.duration_seconds, CORRELATION_CACHE_MAX_TTL)
+    for ticker, ticker_stats in correlate_batch(aligned).items():
+        # An empty series is usually a failed or not-yet-filled read
+        # (the timeseries batch query returns empty buckets on error), so
+        # it is retried on the next request instead of cached
+        if ticker_stats.sample_size > 0:
+            _correlation_cache.set(f"{ticker}#{resolution.value}", ticker_stats, ttl)
+        results[ticker] = ticker_stats
+    return results
+
+
+def clear_correlation_cache() -> None:
+    """Clear cached correlation statistics. Used in tests."""
+    _correlation_cache.clear()
+
+
+def _load_aligned_series(
+    tickers: list[str], resolution: Resolution
+) -> dict[str, AlignedSeries]:
+    """Load sentiment buckets and cached candles and align them per ticker.
+
+    Covers the sentiment retention window of the resolution (the oldest
+    buckets that can exist).
+    """
+    end = datetime.now(UTC)
+    start = end - timedelta(seconds=resolution.ttl_seconds)
+    sentiment = query_timeseries_batch(tickers, resolution, start, end)
+
+    def load_closes(ticker: str) -> tuple[str, Any]:
+        try:
+            return ticker, get_cached_candle_columns(
+                ticker=ticker,
+                source="tiingo",
+                resolution=OHLC_RESOLUTIONS[resolution],
+                start_time=start,
+                end_time=end,
+            )
+        except Exception as e:
+            logger.warning(
+                "Failed to read cached OHLC for correlation",
+                extra={"ticker": sanitize_for_log(ticker), **get_safe_error_info(e)},
+            )
+            return ticker, None
+
+    with ThreadPoolExecutor(max_workers=min(len(tickers), 10)) as executor:
+        columns_by_ticker = dict(executor.map(load_closes, tickers))
+
+    aligned: dict[str, AlignedSeries] = {}
+    for ticker in tickers:
+        columns = columns_by_ticker.get(ticker)
+        response = sentiment.get(ticker)
+        if columns is None or response is None:
+            continue
+        aligned[ticker] = align_sentiment_returns(
+            [datetime.fromisoformat(b.timestamp).timestamp() for b in response.buckets],
+            [b.avg for b in response.buckets],
+            columns.timestamps,
+            columns.close,
+            resolution.duration_seconds,
+        )
+    return aligned
+
+
+def _round_corr(value: float | None) -> float | None:
+    return None if value is None else round(max(-1.0, min(1.0, value)), 4)
+
+
 # Helper functions
 
 
@@ -4,16 +4,70 @@ Provides headline-based deduplication to identify duplicate articles
 across Tiingo and Finnhub sources.
 
 Feature 1010: Parallel Ingestion with Cross-Source Deduplication
+
+Bulk path (upsert_articles_bulk): a re-poll returns mostly articles that
+are already stored, so existence is resolved for the whole batch first
+(a warm-container cache of recently seen items, then chunked
+BatchGetItem for the rest) and only new or changed items are written,
+in parallel. Outcomes match upsert_article_with_source() per article.
+
+For On-Call Engineers:
+    "Bulk article upsert" logs per batch how many keys came from the seen
+    cache vs. BatchGetItem and how many items were written. Unexpected
+    "Bulk upsert condition failed" warnings mean another invocation wrote
+    the same item concurrently; those articles take the per-article path
+    and are still deduplicated correctly.
 """
 
 import hashlib
 import logging
+import os
 import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any
+from typing import Any, NamedTuple
+
+from src.lib.cache_utils import TTLCache
 
 logger = logging.getLogger(__name__)
 
+# BatchGetItem accepts at most 100 keys per request
+BATCH_GET_MAX_KEYS = 100
+BATCH_GET_MAX_RETRIES = 3
+
+BULK_WRITE_MAX_WORKERS = int(os.environ.get("DEDUP_WRITE_MAX_WORKERS", "8"))
+
+# Items seen in this container: "source_id#timestamp" -> sources. Items
+# live TTL_DAYS (30) and sources are only ever added, so a cached entry
+# can be stale only by missing a source; the conditional write catches it.
+SEEN_CACHE_TTL_SECONDS = int(os.environ.get("DEDUP_SEEN_CACHE_TTL_SECONDS", "21600"))
+SEEN_CACHE_MAX_ENTRIES = int(os.environ.get("DEDUP_SEEN_CACHE_MAX_ENTRIES", "20000"))
+_seen_items = TTLCache(
+    name="dedup_seen",
+    max_entries=SEEN_CACHE_MAX_ENTRIES,
+    ttl=SEEN_CACHE_TTL_SECONDS,
+)
+
+
+class ArticleUpsert(NamedTuple):
+    """Arguments of one upsert_article_with_source() call."""
+
+    dedup_key: str
+    timestamp: str
+    source: str
+    attribution: dict[str, Any]
+    item_data: dict[str, Any]
+
+
+def _seen_key(key: tuple[str, str]) -> str:
+    return f"{key[0]}#{key[1]}"
+
+
+def clear_seen_cache() -> None:
+    """Clear the seen-items cache. Used in tests."""
+    _seen_items.clear()
+
 
 def normalize_headline(headline: str) -> str:
     """Normalize headline for cross-source comparison.
@@ -276,3 +330,287 @@ def upsert_article_with_source(
 
         # Re-raise other errors
         raise
+
+
+def upsert_articles_bulk(
+    table: Any,
+    articles: list[ArticleUpsert],
+    max_workers: int = BULK_WRITE_MAX_WORKERS,
+) -> list[str]:
+    """Upsert many articles, writing only new or changed items.
+
+    Equivalent to calling upsert_article_with_source() for each article in
+    order, but:
+    1. Entries for the same item (source_id, timestamp) are grouped.
+    2. Which items exist, and with which sources, is resolved for the
+       whole batch from the seen-items cache and chunked BatchGetItem.
+    3. Items already holding every source in the batch are not written.
+       New items get one conditional put carrying all their batch
+       sources; existing items get one conditional update adding them.
+       Writes run in parallel with bounded concurrency.
+    4. A write whose condition fails (concurrent writer) or whose item
+       could not be resolved falls back to upsert_article_with_source().
+
+    Args:
+        table: DynamoDB table resource
+        articles: Upserts in processing order
+        max_workers: Maximum concurrent writes
+
+    Returns:
+        "created", "updated" or "duplicate" for each article, in order
+
+    Raises:
+        ClientError: On DynamoDB write errors (other than condition check),
+            after all other writes have completed
+    """
+    outcomes = [""] * len(articles)
+    groups: dict[tuple[str, str], list[int]] = {}
+    for i, article in enumerate(articles):
+        key = (f"dedup:{article.dedup_key}", article.timestamp)
+        groups.setdefault(key, []).append(i)
+    if not groups:
+        return outcomes
+
+    existing, unresolved, cache_hits = _resolve_existing(table, list(groups))
+
+    tasks = []
+    for key, indexes in groups.items():
+        if key in unresolved:
+            tasks.append((_upsert_each, key, indexes, None))
+            continue
+        sources = existing.get(key)
+        pending_sources: set[str] = set()
+        to_write = []
+        for i in indexes:
+            source = articles[i].source
+            if (sources is not None and source in sources) or source in pending_sources:
+                outcomes[i] = "duplicate"
+            else:
+                pending_sources.add(source)
+                to_write.append(i)
+        if to_write:
+            write = _create_item if sources is None else _add_sources
+            tasks.append((write, key, to_write, sources))
+
+    errors: list[Exception] = []
+
+    def run(task: tuple) -> None:
+        write, key, indexes, sources = task
+        try:
+            for i, outcome in write(table, articles, key, indexes, sources).items():
+                outcomes[i] = outcome
+        except Exception as e:
+            errors.append(e)
+
+    if len(tasks) > 1 and max_workers > 1:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(tasks))) as executor:
+            list(executor.map(run, tasks))
+    else:
+        for task in tasks:
+            run(task)
+
+    logger.info(
+        "Bulk article upsert",
+        extra={
+            "articles": len(articles),
+            "items": len(groups),
+            "seen_cache_hits": cache_hits,
+            "batch_get_keys": len(groups) - cache_hits,
+            "writes": len(tasks),
+            "new_items": outcomes.count("created"),
+            "sources_added": outcomes.count("updated"),
+            "duplicates_skipped": outcomes.count("duplicate"),
+        },
+    )
+
+    if errors:
+        raise errors[0]
+    return outcomes
+
+
+def _resolve_existing(
+    table: Any, keys: list[tuple[str, str]]
+) -> tuple[dict[tuple[str, str], set[str]], set[tuple[str, str]], int]:
+    """Find which items exist and their sources.
+
+    Returns:
+        (existing key -> sources, keys left unresolved, seen-cache hits)
+    """
+    existing: dict[tuple[str, str], set[str]] = {}
+    to_fetch = []
+    for key in keys:
+        cached = _seen_items.get(_seen_key(key))
+        if cached is not None:
+            existing[key] = set(cached)
+        else:
+            to_fetch.append(key)
+    cache_hits = len(keys) - len(to_fetch)
+
+    unresolved: set[tuple[str, str]] = set()
+    for start in range(0, len(to_fetch), BATCH_GET_MAX_KEYS):
+        chunk = to_fetch[start : start + BATCH_GET_MAX_KEYS]
+        items, unprocessed = _batch_get_sources(table, chunk)
+        for item in items:
+            key = (item["source_id"], item["timestamp"])
+            existing[key] = set(item.get("sources") or [])
+            _seen_items.set(_seen_key(key), frozenset(existing[key]))
+        unresolved.update(unprocessed)
+    return existing, unresolved, cache_hits
+
+
+def _batch_get_sources(
+    table: Any, keys: list[tuple[str, str]]
+) -> tuple[list[dict[str, Any]], list[tuple[str, str]]]:
+    """BatchGetItem one chunk, retrying UnprocessedKeys.
+
+    Returns:
+        (items found, keys still unprocessed after retries)
+    """
+    items: list[dict[str, Any]] = []
+    request: dict[str, Any] = {
+        table.name: {
+            "Keys": [{"source_id": sid, "timestamp": ts} for sid, ts in keys],
+            "ProjectionExpression": "source_id, #ts, sources",
+            "ExpressionAttributeNames": {"#ts": "timestamp"},
+        }
+    }
+    retry_count = 0
+
+    while True:
+        try:
+            response = table.meta.client.batch_get_item(RequestItems=request)
+        except Exception as e:
+            logger.warning(
+                "Bulk dedup lookup failed, using per-article upserts",
+                extra={"error_type": type(e).__name__, "keys": len(keys)},
+            )
+            return items, [
+                (k["source_id"], k["timestamp"]) for k in request[table.name]["Keys"]
+            ]
+        items.extend(response.get("Responses", {}).get(table.name, []))
+        unprocessed = response.get("UnprocessedKeys", {}).get(table.name)
+        if not unprocessed:
+            return items, []
+        retry_count += 1
+        if retry_count > BATCH_GET_MAX_RETRIES:
+            return items, [
+                (k["source_id"], k["timestamp"]) for k in unprocessed["Keys"]
+            ]
+        request = {table.name: unprocessed}
+        time.sleep(0.05 * 2**retry_count)
+
+
+def _is_condition_failure(error: Exception) -> bool:
+    response = getattr(error, "response", None) or {}
+    return response.get("Error", {}).get("Code") == "ConditionalCheckFailedException"
+
+
+def _create_item(
+    table: Any,
+    articles: list[ArticleUpsert],
+    key: tuple[str, str],
+    indexes: list[int],
+    sources: set[str] | None,
+) -> dict[int, str]:
+    """Create a new item carrying every batch source in one put."""
+    source_id, timestamp = key
+    first = articles[indexes[0]]
+    now = datetime.now().isoformat()
+    item = {
+        "source_id": source_id,
+        "timestamp": timestamp,
+        "dedup_key": first.dedup_key,
+        "sources": [articles[i].source for i in indexes],
+        "source_attribution": {
+            articles[i].source: articles[i].attribution for i in indexes
+        },
+        "created_at": now,
+        "updated_at": now,
+        **first.item_data,
+    }
+    try:
+        table.put_item(
+            Item=item,
+            ConditionExpression="attribute_not_exists(source_id)",
+        )
+    except Exception as e:
+        if not _is_condition_failure(e):
+            raise
+        logger.warning(
+            "Bulk upsert condition failed, retrying per article",
+            extra={"dedup_key": first.dedup_key[:8]},
+        )
+        return _upsert_each(table, articles, key, indexes, sources)
+
+    _seen_items.set(_seen_key(key), frozenset(item["sources"]))
+    return {i: "created" if i == indexes[0] else "updated" for i in indexes}
+
+
+def _add_sources(
+    table: Any,
+    articles: list[ArticleUpsert],
+    key: tuple[str, str],
+    indexes: list[int],
+    sources: set[str] | None,
+) -> dict[int, str]:
+    """Add the batch's new sources to an existing item in one update."""
+    source_id, timestamp = key
+    names: dict[str, str] = {}
+    values: dict[str, Any] = {
+        ":new_sources": [articles[i].source for i in indexes],
+        ":empty_list": [],
+        ":now": datetime.now().isoformat(),
+    }
+    sets = ["sources = list_append(if_not_exists(sources, :empty_list), :new_sources)"]
+    conditions = ["attribute_exists(source_id)"]
+    for n, i in enumerate(indexes):
+        names[f"#src{n}"] = articles[i].source
+        values[f":attr{n}"] = articles[i].attribution
+        values[f":src{n}"] = articles[i].source
+        sets.append(f"source_attribution.#src{n} = :attr{n}")
+        conditions.append(f"NOT contains(sources, :src{n})")
+    sets.append("updated_at = :now")
+
+    try:
+        table.update_item(
+            Key={"source_id": source_id, "timestamp": timestamp},
+            UpdateExpression="SET " + ", ".join(sets),
+            ExpressionAttributeNames=names,
+            ExpressionAttributeValues=values,
+            ConditionExpression=" AND ".join(conditions),
+        )
+    except Exception as e:
+        if not _is_condition_failure(e):
+            raise
+        logger.warning(
+            "Bulk upsert condition failed, retrying per article",
+            extra={"dedup_key": articles[indexes[0]].dedup_key[:8]},
+        )
+        return _upsert_each(table, articles, key, indexes, sources)
+
+    _seen_items.set(
+        _seen_key(key), frozenset((sources or set()) | set(values[":new_sources"]))
+    )
+    return dict.fromkeys(indexes, "updated")
+
+
+def _upsert_each(
+    table: Any,
+    articles: list[ArticleUpsert],
+    key: tuple[str, str],
+    indexes: list[int],
+    sources: set[str] | None,
+) -> dict[int, str]:
+    """Per-article fallback: upsert_article_with_source() in order."""
+    _seen_items.invalidate(_seen_key(key))
+    return {
+        i: upsert_article_with_source(
+            table,
+            articles[i].dedup_key,
+            articles[i].timestamp,
+            articles[i].source,
+            articles[i].attribution,
+            articles[i].item_data,
+        )
+        for i in indexes
+    }
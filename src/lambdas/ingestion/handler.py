@@ -54,8 +54,12 @@ For Developers:
     7. Only publish SNS for newly created articles (not updates)
     8. Emit ingestion and collision metrics to CloudWatch
 
+    Steps 5-7 stream: each source is stored in chunks as soon as its fetch
+    completes and SNS batches go out as soon as 10 new articles are stored.
+
     Key modules:
     - parallel_fetcher.py: ThreadPoolExecutor-based concurrent fetching
+    - pipeline.py: Bounded-queue stages from fetched articles to SNS publish
     - dedup.py: Headline normalization, dedup key generation, atomic upsert
     - metrics.py: IngestionMetrics for collision rate tracking
 
@@ -71,6 +75,7 @@ import json
 import logging
 import os
 import time
+from collections.abc import Iterator
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
@@ -89,13 +94,16 @@ from src.lambdas.ingestion.alerting import (
     create_alert_publisher,
 )
 from src.lambdas.ingestion.dedup import (
+    ArticleUpsert,
     build_source_attribution,
     generate_dedup_key,
     normalize_headline,
     upsert_article_with_source,
+    upsert_articles_bulk,
 )
 from src.lambdas.ingestion.metrics import IngestionMetrics
 from src.lambdas.ingestion.parallel_fetcher import ParallelFetcher
+from src.lambdas.ingestion.pipeline import IngestionPipeline, PipelineResult
 from src.lambdas.ingestion.self_healing import run_self_healing_check
 from src.lambdas.shared.adapters.base import (
     AdapterError,
@@ -111,6 +119,7 @@ from src.lambdas.shared.logging_utils import (
     get_safe_error_info,
     sanitize_for_log,
 )
+from src.lambdas.shared.metric_counters import CounterBatch, get_counters_table
 from src.lambdas.shared.quota_tracker import QuotaTracker
 from src.lambdas.shared.secrets import get_api_key
 from src.lib.metrics import emit_metric, emit_metrics_batch
@@ -294,14 +303,15 @@ def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
             sources_affected=sources_list,
         )
 
-        # DFA-002: Collect messages for batch publishing
+        # DFA-002: Collect messages for batch publishing (sequential mode)
         pending_sns_messages: list[dict[str, Any]] = []
+        pipeline_result: PipelineResult | None = None
 
         try:
             # Feature 1010: Use parallel mode if enabled
             if PARALLEL_INGESTION_ENABLED:
                 logger.info("Using parallel ingestion mode")
-                parallel_messages, parallel_summary, parallel_errors = _parallel_ingest(
+                pipeline_result, parallel_summary, parallel_errors = _parallel_ingest(
                     tickers=tickers,
                     tiingo_adapter=tiingo_adapter,
                     finnhub_adapter=finnhub_adapter,
@@ -311,10 +321,11 @@ def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
                     table=table,
                     config=config,
                     failure_tracker=failure_tracker,
+                    sns_client=sns_client,
                 )
 
-                # Merge parallel results into main summary
-                pending_sns_messages.extend(parallel_messages)
+                # Merge parallel results into main summary (the pipeline has
+                # already published its SNS messages)
                 summary["tiingo_articles"] = parallel_summary["tiingo_articles"]
                 summary["finnhub_articles"] = parallel_summary["finnhub_articles"]
                 summary["new_items"] = parallel_summary["new_items"]
@@ -348,14 +359,14 @@ def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
                                 ticker_stats["tiingo"] = len(articles)
                                 summary["tiingo_articles"] += len(articles)
 
-                                # Process each article (collect SNS messages)
-                                for article in articles:
-                                    sns_msg = _process_article(
-                                        article=article,
-                                        source="tiingo",
-                                        table=table,
-                                        model_version=config["model_version"],
-                                    )
+                                # Process all articles (collect SNS messages)
+                                sns_msgs = _process_articles(
+                                    articles=articles,
+                                    source="tiingo",
+                                    table=table,
+                                    model_version=config["model_version"],
+                                )
+                                for sns_msg in sns_msgs:
                                     if sns_msg is not None:
                                         ticker_stats["new"] += 1
                                         summary["new_items"] += 1
@@ -420,14 +431,14 @@ def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
                                 ticker_stats["finnhub"] = len(articles)
                                 summary["finnhub_articles"] += len(articles)
 
-                                # Process each article (collect SNS messages)
-                                for article in articles:
-                                    sns_msg = _process_article(
-                                        article=article,
-                                        source="finnhub",
-                                        table=table,
-                                        model_version=config["model_version"],
-                                    )
+                                # Process all articles (collect SNS messages)
+                                sns_msgs = _process_articles(
+                                    articles=articles,
+                                    source="finnhub",
+                                    table=table,
+                                    model_version=config["model_version"],
+                                )
+                                for sns_msg in sns_msgs:
                                     if sns_msg is not None:
                                         ticker_stats["new"] += 1
                                         summary["new_items"] += 1
@@ -488,6 +499,16 @@ def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
                     summary["tickers_processed"] += 1
                     per_ticker_stats[ticker] = ticker_stats
 
+            # One SNS message per newly created item: count them into the
+            # dashboard's materialized counters before publishing
+            if pending_sns_messages:
+                counters = CounterBatch()
+                for msg in pending_sns_messages:
+                    counters.record_ingested(
+                        msg["body"]["timestamp"], msg["body"]["matched_tickers"]
+                    )
+                counters.flush(get_counters_table())
+
             # DFA-002: Batch publish all collected SNS messages
             if pending_sns_messages:
                 published_count = _publish_sns_batch(
@@ -538,7 +559,7 @@ def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
         execution_time_ms = (time.perf_counter() - start_time) * 1000
 
         # Emit metrics
-        _emit_summary_metrics(summary, execution_time_ms)
+        _emit_summary_metrics(summary, execution_time_ms, pipeline_result)
 
         logger.info(
             "Financial ingestion completed",
@@ -971,6 +992,59 @@ def _process_article(
     Returns:
         SNS message dict if article is new, None if duplicate or updated
     """
+    upsert = _build_article_upsert(article, source)
+
+    # Feature 1010: Upsert with cross-source dedup
+    result = upsert_article_with_source(
+        table=table,
+        dedup_key=upsert.dedup_key,
+        timestamp=upsert.timestamp,
+        source=source,
+        attribution=upsert.attribution,
+        item_data=upsert.item_data,
+    )
+    return _article_sns_message(upsert, result, model_version)
+
+
+def _process_articles(
+    articles: list[NewsArticle],
+    source: str,
+    table: Any,
+    model_version: str,
+) -> list[dict[str, Any] | None]:
+    """Process a batch of articles from one source with one bulk upsert.
+
+    Same outcome per article as _process_article(), but existing items are
+    resolved for the whole batch and only new or changed items are
+    written (see upsert_articles_bulk), so a re-poll of mostly duplicate
+    articles costs a few BatchGetItem calls instead of a write per article.
+
+    Args:
+        articles: NewsArticle objects
+        source: Source name (tiingo or finnhub)
+        table: DynamoDB table resource
+        model_version: Current model version
+
+    Returns:
+        SNS message dict (new article) or None, per article in order
+    """
+    upserts = [_build_article_upsert(article, source) for article in articles]
+    return _store_upserts(table, upserts, model_version)
+
+
+def _store_upserts(
+    table: Any, upserts: list[ArticleUpsert], model_version: str
+) -> list[dict[str, Any] | None]:
+    """Bulk upsert built articles; SNS message (new article) or None per upsert."""
+    results = upsert_articles_bulk(table, upserts)
+    return [
+        _article_sns_message(upsert, result, model_version)
+        for upsert, result in zip(upserts, results, strict=True)
+    ]
+
+
+def _build_article_upsert(article: NewsArticle, source: str) -> ArticleUpsert:
+    """Build the dedup key, source attribution and item data for an article."""
     # Feature 1010: Generate cross-source dedup key from headline + date
     headline = article.title or ""
     dedup_key = generate_dedup_key(headline, article.published_at)
@@ -1008,43 +1082,46 @@ def _process_article(
         },
     }
 
-    # Feature 1010: Upsert with cross-source dedup
-    timestamp = article.published_at.isoformat()
-    result = upsert_article_with_source(
-        table=table,
+    return ArticleUpsert(
         dedup_key=dedup_key,
-        timestamp=timestamp,
+        timestamp=article.published_at.isoformat(),
         source=source,
         attribution=attribution,
         item_data=item_data,
     )
 
+
+def _article_sns_message(
+    upsert: ArticleUpsert, result: str, model_version: str
+) -> dict[str, Any] | None:
+    """SNS message for a newly created article, None otherwise."""
     # Only publish SNS for new articles (not updates or duplicates)
     if result != "created":
         logger.debug(
             "Article dedup result",
             extra={
                 "result": result,
-                "source": sanitize_for_log(source),
-                "dedup_key": dedup_key[:8],  # Truncate for logging
+                "source": sanitize_for_log(upsert.source),
+                "dedup_key": upsert.dedup_key[:8],  # Truncate for logging
             },
         )
         return None
 
     # Feature 1010: Use dedup-based source_id for SNS message
-    source_id = f"dedup:{dedup_key}"
+    source_id = f"dedup:{upsert.dedup_key}"
 
     # Return message for batch publishing (DFA-002 optimization)
     return {
-        "source_type": source,
+        "source_type": upsert.source,
         "body": {
             "source_id": source_id,
-            "source_type": source,
-            "sources": [source],  # Feature 1010: Track sources
-            "text_for_analysis": text_for_analysis,
+            "source_type": upsert.source,
+            "sources": [upsert.source],  # Feature 1010: Track sources
+            "text_for_analysis": upsert.item_data["text_for_analysis"],
             "model_version": model_version,
-            "matched_tickers": article.tickers,
-            "timestamp": timestamp,
+            "matched_tickers": upsert.item_data["matched_tickers"],
+            "tags": upsert.item_data["metadata"]["tags"],
+            "timestamp": upsert.timestamp,
         },
     }
 
@@ -1178,12 +1255,17 @@ def _publish_sns_batch(
     return success_count
 
 
-def _emit_summary_metrics(summary: dict[str, int], execution_time_ms: float) -> None:
+def _emit_summary_metrics(
+    summary: dict[str, int],
+    execution_time_ms: float,
+    pipeline_result: PipelineResult | None = None,
+) -> None:
     """Emit all summary metrics to CloudWatch.
 
     Args:
         summary: Summary counters dict
         execution_time_ms: Total execution time
+        pipeline_result: Streaming pipeline timings (parallel mode only)
     """
     metrics = [
         {
@@ -1223,6 +1305,24 @@ def _emit_summary_metrics(summary: dict[str, int], execution_time_ms: float) ->
             {"name": "IngestionErrors", "value": summary["errors"], "unit": "Count"}
         )
 
+    if pipeline_result is not None:
+        for stage, stage_ms in pipeline_result.stage_ms.items():
+            metrics.append(
+                {
+                    "name": f"IngestionStage{stage.capitalize()}Ms",
+                    "value": stage_ms,
+                    "unit": "Milliseconds",
+                }
+            )
+        if pipeline_result.first_publish_ms is not None:
+            metrics.append(
+                {
+                    "name": "FirstPublishMs",
+                    "value": pipeline_result.first_publish_ms,
+                    "unit": "Milliseconds",
+                }
+            )
+
     emit_metrics_batch(metrics)
 
 
@@ -1237,12 +1337,18 @@ def _parallel_ingest(
     table: Any,
     config: dict[str, Any],
     failure_tracker: Any,
-) -> tuple[list[dict[str, Any]], dict[str, int], list[dict[str, Any]]]:
-    """Execute parallel ingestion using ParallelFetcher.
+    sns_client: Any,
+) -> tuple[PipelineResult, dict[str, int], list[dict[str, Any]]]:
+    """Execute parallel ingestion using ParallelFetcher and IngestionPipeline.
 
     Feature 1010: Fetches from Tiingo and Finnhub concurrently with
     cross-source deduplication and collision metrics.
 
+    Articles stream through IngestionPipeline: each source is stored in
+    chunks as soon as its fetch completes, and SNS batches are published
+    as soon as 10 new articles are stored, instead of after everything
+    has been fetched and stored.
+
     Args:
         tickers: List of ticker symbols
         tiingo_adapter: Tiingo API adapter
@@ -1253,11 +1359,11 @@ def _parallel_ingest(
         table: DynamoDB table
         config: Configuration dict
         failure_tracker: Failure tracker for alerting
+        sns_client: SNS client for publishing new articles
 
     Returns:
-        Tuple of (pending_sns_messages, summary_dict, errors_list)
+        Tuple of (pipeline_result, summary_dict, errors_list)
     """
-    pending_sns_messages: list[dict[str, Any]] = []
     summary = {
         "tiingo_articles": 0,
         "finnhub_articles": 0,
@@ -1280,8 +1386,49 @@ def _parallel_ingest(
         quota_tracker=quota_tracker,
     )
 
-    # Fetch from all sources in parallel
-    results = fetcher.fetch_all_sources(tickers)
+    # One SNS message per newly created item: count them into the
+    # dashboard's materialized counters
+    counters = CounterBatch()
+    fetched_sources: list[str] = []
+
+    def fetched() -> Iterator[tuple[str, list[NewsArticle]]]:
+        for source, articles in fetcher.iter_all_sources(tickers):
+            summary[f"{source}_articles"] = len(articles)
+            if articles:
+                fetched_sources.append(source)
+            yield source, articles
+
+    def on_stored(sns_msg: dict[str, Any] | None) -> None:
+        if sns_msg is not None:
+            counters.record_ingested(
+                sns_msg["body"]["timestamp"], sns_msg["body"]["matched_tickers"]
+            )
+            # Feature 1010: Track new article stored
+            ingestion_metrics.record_stored()
+        else:
+            # Feature 1010: Track collision (duplicate from cross-source)
+            ingestion_metrics.record_collision()
+
+    pipeline = IngestionPipeline(
+        normalize=lambda articles, source: [
+            _build_article_upsert(article, source) for article in articles
+        ],
+        store=lambda upserts: _store_upserts(table, upserts, config["model_version"]),
+        publish=lambda messages: _publish_sns_batch(
+            sns_client=sns_client,
+            sns_topic_arn=config["sns_topic_arn"],
+            messages=messages,
+        ),
+        on_stored=on_stored,
+    )
+    try:
+        result = pipeline.run(fetched())
+    finally:
+        counters.flush(get_counters_table())
+
+    summary["new_items"] = result.new_items
+    summary["duplicates_skipped"] = result.duplicates_skipped
+
     metrics = fetcher.get_metrics()
     fetch_errors = fetcher.get_errors()
 
@@ -1310,52 +1457,9 @@ def _parallel_ingest(
         errors.append({"source": source, "error": error.get("error")})
         summary["errors"] += 1
 
-    # Process Tiingo articles
-    tiingo_articles = results.get("tiingo", [])
-    summary["tiingo_articles"] = len(tiingo_articles)
-    for article in tiingo_articles:
-        sns_msg = _process_article(
-            article=article,
-            source="tiingo",
-            table=table,
-            model_version=config["model_version"],
-        )
-        if sns_msg is not None:
-            summary["new_items"] += 1
-            pending_sns_messages.append(sns_msg)
-            # Feature 1010: Track new article stored
-            ingestion_metrics.record_stored()
-        else:
-            summary["duplicates_skipped"] += 1
-            # Feature 1010: Track collision (duplicate from cross-source)
-            ingestion_metrics.record_collision()
-
-    # Record Tiingo success if articles were fetched
-    if tiingo_articles:
-        failure_tracker.record_success()
-
-    # Process Finnhub articles
-    finnhub_articles = results.get("finnhub", [])
-    summary["finnhub_articles"] = len(finnhub_articles)
-    for article in finnhub_articles:
-        sns_msg = _process_article(
-            article=article,
-            source="finnhub",
-            table=table,
-            model_version=config["model_version"],
-        )
-        if sns_msg is not None:
-            summary["new_items"] += 1
-            pending_sns_messages.append(sns_msg)
-            # Feature 1010: Track new article stored
-            ingestion_metrics.record_stored()
-        else:
-            summary["duplicates_skipped"] += 1
-            # Feature 1010: Track collision (duplicate from cross-source)
-            ingestion_metrics.record_collision()
-
-    # Record Finnhub success if articles were fetched
-    if finnhub_articles:
+    # Record success per source that fetched articles (after the failures,
+    # so a healthy source resets the consecutive-failure count)
+    for _source in fetched_sources:
         failure_tracker.record_success()
 
     # Feature 1010: Finalize and publish collision metrics
@@ -1381,4 +1485,4 @@ def _parallel_ingest(
     # Publish collision metrics to CloudWatch
     ingestion_metrics.publish_to_cloudwatch()
 
-    return pending_sns_messages, summary, errors
+    return result, summary, errors
@@ -8,6 +8,7 @@ Feature 1010: Parallel Ingestion with Cross-Source Deduplication
 
 import logging
 import time
+from collections.abc import Iterator
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import UTC, datetime, timedelta
 from typing import Any
@@ -95,6 +96,26 @@ class ParallelFetcher:
             Dict mapping source name to list of articles:
             {"tiingo": [...], "finnhub": [...]}
         """
+        for _source, _articles in self.iter_all_sources(tickers):
+            pass
+        return self._results
+
+    def iter_all_sources(
+        self, tickers: list[str]
+    ) -> Iterator[tuple[str, list[NewsArticle]]]:
+        """Fetch articles from all sources in parallel, yielding as each completes.
+
+        Lets the caller start storing one source's articles while the other
+        source is still being fetched. A failed source is recorded in
+        get_errors() and not yielded. Metrics are complete once the
+        iterator is exhausted.
+
+        Args:
+            tickers: List of ticker symbols to fetch
+
+        Yields:
+            (source name, articles) per successful source
+        """
         self._start_time = time.time()
         self._results = {"tiingo": [], "finnhub": []}
         self._errors = []
@@ -127,13 +148,6 @@ class ParallelFetcher:
                 source = futures[future]
                 try:
                     articles = future.result()
-                    self._results[source] = articles
-                    self._metrics.set(f"{source}_count", len(articles))
-                    self._record_success(source)
-                    logger.debug(
-                        "Parallel fetch completed",
-                        extra={"source": source, "count": len(articles)},
-                    )
                 except Exception as e:
                     self._results[source] = []
                     self._metrics.set(f"{source}_count", 0)
@@ -167,6 +181,16 @@ class ParallelFetcher:
                         dimensions={"FailurePath": "parallel_fetcher_aggregate"},
                         namespace="SentimentAnalyzer/Reliability",
                     )
+                    continue
+
+                self._results[source] = articles
+                self._metrics.set(f"{source}_count", len(articles))
+                self._record_success(source)
+                logger.debug(
+                    "Parallel fetch completed",
+                    extra={"source": source, "count": len(articles)},
+                )
+                yield source, articles
 
         self._end_time = time.time()
 
@@ -175,8 +199,6 @@ class ParallelFetcher:
         self._metrics.set("total_count", total)
         self._metrics.set("duration_ms", self._get_duration_ms())
 
-        return self._results
-
     def _can_fetch_tiingo(self) -> bool:
         """Check if Tiingo fetch is allowed."""
         if not self._tiingo_breaker.can_execute():
@@ -0,0 +1,284 @@
+"""Streaming ingestion pipeline from fetched articles to SNS publish.
+
+Stages, connected by bounded queues:
+
+    fetch ──> normalize/dedup ──> store (N workers) ──> collect ──> publish (N workers)
+
+- fetch: the caller's iterator of (source, articles), e.g.
+  ParallelFetcher.iter_all_sources(), yielding each source as it completes
+- normalize/dedup: splits a source's articles into chunks and builds the
+  dedup upserts for each chunk
+- store: writes each chunk (bulk conditional upsert) and turns the outcomes
+  into SNS messages for new articles
+- collect: single thread that tallies outcomes and cuts SNS batches as
+  soon as SNS_BATCH_SIZE messages are ready
+- publish: sends each batch with SNS PublishBatch
+
+Each queue holds at most QUEUE_MAXSIZE entries, so a slow stage blocks the
+one before it (backpressure) instead of letting work pile up in memory. The
+first SNS batch goes out while later chunks are still being stored.
+
+For On-Call Engineers:
+    Per-stage busy time is returned in PipelineResult.stage_ms and emitted
+    as IngestionStage<Stage>Ms metrics; FirstPublishMs is the time from
+    pipeline start to the first successful batch. A store failure stops
+    nothing else: the remaining chunks still go through, and the first
+    error is re-raised once the pipeline has drained.
+"""
+
+import logging
+import os
+import threading
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+from src.lib.threading_utils import ThreadSafeQueue
+
+logger = logging.getLogger(__name__)
+
+# Articles per store chunk (one bulk upsert each)
+STORE_CHUNK_SIZE = int(os.environ.get("INGESTION_STORE_CHUNK_SIZE", "25"))
+STORE_WORKERS = int(os.environ.get("INGESTION_STORE_WORKERS", "2"))
+PUBLISH_WORKERS = int(os.environ.get("INGESTION_PUBLISH_WORKERS", "2"))
+
+# Entries per inter-stage queue before the producing stage blocks
+QUEUE_MAXSIZE = int(os.environ.get("INGESTION_QUEUE_MAXSIZE", "4"))
+
+# SNS batch limit (AWS maximum)
+SNS_BATCH_SIZE = 10
+
+STAGES = ("fetch", "normalize", "store", "publish")
+
+# Queue sentinel telling a worker to exit
+_DONE = object()
+
+
+@dataclass
+class PipelineResult:
+    """Outcome of one pipeline run."""
+
+    new_items: int = 0
+    duplicates_skipped: int = 0
+    published: int = 0
+    batches: int = 0
+    first_publish_ms: float | None = None
+    stage_ms: dict[str, float] = field(default_factory=dict)
+
+
+class IngestionPipeline:
+    """Runs fetched articles through normalize → store → publish concurrently.
+
+    The stage functions are injected so this module stays independent of
+    DynamoDB, SNS and the article schema:
+
+        pipeline = IngestionPipeline(
+            normalize=lambda articles, source: [...],  # -> upserts
+            store=lambda upserts: [...],  # -> SNS message or None, per upsert
+            publish=lambda messages: 10,  # -> number published
+            on_stored=lambda message: ...,  # collect thread, per upsert
+        )
+        result = pipeline.run(fetcher.iter_all_sources(tickers))
+
+    on_stored runs on the single collect thread only, so it may update
+    counters without locking.
+    """
+
+    def __init__(
+        self,
+        normalize: Callable[[list[Any], str], list[Any]],
+        store: Callable[[list[Any]], list[dict[str, Any] | None]],
+        publish: Callable[[list[dict[str, Any]]], int],
+        on_stored: Callable[[dict[str, Any] | None], None] | None = None,
+        chunk_size: int = STORE_CHUNK_SIZE,
+        store_workers: int = STORE_WORKERS,
+        publish_workers: int = PUBLISH_WORKERS,
+        queue_maxsize: int = QUEUE_MAXSIZE,
+        batch_size: int = SNS_BATCH_SIZE,
+    ):
+        self._normalize = normalize
+        self._store = store
+        self._publish = publish
+        self._on_stored = on_stored
+        self._chunk_size = max(1, chunk_size)
+        self._store_workers = max(1, store_workers)
+        self._publish_workers = max(1, publish_workers)
+        self._queue_maxsize = max(1, queue_maxsize)
+        self._batch_size = max(1, min(batch_size, SNS_BATCH_SIZE))
+
+        self._lock = threading.Lock()
+        self._errors: list[Exception] = []
+
+    def run(self, sources: Iterable[tuple[str, list[Any]]]) -> PipelineResult:
+        """Drive every source through the pipeline and wait for it to drain.
+
+        Args:
+            sources: (source name, articles) pairs, consumed lazily
+
+        Returns:
+            PipelineResult with counts and per-stage timings
+
+        Raises:
+            The first exception raised by a stage, after all other work
+            has been stored and published.
+        """
+        result = PipelineResult(stage_ms=dict.fromkeys(STAGES, 0.0))
+        self._errors = []
+        start = time.perf_counter()
+
+        store_q: ThreadSafeQueue = ThreadSafeQueue(maxsize=self._queue_maxsize)
+        collect_q: ThreadSafeQueue = ThreadSafeQueue(maxsize=self._queue_maxsize)
+        publish_q: ThreadSafeQueue = ThreadSafeQueue(maxsize=self._queue_maxsize)
+
+        store_threads = [
+            self._start(self._store_worker, store_q, collect_q, result)
+            for _ in range(self._store_workers)
+        ]
+        publish_threads = [
+            self._start(self._publish_worker, publish_q, result, start)
+            for _ in range(self._publish_workers)
+        ]
+        collect_thread = self._start(self._collect, collect_q, publish_q, result)
+
+        try:
+            self._feed(sources, store_q, result)
+        except Exception as e:
+            self._record_error("normalize", e)
+        finally:
+            # Shut stages down in order so every queued item is processed
+            for _ in store_threads:
+                store_q.put(_DONE)
+            for thread in store_threads:
+                thread.join()
+            collect_q.put(_DONE)
+            collect_thread.join()
+            for _ in publish_threads:
+                publish_q.put(_DONE)
+            for thread in publish_threads:
+                thread.join()
+
+        logger.info(
+            "Ingestion pipeline complete",
+            extra={
+                "new_items": result.new_items,
+                "duplicates_skipped": result.duplicates_skipped,
+                "published": result.published,
+                "batches": result.batches,
+                "first_publish_ms": (
+                    round(result.first_publish_ms, 2)
+                    if result.first_publish_ms is not None
+                    else None
+                ),
+                "total_ms": round((time.perf_counter() - start) * 1000, 2),
+                **{f"{k}_ms": round(v, 2) for k, v in result.stage_ms.items()},
+            },
+        )
+
+        if self._errors:
+            raise self._errors[0]
+        return result
+
+    def _start(self, target: Callable[..., None], *args: Any) -> threading.Thread:
+        thread = threading.Thread(target=target, args=args, daemon=True)
+        thread.start()
+        return thread
+
+    def _record_error(self, stage: str, error: Exception) -> None:
+        logger.error(
+            "Ingestion pipeline stage failed",
+            extra={"stage": stage, "error_type": type(error).__name__},
+        )
+        with self._lock:
+            self._errors.append(error)
+
+    def _add_time(self, result: PipelineResult, stage: str, since: float) -> None:
+        elapsed_ms = (time.perf_counter() - since) * 1000
+        with self._lock:
+            result.stage_ms[stage] += elapsed_ms
+
+    def _feed(
+        self,
+        sources: Iterable[tuple[str, list[Any]]],
+        store_q: ThreadSafeQueue,
+        result: PipelineResult,
+    ) -> None:
+        """Fetch and normalize stages: chunk each source into the store queue."""
+        iterator = iter(sources)
+        while True:
+            waited = time.perf_counter()
+            try:
+                source, articles = next(iterator)
+            except StopIteration:
+                self._add_time(result, "fetch", waited)
+                return
+            self._add_time(result, "fetch", waited)
+
+            for i in range(0, len(articles), self._chunk_size):
+                began = time.perf_counter()
+                upserts = self._normalize(articles[i : i + self._chunk_size], source)
+                self._add_time(result, "normalize", began)
+                # Blocks while the store stage is QUEUE_MAXSIZE chunks behind
+                store_q.put(upserts)
+
+    def _store_worker(
+        self,
+        store_q: ThreadSafeQueue,
+        collect_q: ThreadSafeQueue,
+        result: PipelineResult,
+    ) -> None:
+        while (upserts := store_q.get()) is not _DONE:
+            began = time.perf_counter()
+            try:
+                messages = self._store(upserts)
+            except Exception as e:
+                self._record_error("store", e)
+                continue
+            finally:
+                self._add_time(result, "store", began)
+            collect_q.put(messages)
+
+    def _collect(
+        self,
+        collect_q: ThreadSafeQueue,
+        publish_q: ThreadSafeQueue,
+        result: PipelineResult,
+    ) -> None:
+        buffer: list[dict[str, Any]] = []
+        while (messages := collect_q.get()) is not _DONE:
+            for message in messages:
+                if message is not None:
+                    result.new_items += 1
+                    buffer.append(message)
+                else:
+                    result.duplicates_skipped += 1
+                if self._on_stored is not None:
+                    # An exception here must not stop the collect thread:
+                    # the store workers would block on a full queue
+                    try:
+                        self._on_stored(message)
+                    except Exception as e:
+                        self._record_error("collect", e)
+                if len(buffer) >= self._batch_size:
+                    publish_q.put(buffer)
+                    buffer = []
+        if buffer:
+            publish_q.put(buffer)
+
+    def _publish_worker(
+        self, publish_q: ThreadSafeQueue, result: PipelineResult, start: float
+    ) -> None:
+        while (batch := publish_q.get()) is not _DONE:
+            began = time.perf_counter()
+            try:
+                published = self._publish(batch)
+            except Exception as e:
+                self._record_error("publish", e)
+                continue
+            finally:
+                self._add_time(result, "publish", began)
+            with self._lock:
+                result.published += published
+                result.batches += 1
+                if published and result.first_publish_ms is None:
+                    result.first_publish_ms = (time.perf_counter() - start) * 1000
@@ -31,15 +31,18 @@ For On-Call Engineers:
 For Developers:
     Self-healing workflow:
     1. Query by_status GSI for pending items older than threshold
-    2. Batch GetItem to fetch full item data (GSI is KEYS_ONLY)
+    2. BatchGetItem to fetch full item data (GSI is KEYS_ONLY), chunks of
+       HYDRATION_CHUNK_SIZE keys fetched in parallel
     3. Filter out items that have sentiment (already analyzed)
-    4. Batch publish to SNS analysis topic
+    4. Batch publish each hydrated chunk to the SNS analysis topic as soon
+       as it arrives
     5. Log and emit metrics
 
     Key functions:
     - run_self_healing_check(): Main entry point, called from handler
     - query_stale_pending_items(): Query GSI for stale pending items
-    - get_full_items(): Batch GetItem for KEYS_ONLY GSI results
+    - iter_full_item_batches(): Hydrate KEYS_ONLY GSI results per chunk
+    - get_full_items(): All hydrated items at once
     - republish_items_to_sns(): Batch publish items to SNS
 """
 
@@ -47,6 +50,8 @@ import json
 import logging
 import os
 import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 from typing import Any
@@ -68,6 +73,17 @@ SELF_HEALING_BATCH_SIZE = int(os.environ.get("SELF_HEALING_BATCH_SIZE", "100"))
 # SNS batch limit (AWS maximum)
 SNS_BATCH_SIZE = 10
 
+# BatchGetItem accepts at most 100 keys per request
+HYDRATION_CHUNK_SIZE = int(os.environ.get("SELF_HEALING_HYDRATION_CHUNK_SIZE", "100"))
+HYDRATION_MAX_WORKERS = int(os.environ.get("SELF_HEALING_HYDRATION_MAX_WORKERS", "4"))
+BATCH_GET_MAX_RETRIES = 3
+
+# Attributes republish_items_to_sns needs, plus sentiment for the filter
+HYDRATION_PROJECTION = (
+    "source_id, #ts, source_type, text_for_analysis, "
+    "matched_tickers, sentiment, metadata"
+)
+
 
 @dataclass
 class SelfHealingResult:
@@ -166,31 +182,33 @@ def query_stale_pending_items(
     return stale_items[:limit]  # Ensure we don't exceed limit
 
 
-@tracer.capture_method
-def get_full_items(
+def iter_full_item_batches(
     table: Any,
     item_keys: list[dict[str, Any]],
-) -> list[dict[str, Any]]:
-    """Fetch full item data for items returned from KEYS_ONLY GSI.
+    chunk_size: int = HYDRATION_CHUNK_SIZE,
+    max_workers: int = HYDRATION_MAX_WORKERS,
+) -> Iterator[list[dict[str, Any]]]:
+    """Fetch full item data for KEYS_ONLY GSI results, one chunk at a time.
 
-    The by_status GSI only returns source_id, status, and timestamp.
-    This function fetches the complete item data needed for republishing
-    (text_for_analysis, matched_tickers, source_type, etc.).
+    Keys are split into BatchGetItem chunks fetched in parallel; each chunk
+    is yielded as soon as it arrives so the caller can republish it while
+    the rest are still in flight. Items with a 'sentiment' attribute are
+    filtered out (already analyzed).
 
-    Items with a 'sentiment' attribute are filtered out (already analyzed).
+    A chunk that fails, or whose UnprocessedKeys survive the retries, is
+    logged and skipped: those items stay pending and are picked up by the
+    next self-healing run.
 
     Args:
         table: DynamoDB Table resource
-        item_keys: List of items with source_id from GSI query
+        item_keys: List of items with source_id and timestamp from GSI query
+        chunk_size: Keys per BatchGetItem request (at most 100)
+        max_workers: Chunks fetched concurrently
 
-    Returns:
-        List of full items that don't have sentiment attribute
+    Yields:
+        Lists of full items that don't have sentiment attribute
     """
-    if not item_keys:
-        return []
-
-    full_items: list[dict[str, Any]] = []
-
+    keys: dict[tuple[str, str], dict[str, str]] = {}
     for item in item_keys:
         source_id = item.get("source_id")
         timestamp = item.get("timestamp")
@@ -205,41 +223,99 @@ def get_full_items(
                 },
             )
             continue
+        # BatchGetItem rejects duplicate keys within a request
+        keys[(source_id, timestamp)] = {"source_id": source_id, "timestamp": timestamp}
 
-        try:
-            response = table.get_item(
-                Key={"source_id": source_id, "timestamp": timestamp},
-                ProjectionExpression=(
-                    "source_id, #ts, source_type, text_for_analysis, "
-                    "matched_tickers, sentiment, metadata"
-                ),
-                ExpressionAttributeNames={
-                    "#ts": "timestamp",
-                },
-            )
+    if not keys:
+        return
+
+    key_list = list(keys.values())
+    chunk_size = max(1, min(chunk_size, 100))
+    chunks = [key_list[i : i + chunk_size] for i in range(0, len(key_list), chunk_size)]
 
-            full_item = response.get("Item")
-            if full_item:
+    executor = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(chunks))))
+    try:
+        futures = [executor.submit(_batch_get_items, table, chunk) for chunk in chunks]
+        for future in as_completed(futures):
+            try:
+                items = future.result()
+            except Exception as e:
+                logger.warning("Failed to get full items", extra=get_safe_error_info(e))
+                continue
+
+            pending = []
+            for full_item in items:
                 # Filter out items that already have sentiment (already analyzed)
                 if "sentiment" not in full_item:
-                    full_items.append(full_item)
+                    pending.append(full_item)
                 else:
                     logger.debug(
                         "Skipping item with sentiment",
-                        extra={"source_id": sanitize_for_log(source_id[:20])},
+                        extra={
+                            "source_id": sanitize_for_log(full_item["source_id"][:20])
+                        },
                     )
+            yield pending
+    finally:
+        # A caller that stops early must not wait for the remaining chunks
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _batch_get_items(table: Any, keys: list[dict[str, str]]) -> list[dict[str, Any]]:
+    """BatchGetItem one chunk of keys, retrying UnprocessedKeys with backoff."""
+    items: list[dict[str, Any]] = []
+    request: dict[str, Any] = {
+        table.name: {
+            "Keys": keys,
+            "ProjectionExpression": HYDRATION_PROJECTION,
+            "ExpressionAttributeNames": {"#ts": "timestamp"},
+        }
+    }
+    retry_count = 0
+
+    while request:
+        response = table.meta.client.batch_get_item(RequestItems=request)
+        items.extend(response.get("Responses", {}).get(table.name, []))
+        request = response.get("UnprocessedKeys") or {}
+        if request:
+            retry_count += 1
+            if retry_count > BATCH_GET_MAX_RETRIES:
+                logger.warning(
+                    "Self-healing hydration left unprocessed keys",
+                    extra={
+                        "unprocessed": len(request.get(table.name, {}).get("Keys", []))
+                    },
+                )
+                break
+            time.sleep(0.05 * 2**retry_count)
 
-        except Exception as e:
-            logger.warning(
-                "Failed to get full item",
-                extra={
-                    "source_id": sanitize_for_log(source_id[:20]),
-                    **get_safe_error_info(e),
-                },
-            )
-            continue
+    return items
 
-    return full_items
+
+@tracer.capture_method
+def get_full_items(
+    table: Any,
+    item_keys: list[dict[str, Any]],
+) -> list[dict[str, Any]]:
+    """Fetch full item data for items returned from KEYS_ONLY GSI.
+
+    The by_status GSI only returns source_id, status, and timestamp.
+    This function fetches the complete item data needed for republishing
+    (text_for_analysis, matched_tickers, source_type, etc.) with chunked
+    BatchGetItem; see iter_full_item_batches().
+
+    Items with a 'sentiment' attribute are filtered out (already analyzed).
+
+    Args:
+        table: DynamoDB Table resource
+        item_keys: List of items with source_id from GSI query
+
+    Returns:
+        List of full items that don't have sentiment attribute
+    """
+    return [
+        item for batch in iter_full_item_batches(table, item_keys) for item in batch
+    ]
 
 
 @tracer.capture_method
@@ -281,6 +357,7 @@ def republish_items_to_sns(
                 "text_for_analysis": item.get("text_for_analysis", ""),
                 "model_version": model_version,
                 "matched_tickers": item.get("matched_tickers", []),
+                "tags": (item.get("metadata") or {}).get("tags", []),
                 "timestamp": item.get("timestamp", ""),
                 "republished": True,  # Mark as republished for observability
             }
@@ -341,8 +418,8 @@ def run_self_healing_check(
     This is the main entry point called from the ingestion handler.
     It orchestrates the full self-healing workflow:
     1. Query for stale pending items
-    2. Fetch full item data
-    3. Republish to SNS
+    2. Fetch full item data, chunk by chunk
+    3. Republish each chunk to SNS as it arrives
     4. Log and emit metrics
 
     The function is wrapped in try/except to prevent self-healing
@@ -376,11 +453,18 @@ def run_self_healing_check(
             emit_metric("SelfHealingItemsRepublished", 0)
             return result
 
-        # Step 2: Fetch full item data (filter out items with sentiment)
-        full_items = get_full_items(table, stale_keys)
-        result.items_found = len(full_items)
+        # Steps 2-3: Fetch full item data (filter out items with sentiment)
+        # and republish each chunk while the others are still being fetched
+        for full_items in iter_full_item_batches(table, stale_keys):
+            result.items_found += len(full_items)
+            result.items_republished += republish_items_to_sns(
+                sns_client=sns_client,
+                sns_topic_arn=sns_topic_arn,
+                items=full_items,
+                model_version=model_version,
+            )
 
-        if not full_items:
+        if not result.items_found:
             logger.info(
                 "Self-healing: all stale items already have sentiment",
                 extra={
@@ -392,15 +476,6 @@ def run_self_healing_check(
             emit_metric("SelfHealingItemsRepublished", 0)
             return result
 
-        # Step 3: Republish to SNS
-        published = republish_items_to_sns(
-            sns_client=sns_client,
-            sns_topic_arn=sns_topic_arn,
-            items=full_items,
-            model_version=model_version,
-        )
-        result.items_republished = published
-
         # Calculate execution time
         result.execution_time_ms = (time.perf_counter() - start_time) * 1000
 
@@ -16,21 +16,32 @@ For On-Call Engineers:
     The analysis Lambda calls the internal /api/internal/alerts/evaluate endpoint.
     Alerts are only triggered if the threshold is crossed and user has email quota.
 
+    Enabled rules are held in a warm per-ticker index (sorted by threshold)
+    (src/lambdas/shared/alert_index.py). The dashboard alert endpoints drop
+    it on every rule change; otherwise it is reloaded every
+    ALERT_INDEX_TTL_SECONDS.
+
 Security Notes:
     - Internal endpoints are restricted to dev/test environments
     - Email quota is tracked per user per day (max 10)
     - Alert cooldown prevents duplicate triggers
 """
 
+import bisect
 import logging
 import os
 import uuid
+from collections import defaultdict
 from datetime import UTC, datetime, timedelta
 from typing import Any, Literal
 
 from aws_lambda_powertools import Tracer
 from pydantic import BaseModel
 
+from src.lambdas.shared.alert_index import (
+    alert_index_cache,
+    invalidate_alert_index,  # noqa: F401 - re-exported for callers and tests
+)
 from src.lambdas.shared.logging_utils import get_safe_error_info, sanitize_for_log
 from src.lambdas.shared.models.alert_rule import ALERT_LIMITS, AlertRule
 from src.lambdas.shared.models.status_utils import ENABLED
@@ -110,6 +121,59 @@ class EmailQuotaResponse(BaseModel):
     top_users: list[dict[str, Any]]
 
 
+# Threshold index
+
+
+class _ThresholdIndex:
+    """Rules of one alert type, sorted by threshold for each direction."""
+
+    def __init__(self, rules: list[AlertRule]):
+        above = sorted(
+            (r for r in rules if r.threshold_direction == "above"),
+            key=lambda r: r.threshold_value,
+        )
+        below = sorted(
+            (r for r in rules if r.threshold_direction == "below"),
+            key=lambda r: r.threshold_value,
+        )
+        self._above = above
+        self._above_thresholds = [r.threshold_value for r in above]
+        self._below = below
+        self._below_thresholds = [r.threshold_value for r in below]
+
+    def crossed(self, value: float) -> list[AlertRule]:
+        """Rules whose threshold is crossed by value (see _evaluate_threshold)."""
+        # "above" fires when value > threshold: every threshold strictly below value
+        above = self._above[: bisect.bisect_left(self._above_thresholds, value)]
+        # "below" fires when value < threshold: every threshold strictly above value
+        below = self._below[bisect.bisect_right(self._below_thresholds, value) :]
+        return above + below
+
+
+class TickerAlertIndex:
+    """Enabled alert rules for one ticker, indexed by type and threshold.
+
+    Finding the rules crossed by a new value is a binary search per
+    direction, so evaluation cost follows the number of crossed rules
+    rather than the number of rules on the ticker.
+    """
+
+    def __init__(self, rules: list[AlertRule]):
+        self.rules = [r for r in rules if r.status == ENABLED]
+        by_type: dict[str, list[AlertRule]] = defaultdict(list)
+        for rule in self.rules:
+            by_type[rule.alert_type].append(rule)
+        self._by_type = {t: _ThresholdIndex(r) for t, r in by_type.items()}
+
+    def crossed(self, alert_type: str, value: float) -> list[AlertRule]:
+        """Rules of alert_type whose threshold is crossed by value."""
+        index = self._by_type.get(alert_type)
+        return index.crossed(value) if index else []
+
+
+_EMPTY_INDEX = TickerAlertIndex([])
+
+
 # Service functions
 
 
@@ -137,59 +201,47 @@ def evaluate_alerts_for_ticker(
     notifications_queued = 0
 
     try:
-        # Find all alerts for this ticker using GSI or scan
-        # For simplicity, scan all alerts and filter by ticker
-        # In production, use a GSI on ticker
-        alerts = _find_alerts_by_ticker(table, ticker)
+        index = _find_ticker_index(table, ticker)
 
         logger.info(
-            f"Evaluating {len(alerts)} alerts for ticker {ticker}",
+            f"Evaluating {len(index.rules)} alerts for ticker {ticker}",
             extra={
                 "ticker": sanitize_for_log(ticker),
-                "alert_count": len(alerts),
+                "alert_count": len(index.rules),
                 "sentiment_score": sentiment_score,
                 "volatility_atr": volatility_atr,
             },
         )
 
-        for alert in alerts:
-            # Skip disabled alerts - use status field (with is_enabled fallback)
-            if alert.status != ENABLED:
-                continue
-
-            # Check cooldown (don't trigger same alert within 1 hour)
-            if _is_in_cooldown(alert):
-                continue
-
-            # Evaluate based on alert type
-            triggered = False
-            current_value = 0.0
-
-            if (
-                alert.alert_type == "sentiment_threshold"
-                and sentiment_score is not None
-            ):
-                current_value = sentiment_score
-                triggered = _evaluate_threshold(
-                    current_value,
-                    alert.threshold_value,
-                    alert.threshold_direction,
-                )
-            elif (
-                alert.alert_type == "volatility_threshold"
-                and volatility_atr is not None
-            ):
-                current_value = volatility_atr
-                triggered = _evaluate_threshold(
-                    current_value,
-                    alert.threshold_value,
-                    alert.threshold_direction,
-                )
+        # Rules whose threshold is crossed, found by bisection
+        crossed: dict[int, float] = {}
+        if sentiment_score is not None:
+            for alert in index.crossed("sentiment_threshold", sentiment_score):
+                crossed[id(alert)] = sentiment_score
+        if volatility_atr is not None:
+            for alert in index.crossed("volatility_threshold", volatility_atr):
+                crossed[id(alert)] = volatility_atr
+
+        # Check cooldown (don't trigger same alert within 1 hour)
+        active = [alert for alert in index.rules if not _is_in_cooldown(alert)]
+
+        # One quota read for all users with a triggered alert
+        remaining = _check_email_quotas(
+            table, {alert.user_id for alert in active if id(alert) in crossed}
+        )
+
+        for alert in active:
+            triggered = id(alert) in crossed
+            current_value = crossed.get(id(alert), 0.0)
+            if not triggered:
+                if alert.alert_type == "sentiment_threshold":
+                    current_value = sentiment_score or 0.0
+                elif alert.alert_type == "volatility_threshold":
+                    current_value = volatility_atr or 0.0
 
             notification_id = None
             if triggered:
-                # Check user's email quota
-                if _check_email_quota(table, alert.user_id):
+                if remaining.get(alert.user_id, 0) > 0:
                     # Queue notification
                     notification_id = _queue_notification(
                         table,
@@ -198,9 +250,12 @@ def evaluate_alerts_for_ticker(
                     )
                     if notification_id:
                         notifications_queued += 1
+                        remaining[alert.user_id] -= 1
 
-                        # Update alert trigger info
+                        # Update alert trigger info (and the warm index copy,
+                        # so cooldown holds until the next reload)
                         _update_alert_triggered(table, alert)
+                        alert.last_triggered_at = datetime.now(UTC)
 
                 triggered_count += 1
 
@@ -216,7 +271,7 @@ def evaluate_alerts_for_ticker(
             )
 
         return EvaluateAlertsResponse(
-            evaluated=len(alerts),
+            evaluated=len(index.rules),
             triggered=triggered_count,
             notifications_queued=notifications_queued,
             details=details,
@@ -310,60 +365,58 @@ def verify_internal_auth(auth_header: str | None) -> bool:
 # Helper functions
 
 
-def _find_alerts_by_ticker(table: Any, ticker: str) -> list[AlertRule]:
-    """Find all active alerts for a specific ticker.
+def _load_alert_index(table: Any) -> dict[str, TickerAlertIndex]:
+    """Load every enabled alert rule and index it by ticker.
 
-    Uses by_entity_status GSI for O(result) query performance with FilterExpression on ticker.
-    (502-gsi-query-optimization: Replaced scan with GSI query)
+    Uses the by_entity_status GSI without a ticker filter: one paginated
+    read of all enabled rules per refresh, instead of a filtered read of
+    all rules on every evaluation.
 
     Args:
         table: DynamoDB Table resource
-        ticker: Ticker symbol to find alerts for
 
     Returns:
-        List of AlertRule objects for the ticker
+        Dict mapping ticker to its TickerAlertIndex
     """
-    alerts = []
+    by_ticker: dict[str, list[AlertRule]] = defaultdict(list)
+
+    # ALERT_RULE uses "enabled"/"disabled" status values (not "active"/"inactive")
+    query_kwargs: dict[str, Any] = {
+        "IndexName": "by_entity_status",
+        "KeyConditionExpression": "entity_type = :type AND #status = :status",
+        "ExpressionAttributeNames": {"#status": "status"},
+        "ExpressionAttributeValues": {":type": "ALERT_RULE", ":status": ENABLED},
+    }
+    while True:
+        response = table.query(**query_kwargs)
+        for item in response.get("Items", []):
+            alert = AlertRule.from_dynamodb_item(item)
+            by_ticker[alert.ticker].append(alert)
+        if "LastEvaluatedKey" not in response:
+            break
+        query_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
 
-    try:
-        # Query using by_entity_status GSI, filter by ticker
-        # ALERT_RULE uses "enabled"/"disabled" status values (not "active"/"inactive")
-        response = table.query(
-            IndexName="by_entity_status",
-            KeyConditionExpression="entity_type = :type AND #status = :status",
-            FilterExpression="ticker = :ticker",
-            ExpressionAttributeNames={"#status": "status"},
-            ExpressionAttributeValues={
-                ":type": "ALERT_RULE",
-                ":status": ENABLED,
-                ":ticker": ticker,
-            },
-        )
+    return {ticker: TickerAlertIndex(rules) for ticker, rules in by_ticker.items()}
 
-        for item in response.get("Items", []):
-            alerts.append(AlertRule.from_dynamodb_item(item))
-
-        # Handle pagination with LastEvaluatedKey
-        while "LastEvaluatedKey" in response:
-            response = table.query(
-                IndexName="by_entity_status",
-                KeyConditionExpression="entity_type = :type AND #status = :status",
-                FilterExpression="ticker = :ticker",
-                ExpressionAttributeNames={"#status": "status"},
-                ExpressionAttributeValues={
-                    ":type": "ALERT_RULE",
-                    ":status": ENABLED,
-                    ":ticker": ticker,
-                },
-                ExclusiveStartKey=response["LastEvaluatedKey"],
-            )
-            for item in response.get("Items", []):
-                alerts.append(AlertRule.from_dynamodb_item(item))
 
-    except Exception as e:
-        logger.error(f"Error finding alerts for ticker: {e}")
+def _find_ticker_index(table: Any, ticker: str) -> TickerAlertIndex:
+    """Get the warm alert index for a ticker, reloading it when expired.
+
+    Args:
+        table: DynamoDB Table resource
+        ticker: Ticker symbol to find alerts for
 
-    return alerts
+    Returns:
+        TickerAlertIndex (empty if the ticker has no alerts or loading failed)
+    """
+    try:
+        indexes = alert_index_cache.get_or_load(
+            "enabled", lambda: _load_alert_index(table)
+        )
+    except Exception as e:
+        logger.error(f"Error loading alert index: {e}")
+        return _EMPTY_INDEX
+    return indexes.get(ticker, _EMPTY_INDEX)
 
 
 def _evaluate_threshold(
@@ -404,34 +457,45 @@ def _is_in_cooldown(alert: AlertRule, cooldown_hours: int = 1) -> bool:
     return datetime.now(UTC) < cooldown_end
 
 
-def _check_email_quota(table: Any, user_id: str) -> bool:
-    """Check if user has remaining email quota.
+def _check_email_quotas(table: Any, user_ids: set[str]) -> dict[str, int]:
+    """Get remaining email quota for several users with one BatchGetItem.
 
     Args:
         table: DynamoDB Table resource
-        user_id: User to check
+        user_ids: Users to check
 
     Returns:
-        True if user can receive email, False if quota exceeded
+        Dict mapping user_id to emails remaining today. Users are given the
+        full quota if their record is missing or the read fails.
     """
+    max_per_day = ALERT_LIMITS["max_emails_per_day"]
+    remaining = dict.fromkeys(user_ids, max_per_day)
+    if not user_ids:
+        return remaining
+
     try:
         today = datetime.now(UTC).strftime("%Y-%m-%d")
+        keys = [{"PK": f"USER_QUOTA#{user_id}", "SK": today} for user_id in user_ids]
+
+        # BatchGetItem accepts at most 100 keys per request
+        for i in range(0, len(keys), 100):
+            request: dict[str, Any] = {table.name: {"Keys": keys[i : i + 100]}}
+            for _ in range(4):
+                response = table.meta.client.batch_get_item(RequestItems=request)
+                for item in response.get("Responses", {}).get(table.name, []):
+                    user_id = item["PK"].removeprefix("USER_QUOTA#")
+                    remaining[user_id] = max(0, max_per_day - int(item.get("count", 0)))
+                request = response.get("UnprocessedKeys") or {}
+                if not request:
+                    break
 
-        response = table.get_item(
-            Key={
-                "PK": f"USER_QUOTA#{user_id}",
-                "SK": today,
-            }
+    except Exception as e:
+        # Default to allowing on error
+        logger.warning(
+            "Failed to read email quotas, allowing", extra=get_safe_error_info(e)
         )
 
-        item = response.get("Item", {})
-        emails_today = int(item.get("count", 0))
-
-        return emails_today < ALERT_LIMITS["max_emails_per_day"]
-
-    except Exception:
-        # Default to allowing on error
-        return True
+    return remaining
 
 
 def _queue_notification(
@@ -7,6 +7,11 @@ Generates personalized daily digest emails with:
 
 Scheduled via EventBridge at configurable times per user timezone.
 
+Each run first collects the ticker universe across all due users, fetches
+every distinct ticker once (in parallel) into an in-run memo, then renders
+and sends the emails with bounded concurrency. Cost scales with distinct
+tickers rather than users x tickers.
+
 For On-Call Engineers:
     Digest failures are non-critical (no alert triggered).
     Check CloudWatch logs for DIGEST_ERROR entries.
@@ -21,6 +26,9 @@ Security Notes:
 """
 
 import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime, timedelta
 from typing import Any
 from zoneinfo import ZoneInfo
@@ -35,6 +43,11 @@ from src.lambdas.shared.models.user import User
 
 logger = logging.getLogger(__name__)
 
+# Parallel ticker fetches per run (DynamoDB queries)
+DIGEST_TICKER_WORKERS = int(os.environ.get("DIGEST_TICKER_WORKERS", "10"))
+# Concurrent digest renders/sends (bounded for SendGrid rate limits)
+DIGEST_SEND_WORKERS = int(os.environ.get("DIGEST_SEND_WORKERS", "4"))
+
 
 class DigestServiceError(Exception):
     """Base exception for digest service errors."""
@@ -74,7 +87,14 @@ class DigestData:
 
 
 class DigestService:
-    """Service for generating and sending daily digest emails."""
+    """Service for generating and sending daily digest emails.
+
+    One instance serves one digest run. Ticker data and user configurations
+    are memoized on the instance, so a ticker watched by many users is only
+    queried once per run. The memos are shared by the send pool's threads
+    and guarded by a lock; failed reads are not memoized, so a later
+    generate_digest() retries them.
+    """
 
     def __init__(
         self, table: Any, dashboard_url: str = "https://sentiment-analyzer.com"
@@ -87,6 +107,10 @@ class DigestService:
         """
         self.table = table
         self.dashboard_url = dashboard_url
+        # In-run memos: (ticker, days) -> ticker data, user_id -> configs
+        self._ticker_memo: dict[tuple[str, int], dict[str, Any]] = {}
+        self._config_memo: dict[str, list[Configuration]] = {}
+        self._memo_lock = threading.Lock()
 
     def get_users_for_digest(
         self, current_hour_utc: int
@@ -244,6 +268,11 @@ class DigestService:
         Returns:
             List of Configuration objects
         """
+        with self._memo_lock:
+            memoized = self._config_memo.get(user_id)
+        if memoized is not None:
+            return memoized
+
         configs: list[Configuration] = []
 
         try:
@@ -271,14 +300,49 @@ class DigestService:
                     **get_safe_error_info(e),
                 },
             )
+            return configs
 
+        with self._memo_lock:
+            self._config_memo[user_id] = configs
         return configs
 
+    def prefetch_ticker_data(
+        self, users: list[tuple[User, DigestSettings]], days: int = 1
+    ) -> int:
+        """Load configurations for all users and fetch their tickers once.
+
+        Computes the ticker universe across every due user, then fetches it
+        with a single parallel get_ticker_sentiment_data() call. Later
+        generate_digest() calls are served from the in-run memos.
+
+        Args:
+            users: (User, DigestSettings) tuples due for digest
+            days: Number of days to look back
+
+        Returns:
+            Number of distinct tickers fetched
+        """
+        universe: set[str] = set()
+        for user, settings in users:
+            for config in self.get_user_configurations(user.user_id, settings):
+                universe.update(ticker.symbol for ticker in config.tickers)
+
+        self.get_ticker_sentiment_data(sorted(universe), days=days)
+        logger.info(
+            "Prefetched digest ticker data",
+            extra={"users": len(users), "tickers": len(universe)},
+        )
+        return len(universe)
+
     def get_ticker_sentiment_data(
         self, tickers: list[str], days: int = 1
     ) -> dict[str, dict[str, Any]]:
         """Get sentiment data for tickers over specified period.
 
+        Tickers not yet in the in-run memo are fetched in parallel (bounded
+        by DIGEST_TICKER_WORKERS); memoized tickers cost nothing. Failed
+        reads are returned with ``"error": True`` but not memoized.
+
         Args:
             tickers: List of ticker symbols
             days: Number of days to look back (default 1 for daily)
@@ -296,88 +360,112 @@ class DigestService:
                 }
             }
         """
-        ticker_data: dict[str, dict[str, Any]] = {}
-        cutoff = datetime.now(UTC) - timedelta(days=days)
-
-        for ticker in tickers:
-            try:
-                # Query sentiment results for ticker
-                response = self.table.query(
-                    KeyConditionExpression=(
-                        Key("PK").eq(f"TICKER#{ticker}")
-                        & Key("SK").gte(cutoff.isoformat())
-                    ),
-                    Limit=50,  # Reasonable limit for daily digest
+        with self._memo_lock:
+            results = {
+                t: self._ticker_memo[(t, days)]
+                for t in tickers
+                if (t, days) in self._ticker_memo
+            }
+        missing = [t for t in dict.fromkeys(tickers) if t not in results]
+        if missing:
+            cutoff = datetime.now(UTC) - timedelta(days=days)
+            max_workers = min(len(missing), DIGEST_TICKER_WORKERS)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                fetched = list(
+                    executor.map(
+                        lambda t: self._fetch_ticker_sentiment(t, cutoff), missing
+                    )
                 )
+            results.update(zip(missing, fetched, strict=True))
+            with self._memo_lock:
+                for ticker, data in zip(missing, fetched, strict=True):
+                    if not data.get("error"):
+                        self._ticker_memo[(ticker, days)] = data
 
-                items = response.get("Items", [])
-
-                if not items:
-                    ticker_data[ticker] = {
-                        "current_sentiment": 0.0,
-                        "previous_sentiment": 0.0,
-                        "sentiment_change": 0.0,
-                        "sentiment_label": "neutral",
-                        "article_count": 0,
-                        "volatility": None,
-                    }
-                    continue
-
-                # Calculate aggregated sentiment
-                scores = [float(item.get("sentiment_score", 0)) for item in items]
-                current_score = sum(scores) / len(scores) if scores else 0.0
-
-                # Get previous day for comparison (if available)
-                prev_cutoff = cutoff - timedelta(days=1)
-                prev_response = self.table.query(
-                    KeyConditionExpression=(
-                        Key("PK").eq(f"TICKER#{ticker}")
-                        & Key("SK").between(prev_cutoff.isoformat(), cutoff.isoformat())
-                    ),
-                    Limit=50,
-                )
-                prev_items = prev_response.get("Items", [])
-                prev_scores = [
-                    float(item.get("sentiment_score", 0)) for item in prev_items
-                ]
-                prev_score = sum(prev_scores) / len(prev_scores) if prev_scores else 0.0
-
-                # Determine label (inclusive thresholds per project standard)
-                if current_score >= 0.33:
-                    label = "positive"
-                elif current_score <= -0.33:
-                    label = "negative"
-                else:
-                    label = "neutral"
-
-                ticker_data[ticker] = {
-                    "current_sentiment": round(current_score, 4),
-                    "previous_sentiment": round(prev_score, 4),
-                    "sentiment_change": round(current_score - prev_score, 4),
-                    "sentiment_label": label,
-                    "article_count": len(items),
-                    "volatility": None,  # Would come from ATR metrics
-                }
+        return {ticker: results[ticker] for ticker in tickers}
 
-            except Exception as e:
-                logger.warning(
-                    "Failed to get ticker data",
-                    extra={
-                        "ticker": sanitize_for_log(ticker),
-                        **get_safe_error_info(e),
-                    },
-                )
-                ticker_data[ticker] = {
+    def _fetch_ticker_sentiment(self, ticker: str, cutoff: datetime) -> dict[str, Any]:
+        """Query and aggregate one ticker's current and previous window.
+
+        Args:
+            ticker: Ticker symbol
+            cutoff: Start of the current window
+
+        Returns:
+            Sentiment data dict (see get_ticker_sentiment_data)
+        """
+        try:
+            # Query sentiment results for ticker
+            response = self.table.query(
+                KeyConditionExpression=(
+                    Key("PK").eq(f"TICKER#{ticker}") & Key("SK").gte(cutoff.isoformat())
+                ),
+                Limit=50,  # Reasonable limit for daily digest
+            )
+
+            items = response.get("Items", [])
+
+            if not items:
+                return {
                     "current_sentiment": 0.0,
                     "previous_sentiment": 0.0,
                     "sentiment_change": 0.0,
                     "sentiment_label": "neutral",
                     "article_count": 0,
                     "volatility": None,
-                    "error": True,
                 }
 
-        return ticker_data
+            # Calculate aggregated sentiment
+            scores = [float(item.get("sentiment_score", 0)) for item in items]
+            current_score = sum(scores) / len(scores) if scores else 0.0
+
+            # Get previous day for comparison (if available)
+            prev_cutoff = cutoff - timedelta(days=1)
+            prev_response = self.table.query(
+                KeyConditionExpression=(
+                    Key("PK").eq(f"TICKER#{ticker}")
+                    & Key("SK").between(prev_cutoff.isoformat(), cutoff.isoformat())
+                ),
+                Limit=50,
+            )
+            prev_items = prev_response.get("Items", [])
+            prev_scores = [float(item.get("sentiment_score", 0)) for item in prev_items]
+            prev_score = sum(prev_scores) / len(prev_scores) if prev_scores else 0.0
+
+            # Determine label (inclusive thresholds per project standard)
+            if current_score >= 0.33:
+                label = "positive"
+            elif current_score <= -0.33:
+                label = "negative"
+            else:
+                label = "neutral"
+
+            return {
+                "current_sentiment": round(current_score, 4),
+                "previous_sentiment": round(prev_score, 4),
+                "sentiment_change": round(current_score - prev_score, 4),
+                "sentiment_label": label,
+                "article_count": len(items),
+                "volatility": None,  # Would come from ATR metrics
+            }
+
+        except Exception as e:
+            logger.warning(
+                "Failed to get ticker data",
+                extra={
+                    "ticker": sanitize_for_log(ticker),
+                    **get_safe_error_info(e),
+                },
+            )
+            return {
+                "current_sentiment": 0.0,
+                "previous_sentiment": 0.0,
+                "sentiment_change": 0.0,
+                "sentiment_label": "neutral",
+                "article_count": 0,
+                "volatility": None,
+                "error": True,
+            }
 
     def generate_digest(
         self, user: User, settings: DigestSettings
@@ -600,20 +688,24 @@ def process_daily_digests(
         logger.error("Failed to get users for digest", extra=get_safe_error_info(e))
         return stats
 
-    for user, settings in users_due:
-        stats["processed"] += 1
+    # One fetch per distinct ticker across all users, before any rendering
+    try:
+        service.prefetch_ticker_data(users_due)
+    except Exception as e:
+        # Non-fatal: generate_digest() fetches whatever is still missing
+        logger.warning("Failed to prefetch digest data", extra=get_safe_error_info(e))
 
+    def send_digest(user: User, settings: DigestSettings) -> str:
         try:
             # Generate digest
             digest = service.generate_digest(user, settings)
 
             if not digest or not digest.has_content:
-                stats["skipped"] += 1
                 logger.debug(
                     "Skipping digest (no content)",
                     extra={"user_id": sanitize_for_log(user.user_id[:8])},
                 )
-                continue
+                return "skipped"
 
             # Build email
             html_content = service.build_digest_html(digest)
@@ -630,21 +722,20 @@ def process_daily_digests(
             )
 
             if success:
-                stats["sent"] += 1
                 service.update_last_sent(user.user_id)
                 logger.info(
                     "Sent digest email",
                     extra={"user_id": sanitize_for_log(user.user_id[:8])},
                 )
-            else:
-                stats["failed"] += 1
-                logger.warning(
-                    "Failed to send digest",
-                    extra={"user_id": sanitize_for_log(user.user_id[:8])},
-                )
+                return "sent"
+
+            logger.warning(
+                "Failed to send digest",
+                extra={"user_id": sanitize_for_log(user.user_id[:8])},
+            )
+            return "failed"
 
         except Exception as e:
-            stats["failed"] += 1
             logger.error(
                 "Error processing digest",
                 extra={
@@ -652,6 +743,14 @@ def process_daily_digests(
                     **get_safe_error_info(e),
                 },
             )
+            return "failed"
+
+    if users_due:
+        max_workers = min(len(users_due), DIGEST_SEND_WORKERS)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for outcome in executor.map(lambda u: send_digest(*u), users_due):
+                stats["processed"] += 1
+                stats[outcome] += 1
 
     logger.info("Digest processing complete", extra=stats)
     return stats
@@ -4,7 +4,7 @@ import hashlib
 import json
 import logging
 import os
-import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime, timedelta
 from typing import Any, Literal
 
@@ -19,7 +19,8 @@ from src.lambdas.shared.adapters.base import (
     SentimentData,
 )
 from src.lambdas.shared.logging_utils import sanitize_for_log
-from src.lib.cache_utils import CacheStats, get_global_emitter
+from src.lib.cache_utils import TTLCache
+from src.lib.threading_utils import TokenBucket
 
 logger = logging.getLogger(__name__)
 
@@ -28,20 +29,46 @@ logger = logging.getLogger(__name__)
 # Feature 1224: Added jitter to TTL to prevent thundering herd
 # =============================================================================
 # Cache TTL in seconds (default 30 minutes for news/sentiment, 1 hour for OHLC)
-# Feature 1224: CacheStats for CloudWatch metric emission
-_finnhub_stats = CacheStats(name="finnhub")
-get_global_emitter().register(_finnhub_stats)
-
 API_CACHE_TTL_NEWS_SECONDS = int(os.environ.get("API_CACHE_TTL_NEWS_SECONDS", "1800"))
 API_CACHE_TTL_SENTIMENT_SECONDS = int(
     os.environ.get("API_CACHE_TTL_SENTIMENT_SECONDS", "1800")
 )
 API_CACHE_TTL_OHLC_SECONDS = int(os.environ.get("API_CACHE_TTL_OHLC_SECONDS", "3600"))
+# Stale-while-revalidate window: serve an expired entry this long while a
+# single caller refreshes it (0 = disabled)
+API_CACHE_STALE_SECONDS = int(os.environ.get("API_CACHE_STALE_SECONDS", "0"))
 
 # In-memory cache (survives Lambda warm invocations)
-# Feature 1224: tuple now (timestamp, value, effective_ttl) for jittered expiry
-_finnhub_cache: dict[str, tuple[float, Any, float]] = {}
+# Feature 1224: entries carry a jittered TTL; CacheStats registered by TTLCache
+# Concurrent misses for one key share a single request (get_or_load)
 _MAX_CACHE_ENTRIES = 100  # Prevent unbounded memory growth
+_finnhub_cache = TTLCache(
+    name="finnhub",
+    max_entries=_MAX_CACHE_ENTRIES,
+    stale_ttl=API_CACHE_STALE_SECONDS,
+)
+_finnhub_stats = _finnhub_cache.stats
+
+
+# Finnhub free tier: 60 calls/minute. Every outbound call takes a token; the
+# bucket is shared by all adapter instances and threads in this execution
+# environment. The burst defaults to one minute of quota so a full ingestion
+# run's tickers can go out at once, while sustained traffic stays at 60/min.
+FINNHUB_RATE_LIMIT_PER_MINUTE = int(
+    os.environ.get("FINNHUB_RATE_LIMIT_PER_MINUTE", "60")
+)
+FINNHUB_RATE_LIMIT_BURST = int(
+    os.environ.get("FINNHUB_RATE_LIMIT_BURST", str(FINNHUB_RATE_LIMIT_PER_MINUTE))
+)
+FINNHUB_RATE_LIMIT_WAIT_SECONDS = float(
+    os.environ.get("FINNHUB_RATE_LIMIT_WAIT_SECONDS", "10")
+)
+_finnhub_rate_limiter = TokenBucket(
+    rate=FINNHUB_RATE_LIMIT_PER_MINUTE / 60, capacity=FINNHUB_RATE_LIMIT_BURST
+)
+
+# Concurrent per-ticker requests in get_news()
+FINNHUB_NEWS_MAX_WORKERS = int(os.environ.get("FINNHUB_NEWS_MAX_WORKERS", "10"))
 
 
 def _get_cache_key(endpoint: str, params: dict) -> str:
@@ -52,38 +79,26 @@ def _get_cache_key(endpoint: str, params: dict) -> str:
 
 
 def _get_from_cache(key: str, ttl: int) -> Any | None:
-    """Get value from cache if not expired."""
-    if key in _finnhub_cache:
-        entry = _finnhub_cache[key]
-        timestamp, value = entry[0], entry[1]
-        # Feature 1224: Use stored jittered TTL if available, else base TTL
-        effective_ttl = entry[2] if len(entry) > 2 else ttl
-        if time.time() - timestamp < effective_ttl:
-            _finnhub_stats.record_hit()
-            return value
-        # Expired - remove from cache
-        del _finnhub_cache[key]
-    _finnhub_stats.record_miss()
-    return None
+    """Get value from cache if not expired (TTL is stored per entry)."""
+    return _finnhub_cache.get(key)
 
 
 def _put_in_cache(key: str, value: Any, base_ttl: int = 0) -> None:
     """Put value in cache with jittered TTL."""
-    from src.lib.cache_utils import jittered_ttl
-
-    global _finnhub_cache
-    # Evict oldest entries if cache is full
-    if len(_finnhub_cache) >= _MAX_CACHE_ENTRIES:
-        oldest_key = min(_finnhub_cache.keys(), key=lambda k: _finnhub_cache[k][0])
-        del _finnhub_cache[oldest_key]
-    effective_ttl = jittered_ttl(base_ttl) if base_ttl > 0 else 0
-    _finnhub_cache[key] = (time.time(), value, effective_ttl)
+    _finnhub_cache.set(key, value, base_ttl)
 
 
 def clear_cache() -> None:
     """Clear the API response cache. Used in tests."""
-    global _finnhub_cache
-    _finnhub_cache = {}
+    _finnhub_cache.clear()
+
+
+def reset_rate_limiter() -> None:
+    """Refill the request token bucket. Used in tests."""
+    global _finnhub_rate_limiter
+    _finnhub_rate_limiter = TokenBucket(
+        rate=FINNHUB_RATE_LIMIT_PER_MINUTE / 60, capacity=FINNHUB_RATE_LIMIT_BURST
+    )
 
 
 class FinnhubAdapter(BaseAdapter):
@@ -160,6 +175,29 @@ class FinnhubAdapter(BaseAdapter):
 
         return response.json()
 
+    def _get(self, endpoint: str, params: dict) -> dict | list:
+        """Issue a rate-limited GET on a cache miss and return the parsed response.
+
+        Raises:
+            RateLimitError: If no request token frees up within
+                FINNHUB_RATE_LIMIT_WAIT_SECONDS
+        """
+        if not _finnhub_rate_limiter.acquire(timeout=FINNHUB_RATE_LIMIT_WAIT_SECONDS):
+            raise RateLimitError(
+                "Finnhub local rate limit exceeded",
+                retry_after=(
+                    int(1 / _finnhub_rate_limiter.rate) + 1
+                    if _finnhub_rate_limiter.rate > 0
+                    else 60
+                ),
+            )
+        logger.debug(
+            "Finnhub cache miss for %s %s",
+            endpoint,
+            sanitize_for_log(str(params.get("symbol", ""))),
+        )
+        return self._handle_response(self.client.get(endpoint, params=params))
+
     def get_news(
         self,
         tickers: list[str],
@@ -179,7 +217,11 @@ class FinnhubAdapter(BaseAdapter):
             limit: Maximum articles per ticker
 
         Returns:
-            List of normalized NewsArticle objects
+            List of normalized NewsArticle objects. If the rate limit is hit
+            part-way, the articles of the tickers fetched so far.
+
+        Raises:
+            RateLimitError: If the rate limit is hit before any ticker is fetched
         """
         if not tickers:
             return []
@@ -190,57 +232,88 @@ class FinnhubAdapter(BaseAdapter):
         if start_date is None:
             start_date = end_date - timedelta(days=7)
 
+        from_date = start_date.strftime("%Y-%m-%d")
+        to_date = end_date.strftime("%Y-%m-%d")
+
+        # Once the rate limit is hit, the remaining tickers are skipped and
+        # the articles gathered so far are returned
+        rate_limited: list[RateLimitError] = []
+
+        def fetch_ticker(ticker: str) -> list[NewsArticle] | None:
+            if rate_limited:
+                return None
+            try:
+                return self._get_ticker_news(ticker, from_date, to_date, limit)
+            except RateLimitError as e:
+                logger.warning(f"Finnhub news rate limited at {ticker}: {e}")
+                rate_limited.append(e)
+                return None
+
+        # One request per ticker: overlap them on a bounded pool sharing the
+        # httpx client; the module token bucket keeps us under the rate limit
+        workers = min(FINNHUB_NEWS_MAX_WORKERS, len(tickers))
+        if workers <= 1:
+            per_ticker = map(fetch_ticker, tickers)
+        else:
+            with ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="finnhub-news"
+            ) as pool:
+                per_ticker = list(pool.map(fetch_ticker, tickers))
+
+        results = [articles for articles in per_ticker if articles is not None]
+        if rate_limited and not results:
+            raise rate_limited[0]
+
+        # Results stay in ticker order, as with sequential fetching
+        return [article for articles in results for article in articles]
+
+    def _get_ticker_news(
+        self, ticker: str, from_date: str, to_date: str, limit: int
+    ) -> list[NewsArticle]:
+        """Fetch and parse company news for one ticker.
+
+        Request failures are logged and yield no articles so one ticker
+        cannot fail the batch; API errors (rate limit, auth) propagate, and
+        get_news() handles rate limits per ticker.
+        """
+        # DFA-004: Check cache first for each ticker
+        cache_params = {"symbol": ticker, "from": from_date, "to": to_date}
+        cache_key = _get_cache_key("/company-news", cache_params)
+        try:
+            # Cache the raw response
+            data = _finnhub_cache.get_or_load(
+                cache_key,
+                lambda: self._get("/company-news", cache_params),
+                API_CACHE_TTL_NEWS_SECONDS,
+            )
+        except httpx.RequestError as e:
+            logger.error(f"Finnhub news request failed for {ticker}: {e}")
+            return []  # Continue with other tickers
+
+        # Parse response - Finnhub returns array of news
         articles = []
-        for ticker in tickers:
-            # DFA-004: Check cache first for each ticker
-            cache_params = {
-                "symbol": ticker,
-                "from": start_date.strftime("%Y-%m-%d"),
-                "to": end_date.strftime("%Y-%m-%d"),
-            }
-            cache_key = _get_cache_key("/company-news", cache_params)
-            cached_data = _get_from_cache(cache_key, API_CACHE_TTL_NEWS_SECONDS)
-
-            if cached_data is not None:
-                logger.debug(f"Finnhub news cache hit for {ticker}")
-                data = cached_data
-            else:
-                try:
-                    response = self.client.get(
-                        "/company-news",
-                        params=cache_params,
-                    )
-                    data = self._handle_response(response)
-                    # Cache the raw response
-                    _put_in_cache(cache_key, data, API_CACHE_TTL_NEWS_SECONDS)
-                    logger.debug(f"Finnhub news cache miss for {ticker}, cached")
-                except httpx.RequestError as e:
-                    logger.error(f"Finnhub news request failed for {ticker}: {e}")
-                    continue  # Continue with other tickers
-
-            # Parse response - Finnhub returns array of news
-            for item in data[:limit]:
-                try:
-                    # Finnhub uses Unix timestamp (epoch seconds are UTC-anchored).
-                    # Feature 1398: parse as tz-aware UTC so published_at.isoformat()
-                    # matches Tiingo's, keeping the cross-source dedup SK identical.
-                    published_at = datetime.fromtimestamp(item["datetime"], tz=UTC)
-                    articles.append(
-                        NewsArticle(
-                            article_id=str(item.get("id", hash(item["headline"]))),
-                            source="finnhub",
-                            title=item["headline"],
-                            description=item.get("summary"),
-                            url=item.get("url"),
-                            published_at=published_at,
-                            tickers=[ticker],  # Finnhub is per-ticker
-                            tags=item.get("category", "").split(","),
-                            source_name=item.get("source"),
-                        )
+        for item in data[:limit]:
+            try:
+                # Finnhub uses Unix timestamp (epoch seconds are UTC-anchored).
+                # Feature 1398: parse as tz-aware UTC so published_at.isoformat()
+                # matches Tiingo's, keeping the cross-source dedup SK identical.
+                published_at = datetime.fromtimestamp(item["datetime"], tz=UTC)
+                articles.append(
+                    NewsArticle(
+                        article_id=str(item.get("id", hash(item["headline"]))),
+                        source="finnhub",
+                        title=item["headline"],
+                        description=item.get("summary"),
+                        url=item.get("url"),
+                        published_at=published_at,
+                        tickers=[ticker],  # Finnhub is per-ticker
+                        tags=item.get("category", "").split(","),
+                        source_name=item.get("source"),
                     )
-                except (KeyError, ValueError) as e:
-                    logger.warning(f"Failed to parse Finnhub article: {e}")
-                    continue
+                )
+            except (KeyError, ValueError) as e:
+                logger.warning(f"Failed to parse Finnhub article: {e}")
+                continue
 
         return articles
 
@@ -259,24 +332,16 @@ class FinnhubAdapter(BaseAdapter):
         # DFA-004: Check cache first
         cache_params = {"symbol": ticker}
         cache_key = _get_cache_key("/news-sentiment", cache_params)
-        cached_data = _get_from_cache(cache_key, API_CACHE_TTL_SENTIMENT_SECONDS)
-
-        if cached_data is not None:
-            logger.debug(f"Finnhub sentiment cache hit for {ticker}")
-            data = cached_data
-        else:
-            try:
-                response = self.client.get(
-                    "/news-sentiment",
-                    params=cache_params,
-                )
-                data = self._handle_response(response)
-                # Cache the raw response
-                _put_in_cache(cache_key, data, API_CACHE_TTL_SENTIMENT_SECONDS)
-                logger.debug(f"Finnhub sentiment cache miss for {ticker}, cached")
-            except httpx.RequestError as e:
-                logger.error(f"Finnhub sentiment request failed: {e}")
-                raise AdapterError(f"Finnhub sentiment request failed: {e}") from e
+        try:
+            # Cache the raw response
+            data = _finnhub_cache.get_or_load(
+                cache_key,
+                lambda: self._get("/news-sentiment", cache_params),
+                API_CACHE_TTL_SENTIMENT_SECONDS,
+            )
+        except httpx.RequestError as e:
+            logger.error(f"Finnhub sentiment request failed: {e}")
+            raise AdapterError(f"Finnhub sentiment request failed: {e}") from e
 
         # Check if data is valid
         if not data or not data.get("sentiment"):
@@ -347,26 +412,16 @@ class FinnhubAdapter(BaseAdapter):
             "to": to_ts,
         }
         cache_key = _get_cache_key("/stock/candle", cache_params)
-        cached_data = _get_from_cache(cache_key, cache_ttl)
-
-        if cached_data is not None:
-            logger.debug("Finnhub OHLC cache hit for %s", sanitize_for_log(ticker))
-            data = cached_data
-        else:
-            try:
-                response = self.client.get(
-                    "/stock/candle",
-                    params=cache_params,
-                )
-                data = self._handle_response(response)
-                # Cache the raw response
-                _put_in_cache(cache_key, data, cache_ttl)
-                logger.debug(
-                    "Finnhub OHLC cache miss for %s, cached", sanitize_for_log(ticker)
-                )
-            except httpx.RequestError as e:
-                logger.error(f"Finnhub OHLC request failed: {e}")
-                raise AdapterError(f"Finnhub OHLC request failed: {e}") from e
+        try:
+            # Cache the raw response
+            data = _finnhub_cache.get_or_load(
+                cache_key,
+                lambda: self._get("/stock/candle", cache_params),
+                cache_ttl,
+            )
+        except httpx.RequestError as e:
+            logger.error(f"Finnhub OHLC request failed: {e}")
+            raise AdapterError(f"Finnhub OHLC request failed: {e}") from e
 
         # Check for no data
         if data.get("s") == "no_data":
@@ -4,7 +4,6 @@ import hashlib
 import json
 import logging
 import os
-import time
 from datetime import UTC, datetime, timedelta
 from typing import Any, Literal
 
@@ -19,7 +18,7 @@ from src.lambdas.shared.adapters.base import (
     SentimentData,
 )
 from src.lambdas.shared.logging_utils import sanitize_for_log
-from src.lib.cache_utils import CacheStats, get_global_emitter
+from src.lib.cache_utils import TTLCache
 
 logger = logging.getLogger(__name__)
 
@@ -30,15 +29,20 @@ logger = logging.getLogger(__name__)
 # Cache TTL in seconds (default 30 minutes for news, 1 hour for OHLC)
 API_CACHE_TTL_NEWS_SECONDS = int(os.environ.get("API_CACHE_TTL_NEWS_SECONDS", "1800"))
 API_CACHE_TTL_OHLC_SECONDS = int(os.environ.get("API_CACHE_TTL_OHLC_SECONDS", "3600"))
-
-# Feature 1224: CacheStats for CloudWatch metric emission
-_tiingo_stats = CacheStats(name="tiingo")
-get_global_emitter().register(_tiingo_stats)
+# Stale-while-revalidate window: serve an expired entry this long while a
+# single caller refreshes it (0 = disabled)
+API_CACHE_STALE_SECONDS = int(os.environ.get("API_CACHE_STALE_SECONDS", "0"))
 
 # In-memory cache (survives Lambda warm invocations)
-# Feature 1224: tuple now (timestamp, value, effective_ttl) for jittered expiry
-_tiingo_cache: dict[str, tuple[float, Any, float]] = {}
+# Feature 1224: entries carry a jittered TTL; CacheStats registered by TTLCache
+# Concurrent misses for one key share a single request (get_or_load)
 _MAX_CACHE_ENTRIES = 100  # Prevent unbounded memory growth
+_tiingo_cache = TTLCache(
+    name="tiingo",
+    max_entries=_MAX_CACHE_ENTRIES,
+    stale_ttl=API_CACHE_STALE_SECONDS,
+)
+_tiingo_stats = _tiingo_cache.stats
 
 
 def _get_cache_key(endpoint: str, params: dict) -> str:
@@ -49,38 +53,18 @@ def _get_cache_key(endpoint: str, params: dict) -> str:
 
 
 def _get_from_cache(key: str, ttl: int) -> Any | None:
-    """Get value from cache if not expired."""
-    if key in _tiingo_cache:
-        entry = _tiingo_cache[key]
-        timestamp, value = entry[0], entry[1]
-        # Feature 1224: Use stored jittered TTL if available, else base TTL
-        effective_ttl = entry[2] if len(entry) > 2 else ttl
-        if time.time() - timestamp < effective_ttl:
-            _tiingo_stats.record_hit()
-            return value
-        # Expired - remove from cache
-        del _tiingo_cache[key]
-    _tiingo_stats.record_miss()
-    return None
+    """Get value from cache if not expired (TTL is stored per entry)."""
+    return _tiingo_cache.get(key)
 
 
 def _put_in_cache(key: str, value: Any, base_ttl: int = 0) -> None:
     """Put value in cache with jittered TTL."""
-    from src.lib.cache_utils import jittered_ttl
-
-    global _tiingo_cache
-    # Evict oldest entries if cache is full
-    if len(_tiingo_cache) >= _MAX_CACHE_ENTRIES:
-        oldest_key = min(_tiingo_cache.keys(), key=lambda k: _tiingo_cache[k][0])
-        del _tiingo_cache[oldest_key]
-    effective_ttl = jittered_ttl(base_ttl) if base_ttl > 0 else 0
-    _tiingo_cache[key] = (time.time(), value, effective_ttl)
+    _tiingo_cache.set(key, value, base_ttl)
 
 
 def clear_cache() -> None:
     """Clear the API response cache. Used in tests."""
-    global _tiingo_cache
-    _tiingo_cache = {}
+    _tiingo_cache.clear()
 
 
 class TiingoAdapter(BaseAdapter):
@@ -207,28 +191,29 @@ class TiingoAdapter(BaseAdapter):
             "limit": limit,
         }
         cache_key = _get_cache_key("/tiingo/news", cache_params)
-        cached_data = _get_from_cache(cache_key, API_CACHE_TTL_NEWS_SECONDS)
-        if cached_data is not None:
-            logger.debug(f"Tiingo news cache hit for {tickers_param}")
-            data = cached_data
-        else:
-            try:
-                response = self.client.get(
-                    "/tiingo/news",
-                    params=cache_params,
+
+        def fetch() -> dict | list:
+            response = self.client.get(
+                "/tiingo/news",
+                params=cache_params,
+            )
+            data = self._handle_response(response)
+            if data:
+                logger.debug(f"Tiingo news cache miss for {tickers_param}, cached")
+            else:
+                logger.warning(
+                    f"Tiingo news returned empty data for {tickers_param}, NOT caching"
                 )
-                data = self._handle_response(response)
-                # Only cache non-empty responses - 404s return [] and should not be cached
-                if data:
-                    _put_in_cache(cache_key, data, API_CACHE_TTL_NEWS_SECONDS)
-                    logger.debug(f"Tiingo news cache miss for {tickers_param}, cached")
-                else:
-                    logger.warning(
-                        f"Tiingo news returned empty data for {tickers_param}, NOT caching"
-                    )
-            except httpx.RequestError as e:
-                logger.error(f"Tiingo request failed: {e}")
-                raise AdapterError(f"Tiingo request failed: {e}") from e
+            return data
+
+        try:
+            # Only cache non-empty responses - 404s return [] and should not be cached
+            data = _tiingo_cache.get_or_load(
+                cache_key, fetch, API_CACHE_TTL_NEWS_SECONDS, cache_if=bool
+            )
+        except httpx.RequestError as e:
+            logger.error(f"Tiingo request failed: {e}")
+            raise AdapterError(f"Tiingo request failed: {e}") from e
 
         # Parse response
         articles = []
@@ -302,36 +287,37 @@ class TiingoAdapter(BaseAdapter):
             "endDate": end_date.strftime("%Y-%m-%d"),
         }
         cache_key = _get_cache_key(endpoint, cache_params)
-        cached_data = _get_from_cache(cache_key, API_CACHE_TTL_OHLC_SECONDS)
-        if cached_data is not None:
-            logger.debug("Tiingo OHLC cache hit for %s", sanitize_for_log(ticker))
-            data = cached_data
-        else:
-            try:
-                response = self.client.get(
-                    endpoint,
-                    params={
-                        "startDate": start_date.strftime("%Y-%m-%d"),
-                        "endDate": end_date.strftime("%Y-%m-%d"),
-                    },
+
+        def fetch() -> dict | list:
+            response = self.client.get(
+                endpoint,
+                params={
+                    "startDate": start_date.strftime("%Y-%m-%d"),
+                    "endDate": end_date.strftime("%Y-%m-%d"),
+                },
+            )
+            data = self._handle_response(response)
+            if data:
+                logger.debug(
+                    "Tiingo OHLC cache miss for %s, cached",
+                    sanitize_for_log(ticker),
                 )
-                data = self._handle_response(response)
-                # Only cache non-empty responses - 404s return [] and should not be cached
-                # This prevents "no data" errors from being cached for 1 hour
-                if data:
-                    _put_in_cache(cache_key, data, API_CACHE_TTL_OHLC_SECONDS)
-                    logger.debug(
-                        "Tiingo OHLC cache miss for %s, cached",
-                        sanitize_for_log(ticker),
-                    )
-                else:
-                    logger.warning(
-                        "Tiingo OHLC returned empty data for %s, NOT caching",
-                        sanitize_for_log(ticker),
-                    )
-            except httpx.RequestError as e:
-                logger.error(f"Tiingo OHLC request failed: {e}")
-                raise AdapterError(f"Tiingo OHLC request failed: {e}") from e
+            else:
+                logger.warning(
+                    "Tiingo OHLC returned empty data for %s, NOT caching",
+                    sanitize_for_log(ticker),
+                )
+            return data
+
+        try:
+            # Only cache non-empty responses - 404s return [] and should not be cached
+            # This prevents "no data" errors from being cached for 1 hour
+            data = _tiingo_cache.get_or_load(
+                cache_key, fetch, API_CACHE_TTL_OHLC_SECONDS, cache_if=bool
+            )
+        except httpx.RequestError as e:
+            logger.error(f"Tiingo OHLC request failed: {e}")
+            raise AdapterError(f"Tiingo OHLC request failed: {e}") from e
 
         # Parse response
         candles = []
@@ -404,41 +390,36 @@ class TiingoAdapter(BaseAdapter):
             "resampleFreq": resample_freq,
         }
         cache_key = _get_cache_key(endpoint, cache_params)
-        cached_data = _get_from_cache(cache_key, cache_ttl)
-        if cached_data is not None:
-            logger.debug(
-                "Tiingo IEX intraday cache hit for %s (%s)",
-                sanitize_for_log(ticker),
-                resample_freq,
+
+        def fetch() -> dict | list:
+            response = self.client.get(
+                endpoint,
+                params={
+                    "startDate": start_date.strftime("%Y-%m-%d"),
+                    "resampleFreq": resample_freq,
+                },
             )
-            data = cached_data
-        else:
-            try:
-                response = self.client.get(
-                    endpoint,
-                    params={
-                        "startDate": start_date.strftime("%Y-%m-%d"),
-                        "resampleFreq": resample_freq,
-                    },
+            data = self._handle_response(response)
+            if data:
+                logger.debug(
+                    "Tiingo IEX intraday cache miss for %s (%s), cached",
+                    sanitize_for_log(ticker),
+                    resample_freq,
                 )
-                data = self._handle_response(response)
-                # Only cache non-empty responses - 404s return [] and should not be cached
-                if data:
-                    _put_in_cache(cache_key, data, cache_ttl)
-                    logger.debug(
-                        "Tiingo IEX intraday cache miss for %s (%s), cached",
-                        sanitize_for_log(ticker),
-                        resample_freq,
-                    )
-                else:
-                    logger.warning(
-                        "Tiingo IEX intraday returned empty data for %s (%s), NOT caching",
-                        sanitize_for_log(ticker),
-                        resample_freq,
-                    )
-            except httpx.RequestError as e:
-                logger.error(f"Tiingo IEX intraday request failed: {e}")
-                raise AdapterError(f"Tiingo IEX intraday request failed: {e}") from e
+            else:
+                logger.warning(
+                    "Tiingo IEX intraday returned empty data for %s (%s), NOT caching",
+                    sanitize_for_log(ticker),
+                    resample_freq,
+                )
+            return data
+
+        try:
+            # Only cache non-empty responses - 404s return [] and should not be cached
+            data = _tiingo_cache.get_or_load(cache_key, fetch, cache_ttl, cache_if=bool)
+        except httpx.RequestError as e:
+            logger.error(f"Tiingo IEX intraday request failed: {e}")
+            raise AdapterError(f"Tiingo IEX intraday request failed: {e}") from e
 
         # Parse response (IEX format is slightly different from daily)
         candles = []
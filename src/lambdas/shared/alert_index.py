@@ -0,0 +1,28 @@
+"""Warm index of enabled alert rules, shared by the evaluator and alert CRUD.
+
+The alert evaluator caches every enabled ALERT_RULE grouped by ticker and
+reloads it every ALERT_INDEX_TTL_SECONDS. The dashboard alert endpoints
+call invalidate_alert_index() after creating, updating, toggling or
+deleting a rule, so an evaluation in the same process sees the change
+immediately instead of after the TTL.
+
+For On-Call Engineers:
+    The index is per process. A Lambda that evaluates alerts but did not
+    serve the rule change still picks it up within ALERT_INDEX_TTL_SECONDS.
+"""
+
+import os
+
+from src.lib.cache_utils import TTLCache
+
+ALERT_INDEX_TTL_SECONDS = int(os.environ.get("ALERT_INDEX_TTL_SECONDS", "60"))
+
+# One entry: ticker -> TickerAlertIndex for every enabled rule
+alert_index_cache = TTLCache(
+    name="alert_index", max_entries=1, ttl=ALERT_INDEX_TTL_SECONDS
+)
+
+
+def invalidate_alert_index() -> None:
+    """Drop the warm alert index so the next evaluation reloads it."""
+    alert_index_cache.clear()
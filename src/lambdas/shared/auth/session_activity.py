@@ -0,0 +1,278 @@
+"""Write-behind session activity tracking for validate_session.
+
+Every authenticated request validates its session, and each validation
+used to write last_active_at (and, with extend_on_valid, a new expiry) to
+the users table. Those touches were the largest write source on the
+table. This module keeps that work off the request path:
+
+- Validated sessions are cached in-process for SESSION_CACHE_TTL_SECONDS,
+  keyed by table, user_id and the token's revocation id, so repeated
+  requests skip the GetItem.
+- Touches are coalesced per user: a user is written at most once per
+  SESSION_WRITE_INTERVAL_SECONDS. Touches inside the interval are merged
+  (latest last_active_at, furthest expiry) and written by
+  flush_session_activity() at invocation end, once the interval has
+  passed.
+- Expiry extensions are conditional on the session still being live, so
+  a deferred write can never revive a signed-out or revoked session.
+
+For On-Call Engineers:
+    A revocation or sign-out handled by another execution environment is
+    seen here within SESSION_CACHE_TTL_SECONDS; set it to 0 to disable the
+    cache. last_active_at lags real activity by up to
+    SESSION_WRITE_INTERVAL_SECONDS.
+
+Security Notes:
+    - Cache hits still run check_revocation_id() against the cached
+      revocation_id
+    - sign_out and revoke_user_session invalidate the cache and drop
+      pending touches for the user in this environment
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
+
+from botocore.exceptions import ClientError
+
+from src.lambdas.shared.logging_utils import get_safe_error_info, sanitize_for_log
+from src.lib.cache_utils import TTLCache
+
+logger = logging.getLogger(__name__)
+
+# Configuration
+SESSION_CACHE_TTL_SECONDS = float(os.environ.get("SESSION_CACHE_TTL_SECONDS", "10"))
+SESSION_WRITE_INTERVAL_SECONDS = float(
+    os.environ.get("SESSION_WRITE_INTERVAL_SECONDS", "60")
+)
+SESSION_CACHE_MAX_ENTRIES = 10_000
+
+# ttl_timestamp stays this long past session expiry (as in extend_session_expiry)
+TTL_GRACE_SECONDS = 90 * 24 * 3600
+
+
+@dataclass(frozen=True)
+class CachedSession:
+    """A session validated against DynamoDB within the cache TTL.
+
+    Attributes:
+        user_id: User UUID
+        pk: Users table partition key
+        sk: Users table sort key
+        auth_type: "anonymous" or an authenticated type
+        session_expires_at: Expiry, including touches not yet written
+        revocation_id: User's revocation_id when validated
+    """
+
+    user_id: str
+    pk: str
+    sk: str
+    auth_type: str
+    session_expires_at: datetime
+    revocation_id: int
+
+
+@dataclass
+class _PendingTouch:
+    """Merged touches for one user not yet written."""
+
+    table: Any
+    pk: str
+    sk: str
+    last_active_at: datetime
+    session_expires_at: datetime | None = None
+
+
+_sessions = TTLCache(
+    name="validated_sessions",
+    max_entries=SESSION_CACHE_MAX_ENTRIES,
+    ttl=SESSION_CACHE_TTL_SECONDS,
+)
+_lock = threading.Lock()
+_pending: dict[str, _PendingTouch] = {}
+# user_id -> time.monotonic() of the last write
+_last_written: dict[str, float] = {}
+
+
+def _cache_key(table: Any, user_id: str, rev: int | None) -> str:
+    # user_id first so invalidate_session() can drop every key by prefix
+    return f"{user_id}#{getattr(table, 'name', '')}#{rev}"
+
+
+def get_cached_session(
+    table: Any, user_id: str, rev: int | None = None
+) -> CachedSession | None:
+    """Return a recently validated session, or None.
+
+    Args:
+        table: DynamoDB Table resource the session was validated against
+        user_id: User UUID
+        rev: Revocation id from the caller's JWT (None without a JWT)
+    """
+    if SESSION_CACHE_TTL_SECONDS <= 0:
+        return None
+    return _sessions.get(_cache_key(table, user_id, rev))
+
+
+def cache_session(table: Any, session: CachedSession, rev: int | None = None) -> None:
+    """Cache a session that passed validation against DynamoDB."""
+    if SESSION_CACHE_TTL_SECONDS <= 0:
+        return
+    _sessions.set(_cache_key(table, session.user_id, rev), session)
+
+
+def invalidate_session(user_id: str) -> None:
+    """Forget cached validations and pending touches for a user.
+
+    Called when this environment signs a user out or revokes a session.
+    """
+    _sessions.invalidate(prefix=f"{user_id}#")
+    with _lock:
+        _pending.pop(user_id, None)
+
+
+def record_touch(
+    table: Any,
+    session: CachedSession,
+    new_expiry: datetime | None = None,
+) -> None:
+    """Record activity for a validated session.
+
+    Written immediately if the user was not written within
+    SESSION_WRITE_INTERVAL_SECONDS, otherwise merged into the pending
+    touch for flush_session_activity().
+
+    Args:
+        table: DynamoDB Table resource
+        session: The validated session
+        new_expiry: Sliding expiry to extend the session to, if any
+    """
+    now = datetime.now(UTC)
+    with _lock:
+        touch = _pending.get(session.user_id)
+        if touch is None:
+            touch = _pending[session.user_id] = _PendingTouch(
+                table=table, pk=session.pk, sk=session.sk, last_active_at=now
+            )
+        touch.last_active_at = now
+        if new_expiry is not None and (
+            touch.session_expires_at is None or new_expiry > touch.session_expires_at
+        ):
+            touch.session_expires_at = new_expiry
+        if not _is_due(session.user_id):
+            return
+        _pending.pop(session.user_id)
+        _last_written[session.user_id] = time.monotonic()
+
+    _write_touch(session.user_id, touch)
+
+
+def flush_session_activity(force: bool = False) -> int:
+    """Write pending touches whose write interval has passed.
+
+    Handlers call this at the end of each invocation.
+
+    Args:
+        force: Write every pending touch regardless of the interval
+
+    Returns:
+        Number of users written
+    """
+    with _lock:
+        due = [user_id for user_id in _pending if force or _is_due(user_id)]
+        touches = [(user_id, _pending.pop(user_id)) for user_id in due]
+        now = time.monotonic()
+        # Forget users whose interval has passed with nothing pending
+        for user_id in [
+            u
+            for u, last in _last_written.items()
+            if now - last >= SESSION_WRITE_INTERVAL_SECONDS and u not in _pending
+        ]:
+            del _last_written[user_id]
+        for user_id in due:
+            _last_written[user_id] = now
+
+    for user_id, touch in touches:
+        _write_touch(user_id, touch)
+    return len(touches)
+
+
+def clear_session_activity() -> None:
+    """Drop cached sessions and pending touches (for testing)."""
+    _sessions.clear()
+    with _lock:
+        _pending.clear()
+        _last_written.clear()
+
+
+def _is_due(user_id: str) -> bool:
+    """Whether the user may be written now. Caller holds _lock."""
+    last = _last_written.get(user_id)
+    if last is None:
+        return True
+    if time.monotonic() - last >= SESSION_WRITE_INTERVAL_SECONDS:
+        # Keep the map bounded by recently written users
+        del _last_written[user_id]
+        return True
+    return False
+
+
+def _write_touch(user_id: str, touch: _PendingTouch) -> None:
+    """One UpdateItem for a user's merged touches.
+
+    Silent failure - activity tracking never fails a request.
+    """
+    try:
+        if touch.session_expires_at is None:
+            touch.table.update_item(
+                Key={"PK": touch.pk, "SK": touch.sk},
+                UpdateExpression="SET last_active_at = :now",
+                # Never recreate a deleted session as an item with no TTL
+                ConditionExpression="attribute_exists(PK)",
+                ExpressionAttributeValues={
+                    ":now": touch.last_active_at.isoformat(),
+                },
+            )
+            return
+
+        touch.table.update_item(
+            Key={"PK": touch.pk, "SK": touch.sk},
+            UpdateExpression=(
+                "SET last_active_at = :now, session_expires_at = :expires, #ttl = :ttl"
+            ),
+            # Only extend a session that is still live and not revoked
+            ConditionExpression=(
+                "session_expires_at > :now "
+                "AND (attribute_not_exists(revoked) OR revoked = :false)"
+            ),
+            ExpressionAttributeNames={"#ttl": "ttl_timestamp"},
+            ExpressionAttributeValues={
+                ":now": touch.last_active_at.isoformat(),
+                ":expires": touch.session_expires_at.isoformat(),
+                ":ttl": int(touch.session_expires_at.timestamp()) + TTL_GRACE_SECONDS,
+                ":false": False,
+            },
+        )
+    except ClientError as e:
+        if e.response.get("Error", {}).get("Code") == "ConditionalCheckFailedException":
+            logger.info(
+                "Skipped session activity write for ended session",
+                extra={"user_id_prefix": sanitize_for_log(user_id[:8])},
+            )
+            invalidate_session(user_id)
+            return
+        logger.warning(
+            "Failed to write session activity",
+            extra=get_safe_error_info(e),
+        )
+    except Exception as e:
+        logger.warning(
+            "Failed to write session activity",
+            extra=get_safe_error_info(e),
+        )
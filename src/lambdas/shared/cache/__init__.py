@@ -2,12 +2,19 @@
 
 from src.lambdas.shared.cache.ohlc_cache import (
     CachedCandle,
+    CandleColumns,
     OHLCCacheResult,
     candles_to_cached,
+    get_cached_candle_columns,
     get_cached_candles,
     is_market_open,
     put_cached_candles,
 )
+from src.lambdas.shared.cache.response_cache import (
+    CachedResponse,
+    ResponseCache,
+    cached_json_response,
+)
 from src.lambdas.shared.cache.ticker_cache import (
     TickerCache,
     TickerInfo,
@@ -23,9 +30,15 @@ __all__ = [
     "clear_ticker_cache",
     # OHLC persistent cache (Feature 1087)
     "CachedCandle",
+    "CandleColumns",
     "OHLCCacheResult",
     "get_cached_candles",
+    "get_cached_candle_columns",
     "put_cached_candles",
     "candles_to_cached",
     "is_market_open",
+    # Pre-serialized response cache
+    "CachedResponse",
+    "ResponseCache",
+    "cached_json_response",
 ]
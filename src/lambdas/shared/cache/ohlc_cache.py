@@ -7,6 +7,12 @@ Key Design:
 - PK: {ticker}#{source} (e.g., "AAPL#tiingo")
 - SK: {resolution}#{timestamp} (e.g., "5m#2025-12-27T10:30:00Z")
 
+Read Path:
+- One DynamoDB client per region is reused across invocations
+- Queries follow LastEvaluatedKey, so ranges larger than 1 MB are complete
+- Long intraday ranges are split into SK sub-ranges queried concurrently
+- Items parse straight into CandleColumns (typed arrays, no per-row model)
+
 For On-Call Engineers:
     If cache queries are slow:
     1. Check DynamoDB table exists and has correct billing mode
@@ -15,14 +21,19 @@ For On-Call Engineers:
 """
 
 import logging
+import math
 import os
 import time
-from datetime import UTC, datetime
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
 from decimal import Decimal
-from typing import NamedTuple
+from typing import Any, NamedTuple
 from zoneinfo import ZoneInfo
 
 import boto3
+from botocore.config import Config
 from pydantic import BaseModel, Field
 
 logger = logging.getLogger(__name__)
@@ -72,6 +83,68 @@ BATCH_WRITE_BASE_DELAY_MS = 100
 # Intraday resolutions (anything other than daily)
 _DAILY_RESOLUTIONS = {"D", "1D", "d", "1d", "daily"}
 
+# Parallel read constants: intraday ranges longer than one segment span are
+# split into up to MAX_QUERY_SEGMENTS SK sub-ranges queried concurrently.
+QUERY_SEGMENT_SPAN = timedelta(days=30)
+MAX_QUERY_SEGMENTS = 8
+
+# Reused DynamoDB clients keyed by region (Lambda global scope caching)
+_dynamodb_clients: dict[str, Any] = {}
+
+
+@dataclass
+class CandleColumns:
+    """Cached candles as parallel typed arrays, sorted by timestamp.
+
+    Avoids building one CachedCandle model per row on large reads; use
+    to_cached_candles() where the model list is needed.
+    """
+
+    source: str
+    resolution: str
+    timestamps: array = field(default_factory=lambda: array("d"))  # epoch seconds
+    open: array = field(default_factory=lambda: array("d"))
+    high: array = field(default_factory=lambda: array("d"))
+    low: array = field(default_factory=lambda: array("d"))
+    close: array = field(default_factory=lambda: array("d"))
+    volume: array = field(default_factory=lambda: array("q"))
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def extend(self, other: "CandleColumns") -> None:
+        """Append another (later) segment's columns in place."""
+        self.timestamps.extend(other.timestamps)
+        self.open.extend(other.open)
+        self.high.extend(other.high)
+        self.low.extend(other.low)
+        self.close.extend(other.close)
+        self.volume.extend(other.volume)
+
+    def to_cached_candles(self) -> list["CachedCandle"]:
+        """Materialize the columns as CachedCandle models."""
+        return [
+            CachedCandle(
+                timestamp=datetime.fromtimestamp(ts, tz=UTC),
+                open=o,
+                high=h,
+                low=lo,
+                close=c,
+                volume=v,
+                source=self.source,
+                resolution=self.resolution,
+            )
+            for ts, o, h, lo, c, v in zip(
+                self.timestamps,
+                self.open,
+                self.high,
+                self.low,
+                self.close,
+                self.volume,
+                strict=True,
+            )
+        ]
+
 
 def _compute_ttl(resolution: str, candles: list["CachedCandle"]) -> int:
     """Compute TTL epoch seconds for a batch of candles.
@@ -117,15 +190,29 @@ def _get_table_name() -> str:
 
 
 def _get_dynamodb_client():
-    """Get DynamoDB client (lazy initialization).
+    """Get DynamoDB client (lazy initialization, reused per region).
 
     Uses AWS_REGION or AWS_DEFAULT_REGION from environment.
-    Falls back to us-east-1 if neither is set.
+    Falls back to us-east-1 if neither is set. The connection pool is sized
+    for MAX_QUERY_SEGMENTS concurrent segment queries.
     """
     region = os.environ.get("AWS_REGION") or os.environ.get(
         "AWS_DEFAULT_REGION", "us-east-1"
     )
-    return boto3.client("dynamodb", region_name=region)
+    client = _dynamodb_clients.get(region)
+    if client is None:
+        client = boto3.client(
+            "dynamodb",
+            region_name=region,
+            config=Config(max_pool_connections=MAX_QUERY_SEGMENTS),
+        )
+        _dynamodb_clients[region] = client
+    return client
+
+
+def clear_client_cache() -> None:
+    """Drop reused DynamoDB clients (for testing)."""
+    _dynamodb_clients.clear()
 
 
 def _build_pk(ticker: str, source: str) -> str:
@@ -199,33 +286,72 @@ def get_cached_candles(
     Returns:
         OHLCCacheResult with candles and cache hit status
     """
+    columns = get_cached_candle_columns(
+        ticker, source, resolution, start_time, end_time
+    )
+    if not len(columns):
+        return OHLCCacheResult(cache_hit=False)
+
+    return OHLCCacheResult(
+        candles=columns.to_cached_candles(),
+        cache_hit=True,
+    )
+
+
+def get_cached_candle_columns(
+    ticker: str,
+    source: str,
+    resolution: str,
+    start_time: datetime,
+    end_time: datetime,
+) -> CandleColumns:
+    """Query DynamoDB for cached OHLC candles as columns.
+
+    Reads every page of the range. Intraday ranges longer than
+    QUERY_SEGMENT_SPAN are split into SK sub-ranges queried concurrently.
+
+    Args:
+        ticker: Stock symbol (e.g., "AAPL")
+        source: Data provider ("tiingo" or "finnhub")
+        resolution: Candle resolution ("1", "5", "15", "30", "60", "D")
+        start_time: Range start (inclusive, UTC)
+        end_time: Range end (inclusive, UTC)
+
+    Returns:
+        CandleColumns sorted by timestamp (empty on cache miss)
+
+    Raises:
+        ClientError: If a DynamoDB query fails
+    """
+    columns = CandleColumns(source=source, resolution=resolution)
     table_name = _get_table_name()
     if not table_name:
         logger.warning("OHLC cache table not configured")
-        return OHLCCacheResult(cache_hit=False)
+        return columns
 
     pk = _build_pk(ticker, source)
-    sk_start = _build_sk(resolution, start_time)
-    sk_end = _build_sk(resolution, end_time)
-
+    segments = _split_range(resolution, start_time, end_time)
     client = _get_dynamodb_client()
-    response = client.query(
-        TableName=table_name,
-        KeyConditionExpression="PK = :pk AND SK BETWEEN :start AND :end",
-        ExpressionAttributeValues={
-            ":pk": {"S": pk},
-            ":start": {"S": sk_start},
-            ":end": {"S": sk_end},
-        },
-        ProjectionExpression="SK, #o, high, low, #c, volume",
-        ExpressionAttributeNames={
-            "#o": "open",  # 'open' is reserved word
-            "#c": "close",  # 'close' is reserved word
-        },
-    )
 
-    items = response.get("Items", [])
-    if not items:
+    if len(segments) == 1:
+        results = [
+            _query_segment(client, table_name, pk, resolution, source, *segments[0])
+        ]
+    else:
+        with ThreadPoolExecutor(max_workers=len(segments)) as executor:
+            futures = [
+                executor.submit(
+                    _query_segment, client, table_name, pk, resolution, source, *seg
+                )
+                for seg in segments
+            ]
+            results = [future.result() for future in futures]
+
+    # Segments are disjoint and in order, and each is SK-sorted
+    for segment_columns in results:
+        columns.extend(segment_columns)
+
+    if not len(columns):
         logger.debug(
             "OHLC cache miss",
             extra={
@@ -234,30 +360,7 @@ def get_cached_candles(
                 "resolution": resolution,
             },
         )
-        return OHLCCacheResult(cache_hit=False)
-
-    candles = []
-    for item in items:
-        try:
-            res, ts = _parse_sk(item["SK"]["S"])
-            candles.append(
-                CachedCandle(
-                    timestamp=ts,
-                    open=float(item["open"]["N"]),
-                    high=float(item["high"]["N"]),
-                    low=float(item["low"]["N"]),
-                    close=float(item["close"]["N"]),
-                    volume=int(item.get("volume", {}).get("N", 0)),
-                    source=source,
-                    resolution=res,
-                )
-            )
-        except (KeyError, ValueError) as e:
-            logger.warning(
-                "Failed to parse cached candle",
-                extra={"error": str(e), "item": item},
-            )
-            continue
+        return columns
 
     logger.info(
         "OHLC cache hit",
@@ -265,14 +368,97 @@ def get_cached_candles(
             "ticker": ticker,
             "source": source,
             "resolution": resolution,
-            "count": len(candles),
+            "count": len(columns),
+            "segments": len(segments),
         },
     )
+    return columns
 
-    return OHLCCacheResult(
-        candles=sorted(candles, key=lambda c: c.timestamp),
-        cache_hit=True,
-    )
+
+def _split_range(
+    resolution: str, start_time: datetime, end_time: datetime
+) -> list[tuple[datetime, datetime]]:
+    """Split [start, end] into disjoint inclusive sub-ranges for parallel reads.
+
+    SKs have second precision, so each segment ends one second before the
+    next begins. Daily ranges are small enough to read as one segment.
+    """
+    span = end_time - start_time
+    if resolution in _DAILY_RESOLUTIONS or span <= QUERY_SEGMENT_SPAN:
+        return [(start_time, end_time)]
+
+    count = min(MAX_QUERY_SEGMENTS, math.ceil(span / QUERY_SEGMENT_SPAN))
+    step = span / count
+    bounds = [start_time + step * i for i in range(count)] + [end_time]
+    return [
+        (
+            bounds[i],
+            bounds[i + 1] - timedelta(seconds=1) if i < count - 1 else end_time,
+        )
+        for i in range(count)
+    ]
+
+
+def _query_segment(
+    client: Any,
+    table_name: str,
+    pk: str,
+    resolution: str,
+    source: str,
+    start_time: datetime,
+    end_time: datetime,
+) -> CandleColumns:
+    """Read every page of one SK range into columns."""
+    columns = CandleColumns(source=source, resolution=resolution)
+    query_kwargs: dict[str, Any] = {
+        "TableName": table_name,
+        "KeyConditionExpression": "PK = :pk AND SK BETWEEN :start AND :end",
+        "ExpressionAttributeValues": {
+            ":pk": {"S": pk},
+            ":start": {"S": _build_sk(resolution, start_time)},
+            ":end": {"S": _build_sk(resolution, end_time)},
+        },
+        "ProjectionExpression": "SK, #o, high, low, #c, volume",
+        "ExpressionAttributeNames": {
+            "#o": "open",  # 'open' is reserved word
+            "#c": "close",  # 'close' is reserved word
+        },
+    }
+
+    while True:
+        response = client.query(**query_kwargs)
+        _append_items(columns, response.get("Items", []))
+        last_key = response.get("LastEvaluatedKey")
+        if not last_key:
+            return columns
+        query_kwargs["ExclusiveStartKey"] = last_key
+
+
+def _append_items(columns: CandleColumns, items: list[dict]) -> None:
+    """Parse low-level DynamoDB items onto the columns, skipping bad rows."""
+    for item in items:
+        try:
+            _, timestamp = item["SK"]["S"].split("#", 1)
+            ts = datetime.fromisoformat(timestamp).timestamp()
+            row = (
+                float(item["open"]["N"]),
+                float(item["high"]["N"]),
+                float(item["low"]["N"]),
+                float(item["close"]["N"]),
+                int(item.get("volume", {}).get("N", 0)),
+            )
+        except (KeyError, ValueError) as e:
+            logger.warning(
+                "Failed to parse cached candle",
+                extra={"error": str(e), "item": item},
+            )
+            continue
+        columns.timestamps.append(ts)
+        columns.open.append(row[0])
+        columns.high.append(row[1])
+        columns.low.append(row[2])
+        columns.close.append(row[3])
+        columns.volume.append(row[4])
 
 
 def put_cached_candles(
@@ -0,0 +1,162 @@
+"""Pre-serialized response cache with ETag support.
+
+Stores finished JSON bodies with a strong ETag so cache hits skip
+serialization entirely, and conditional requests (If-None-Match) are
+answered with 304 Not Modified without touching the payload.
+
+Storage, TTL jitter, LRU eviction and stats come from TTLCache.
+
+For On-Call Engineers:
+    Hit/miss counts for each cache are emitted via CacheStats
+    (Cache/Hits, Cache/Misses with a Cache dimension). A 304 rate near
+    zero on a hot endpoint usually means clients are not sending
+    If-None-Match, not that the cache is cold.
+"""
+
+import hashlib
+import time
+from collections.abc import Callable, Hashable
+from typing import Any, NamedTuple
+
+import orjson
+from aws_lambda_powertools.event_handler import Response
+
+from src.lambdas.shared.utils.event_helpers import get_header
+from src.lib.cache_utils import TTLCache
+
+
+class CachedResponse(NamedTuple):
+    """A cached payload and its serialized body."""
+
+    payload: Any
+    body: str
+    etag: str
+    stored_at: float
+
+    @property
+    def age(self) -> int:
+        """Seconds since the entry was stored."""
+        return int(time.time() - self.stored_at)
+
+
+def make_etag(body: str) -> str:
+    """Build a strong ETag from a serialized body."""
+    return '"' + hashlib.blake2b(body.encode(), digest_size=16).hexdigest() + '"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Check an If-None-Match header against an ETag (weak comparison).
+
+    Args:
+        if_none_match: Raw If-None-Match header value, or None
+        etag: Current entity tag (quoted)
+
+    Returns:
+        True if the client's copy is current and a 304 can be returned
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+def cached_json_response(
+    entry: CachedResponse,
+    event: dict,
+    headers: dict[str, str] | None = None,
+) -> Response:
+    """Build a 200 or 304 response from a cache entry.
+
+    Args:
+        entry: Cache entry to serve
+        event: API Gateway event (for If-None-Match)
+        headers: Additional response headers
+
+    Returns:
+        304 with no body if If-None-Match matches, else 200 with the cached body
+    """
+    response_headers = {**(headers or {}), "ETag": entry.etag}
+    if etag_matches(get_header(event, "If-None-Match"), entry.etag):
+        return Response(status_code=304, body="", headers=response_headers)
+    return Response(
+        status_code=200,
+        content_type="application/json",
+        body=entry.body,
+        headers=response_headers,
+    )
+
+
+def _entry_size(response: CachedResponse) -> int:
+    # The payload is held too; its serialized length stands in for its size
+    return 2 * len(response.body)
+
+
+class ResponseCache(TTLCache):
+    """TTLCache of pre-serialized responses.
+
+    Values are CachedResponse; max_bytes (if set) bounds the summed size of
+    bodies and payloads (each payload counted at its body's length), so a
+    few very large payloads cannot exhaust Lambda memory.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_entries: int,
+        ttl: float = 0,
+        max_bytes: int | None = None,
+        on_evict: Callable[[Hashable], None] | None = None,
+    ) -> None:
+        """Initialize response cache.
+
+        Args:
+            name: Cache name for CacheStats / CloudWatch dimension.
+            max_entries: Maximum number of entries before LRU eviction.
+            ttl: Default base TTL in seconds (jittered per entry).
+            max_bytes: Optional bound on summed body and payload size.
+            on_evict: Called with the key of each entry evicted for space.
+        """
+        super().__init__(
+            name,
+            max_entries,
+            ttl=ttl,
+            max_bytes=max_bytes,
+            sizeof=_entry_size,
+            on_evict=on_evict,
+        )
+
+    def put(
+        self,
+        key: str,
+        payload: Any,
+        ttl: float | None = None,
+        body: str | None = None,
+    ) -> CachedResponse:
+        """Serialize (unless body is given) and store a payload.
+
+        Args:
+            key: Cache key
+            payload: JSON-serializable payload (kept for callers needing data)
+            ttl: Base TTL in seconds; defaults to the cache's ttl
+            body: Pre-serialized body; defaults to orjson.dumps(payload)
+
+        Returns:
+            The stored response
+        """
+        if body is None:
+            body = orjson.dumps(payload).decode()
+        response = CachedResponse(
+            payload=payload,
+            body=body,
+            etag=make_etag(body),
+            stored_at=time.time(),
+        )
+        self.set(key, response, ttl)
+        return response
@@ -12,11 +12,13 @@ import logging
 import os
 import threading
 import time
+from collections import defaultdict
+from collections.abc import Iterable
 from datetime import UTC, datetime
 from typing import Literal
 
 import boto3
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 from src.lambdas.shared.retry import s3_retry
 from src.lib.cache_utils import CacheStats, jittered_ttl, validate_non_empty
@@ -43,6 +45,89 @@ class TickerInfo(BaseModel):
     delisting_reason: str | None = None
 
 
+class _TickerSearchIndex:
+    """Prefix and trigram index over active tickers for autocomplete.
+
+    Built once per ticker list (~8K symbols); the autocomplete endpoint
+    searches on every keystroke.
+
+    - Ranking is precomputed: each active ticker's rank is its position in
+      the ticker list, and every posting list below is in rank order.
+    - Symbol prefixes: every prefix of every symbol (at most 5 each) maps to
+      the ranked tickers sharing it - a flattened trie, one dict lookup.
+    - Company names: every trigram of the lowercased name maps to the
+      ranked tickers containing it. A query walks the posting list of its
+      rarest trigram and confirms the substring, stopping at limit.
+      Queries under 3 characters walk all names in rank order instead;
+      they match densely, so the early exit comes quickly.
+    """
+
+    GRAM_SIZE = 3
+
+    def __init__(self, symbols: dict[str, TickerInfo]):
+        self._tickers = [t for t in symbols.values() if t.is_active]
+        self._names = [t.name.lower() for t in self._tickers]
+        self._by_symbol = {t.symbol: rank for rank, t in enumerate(self._tickers)}
+
+        n = self.GRAM_SIZE
+        prefixes: defaultdict[str, list[int]] = defaultdict(list)
+        grams: defaultdict[str, list[int]] = defaultdict(list)
+        for rank, ticker in enumerate(self._tickers):
+            symbol = ticker.symbol
+            for end in range(len(symbol) + 1):
+                prefixes[symbol[:end]].append(rank)
+            name = self._names[rank]
+            for gram in {name[i : i + n] for i in range(len(name) - n + 1)}:
+                grams[gram].append(rank)
+        self._prefixes = dict(prefixes)
+        self._grams = dict(grams)
+
+    def search(self, query: str, limit: int) -> list[TickerInfo]:
+        if limit <= 0:
+            return []
+        query_upper = query.upper()
+        query_lower = query.lower()
+        ranks: list[int] = []
+        seen: set[int] = set()
+
+        def add(rank: int) -> bool:
+            if rank not in seen:
+                seen.add(rank)
+                ranks.append(rank)
+            return len(ranks) >= limit
+
+        # Exact symbol match, then symbol prefix matches
+        exact = self._by_symbol.get(query_upper)
+        if exact is not None and add(exact):
+            return self._results(ranks)
+        for rank in self._prefixes.get(query_upper, ()):
+            if add(rank):
+                return self._results(ranks)
+
+        # Company name contains query
+        for rank in self._name_candidates(query_lower):
+            if query_lower in self._names[rank] and add(rank):
+                break
+        return self._results(ranks)
+
+    def _name_candidates(self, query_lower: str) -> Iterable[int]:
+        """Ranks whose names may contain the query, in rank order."""
+        n = self.GRAM_SIZE
+        if len(query_lower) < n:
+            return range(len(self._names))
+        shortest: list[int] | None = None
+        for i in range(len(query_lower) - n + 1):
+            postings = self._grams.get(query_lower[i : i + n])
+            if postings is None:
+                return ()
+            if shortest is None or len(postings) < len(shortest):
+                shortest = postings
+        return shortest or ()
+
+    def _results(self, ranks: list[int]) -> list[TickerInfo]:
+        return [self._tickers[rank] for rank in ranks]
+
+
 class TickerCache(BaseModel):
     """Static cache of ~8K US stock symbols.
 
@@ -61,6 +146,8 @@ class TickerCache(BaseModel):
 
     model_config = {"arbitrary_types_allowed": True}
 
+    _index: "_TickerSearchIndex" = PrivateAttr()
+
     @classmethod
     def load_from_s3(cls, bucket: str, key: str) -> "TickerCache":
         """Load cache from S3 bucket.
@@ -151,9 +238,17 @@ class TickerCache(BaseModel):
             exchanges=exchanges,
         )
 
+    def model_post_init(self, __context) -> None:
+        """Build the search index once per loaded ticker list."""
+        self._index = _TickerSearchIndex(self.symbols)
+
     def search(self, query: str, limit: int = 10) -> list[TickerInfo]:
         """Search by symbol prefix or company name.
 
+        Results are ranked: exact symbol match, then symbol prefix matches,
+        then company names containing the query, each group in ticker list
+        order. Served from the index built at load time.
+
         Args:
             query: Search query (case-insensitive)
             limit: Maximum results to return
@@ -161,33 +256,7 @@ class TickerCache(BaseModel):
         Returns:
             List of matching TickerInfo objects
         """
-        query_upper = query.upper()
-        query_lower = query.lower()
-        results = []
-
-        # First pass: exact symbol match
-        if query_upper in self.symbols:
-            ticker = self.symbols[query_upper]
-            if ticker.is_active:
-                results.append(ticker)
-
-        # Second pass: symbol prefix match
-        for symbol, ticker in self.symbols.items():
-            if ticker.is_active and symbol.startswith(query_upper):
-                if ticker not in results:
-                    results.append(ticker)
-                    if len(results) >= limit:
-                        return results
-
-        # Third pass: company name contains
-        for ticker in self.symbols.values():
-            if ticker.is_active and query_lower in ticker.name.lower():
-                if ticker not in results:
-                    results.append(ticker)
-                    if len(results) >= limit:
-                        return results
-
-        return results[:limit]
+        return self._index.search(query, limit)
 
     def validate(
         self, symbol: str
@@ -0,0 +1,495 @@
+"""Sentiment-price correlation engine.
+
+Aligns sentiment-timeseries buckets with close-to-close price returns at
+the same resolution and computes, per ticker:
+- Pearson and Spearman correlation over the aligned sample
+- rolling Pearson over a fixed window of buckets
+- lagged cross-correlation, sentiment leading (lag > 0) or trailing
+  (lag < 0) returns by whole buckets
+- sentiment and volatility (mean absolute return) trend, last window
+  against the window before it
+
+Lags, rolling windows and trend windows count buckets of time, not
+aligned points: each series is laid on a contiguous bucket grid from its
+first to its last aligned bucket, with gaps (no news, market closed) left
+empty, so a lag of one always pairs adjacent buckets.
+
+With NumPy available every ticker is computed at once on right-aligned,
+NaN-padded (tickers x buckets) matrices; otherwise a pure-Python pass per
+ticker gives the same values.
+"""
+
+import math
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
+from typing import Literal
+
+try:
+    import numpy as np
+except ImportError:  # numpy not packaged in every Lambda
+    np = None
+
+# Fewer aligned points than this give no correlation (None)
+MIN_SAMPLES = 10
+
+DEFAULT_WINDOW = 20
+DEFAULT_MAX_LAG = 5
+
+# Change in mean sentiment (score units) that counts as a trend
+SENTIMENT_TREND_THRESHOLD = 0.05
+# Relative change in mean absolute return that counts as a trend
+VOLATILITY_TREND_THRESHOLD = 0.1
+
+Trend = Literal["increasing", "decreasing", "stable"]
+
+
+@dataclass
+class AlignedSeries:
+    """Sentiment and price return per bucket, for buckets having both."""
+
+    timestamps: list[float] = field(default_factory=list)  # bucket start, epoch s
+    sentiment: list[float] = field(default_factory=list)
+    returns: list[float] = field(default_factory=list)
+    # Bucket length; 0 means the smallest gap between timestamps
+    bucket_seconds: int = 0
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def grid_positions(self) -> list[int]:
+        """Bucket index of each aligned point, counted from the first bucket."""
+        if not self.timestamps:
+            return []
+        step = self.bucket_seconds or min(
+            (
+                b - a
+                for a, b in zip(self.timestamps, self.timestamps[1:], strict=False)
+                if b > a
+            ),
+            default=1,
+        )
+        first = self.timestamps[0]
+        return [round((ts - first) / step) for ts in self.timestamps]
+
+
+@dataclass
+class CorrelationStats:
+    """Correlation of one ticker's sentiment with its price returns."""
+
+    sample_size: int
+    pearson: float | None
+    spearman: float | None
+    # Pearson over the `window` buckets ending at each grid bucket from
+    # index window - 1 on (None where a bucket is missing or undefined)
+    rolling_pearson: list[float | None]
+    lag_correlations: dict[int, float | None]
+    best_lag: int | None
+    best_lag_correlation: float | None
+    sentiment_trend: Trend
+    volatility_trend: Trend
+
+
+def align_sentiment_returns(
+    sentiment_timestamps: Sequence[float],
+    sentiment_values: Sequence[float],
+    price_timestamps: Sequence[float],
+    closes: Sequence[float],
+    bucket_seconds: int,
+) -> AlignedSeries:
+    """Join sentiment buckets with close-to-close returns on bucket start.
+
+    The return of a candle is its close over the previous candle's close,
+    minus one, and belongs to the candle's bucket.
+
+    Args:
+        sentiment_timestamps: Sentiment bucket starts (epoch seconds)
+        sentiment_values: Sentiment per bucket (e.g. bucket average)
+        price_timestamps: Candle timestamps (epoch seconds, ascending)
+        closes: Candle closes
+        bucket_seconds: Resolution of both series
+
+    Returns:
+        AlignedSeries ordered by bucket
+    """
+    returns_by_bucket: dict[int, float] = {}
+    for i in range(1, len(closes)):
+        if closes[i - 1] > 0:
+            bucket = int(price_timestamps[i] // bucket_seconds)
+            returns_by_bucket[bucket] = closes[i] / closes[i - 1] - 1
+
+    aligned = AlignedSeries(bucket_seconds=bucket_seconds)
+    for ts, value in sorted(zip(sentiment_timestamps, sentiment_values, strict=True)):
+        bucket = int(ts // bucket_seconds)
+        if bucket in returns_by_bucket:
+            aligned.timestamps.append(float(bucket * bucket_seconds))
+            aligned.sentiment.append(float(value))
+            aligned.returns.append(returns_by_bucket[bucket])
+    return aligned
+
+
+def correlate_batch(
+    series_by_ticker: Mapping[str, AlignedSeries],
+    window: int = DEFAULT_WINDOW,
+    max_lag: int = DEFAULT_MAX_LAG,
+) -> dict[str, CorrelationStats]:
+    """Compute correlation statistics for many tickers at once.
+
+    Args:
+        series_by_ticker: Ticker -> aligned sentiment/returns
+        window: Rolling window and trend window, in buckets
+        max_lag: Largest lead/lag checked, in buckets
+
+    Returns:
+        Ticker -> CorrelationStats
+    """
+    if window < 2:
+        raise ValueError(f"Correlation window must be at least 2, got {window}")
+    if not series_by_ticker:
+        return {}
+    if np is None:
+        return {
+            ticker: _correlate_python(series, window, max_lag)
+            for ticker, series in series_by_ticker.items()
+        }
+    return _correlate_numpy(series_by_ticker, window, max_lag)
+
+
+# =============================================================================
+# NumPy path: one pass over (tickers x buckets) matrices
+# =============================================================================
+
+
+def _pearson_rows(x: "np.ndarray", y: "np.ndarray") -> "np.ndarray":
+    """Row-wise Pearson over pairs where both values are present."""
+    valid = ~(np.isnan(x) | np.isnan(y))
+    n = valid.sum(axis=1)
+    safe_n = np.maximum(n, 1)
+    xv = np.where(valid, x, 0.0)
+    yv = np.where(valid, y, 0.0)
+    dx = np.where(valid, xv - (xv.sum(axis=1) / safe_n)[:, None], 0.0)
+    dy = np.where(valid, yv - (yv.sum(axis=1) / safe_n)[:, None], 0.0)
+    sxx = (dx * dx).sum(axis=1)
+    syy = (dy * dy).sum(axis=1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        r = (dx * dy).sum(axis=1) / np.sqrt(sxx * syy)
+    # A constant series leaves only rounding error in sxx/syy
+    ok = (sxx > 1e-12 * (xv * xv).sum(axis=1)) & (syy > 1e-12 * (yv * yv).sum(axis=1))
+    return np.where((n >= MIN_SAMPLES) & ok, r, np.nan)
+
+
+def _rank_rows(x: "np.ndarray") -> "np.ndarray":
+    """Average ranks (1-based, ties averaged) per row, NaN kept as NaN."""
+    ranks = np.full_like(x, np.nan)
+    for row in range(x.shape[0]):
+        valid = ~np.isnan(x[row])
+        if not valid.any():
+            continue
+        _, inverse, counts = np.unique(
+            x[row, valid], return_inverse=True, return_counts=True
+        )
+        ends = np.cumsum(counts)
+        ranks[row, valid] = (ends - (counts - 1) / 2.0)[inverse]
+    return ranks
+
+
+def _rolling_pearson_rows(
+    x: "np.ndarray", y: "np.ndarray", window: int
+) -> "np.ndarray":
+    """Row-wise rolling Pearson from cumulative sums (O(rows x buckets))."""
+    rows, width = x.shape
+    out = np.full((rows, width), np.nan)
+    if width < window:
+        return out
+
+    valid = ~(np.isnan(x) | np.isnan(y))
+    # Center each row first so the raw-moment formula keeps its precision
+    xc, yc = _center_rows(x, valid), _center_rows(y, valid)
+
+    def window_sums(values: "np.ndarray") -> "np.ndarray":
+        csum = np.concatenate([np.zeros((rows, 1)), np.cumsum(values, axis=1)], axis=1)
+        return csum[:, window:] - csum[:, :-window]
+
+    n = window_sums(valid.astype(np.float64))
+    sx, sy = window_sums(xc), window_sums(yc)
+    sxx, syy, sxy = window_sums(xc * xc), window_sums(yc * yc), window_sums(xc * yc)
+    var_x = n * sxx - sx * sx
+    var_y = n * syy - sy * sy
+    with np.errstate(invalid="ignore", divide="ignore"):
+        r = (n * sxy - sx * sy) / np.sqrt(var_x * var_y)
+    # Constant windows leave only rounding error in the variance terms
+    ok = (n == window) & (var_x > 1e-12 * n * sxx) & (var_y > 1e-12 * n * syy)
+    out[:, window - 1 :] = np.where(ok, np.clip(r, -1.0, 1.0), np.nan)
+    return out
+
+
+def _center_rows(values: "np.ndarray", valid: "np.ndarray") -> "np.ndarray":
+    """Subtract each row's mean over valid entries; invalid entries become 0."""
+    filled = np.where(valid, values, 0.0)
+    mean = filled.sum(axis=1) / np.maximum(valid.sum(axis=1), 1)
+    return np.where(valid, filled - mean[:, None], 0.0)
+
+
+def _mean_rows(values: "np.ndarray") -> "np.ndarray":
+    """Row means ignoring NaN (NaN for rows with no values)."""
+    valid = ~np.isnan(values)
+    count = valid.sum(axis=1)
+    total = np.where(valid, values, 0.0).sum(axis=1)
+    return np.where(count > 0, total / np.maximum(count, 1), np.nan)
+
+
+def _trend_rows(
+    values: "np.ndarray",
+    sizes: list[int],
+    window: int,
+    threshold: float,
+    relative: bool,
+) -> list[Trend]:
+    """Trend of each row's last-window mean against the window before.
+
+    Rows shorter than two windows are stable, as in the Python path.
+    """
+    if values.shape[1] < 2 * window:
+        return ["stable"] * values.shape[0]
+    recent = _mean_rows(values[:, -window:])
+    previous = _mean_rows(values[:, -2 * window : -window])
+    return [
+        _classify_trend(float(r), float(p), threshold, relative)
+        if size >= 2 * window
+        else "stable"
+        for r, p, size in zip(recent, previous, sizes, strict=True)
+    ]
+
+
+def _correlate_numpy(
+    series_by_ticker: Mapping[str, AlignedSeries], window: int, max_lag: int
+) -> dict[str, CorrelationStats]:
+    tickers = list(series_by_ticker)
+    positions = [s.grid_positions() for s in series_by_ticker.values()]
+    # Grid buckets per ticker, first to last aligned bucket
+    spans = [p[-1] + 1 if p else 0 for p in positions]
+    width = max(spans)
+    x = np.full((len(tickers), width), np.nan)
+    y = np.full((len(tickers), width), np.nan)
+    for row, series in enumerate(series_by_ticker.values()):
+        if len(series):
+            columns = width - spans[row] + np.asarray(positions[row])
+            x[row, columns] = series.sentiment
+            y[row, columns] = series.returns
+
+    pearson = _pearson_rows(x, y)
+    spearman = _pearson_rows(_rank_rows(x), _rank_rows(y))
+    rolling = _rolling_pearson_rows(x, y, window)
+
+    lags: dict[int, np.ndarray] = {}
+    for lag in range(-max_lag, max_lag + 1):
+        if abs(lag) >= width:
+            lags[lag] = np.full(len(tickers), np.nan)
+        elif lag >= 0:
+            lags[lag] = _pearson_rows(x[:, : width - lag], y[:, lag:])
+        else:
+            lags[lag] = _pearson_rows(x[:, -lag:], y[:, : width + lag])
+
+    sentiment_trends = _trend_rows(
+        x, spans, window, SENTIMENT_TREND_THRESHOLD, relative=False
+    )
+    volatility_trends = _trend_rows(
+        np.abs(y), spans, window, VOLATILITY_TREND_THRESHOLD, relative=True
+    )
+
+    results: dict[str, CorrelationStats] = {}
+    for row, (ticker, span) in enumerate(zip(tickers, spans, strict=True)):
+        lag_values = {lag: _opt(values[row]) for lag, values in lags.items()}
+        rolling_row = (
+            rolling[row, width - span + window - 1 :] if span >= window else []
+        )
+        results[ticker] = _stats(
+            len(series_by_ticker[ticker]),
+            _opt(pearson[row]),
+            _opt(spearman[row]),
+            [_opt(v) for v in rolling_row],
+            lag_values,
+            sentiment_trends[row],
+            volatility_trends[row],
+        )
+    return results
+
+
+# =============================================================================
+# Pure-Python path
+# =============================================================================
+
+
+def _pearson(x: Sequence[float], y: Sequence[float]) -> float | None:
+    n = len(x)
+    if n < MIN_SAMPLES:
+        return None
+    mx = sum(x) / n
+    my = sum(y) / n
+    sxx = sum((v - mx) ** 2 for v in x)
+    syy = sum((v - my) ** 2 for v in y)
+    if not _has_variance(x, sxx) or not _has_variance(y, syy):
+        return None
+    sxy = sum((a - mx) * (b - my) for a, b in zip(x, y, strict=True))
+    return sxy / math.sqrt(sxx * syy)
+
+
+def _has_variance(values: Sequence[float], sum_sq_dev: float) -> bool:
+    """False for constant series (allowing for rounding in the mean)."""
+    return sum_sq_dev > 1e-12 * sum(v * v for v in values)
+
+
+def _rank(values: Sequence[float]) -> list[float]:
+    order = sorted(range(len(values)), key=values.__getitem__)
+    ranks = [0.0] * len(values)
+    i = 0
+    while i < len(order):
+        j = i
+        while j + 1 < len(order) and values[order[j + 1]] == values[order[i]]:
+            j += 1
+        for k in range(i, j + 1):
+            ranks[order[k]] = (i + j) / 2.0 + 1
+        i = j + 1
+    return ranks
+
+
+def _correlate_python(
+    series: AlignedSeries, window: int, max_lag: int
+) -> CorrelationStats:
+    positions = series.grid_positions()
+    width = positions[-1] + 1 if positions else 0
+    # Contiguous bucket grid, None where the bucket has no aligned point
+    x: list[float | None] = [None] * width
+    y: list[float | None] = [None] * width
+    for pos, s, r in zip(positions, series.sentiment, series.returns, strict=True):
+        x[pos], y[pos] = s, r
+
+    rolling: list[float | None] = []
+    for end in range(window, width + 1):
+        xs, ys = x[end - window : end], y[end - window : end]
+        complete = None not in xs and None not in ys
+        rolling.append(_window_pearson(xs, ys) if complete else None)
+
+    lags: dict[int, float | None] = {}
+    for lag in range(-max_lag, max_lag + 1):
+        if abs(lag) >= width:
+            lags[lag] = None
+        elif lag >= 0:
+            lags[lag] = _pearson(*_present_pairs(x[: width - lag], y[lag:]))
+        else:
+            lags[lag] = _pearson(*_present_pairs(x[-lag:], y[: width + lag]))
+
+    if width >= 2 * window:
+        sentiment_trend = _classify_trend(
+            _mean_present(x[-window:]),
+            _mean_present(x[-2 * window : -window]),
+            SENTIMENT_TREND_THRESHOLD,
+            False,
+        )
+        volatility_trend = _classify_trend(
+            _mean_present([abs(v) for v in y[-window:] if v is not None]),
+            _mean_present([abs(v) for v in y[-2 * window : -window] if v is not None]),
+            VOLATILITY_TREND_THRESHOLD,
+            True,
+        )
+    else:
+        sentiment_trend = volatility_trend = "stable"
+
+    sentiment, returns = series.sentiment, series.returns
+    return _stats(
+        len(series),
+        _pearson(sentiment, returns),
+        _pearson(_rank(sentiment), _rank(returns)),
+        rolling,
+        lags,
+        sentiment_trend,
+        volatility_trend,
+    )
+
+
+def _present_pairs(
+    x: Sequence[float | None], y: Sequence[float | None]
+) -> tuple[list[float], list[float]]:
+    """The (x, y) pairs where both buckets have a value, as two lists."""
+    xs: list[float] = []
+    ys: list[float] = []
+    for a, b in zip(x, y, strict=True):
+        if a is not None and b is not None:
+            xs.append(a)
+            ys.append(b)
+    return xs, ys
+
+
+def _mean_present(values: Sequence[float | None]) -> float:
+    """Mean of the values present (NaN when there are none)."""
+    present = [v for v in values if v is not None]
+    return sum(present) / len(present) if present else math.nan
+
+
+def _window_pearson(x: Sequence[float], y: Sequence[float]) -> float | None:
+    """Pearson of one rolling window (no MIN_SAMPLES floor)."""
+    n = len(x)
+    mx = sum(x) / n
+    my = sum(y) / n
+    sxx = sum((v - mx) ** 2 for v in x)
+    syy = sum((v - my) ** 2 for v in y)
+    if not _has_variance(x, sxx) or not _has_variance(y, syy):
+        return None
+    sxy = sum((a - mx) * (b - my) for a, b in zip(x, y, strict=True))
+    return max(-1.0, min(1.0, sxy / math.sqrt(sxx * syy)))
+
+
+# =============================================================================
+# Shared helpers
+# =============================================================================
+
+
+def _opt(value: float) -> float | None:
+    value = float(value)
+    return None if math.isnan(value) else value
+
+
+def _classify_trend(
+    recent: float, previous: float, threshold: float, relative: bool
+) -> Trend:
+    if math.isnan(recent) or math.isnan(previous):
+        return "stable"
+    if relative:
+        if previous <= 0:
+            return "stable"
+        change = recent / previous - 1
+    else:
+        change = recent - previous
+    if change > threshold:
+        return "increasing"
+    if change < -threshold:
+        return "decreasing"
+    return "stable"
+
+
+def _stats(
+    size: int,
+    pearson: float | None,
+    spearman: float | None,
+    rolling: list[float | None],
+    lags: dict[int, float | None],
+    sentiment_trend: Trend,
+    volatility_trend: Trend,
+) -> CorrelationStats:
+    defined = {lag: r for lag, r in lags.items() if r is not None}
+    # Strongest relationship either way; ties go to the smallest |lag|
+    best_lag = (
+        min(defined, key=lambda lag: (-abs(defined[lag]), abs(lag)))
+        if defined
+        else None
+    )
+    return CorrelationStats(
+        sample_size=size,
+        pearson=pearson,
+        spearman=spearman,
+        rolling_pearson=rolling,
+        lag_correlations=lags,
+        best_lag=best_lag,
+        best_lag_correlation=defined[best_lag] if best_lag is not None else None,
+        sentiment_trend=sentiment_trend,
+        volatility_trend=volatility_trend,
+    )
@@ -0,0 +1,279 @@
+"""Materialized item counters for dashboard metrics.
+
+Ingestion and analysis record how many items were ingested, analyzed per
+sentiment and matched per ticker into per-minute and per-hour counter rows
+with atomic ADD. Dashboard metrics then sum the rows covering a window with
+BatchGetItem instead of COUNT-querying the GSIs, so the read cost depends
+on the window length rather than on item volume, and counts stay exact
+past the 1 MB query page limit.
+
+Counter rows live in the sentiment-timeseries table (TIMESERIES_TABLE),
+next to the other pre-aggregated buckets:
+    PK: "COUNTER#m#2026-10-16T14:05" (minute) or
+        "COUNTER#h#2026-10-16T14" (hour)
+    SK: "COUNTS"
+    ingested, analyzed, positive, neutral, negative, ticker:AAPL, ...
+    ttl: bucket start + COUNTER_RETENTION_DAYS
+
+Keeping them out of the sentiment-items table keeps them out of its stream
+and out of anything that scans or queries it for articles. Items are
+bucketed by their sort key (published time), which matches the timestamp
+range the GSI queries used.
+
+A window is read as minute rows for its partial first hour plus hour rows
+for the rest, so windows are minute-aligned: one starting at 13:05:40
+includes the whole 13:05 minute.
+
+For On-Call Engineers:
+    Counter writes are best-effort. A failed flush logs "Failed to flush
+    metric counters" and the dashboard undercounts by that batch; item
+    processing is unaffected. Without TIMESERIES_TABLE nothing is counted
+    and the dashboard reports zeros.
+
+    Counts start at zero when the counters are first deployed: a window
+    only covers items recorded since then, so the 24h figures are complete
+    a day after deploy (168h windows after a week).
+"""
+
+import logging
+import os
+import time
+from collections import Counter, defaultdict
+from collections.abc import Iterable
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from src.lambdas.shared.dynamodb import get_table
+from src.lambdas.shared.logging_utils import get_safe_error_info
+
+logger = logging.getLogger(__name__)
+
+COUNTER_PREFIX = "COUNTER#"
+COUNTER_SORT_KEY = "COUNTS"
+
+# Longest dashboard window is 168h; keep a day of headroom
+COUNTER_RETENTION_DAYS = 8
+
+# BatchGetItem accepts at most 100 keys per request
+BATCH_GET_MAX_KEYS = 100
+BATCH_GET_MAX_RETRIES = 3
+
+# Row attributes that are not counts
+_KEY_ATTRIBUTES = ("PK", "SK", "ttl")
+
+INGESTED = "ingested"
+ANALYZED = "analyzed"
+SENTIMENT_VALUES = ("positive", "neutral", "negative")
+TICKER_PREFIX = "ticker:"
+
+
+def _parse_timestamp(value: str | datetime) -> datetime | None:
+    """Parse an item timestamp to an aware UTC datetime (None if invalid)."""
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value)
+        except ValueError:
+            return None
+    if value.tzinfo is None:
+        return value.replace(tzinfo=UTC)
+    return value.astimezone(UTC)
+
+
+def get_counters_table() -> Any | None:
+    """Table resource holding the counter rows (None if not configured)."""
+    name = os.environ.get("TIMESERIES_TABLE")
+    return get_table(name) if name else None
+
+
+def _minute_key(minute: datetime) -> str:
+    return f"{COUNTER_PREFIX}m#{minute:%Y-%m-%dT%H:%M}"
+
+
+def _hour_key(hour: datetime) -> str:
+    return f"{COUNTER_PREFIX}h#{hour:%Y-%m-%dT%H}"
+
+
+class CounterBatch:
+    """Counter increments accumulated in memory and written by flush().
+
+    Increments for the same minute/hour are merged, so a batch of items
+    published close together costs a couple of UpdateItem calls in total.
+    """
+
+    def __init__(self) -> None:
+        self._deltas: dict[str, Counter[str]] = defaultdict(Counter)
+        self._expires_at: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._deltas)
+
+    def record_ingested(
+        self, timestamp: str | datetime, tickers: Iterable[str] = ()
+    ) -> None:
+        """Count a newly created item and each ticker it matched."""
+        counts = Counter({INGESTED: 1})
+        counts.update(f"{TICKER_PREFIX}{ticker}" for ticker in set(tickers) if ticker)
+        self._add(timestamp, counts)
+
+    def record_analyzed(self, timestamp: str | datetime, sentiment: str) -> None:
+        """Count an item moving to analyzed with the given sentiment."""
+        counts = Counter({ANALYZED: 1})
+        if sentiment.lower() in SENTIMENT_VALUES:
+            counts[sentiment.lower()] = 1
+        self._add(timestamp, counts)
+
+    def _add(self, timestamp: str | datetime, counts: Counter[str]) -> None:
+        ts = _parse_timestamp(timestamp)
+        if ts is None:
+            return
+        minute = ts.replace(second=0, microsecond=0)
+        expires_at = int((minute + timedelta(days=COUNTER_RETENTION_DAYS)).timestamp())
+        if expires_at <= time.time():
+            # Older than any dashboard window; the row would never be read
+            return
+        for key in (_minute_key(minute), _hour_key(minute.replace(minute=0))):
+            self._deltas[key].update(counts)
+            self._expires_at[key] = expires_at
+
+    def flush(self, table: Any | None) -> int:
+        """Write accumulated increments with one atomic ADD per row.
+
+        Failures are logged and the affected increments dropped, so callers
+        never fail because of counters.
+
+        Args:
+            table: Counters table resource (see get_counters_table); None
+                drops the increments
+
+        Returns:
+            Number of counter rows written
+        """
+        written = 0
+        if table is None:
+            self._deltas.clear()
+            self._expires_at.clear()
+            return written
+        for key, counts in self._deltas.items():
+            names = {"#ttl": "ttl"}
+            values: dict[str, Any] = {":ttl": self._expires_at[key]}
+            adds = []
+            for i, (attr, count) in enumerate(sorted(counts.items())):
+                names[f"#c{i}"] = attr
+                values[f":c{i}"] = count
+                adds.append(f"#c{i} :c{i}")
+            try:
+                table.update_item(
+                    Key={"PK": key, "SK": COUNTER_SORT_KEY},
+                    UpdateExpression=(
+                        "SET #ttl = if_not_exists(#ttl, :ttl) ADD " + ", ".join(adds)
+                    ),
+                    ExpressionAttributeNames=names,
+                    ExpressionAttributeValues=values,
+                )
+                written += 1
+            except Exception as e:
+                logger.warning(
+                    "Failed to flush metric counters",
+                    extra={"counter": key, **get_safe_error_info(e)},
+                )
+        self._deltas.clear()
+        self._expires_at.clear()
+        return written
+
+
+def window_keys(start: datetime, end: datetime) -> list[str]:
+    """Counter row keys whose buckets cover [start, end], minute-aligned.
+
+    The partial first hour is read from minute rows; every later hour,
+    including the current one, from its hour row.
+    """
+    minute = start.astimezone(UTC).replace(second=0, microsecond=0)
+    hour = minute.replace(minute=0)
+    end_hour = end.astimezone(UTC).replace(minute=0, second=0, microsecond=0)
+
+    keys: list[str] = []
+    if minute != hour:
+        last = end.astimezone(UTC) if hour == end_hour else hour + timedelta(hours=1)
+        while minute < last:
+            keys.append(_minute_key(minute))
+            minute += timedelta(minutes=1)
+        if hour == end_hour:
+            return keys
+        hour += timedelta(hours=1)
+    while hour <= end_hour:
+        keys.append(_hour_key(hour))
+        hour += timedelta(hours=1)
+    return keys
+
+
+def read_window_counts(
+    table: Any | None, windows: dict[str, timedelta], now: datetime | None = None
+) -> dict[str, Counter[str]]:
+    """Sum counter rows for several windows ending now, in one key fetch.
+
+    Args:
+        table: Counters table resource (see get_counters_table); None
+            reports zero for every window
+        windows: Window name -> length, e.g. {"1h": timedelta(hours=1)}
+        now: End of every window (default: current time)
+
+    Returns:
+        Window name -> summed counts (ingested, analyzed, sentiments, tickers)
+    """
+    now = now or datetime.now(UTC)
+    keys_by_window = {
+        name: window_keys(now - length, now) for name, length in windows.items()
+    }
+    all_keys = list(dict.fromkeys(k for keys in keys_by_window.values() for k in keys))
+
+    rows: dict[str, dict[str, Any]] = {}
+    if table is not None:
+        for i in range(0, len(all_keys), BATCH_GET_MAX_KEYS):
+            chunk = all_keys[i : i + BATCH_GET_MAX_KEYS]
+            for item in _batch_get(table, chunk):
+                rows[item["PK"]] = item
+
+    results: dict[str, Counter[str]] = {}
+    for name, keys in keys_by_window.items():
+        totals: Counter[str] = Counter()
+        for key in keys:
+            for attr, value in rows.get(key, {}).items():
+                if attr not in _KEY_ATTRIBUTES:
+                    totals[attr] += int(value)
+        results[name] = totals
+    return results
+
+
+def ticker_counts(counts: Counter[str]) -> dict[str, int]:
+    """Per-ticker counts from summed counters, sorted by count descending."""
+    tickers = {
+        attr[len(TICKER_PREFIX) :]: count
+        for attr, count in counts.items()
+        if attr.startswith(TICKER_PREFIX) and count > 0
+    }
+    return dict(sorted(tickers.items(), key=lambda x: x[1], reverse=True))
+
+
+def _batch_get(table: Any, keys: list[str]) -> list[dict[str, Any]]:
+    """BatchGetItem one chunk of counter rows, retrying UnprocessedKeys.
+
+    Raises once retries are exhausted: silently dropping rows would make
+    the counts wrong without any sign of it.
+    """
+    items: list[dict[str, Any]] = []
+    request: dict[str, Any] = {
+        table.name: {"Keys": [{"PK": k, "SK": COUNTER_SORT_KEY} for k in keys]}
+    }
+    retry_count = 0
+
+    while request:
+        response = table.meta.client.batch_get_item(RequestItems=request)
+        items.extend(response.get("Responses", {}).get(table.name, []))
+        request = response.get("UnprocessedKeys") or {}
+        if request:
+            retry_count += 1
+            if retry_count > BATCH_GET_MAX_RETRIES:
+                raise RuntimeError("BatchGetItem left unprocessed counter keys")
+            time.sleep(0.05 * 2**retry_count)
+
+    return items
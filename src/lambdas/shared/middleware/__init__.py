@@ -18,6 +18,7 @@ from src.lambdas.shared.middleware.hcaptcha import (
 from src.lambdas.shared.middleware.rate_limit import (
     RateLimitExceeded,
     check_rate_limit,
+    flush_rate_limit_counters,
     get_client_ip,
 )
 from src.lambdas.shared.middleware.require_role import (
@@ -44,6 +45,7 @@ __all__ = [
     # Rate limiting
     "RateLimitExceeded",
     "check_rate_limit",
+    "flush_rate_limit_counters",
     "get_client_ip",
     # Security headers
     "add_security_headers",
@@ -51,12 +51,15 @@ class AuthContext:
         auth_type: ANONYMOUS for UUID tokens, AUTHENTICATED for JWT
         auth_method: Where the credential came from ("bearer", "x-user-id", None)
         roles: List of role strings from JWT 'roles' claim (Feature 1130)
+        jwt_claim: Validated JWT claim for AUTHENTICATED contexts, so session
+            validation can check its rev against the user's revocation_id
     """
 
     user_id: str | None
     auth_type: AuthType
     auth_method: str | None = None
     roles: list[str] | None = None
+    jwt_claim: JWTClaim | None = None
 
 
 @dataclass(frozen=True)
@@ -376,6 +379,7 @@ def extract_auth_context_typed(event: dict[str, Any]) -> AuthContext:
                 auth_type=AuthType.AUTHENTICATED,
                 auth_method="bearer",
                 roles=jwt_claim.roles,
+                jwt_claim=jwt_claim,
             )
 
         # Fall back to UUID token (anonymous)
@@ -414,6 +418,7 @@ def extract_auth_context(event: dict[str, Any]) -> dict[str, Any]:
     - auth_method: 'bearer' | None
     - is_authenticated: Whether user ID was found
     - auth_type: 'anonymous' | 'authenticated' (Feature 1048)
+    - jwt_claim: Validated JWTClaim, or None for anonymous tokens
 
     Args:
         event: Lambda event dict
@@ -429,6 +434,7 @@ def extract_auth_context(event: dict[str, Any]) -> dict[str, Any]:
         "auth_method": typed_context.auth_method,
         "is_authenticated": typed_context.user_id is not None,
         "auth_type": typed_context.auth_type.value,  # Feature 1048: expose auth_type
+        "jwt_claim": typed_context.jwt_claim,
     }
 
 
@@ -7,6 +7,11 @@ For On-Call Engineers:
     Different limits apply to different actions (config creation, ticker validation, etc.)
     When rate limit is exceeded, 429 Too Many Requests is returned.
 
+    Each client/action has one counter item per fixed window
+    (PK=RATE#<key>#<action>, SK=WINDOW#<n, zero-padded>, request_count). Counters are
+    flushed at most FLUSH_INTERVAL_SECONDS after a request, so other
+    execution environments see a burst that much late.
+
 Security Notes:
     - IP address is extracted from X-Forwarded-For header (API Gateway/ALB)
     - Rate limits are per-IP, per-action
@@ -14,12 +19,20 @@ Security Notes:
 """
 
 import logging
+import math
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
 from pydantic import BaseModel
 
 from src.lambdas.shared.logging_utils import get_safe_error_info, sanitize_for_log
+from src.lib.cache_utils import TTLCache
+from src.lib.threading_utils import TokenBucket
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +51,14 @@ DEFAULT_RATE_LIMITS = {
     "default": {"limit": 100, "window_seconds": 60},  # 100 per minute
 }
 
+# Pending counters are flushed in the background once this many clients
+# have unflushed requests, or the oldest is this many seconds old
+FLUSH_BATCH_SIZE = int(os.environ.get("RATE_LIMIT_FLUSH_BATCH_SIZE", "25"))
+FLUSH_INTERVAL_SECONDS = float(os.environ.get("RATE_LIMIT_FLUSH_INTERVAL_SECONDS", "1"))
+
+# Clients with a local token bucket per execution environment
+LOCAL_LIMIT_MAX_CLIENTS = 10_000
+
 
 class RateLimitExceeded(Exception):
     """Raised when rate limit is exceeded."""
@@ -111,6 +132,14 @@ def check_rate_limit(
 ) -> RateLimitResult:
     """Check if request is within rate limit.
 
+    Uses a sliding-window counter: the request count is estimated from the
+    current and previous fixed-window counters, the previous one weighted
+    by how much of it still overlaps the sliding window. The counters are
+    read with a single two-item query. Allowed requests are added to them
+    by the batched, asynchronous flush (see flush_rate_limit_counters), and
+    a local token bucket per client denies obvious floods without touching
+    DynamoDB.
+
     Args:
         table: DynamoDB Table resource
         client_ip: Client IP address
@@ -138,49 +167,63 @@ def check_rate_limit(
         rate_key = f"USER#{user_id}"
     else:
         rate_key = f"IP#{client_ip}"
+    pk = f"RATE#{rate_key}#{action}"
 
     now = datetime.now(UTC)
-    window_start = now - timedelta(seconds=window_seconds)
+    now_ts = now.timestamp()
     window_end = now + timedelta(seconds=window_seconds)
+    window_index = int(now_ts // window_seconds)
+    elapsed = now_ts - window_index * window_seconds
+
+    local = _get_local_limit(pk, limit, window_seconds)
+    if now_ts < local.denied_until or local.bucket.available < 1:
+        # Known to be over the limit in this execution environment
+        return _denied(limit, window_end, window_seconds)
 
     try:
-        # Query requests in current window
+        # Query the previous and current window counters
         response = table.query(
-            KeyConditionExpression="PK = :pk AND SK BETWEEN :start AND :end",
+            KeyConditionExpression="PK = :pk AND SK BETWEEN :prev AND :curr",
             ExpressionAttributeValues={
-                ":pk": f"RATE#{rate_key}#{action}",
-                ":start": window_start.isoformat(),
-                ":end": now.isoformat(),
+                ":pk": pk,
+                ":prev": _window_sk(window_index - 1),
+                ":curr": _window_sk(window_index),
             },
+            ProjectionExpression="SK, request_count",
         )
-
-        current_count = len(response.get("Items", []))
-        remaining = max(0, limit - current_count - 1)  # -1 for current request
-
-        if current_count >= limit:
+        counts = {
+            item["SK"]: int(item.get("request_count", 0))
+            for item in response.get("Items", [])
+        }
+        previous = counts.get(_window_sk(window_index - 1), 0)
+        current = counts.get(_window_sk(window_index), 0)
+        previous += _counters.pending(pk, window_index - 1)
+        current += _counters.pending(pk, window_index)
+
+        estimate = previous * (1 - elapsed / window_seconds) + current
+        remaining = max(0, limit - math.ceil(estimate) - 1)  # -1 for current request
+
+        if estimate >= limit:
             # Rate limit exceeded
-            retry_after = window_seconds
+            local.denied_until = now_ts + _seconds_until_allowed(
+                previous, current, elapsed, window_seconds, limit
+            )
 
             logger.warning(
                 "Rate limit exceeded",
                 extra={
                     "client_ip_prefix": sanitize_for_log(client_ip[:8]),
                     "action": action,
-                    "count": current_count,
+                    "count": round(estimate, 2),
                     "limit": limit,
                 },
             )
 
-            return RateLimitResult(
-                allowed=False,
-                limit=limit,
-                remaining=0,
-                reset_at=window_end.isoformat(),
-                retry_after=retry_after,
-            )
+            return _denied(limit, window_end, window_seconds)
 
         # Record this request
-        _record_request(table, rate_key, action, now, window_seconds)
+        local.bucket.try_acquire()
+        _counters.add(table, pk, window_index, window_seconds)
 
         return RateLimitResult(
             allowed=True,
@@ -206,43 +249,197 @@ def check_rate_limit(
         )
 
 
-def _record_request(
-    table: Any,
-    rate_key: str,
-    action: str,
-    timestamp: datetime,
-    ttl_seconds: int,
-) -> None:
-    """Record a request for rate limiting.
+def _denied(limit: int, window_end: datetime, window_seconds: int) -> RateLimitResult:
+    return RateLimitResult(
+        allowed=False,
+        limit=limit,
+        remaining=0,
+        reset_at=window_end.isoformat(),
+        retry_after=window_seconds,
+    )
 
-    Args:
-        table: DynamoDB Table resource
-        rate_key: Rate limit key (IP or user)
-        action: Action being performed
-        timestamp: Request timestamp
-        ttl_seconds: TTL for the record
+
+# Window indexes are zero-padded so that SK order (and BETWEEN) matches
+# numeric order when an index gains a digit
+WINDOW_INDEX_WIDTH = 12
+
+
+def _window_sk(window_index: int) -> str:
+    return f"WINDOW#{window_index:0{WINDOW_INDEX_WIDTH}d}"
+
+
+def _seconds_until_allowed(
+    previous: float, current: float, elapsed: float, window: int, limit: int
+) -> float:
+    """Seconds until the sliding-window estimate drops below limit.
+
+    Assumes no further requests are allowed meanwhile.
     """
-    try:
-        ttl = int((timestamp + timedelta(seconds=ttl_seconds * 2)).timestamp())
+    if current < limit:
+        # Within this window only the previous window's weight decays
+        if previous <= 0:
+            return 0.0
+        return max(0.0, window * (1 - (limit - current) / previous) - elapsed)
+    # Wait for the next window, then for the current one to decay
+    return (window - elapsed) + window * (1 - limit / current)
 
-        table.put_item(
-            Item={
-                "PK": f"RATE#{rate_key}#{action}",
-                "SK": timestamp.isoformat(),
-                "action": action,
-                "rate_key": rate_key,
-                "created_at": timestamp.isoformat(),
-                "ttl_timestamp": ttl,
-                "entity_type": "RATE_LIMIT",
-            }
+
+@dataclass
+class _LocalLimit:
+    """Per-client state in this execution environment."""
+
+    limit: int
+    window_seconds: int
+    bucket: TokenBucket
+    denied_until: float = 0.0
+
+
+def _get_local_limit(pk: str, limit: int, window_seconds: int) -> _LocalLimit:
+    """Local token bucket for a client, refilling at limit per window.
+
+    A bucket only runs dry after this environment alone has allowed
+    ``limit`` requests within the last window, so denying on an empty
+    bucket never denies a request the sliding window would allow.
+    """
+    local = _local_limits.get(pk)
+    if local is None or (local.limit, local.window_seconds) != (
+        limit,
+        window_seconds,
+    ):
+        local = _LocalLimit(
+            limit=limit,
+            window_seconds=window_seconds,
+            bucket=TokenBucket(rate=limit / window_seconds, capacity=limit),
         )
+        _local_limits.set(pk, local, ttl=window_seconds * 2)
+    return local
 
-    except Exception as e:
-        logger.error(
-            "Error recording rate limit request",
-            extra=get_safe_error_info(e),
+
+class _CounterBuffer:
+    """Allowed requests not yet added to the DynamoDB window counters.
+
+    Increments for the same client and window are merged, so a flush
+    costs one atomic ADD per active client rather than one write per
+    request. A flush starts in the background once FLUSH_BATCH_SIZE
+    counters are pending or the oldest is FLUSH_INTERVAL_SECONDS old.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._table: Any = None
+        self._counts: dict[tuple[str, int], int] = {}
+        self._expires_at: dict[tuple[str, int], int] = {}
+        self._oldest: float | None = None
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="rate-limit-flush"
         )
 
+    def pending(self, pk: str, window_index: int) -> int:
+        with self._lock:
+            return self._counts.get((pk, window_index), 0)
+
+    def add(self, table: Any, pk: str, window_index: int, window_seconds: int) -> None:
+        with self._lock:
+            if self._table is not None and self._table is not table:
+                self._submit_locked()
+            self._table = table
+            key = (pk, window_index)
+            self._counts[key] = self._counts.get(key, 0) + 1
+            # Keep the counter while it can still be the previous window
+            self._expires_at[key] = (window_index + 3) * window_seconds
+            now = time.monotonic()
+            if self._oldest is None:
+                self._oldest = now
+            if (
+                len(self._counts) >= FLUSH_BATCH_SIZE
+                or now - self._oldest >= FLUSH_INTERVAL_SECONDS
+            ):
+                self._submit_locked()
+
+    def flush(self) -> int:
+        """Write every pending counter now, after any background flush."""
+        with self._lock:
+            table, counts, expires_at = self._take_locked()
+        # The single worker runs flushes in order, so this one finishes last
+        return self._executor.submit(
+            _write_counters, table, counts, expires_at
+        ).result()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._take_locked()
+
+    def _take_locked(self) -> tuple[Any, dict[tuple[str, int], int], dict]:
+        taken = (self._table, self._counts, self._expires_at)
+        self._counts, self._expires_at = {}, {}
+        self._oldest = None
+        return taken
+
+    def _submit_locked(self) -> None:
+        table, counts, expires_at = self._take_locked()
+        if counts:
+            self._executor.submit(_write_counters, table, counts, expires_at)
+
+
+def _write_counters(
+    table: Any,
+    counts: dict[tuple[str, int], int],
+    expires_at: dict[tuple[str, int], int],
+) -> int:
+    """Add merged request counts with one atomic ADD per window counter.
+
+    Failures are logged and the increments dropped (fail open).
+
+    Returns:
+        Number of counters written
+    """
+    written = 0
+    for (pk, window_index), count in counts.items():
+        try:
+            table.update_item(
+                Key={"PK": pk, "SK": _window_sk(window_index)},
+                UpdateExpression=(
+                    "SET ttl_timestamp = if_not_exists(ttl_timestamp, :ttl), "
+                    "entity_type = :entity_type ADD request_count :count"
+                ),
+                ExpressionAttributeValues={
+                    ":ttl": expires_at[(pk, window_index)],
+                    ":entity_type": "RATE_LIMIT",
+                    ":count": count,
+                },
+            )
+            written += 1
+        except Exception as e:
+            logger.error(
+                "Error recording rate limit request",
+                extra=get_safe_error_info(e),
+            )
+    return written
+
+
+_local_limits = TTLCache(name="rate_limit_local", max_entries=LOCAL_LIMIT_MAX_CLIENTS)
+_counters = _CounterBuffer()
+
+
+def flush_rate_limit_counters() -> int:
+    """Write pending rate limit counters to DynamoDB.
+
+    Handlers call this at the end of an invocation: Lambda freezes the
+    background flush thread between invocations, so counts left pending
+    would otherwise only reach other execution environments on the next
+    request here.
+
+    Returns:
+        Number of counters written
+    """
+    return _counters.flush()
+
+
+def clear_rate_limit_state() -> None:
+    """Drop local buckets and pending counters (for testing)."""
+    _local_limits.clear()
+    _counters.clear()
+
 
 def get_rate_limit_headers(result: RateLimitResult) -> dict[str, str]:
     """Get rate limit headers for response.
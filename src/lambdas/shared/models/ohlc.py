@@ -1,7 +1,7 @@
 """OHLC response models for Price-Sentiment Overlay feature."""
 
+from datetime import UTC, datetime
 from datetime import date as date_type
-from datetime import datetime
 from enum import Enum
 from typing import TYPE_CHECKING, Literal
 
@@ -10,7 +10,7 @@ from pydantic import BaseModel, ConfigDict, Field
 from src.lambdas.shared.models.volatility_metric import OHLCCandle
 
 if TYPE_CHECKING:
-    from src.lambdas.shared.cache.ohlc_cache import CachedCandle
+    from src.lambdas.shared.cache.ohlc_cache import CachedCandle, CandleColumns
 
 
 class TimeRange(str, Enum):  # noqa: UP042 - StrEnum changes str() of serialized members
@@ -154,6 +154,48 @@ class PriceCandle(BaseModel):
             volume=cached.volume,
         )
 
+    @classmethod
+    def from_cached_columns(
+        cls,
+        columns: "CandleColumns",
+        resolution: "OHLCResolution",
+    ) -> list["PriceCandle"]:
+        """Create PriceCandles from columnar DynamoDB cache reads.
+
+        Same date formatting as from_cached_candle(), without building an
+        intermediate CachedCandle per row.
+
+        Args:
+            columns: CandleColumns from ohlc_cache module
+            resolution: Original resolution for date formatting
+
+        Returns:
+            PriceCandle list, oldest first
+        """
+        daily = resolution == OHLCResolution.DAILY
+        candles = []
+        for ts, o, h, lo, c, v in zip(
+            columns.timestamps,
+            columns.open,
+            columns.high,
+            columns.low,
+            columns.close,
+            columns.volume,
+            strict=True,
+        ):
+            timestamp = datetime.fromtimestamp(ts, tz=UTC)
+            candles.append(
+                cls(
+                    date=timestamp.date() if daily else timestamp,
+                    open=o,
+                    high=h,
+                    low=lo,
+                    close=c,
+                    volume=v,
+                )
+            )
+        return candles
+
 
 class OHLCResponse(BaseModel):
     """Response model for OHLC price data endpoint."""
@@ -0,0 +1,312 @@
+"""Concurrent multi-ticker daily OHLC fetcher.
+
+Fetches daily candles for many tickers at once for endpoints that need
+price history per configuration ticker (e.g. ATR volatility):
+
+1. The persistent OHLC cache (DynamoDB) is read first, all tickers in
+   parallel; a ticker is a hit when the cache holds enough candles up to
+   the last completed session.
+2. Misses are fetched from Tiingo on a bounded thread pool.
+3. A Tiingo call still running after OHLC_HEDGE_AFTER_SECONDS is hedged
+   with the same request to Finnhub, and a failed or empty Tiingo call
+   falls back to Finnhub at once. Whichever answers first wins.
+4. Nothing is awaited past OHLC_FETCH_DEADLINE_SECONDS from the start of
+   the batch; tickers still outstanding then are returned without data.
+
+Tiingo results are written through to the persistent cache so the next
+request for the same tickers is served from DynamoDB.
+
+For On-Call Engineers:
+    "OHLC batch fetch" logs cache hits, upstream fetches, Finnhub calls
+    (hedges and fallbacks) and tickers missing at the deadline. Many
+    Finnhub calls mean Tiingo latency is above OHLC_HEDGE_AFTER_SECONDS or
+    Tiingo is failing; many missing tickers with few Finnhub calls mean
+    the pool is saturated (raise OHLC_FETCH_MAX_WORKERS).
+"""
+
+import logging
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from datetime import UTC, date, datetime, timedelta
+from typing import Any
+
+from src.lambdas.shared.adapters.base import OHLCCandle
+from src.lambdas.shared.cache.ohlc_cache import (
+    candles_to_cached,
+    get_cached_candle_columns,
+    put_cached_candles,
+)
+from src.lambdas.shared.logging_utils import get_safe_error_info, sanitize_for_log
+
+logger = logging.getLogger(__name__)
+
+OHLC_FETCH_MAX_WORKERS = int(os.environ.get("OHLC_FETCH_MAX_WORKERS", "8"))
+OHLC_FETCH_DEADLINE_SECONDS = float(os.environ.get("OHLC_FETCH_DEADLINE_SECONDS", "6"))
+OHLC_HEDGE_AFTER_SECONDS = float(os.environ.get("OHLC_HEDGE_AFTER_SECONDS", "1.5"))
+
+CACHE_SOURCE = "tiingo"
+DAILY_RESOLUTION = "D"
+
+
+def fetch_daily_ohlc_batch(
+    tickers: list[str],
+    start_date: datetime,
+    end_date: datetime,
+    tiingo_adapter: Any | None = None,
+    finnhub_adapter: Any | None = None,
+    min_candles: int = 1,
+    max_workers: int = OHLC_FETCH_MAX_WORKERS,
+    hedge_after: float = OHLC_HEDGE_AFTER_SECONDS,
+    deadline: float = OHLC_FETCH_DEADLINE_SECONDS,
+) -> dict[str, list[OHLCCandle]]:
+    """Fetch daily OHLC candles for many tickers within one deadline.
+
+    Args:
+        tickers: Ticker symbols
+        start_date: Range start
+        end_date: Range end
+        tiingo_adapter: TiingoAdapter (primary source)
+        finnhub_adapter: FinnhubAdapter (hedge/fallback source)
+        min_candles: Fewest cached candles that count as a cache hit
+        max_workers: Bound on concurrent calls per source (cache/Tiingo, Finnhub)
+        hedge_after: Seconds a Tiingo call may run before Finnhub is asked too
+        deadline: Seconds after which outstanding tickers are given up
+
+    Returns:
+        Ticker -> candles (oldest first); tickers without data are omitted
+    """
+    tickers = list(dict.fromkeys(tickers))
+    if not tickers:
+        return {}
+
+    stop_at = time.monotonic() + deadline
+    fetched: dict[str, tuple[str, list[OHLCCandle]]] = {}
+    hedged: set[str] = set()
+    # Finnhub gets its own pool so hedges never queue behind slow Tiingo calls
+    workers = max(1, min(max_workers, len(tickers)))
+    executor = ThreadPoolExecutor(max_workers=workers)
+    hedge_executor = ThreadPoolExecutor(max_workers=workers)
+    try:
+        results = _read_cache(
+            executor, tickers, start_date, end_date, min_candles, stop_at
+        )
+        missing = [t for t in tickers if t not in results]
+        if missing and (tiingo_adapter or finnhub_adapter):
+            fetched, hedged = _fetch_upstream(
+                executor,
+                hedge_executor,
+                missing,
+                start_date,
+                end_date,
+                tiingo_adapter,
+                finnhub_adapter,
+                hedge_after,
+                stop_at,
+            )
+        _write_through(executor, fetched, stop_at)
+    finally:
+        # Late upstream calls must not hold the response
+        executor.shutdown(wait=False, cancel_futures=True)
+        hedge_executor.shutdown(wait=False, cancel_futures=True)
+
+    cache_hits = len(results)
+    results.update((ticker, candles) for ticker, (_, candles) in fetched.items())
+    logger.info(
+        "OHLC batch fetch",
+        extra={
+            "ticker_count": len(tickers),
+            "cache_hits": cache_hits,
+            "fetched": len(fetched),
+            "finnhub_calls": len(hedged),
+            "missing": len(tickers) - len(results),
+        },
+    )
+    return results
+
+
+def _read_cache(
+    executor: ThreadPoolExecutor,
+    tickers: list[str],
+    start_date: datetime,
+    end_date: datetime,
+    min_candles: int,
+    stop_at: float,
+) -> dict[str, list[OHLCCandle]]:
+    """Read the persistent cache for all tickers; return the usable hits."""
+    latest_session = _last_completed_session(end_date.date())
+
+    def read(ticker: str) -> list[OHLCCandle] | None:
+        try:
+            columns = get_cached_candle_columns(
+                ticker=ticker,
+                source=CACHE_SOURCE,
+                resolution=DAILY_RESOLUTION,
+                start_time=start_date,
+                end_time=end_date,
+            )
+        except Exception as e:
+            logger.warning(
+                "OHLC cache read failed, fetching live",
+                extra={"ticker": sanitize_for_log(ticker), **get_safe_error_info(e)},
+            )
+            return None
+        if len(columns) < max(min_candles, 1):
+            return None
+        if datetime.fromtimestamp(columns.timestamps[-1], UTC).date() < latest_session:
+            return None  # Stale: the last session has not been cached yet
+        return [
+            OHLCCandle(
+                date=datetime.fromtimestamp(ts, UTC),
+                open=o,
+                high=h,
+                low=lo,
+                close=c,
+                volume=v,
+            )
+            for ts, o, h, lo, c, v in zip(
+                columns.timestamps,
+                columns.open,
+                columns.high,
+                columns.low,
+                columns.close,
+                columns.volume,
+                strict=True,
+            )
+        ]
+
+    futures = {executor.submit(read, ticker): ticker for ticker in tickers}
+    done, _ = wait(futures, timeout=max(0.0, stop_at - time.monotonic()))
+    return {
+        futures[future]: candles
+        for future in done
+        if (candles := future.result()) is not None
+    }
+
+
+def _fetch_upstream(
+    executor: ThreadPoolExecutor,
+    hedge_executor: ThreadPoolExecutor,
+    tickers: list[str],
+    start_date: datetime,
+    end_date: datetime,
+    tiingo_adapter: Any | None,
+    finnhub_adapter: Any | None,
+    hedge_after: float,
+    stop_at: float,
+) -> tuple[dict[str, tuple[str, list[OHLCCandle]]], set[str]]:
+    """Fetch tickers from Tiingo, hedging slow or failed calls with Finnhub.
+
+    Returns:
+        (ticker -> (source, candles), tickers Finnhub was asked for)
+    """
+    owners: dict[Future, tuple[str, str]] = {}
+    started: dict[str, float] = {}
+    hedged: set[str] = set()
+    results: dict[str, tuple[str, list[OHLCCandle]]] = {}
+
+    def submit(ticker: str, source: str, adapter: Any) -> None:
+        def call() -> list[OHLCCandle]:
+            if source == "tiingo":
+                started[ticker] = time.monotonic()
+            return adapter.get_ohlc(ticker, start_date=start_date, end_date=end_date)
+
+        pool = executor if source == "tiingo" else hedge_executor
+        owners[pool.submit(call)] = (ticker, source)
+
+    def hedge(ticker: str) -> None:
+        if finnhub_adapter and ticker not in hedged:
+            hedged.add(ticker)
+            submit(ticker, "finnhub", finnhub_adapter)
+
+    for ticker in tickers:
+        if tiingo_adapter:
+            submit(ticker, "tiingo", tiingo_adapter)
+        else:
+            hedge(ticker)
+
+    handled: set[Future] = set()
+    while True:
+        now = time.monotonic()
+        if now >= stop_at:
+            break
+
+        # Hedge Tiingo calls that have run too long; wake for the next one due.
+        # Calls still queued count from now and are re-checked once started.
+        wake_at = stop_at
+        if finnhub_adapter:
+            for ticker in tickers:
+                if ticker in results or ticker in hedged:
+                    continue
+                due = started.get(ticker, now) + hedge_after
+                if due <= now:
+                    hedge(ticker)
+                else:
+                    wake_at = min(wake_at, due)
+
+        live = {f for f in owners if f not in handled and owners[f][0] not in results}
+        if not live:
+            break
+        done, _ = wait(live, timeout=wake_at - now, return_when=FIRST_COMPLETED)
+        for future in done:
+            handled.add(future)
+            ticker, source = owners[future]
+            candles = _candles_or_none(future, ticker, source)
+            if candles and ticker not in results:
+                results[ticker] = (source, candles)
+            elif not candles and source == "tiingo":
+                hedge(ticker)
+
+    return results, hedged
+
+
+def _candles_or_none(
+    future: Future, ticker: str, source: str
+) -> list[OHLCCandle] | None:
+    """Result of an upstream call, logging (not raising) its failure."""
+    try:
+        return future.result()
+    except Exception as e:
+        logger.warning(
+            f"Failed to get {source.capitalize()} OHLC",
+            extra={"symbol": sanitize_for_log(ticker), **get_safe_error_info(e)},
+        )
+        return None
+
+
+def _write_through(
+    executor: ThreadPoolExecutor,
+    fetched: dict[str, tuple[str, list[OHLCCandle]]],
+    stop_at: float,
+) -> None:
+    """Persist Tiingo results to the OHLC cache, within the deadline."""
+
+    def write(ticker: str, candles: list[OHLCCandle]) -> None:
+        try:
+            put_cached_candles(
+                ticker=ticker,
+                source=CACHE_SOURCE,
+                resolution=DAILY_RESOLUTION,
+                candles=candles_to_cached(candles, CACHE_SOURCE, DAILY_RESOLUTION),
+            )
+        except Exception as e:
+            logger.warning(
+                "OHLC cache write-through failed",
+                extra={"ticker": sanitize_for_log(ticker), **get_safe_error_info(e)},
+            )
+
+    writes = [
+        executor.submit(write, ticker, candles)
+        for ticker, (source, candles) in fetched.items()
+        if source == CACHE_SOURCE
+    ]
+    if writes:
+        wait(writes, timeout=max(0.0, stop_at - time.monotonic()))
+
+
+def _last_completed_session(today: date) -> date:
+    """Most recent weekday before today (holidays make the cache miss)."""
+    day = today - timedelta(days=1)
+    while day.weekday() >= 5:
+        day -= timedelta(days=1)
+    return day
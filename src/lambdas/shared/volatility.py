@@ -3,9 +3,16 @@
 ATR measures market volatility by analyzing the range of price
 movements over a specified period. It's the industry standard
 for technical analysis.
+
+The rolling ATR series is computed once per ticker (atr_series) and the
+current, previous and trend-lookback values are all read from it. With
+NumPy available the series for many tickers is computed in one pass over
+a (tickers x candles) matrix; otherwise a single pure-Python pass per
+ticker is used. Both support SMA and Wilder smoothing.
 """
 
 import logging
+from collections.abc import Mapping, Sequence
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import Literal
@@ -13,8 +20,18 @@ from typing import Literal
 from src.lambdas.shared.adapters.base import OHLCCandle
 from src.lambdas.shared.logging_utils import sanitize_for_log
 
+try:
+    import numpy as np
+except ImportError:  # numpy not packaged in every Lambda
+    np = None
+
 logger = logging.getLogger(__name__)
 
+# "sma": mean of the last N true ranges (the default, as before)
+# "wilder": Wilder's smoothing, ATR_t = (ATR_{t-1} * (N - 1) + TR_t) / N,
+#           seeded with the SMA of the first N true ranges
+ATRSmoothing = Literal["sma", "wilder"]
+
 
 @dataclass
 class ATRResult:
@@ -34,6 +51,9 @@ class ATRResult:
     # Thresholds for classification
     volatility_level: Literal["low", "medium", "high"]
 
+    # ATR as of the previous candle (None with exactly `period` candles)
+    previous_atr: float | None = None
+
 
 def calculate_true_range(
     high: float, low: float, previous_close: float | None
@@ -64,17 +84,153 @@ def calculate_true_range(
     )
 
 
+def atr_series(
+    candles: Sequence[OHLCCandle],
+    period: int = 14,
+    smoothing: ATRSmoothing = "sma",
+) -> list[float]:
+    """Calculate the rolling ATR ending at every candle in one pass.
+
+    Args:
+        candles: OHLC candles (oldest first)
+        period: Number of periods for averaging (default: 14)
+        smoothing: "sma" or "wilder"
+
+    Returns:
+        ATR values for candles[period - 1:], i.e. series[-1] is the current
+        ATR and series[-1 - k] the ATR as of k candles ago. Empty if there
+        are fewer than `period` candles.
+    """
+    return atr_series_batch({"": candles}, period, smoothing)[""]
+
+
+def atr_series_batch(
+    candles_by_ticker: Mapping[str, Sequence[OHLCCandle]],
+    period: int = 14,
+    smoothing: ATRSmoothing = "sma",
+) -> dict[str, list[float]]:
+    """Calculate rolling ATR series for many tickers at once.
+
+    Args:
+        candles_by_ticker: Ticker -> OHLC candles (oldest first)
+        period: Number of periods for averaging (default: 14)
+        smoothing: "sma" or "wilder"
+
+    Returns:
+        Ticker -> ATR series as returned by atr_series()
+    """
+    if period < 1:
+        raise ValueError(f"ATR period must be positive, got {period}")
+    if smoothing not in ("sma", "wilder"):
+        raise ValueError(f"Unknown ATR smoothing: {smoothing}")
+
+    usable = {t: c for t, c in candles_by_ticker.items() if len(c) >= period}
+    results: dict[str, list[float]] = {ticker: [] for ticker in candles_by_ticker}
+    if not usable:
+        return results
+
+    if np is None:
+        for ticker, candles in usable.items():
+            results[ticker] = _atr_series_python(candles, period, smoothing)
+        return results
+
+    # Right-align every ticker in a NaN-padded (tickers x candles) matrix so
+    # each column is one step of the smoothing recurrence for all tickers.
+    width = max(len(c) for c in usable.values())
+    shape = (len(usable), width)
+    high, low, close = (
+        np.full(shape, np.nan),
+        np.full(shape, np.nan),
+        np.full(shape, np.nan),
+    )
+    for row, candles in enumerate(usable.values()):
+        offset = width - len(candles)
+        high[row, offset:] = [c.high for c in candles]
+        low[row, offset:] = [c.low for c in candles]
+        close[row, offset:] = [c.close for c in candles]
+
+    atr = _rolling_atr_numpy(high, low, close, period, smoothing)
+    for row, (ticker, candles) in enumerate(usable.items()):
+        results[ticker] = atr[row, width - len(candles) + period - 1 :].tolist()
+    return results
+
+
+def _rolling_atr_numpy(
+    high: "np.ndarray",
+    low: "np.ndarray",
+    close: "np.ndarray",
+    period: int,
+    smoothing: ATRSmoothing,
+) -> "np.ndarray":
+    """Rolling ATR over NaN-left-padded (tickers x candles) arrays.
+
+    Returns an array of the same shape, NaN until a ticker has `period`
+    true ranges.
+    """
+    previous_close = np.empty_like(close)
+    previous_close[:, 0] = np.nan
+    previous_close[:, 1:] = close[:, :-1]
+
+    # fmax ignores NaN, so a ticker's first candle falls back to high - low
+    # and padding stays NaN
+    true_range = np.fmax(
+        high - low,
+        np.fmax(np.abs(high - previous_close), np.abs(low - previous_close)),
+    )
+
+    # Any window touching padding sums to NaN
+    sma = np.full_like(true_range, np.nan)
+    windows = np.lib.stride_tricks.sliding_window_view(true_range, period, axis=1)
+    sma[:, period - 1 :] = windows.mean(axis=-1)
+    if smoothing == "sma":
+        return sma
+
+    atr = sma.copy()
+    for t in range(period, atr.shape[1]):
+        previous = atr[:, t - 1]
+        atr[:, t] = np.where(
+            np.isnan(previous),
+            sma[:, t],
+            (previous * (period - 1) + true_range[:, t]) / period,
+        )
+    return atr
+
+
+def _atr_series_python(
+    candles: Sequence[OHLCCandle], period: int, smoothing: ATRSmoothing
+) -> list[float]:
+    """Pure-Python atr_series (used when NumPy is unavailable)."""
+    true_ranges = [
+        calculate_true_range(
+            candle.high, candle.low, candles[i - 1].close if i > 0 else None
+        )
+        for i, candle in enumerate(candles)
+    ]
+
+    window_sum = sum(true_ranges[:period])
+    series = [window_sum / period]
+    for i in range(period, len(true_ranges)):
+        if smoothing == "wilder":
+            series.append((series[-1] * (period - 1) + true_ranges[i]) / period)
+        else:
+            window_sum += true_ranges[i] - true_ranges[i - period]
+            series.append(window_sum / period)
+    return series
+
+
 def calculate_atr(
     candles: list[OHLCCandle],
     period: int = 14,
+    smoothing: ATRSmoothing = "sma",
 ) -> float | None:
     """Calculate Average True Range from OHLC candles.
 
-    Uses Simple Moving Average (SMA) of True Range.
+    Uses Simple Moving Average (SMA) of True Range by default.
 
     Args:
         candles: List of OHLC candles (oldest first)
         period: Number of periods for averaging (default: 14)
+        smoothing: "sma" or "wilder"
 
     Returns:
         ATR value or None if insufficient data
@@ -85,17 +241,7 @@ def calculate_atr(
         )
         return None
 
-    # Calculate True Range for each candle
-    true_ranges: list[float] = []
-
-    for i, candle in enumerate(candles):
-        previous_close = candles[i - 1].close if i > 0 else None
-        tr = calculate_true_range(candle.high, candle.low, previous_close)
-        true_ranges.append(tr)
-
-    # Calculate ATR as SMA of last 'period' True Ranges
-    recent_trs = true_ranges[-period:]
-    return sum(recent_trs) / len(recent_trs)
+    return atr_series(candles, period, smoothing)[-1]
 
 
 def calculate_atr_result(
@@ -104,6 +250,7 @@ def calculate_atr_result(
     period: int = 14,
     high_volatility_threshold: float = 0.03,  # 3% ATR = high
     low_volatility_threshold: float = 0.01,  # 1% ATR = low
+    smoothing: ATRSmoothing = "sma",
 ) -> ATRResult | None:
     """Calculate comprehensive ATR result with trend analysis.
 
@@ -113,11 +260,63 @@ def calculate_atr_result(
         period: Number of periods for ATR calculation
         high_volatility_threshold: ATR% above this is high volatility
         low_volatility_threshold: ATR% below this is low volatility
+        smoothing: "sma" or "wilder"
 
     Returns:
         ATRResult with volatility metrics or None if insufficient data
     """
-    if len(candles) < period:
+    return calculate_atr_results(
+        {ticker: candles},
+        period,
+        high_volatility_threshold,
+        low_volatility_threshold,
+        smoothing,
+    )[ticker]
+
+
+def calculate_atr_results(
+    candles_by_ticker: Mapping[str, list[OHLCCandle]],
+    period: int = 14,
+    high_volatility_threshold: float = 0.03,
+    low_volatility_threshold: float = 0.01,
+    smoothing: ATRSmoothing = "sma",
+) -> dict[str, ATRResult | None]:
+    """Calculate ATR results for many tickers from one batched series pass.
+
+    Args:
+        candles_by_ticker: Ticker -> OHLC candles (oldest first)
+        period: Number of periods for ATR calculation
+        high_volatility_threshold: ATR% above this is high volatility
+        low_volatility_threshold: ATR% below this is low volatility
+        smoothing: "sma" or "wilder"
+
+    Returns:
+        Ticker -> ATRResult, or None where data is insufficient or invalid
+    """
+    series_by_ticker = atr_series_batch(candles_by_ticker, period, smoothing)
+    return {
+        ticker: _build_atr_result(
+            ticker,
+            candles,
+            series_by_ticker[ticker],
+            period,
+            high_volatility_threshold,
+            low_volatility_threshold,
+        )
+        for ticker, candles in candles_by_ticker.items()
+    }
+
+
+def _build_atr_result(
+    ticker: str,
+    candles: Sequence[OHLCCandle],
+    series: list[float],
+    period: int,
+    high_volatility_threshold: float,
+    low_volatility_threshold: float,
+) -> ATRResult | None:
+    """Build an ATRResult from a ticker's precomputed ATR series."""
+    if not series:
         logger.warning(
             "Insufficient candles for ticker",
             extra={
@@ -128,10 +327,7 @@ def calculate_atr_result(
         )
         return None
 
-    # Calculate current ATR
-    atr = calculate_atr(candles, period)
-    if atr is None:
-        return None
+    atr = series[-1]
 
     # Get current price for percentage calculation
     current_price = candles[-1].close
@@ -146,26 +342,18 @@ def calculate_atr_result(
         return None
 
     atr_percent = atr / current_price
+    volatility_level = classify_volatility(
+        atr_percent, high_volatility_threshold, low_volatility_threshold
+    )
 
-    # Determine volatility level
-    if atr_percent >= high_volatility_threshold:
-        volatility_level: Literal["low", "medium", "high"] = "high"
-    elif atr_percent <= low_volatility_threshold:
-        volatility_level = "low"
-    else:
-        volatility_level = "medium"
-
-    # Calculate trend by comparing recent ATR to older ATR
-    # Use half-period lookback
-    trend: Literal["increasing", "decreasing", "stable"]
-    trend_arrow: Literal["↑", "↓", "→"]
-
-    if len(candles) >= period * 2:
-        # Calculate ATR from period ago
-        older_candles = candles[:-period]
-        older_atr = calculate_atr(older_candles, period)
+    # Calculate trend by comparing current ATR to the ATR one period ago
+    # (needs period * 2 candles)
+    trend: Literal["increasing", "decreasing", "stable"] = "stable"
+    trend_arrow: Literal["↑", "↓", "→"] = "→"
 
-        if older_atr and older_atr > 0:
+    if len(series) > period:
+        older_atr = series[-1 - period]
+        if older_atr > 0:
             change_ratio = atr / older_atr
             if change_ratio > 1.1:  # 10% increase
                 trend = "increasing"
@@ -173,16 +361,6 @@ def calculate_atr_result(
             elif change_ratio < 0.9:  # 10% decrease
                 trend = "decreasing"
                 trend_arrow = "↓"
-            else:
-                trend = "stable"
-                trend_arrow = "→"
-        else:
-            trend = "stable"
-            trend_arrow = "→"
-    else:
-        # Not enough data for trend analysis
-        trend = "stable"
-        trend_arrow = "→"
 
     return ATRResult(
         ticker=ticker,
@@ -194,6 +372,7 @@ def calculate_atr_result(
         trend=trend,
         trend_arrow=trend_arrow,
         volatility_level=volatility_level,
+        previous_atr=round(series[-2], 4) if len(series) > 1 else None,
     )
 
 
@@ -0,0 +1,196 @@
+"""Shared DynamoDB poll hub for SSE streaming Lambda.
+
+Runs a single PollingService poll cycle per interval for the whole process
+and broadcasts each PollResult to every subscribed connection, so DynamoDB
+reads and aggregation CPU stay constant as the connection count grows.
+
+Each stream runs in its own event loop (see handler._consume_async_stream),
+so the poller lives on a daemon thread with its own loop and hands results
+to subscribers with call_soon_threadsafe. Every subscriber gets a bounded
+queue: a slow consumer drops its oldest pending result rather than
+buffering without limit, which is safe because PollResult is a full
+snapshot and connections diff snapshots themselves.
+"""
+
+import asyncio
+import logging
+import os
+import threading
+from collections.abc import AsyncGenerator
+from dataclasses import dataclass
+
+from polling import PollingService, PollResult, get_polling_service
+
+logger = logging.getLogger(__name__)
+
+# Pending poll results kept per connection before the oldest is dropped
+DEFAULT_QUEUE_SIZE = int(os.environ.get("SSE_POLL_HUB_QUEUE_SIZE", "4"))
+
+
+@dataclass(eq=False)
+class _Subscriber:
+    """A connection's event loop and its bounded result queue."""
+
+    loop: asyncio.AbstractEventLoop
+    queue: asyncio.Queue
+
+
+def _offer(queue: asyncio.Queue, result: PollResult) -> None:
+    """Enqueue a result, dropping the oldest pending one if the queue is full.
+
+    The dropped result's metrics_changed flag is carried forward so a slow
+    consumer still emits the metrics event it would otherwise have missed.
+    """
+    if queue.full():
+        dropped = queue.get_nowait()
+        if dropped.metrics_changed and not result.metrics_changed:
+            result = result._replace(metrics_changed=True)
+    queue.put_nowait(result)
+
+
+class PollHub:
+    """Process-wide poller that fans PollResults out to all connections.
+
+    The poll thread starts with the first subscriber and exits once the
+    last one leaves, so an idle execution environment issues no reads.
+    """
+
+    def __init__(
+        self,
+        poll_service: PollingService | None = None,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+    ):
+        """Initialize poll hub.
+
+        Args:
+            poll_service: Polling service to drive.
+                         Defaults to the global polling service.
+            queue_size: Max pending results per connection.
+        """
+        self._poll_service = poll_service or get_polling_service()
+        self._queue_size = queue_size
+        self._lock = threading.Lock()
+        self._subscribers: set[_Subscriber] = set()
+        self._latest: PollResult | None = None
+        self._thread: threading.Thread | None = None
+        self._stop = threading.Event()
+        self._poll_count = 0
+
+    @property
+    def subscriber_count(self) -> int:
+        """Number of connections currently subscribed."""
+        with self._lock:
+            return len(self._subscribers)
+
+    @property
+    def poll_count(self) -> int:
+        """Number of poll cycles run since the hub was created."""
+        return self._poll_count
+
+    async def subscribe(self) -> AsyncGenerator[PollResult]:
+        """Yield every PollResult from the shared poller.
+
+        Drop-in replacement for PollingService.poll_loop(). A subscriber
+        joining mid-interval first receives the latest result (flagged as
+        metrics_changed so the new client gets initial metrics).
+
+        Yields:
+            PollResult for each poll cycle
+        """
+        subscriber = _Subscriber(
+            loop=asyncio.get_running_loop(),
+            queue=asyncio.Queue(maxsize=self._queue_size),
+        )
+        with self._lock:
+            self._subscribers.add(subscriber)
+            latest = self._latest
+            self._ensure_running()
+
+        if latest is not None:
+            _offer(subscriber.queue, latest._replace(metrics_changed=True))
+
+        try:
+            while True:
+                yield await subscriber.queue.get()
+        finally:
+            with self._lock:
+                self._subscribers.discard(subscriber)
+
+    def close(self, timeout: float | None = None) -> None:
+        """Stop the poll thread and drop all subscribers (tests/shutdown)."""
+        with self._lock:
+            self._subscribers.clear()
+            thread = self._thread
+        self._stop.set()
+        if thread is not None:
+            thread.join(timeout)
+        self._stop.clear()
+
+    def _ensure_running(self) -> None:
+        """Start the poll thread if it is not running. Caller holds _lock."""
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(
+                target=self._run, name="sse-poll-hub", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        """Poll while anyone is subscribed, broadcasting each result."""
+        loop = asyncio.new_event_loop()
+        try:
+            while not self._stop.is_set():
+                with self._lock:
+                    if not self._subscribers:
+                        self._thread = None
+                        self._latest = None
+                        return
+
+                try:
+                    result = loop.run_until_complete(self._poll_service.poll())
+                except Exception as e:
+                    logger.error(
+                        "Poll hub cycle failed",
+                        extra={"error": str(e)},
+                        exc_info=True,
+                    )
+                else:
+                    self._poll_count += 1
+                    self._broadcast(result)
+
+                self._stop.wait(self._poll_service.poll_interval)
+        finally:
+            loop.close()
+
+    def _broadcast(self, result: PollResult) -> None:
+        """Hand a result to every subscriber's event loop."""
+        with self._lock:
+            self._latest = result
+            subscribers = list(self._subscribers)
+
+        for subscriber in subscribers:
+            try:
+                subscriber.loop.call_soon_threadsafe(_offer, subscriber.queue, result)
+            except RuntimeError:
+                # Subscriber's loop closed without unsubscribing
+                with self._lock:
+                    self._subscribers.discard(subscriber)
+
+
+# Global poll hub instance (lazy initialization)
+_poll_hub: PollHub | None = None
+
+
+def get_poll_hub(poll_service: PollingService | None = None) -> PollHub:
+    """Get or create the global poll hub instance.
+
+    Lazy for the same reason as get_polling_service(): SENTIMENTS_TABLE is
+    only guaranteed at Lambda runtime, not import time.
+
+    Args:
+        poll_service: Polling service for the hub if it is created by this
+                     call. Defaults to the global polling service.
+    """
+    global _poll_hub
+    if _poll_hub is None:
+        _poll_hub = PollHub(poll_service)
+    return _poll_hub
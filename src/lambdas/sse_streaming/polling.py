@@ -2,17 +2,32 @@
 
 Polls DynamoDB at configurable intervals to detect new sentiment data.
 Per FR-015: Poll at 5-second intervals (configurable via SSE_POLL_INTERVAL).
+
+Incremental mode (SSE_INCREMENTAL_POLL=true) keeps running aggregates in
+memory and only queries by_sentiment items newer than the last seen
+timestamp, so a poll costs O(new items) instead of O(items in the TTL
+window). Items retract from the aggregates when their ttl_timestamp
+passes, and a periodic full resync corrects any drift.
+
+The by_sentiment range key is the article's publish time, not the time
+analysis finished, and ingestion backfills up to 7 days of news. An
+article analyzed more than INCREMENTAL_LOOKBACK_SECONDS after it was
+published is missed until the next full resync, so the mode stays off in
+deployed environments until the index is ordered by analysis time.
 """
 
 import asyncio
+import heapq
+import itertools
 import logging
 import os
+import threading
 import time
 from collections import Counter
 from dataclasses import dataclass
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from decimal import Decimal
-from typing import NamedTuple
+from typing import Any, NamedTuple
 
 import boto3
 from botocore.exceptions import ClientError
@@ -21,6 +36,19 @@ from tracing import get_tracer, is_enabled
 
 logger = logging.getLogger(__name__)
 
+# by_sentiment GSI partitions, in the order full polls read them
+SENTIMENT_LABELS: tuple[str, ...] = ("positive", "neutral", "negative")
+
+# Incremental queries re-read this far behind the watermark, because items
+# enter the GSI when analysis finishes, which can lag their timestamp.
+INCREMENTAL_LOOKBACK_SECONDS = int(
+    os.environ.get("SSE_INCREMENTAL_LOOKBACK_SECONDS", "300")
+)
+
+# Rebuild aggregates from a full read at least this often (deletes and
+# very late analysis are otherwise invisible to incremental queries).
+FULL_RESYNC_SECONDS = int(os.environ.get("SSE_FULL_RESYNC_SECONDS", "900"))
+
 
 @dataclass
 class TickerAggregate:
@@ -42,6 +70,156 @@ class PollResult(NamedTuple):
     timeseries_buckets: dict[str, dict]
 
 
+class _Contribution(NamedTuple):
+    """What one sentiment item adds to the running aggregates."""
+
+    sentiment: str
+    score: Decimal
+    tickers: tuple[str, ...]
+    expires_at: int | None
+
+
+def _parse_timestamp(value: str) -> datetime | None:
+    """Parse an item's ISO8601 timestamp, or None if it is malformed."""
+    try:
+        parsed = datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=UTC)
+
+
+class WindowAggregates:
+    """Running per-label and per-ticker aggregates over the items in the TTL window.
+
+    Produces the same MetricsEventData and TickerAggregate values as
+    PollingService._aggregate_metrics() and _compute_per_ticker_aggregates()
+    over the same items, but applies and retracts items one at a time.
+    Items are keyed by (source_id, timestamp), so re-reading an item is a
+    no-op and a re-labelled item replaces its previous contribution.
+    """
+
+    def __init__(self):
+        self._items: dict[Any, _Contribution] = {}
+        self._expiry: list[tuple[int, Any]] = []  # min-heap on expires_at
+        self._anonymous_keys = itertools.count()
+        self._label_counts: Counter = Counter()
+        self._ticker_counts: Counter = Counter()
+        self._ticker_score_sums: dict[str, Decimal] = {}
+        self._ticker_labels: dict[str, Counter] = {}
+        self.watermark: datetime | None = None
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def add(self, item: dict) -> None:
+        """Apply a DynamoDB item, replacing any earlier version of it."""
+        source_id = item.get("source_id")
+        timestamp = item.get("timestamp")
+        if source_id is None or timestamp is None:
+            key: Any = next(self._anonymous_keys)
+        else:
+            key = (source_id, timestamp)
+
+        score = item.get("score", Decimal("0"))
+        if not isinstance(score, Decimal):
+            score = Decimal(str(score))
+        expires_at = item.get("ttl_timestamp")
+        contribution = _Contribution(
+            sentiment=item.get("sentiment", "neutral").lower(),
+            score=score,
+            tickers=tuple(t for t in item.get("matched_tickers", []) if t),
+            expires_at=int(expires_at) if expires_at is not None else None,
+        )
+
+        parsed = _parse_timestamp(timestamp)
+        if parsed is not None:
+            # A future-dated item must not push the lookback past real time
+            parsed = min(parsed, datetime.now(UTC))
+            if self.watermark is None or parsed > self.watermark:
+                self.watermark = parsed
+
+        previous = self._items.get(key)
+        if previous == contribution:
+            return
+        if previous is not None:
+            self._apply(previous, -1)
+        self._items[key] = contribution
+        self._apply(contribution, 1)
+        if contribution.expires_at is not None:
+            heapq.heappush(self._expiry, (contribution.expires_at, key))
+
+    def expire(self, now: float) -> int:
+        """Retract items whose ttl_timestamp is at or before now.
+
+        Returns:
+            Number of items retracted
+        """
+        retracted = 0
+        while self._expiry and self._expiry[0][0] <= now:
+            expires_at, key = heapq.heappop(self._expiry)
+            contribution = self._items.get(key)
+            # Skip heap entries superseded by a newer version of the item
+            if contribution is None or contribution.expires_at != expires_at:
+                continue
+            del self._items[key]
+            self._apply(contribution, -1)
+            retracted += 1
+        return retracted
+
+    def _apply(self, contribution: _Contribution, sign: int) -> None:
+        """Add (sign=1) or retract (sign=-1) an item's contribution."""
+        self._label_counts[contribution.sentiment] += sign
+        for ticker in contribution.tickers:
+            self._ticker_counts[ticker] += sign
+            labels = self._ticker_labels.setdefault(ticker, Counter())
+            labels[contribution.sentiment] += sign
+            self._ticker_score_sums[ticker] = (
+                self._ticker_score_sums.get(ticker, Decimal("0"))
+                + sign * contribution.score
+            )
+            if self._ticker_counts[ticker] == 0:
+                del self._ticker_counts[ticker]
+                del self._ticker_labels[ticker]
+                del self._ticker_score_sums[ticker]
+
+    def metrics(self) -> MetricsEventData:
+        """Current window metrics (see PollingService._aggregate_metrics)."""
+        total = len(self._items)
+        return MetricsEventData(
+            total=total,
+            positive=self._label_counts["positive"],
+            neutral=self._label_counts["neutral"],
+            negative=self._label_counts["negative"],
+            by_tag=dict(self._ticker_counts),
+            rate_last_hour=0,  # Would need timestamp filtering
+            rate_last_24h=total,  # Simplified for now
+            timestamp=datetime.now(UTC),
+        )
+
+    def per_ticker(self) -> dict[str, TickerAggregate]:
+        """Current per-ticker aggregates, O(tickers)."""
+        result: dict[str, TickerAggregate] = {}
+        for ticker, count in self._ticker_counts.items():
+            avg_score = float(self._ticker_score_sums[ticker] / count)
+            result[ticker] = TickerAggregate(
+                ticker=ticker,
+                score=avg_score,
+                label=self._majority_label(self._ticker_labels[ticker]),
+                confidence=avg_score,  # No separate confidence field in items
+                count=count,
+            )
+        return result
+
+    @staticmethod
+    def _majority_label(labels: Counter) -> str:
+        """Most common label; ties go to the first label a full poll reads."""
+        best, best_count = "", 0
+        for label in (*SENTIMENT_LABELS, *labels):
+            if labels[label] > best_count:
+                best, best_count = label, labels[label]
+        return best
+
+
 class PollingService:
     """Polls DynamoDB for sentiment data and aggregates metrics.
 
@@ -53,6 +231,7 @@ class PollingService:
         self,
         table_name: str | None = None,
         poll_interval: int | None = None,
+        incremental: bool | None = None,
     ):
         """Initialize polling service.
 
@@ -61,6 +240,8 @@ class PollingService:
                        Defaults to SENTIMENTS_TABLE env var.
             poll_interval: Poll interval in seconds.
                           Defaults to SSE_POLL_INTERVAL env var or 5.
+            incremental: Maintain running aggregates and only query new items.
+                        Defaults to SSE_INCREMENTAL_POLL env var or False.
 
         Raises:
             ValueError: If SENTIMENTS_TABLE env var is not set and no table_name provided.
@@ -77,6 +258,14 @@ class PollingService:
         self._table = None  # Lazy initialization
         self._timeseries_table_name = os.environ.get("TIMESERIES_TABLE")
         self._last_metrics: MetricsEventData | None = None
+        if incremental is None:
+            incremental = (
+                os.environ.get("SSE_INCREMENTAL_POLL", "false").lower() == "true"
+            )
+        self._incremental = incremental
+        self._window: WindowAggregates | None = None
+        self._last_full_sync = 0.0
+        self._window_lock = threading.Lock()
 
     @property
     def poll_interval(self) -> int:
@@ -316,11 +505,16 @@ class PollingService:
         try:
             # Run DynamoDB GSI queries in executor to avoid blocking
             loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(None, self._query_all_sentiments)
-
-            items = response.get("Items", [])
-            metrics = self._aggregate_metrics(items)
-            per_ticker = self._compute_per_ticker_aggregates(items)
+            if self._incremental:
+                item_count, metrics, per_ticker = await loop.run_in_executor(
+                    None, self._refresh_window
+                )
+            else:
+                response = await loop.run_in_executor(None, self._query_all_sentiments)
+                items = response.get("Items", [])
+                item_count = len(items)
+                metrics = self._aggregate_metrics(items)
+                per_ticker = self._compute_per_ticker_aggregates(items)
 
             # T022: Fetch timeseries buckets for partial_bucket events
             tickers = list(per_ticker.keys())
@@ -335,7 +529,7 @@ class PollingService:
 
             # T042: Span annotations
             if span:
-                span.set_attribute("item_count", len(items))
+                span.set_attribute("item_count", item_count)
                 span.set_attribute("changed_count", 1 if changed else 0)
                 span.set_attribute("poll_duration_ms", poll_duration_ms)
 
@@ -396,7 +590,9 @@ class PollingService:
             if span:
                 span.end()
 
-    def _query_by_sentiment(self, sentiment: str) -> list[dict]:
+    def _query_by_sentiment(
+        self, sentiment: str, since: str | None = None
+    ) -> list[dict]:
         """Query DynamoDB table for sentiment items by sentiment type using GSI.
 
         Uses by_sentiment GSI for O(result) query performance instead of O(table) scan.
@@ -404,6 +600,8 @@ class PollingService:
 
         Args:
             sentiment: Sentiment type to query (positive, neutral, negative)
+            since: Only return items with timestamp after this ISO8601 value
+                  (GSI range key condition). None returns all items.
 
         Returns:
             List of DynamoDB items matching the sentiment
@@ -411,19 +609,23 @@ class PollingService:
         table = self._get_table()
         items: list[dict] = []
 
-        response = table.query(
-            IndexName="by_sentiment",
-            KeyConditionExpression="sentiment = :sentiment",
-            ExpressionAttributeValues={":sentiment": sentiment},
-        )
+        query_kwargs: dict[str, Any] = {
+            "IndexName": "by_sentiment",
+            "KeyConditionExpression": "sentiment = :sentiment",
+            "ExpressionAttributeValues": {":sentiment": sentiment},
+        }
+        if since is not None:
+            query_kwargs["KeyConditionExpression"] += " AND #ts > :since"
+            query_kwargs["ExpressionAttributeNames"] = {"#ts": "timestamp"}
+            query_kwargs["ExpressionAttributeValues"][":since"] = since
+
+        response = table.query(**query_kwargs)
         items.extend(response.get("Items", []))
 
         # Handle pagination with LastEvaluatedKey
         while "LastEvaluatedKey" in response:
             response = table.query(
-                IndexName="by_sentiment",
-                KeyConditionExpression="sentiment = :sentiment",
-                ExpressionAttributeValues={":sentiment": sentiment},
+                **query_kwargs,
                 ExclusiveStartKey=response["LastEvaluatedKey"],
             )
             items.extend(response.get("Items", []))
@@ -442,12 +644,55 @@ class PollingService:
         all_items: list[dict] = []
 
         # Query each sentiment type using GSI
-        for sentiment in ("positive", "neutral", "negative"):
+        for sentiment in SENTIMENT_LABELS:
             items = self._query_by_sentiment(sentiment)
             all_items.extend(items)
 
         return {"Items": all_items}
 
+    def _refresh_window(
+        self,
+    ) -> tuple[int, MetricsEventData, dict[str, TickerAggregate]]:
+        """Bring the incremental window up to date (incremental mode).
+
+        Rebuilds from a full read on the first poll and every
+        FULL_RESYNC_SECONDS; otherwise queries only items newer than the
+        watermark minus INCREMENTAL_LOOKBACK_SECONDS. Already-seen items in
+        the lookback are de-duplicated by WindowAggregates.
+
+        Returns:
+            Tuple of (items read, metrics, per-ticker aggregates)
+        """
+        with self._window_lock:
+            now = time.time()
+            window = self._window
+            if (
+                window is None
+                or window.watermark is None
+                or now - self._last_full_sync >= FULL_RESYNC_SECONDS
+            ):
+                window = WindowAggregates()
+                items = self._query_all_sentiments().get("Items", [])
+                self._last_full_sync = now
+            else:
+                since = window.watermark - timedelta(
+                    seconds=INCREMENTAL_LOOKBACK_SECONDS
+                )
+                # Second precision without offset sorts before every stored
+                # timestamp format for that second, so the bound is inclusive.
+                since_key = since.astimezone(UTC).strftime("%Y-%m-%dT%H:%M:%S")
+                items = []
+                for sentiment in SENTIMENT_LABELS:
+                    items.extend(self._query_by_sentiment(sentiment, since=since_key))
+
+            for item in items:
+                window.add(item)
+            window.expire(now)
+            # Only publish the window once fully built, so a failed resync
+            # query leaves the previous aggregates in place.
+            self._window = window
+            return len(items), window.metrics(), window.per_ticker()
+
     async def poll_loop(self):
         """Continuous polling loop generator.
 
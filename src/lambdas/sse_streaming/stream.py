@@ -16,7 +16,7 @@ import asyncio
 import logging
 import os
 import time
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, AsyncIterator
 from datetime import UTC, datetime
 
 from cache_logger import CacheMetricsLogger, log_cold_start_metrics
@@ -29,8 +29,10 @@ from models import (
     SentimentUpdateData,
     SSEEvent,
 )
+from poll_hub import PollHub, get_poll_hub
 from polling import (
     PollingService,
+    PollResult,
     TickerAggregate,
     detect_ticker_changes,
     get_polling_service,
@@ -152,18 +154,26 @@ class SSEStreamGenerator:
         poll_service: PollingService | None = None,
         heartbeat_interval: int | None = None,
         debounce_ms: int = DEFAULT_DEBOUNCE_MS,
+        poll_hub: PollHub | None = None,
     ):
         """Initialize stream generator.
 
         Args:
             conn_manager: Connection manager instance
-            poll_service: Polling service instance
+            poll_service: Polling service instance. When given (and no
+                         poll_hub), each stream iterates its own poll_loop().
             heartbeat_interval: Heartbeat interval in seconds.
                               Defaults to SSE_HEARTBEAT_INTERVAL or 30.
             debounce_ms: Debounce interval for bucket updates (default 100ms)
+            poll_hub: Shared poll hub. Defaults to the global hub when no
+                     poll_service is given, so all streams share one poller.
         """
         self._conn_manager = conn_manager or connection_manager
+        use_shared_hub = poll_hub is None and poll_service is None
         self._poll_service = poll_service or get_polling_service()
+        self._poll_hub = (
+            get_poll_hub(self._poll_service) if use_shared_hub else poll_hub
+        )
         self._heartbeat_interval = heartbeat_interval or int(
             os.environ.get("SSE_HEARTBEAT_INTERVAL", "30")
         )
@@ -358,6 +368,12 @@ class SSEStreamGenerator:
         debounce_key = f"{ticker}#{resolution.value}"
         return self._debouncer.should_emit(debounce_key)
 
+    def _poll_results(self) -> AsyncIterator[PollResult]:
+        """Per-connection view of poll results (shared hub or own poll loop)."""
+        if self._poll_hub is not None:
+            return self._poll_hub.subscribe()
+        return self._poll_service.poll_loop()
+
     async def generate_global_stream(
         self,
         connection: SSEConnection,
@@ -411,7 +427,7 @@ class SSEStreamGenerator:
 
         try:
             # Main event loop
-            async for poll_result in self._poll_service.poll_loop():
+            async for poll_result in self._poll_results():
                 # T046: Check deadline before creating more spans (FR-093)
                 if not flush_fired and self._check_deadline_flush():
                     flush_fired = True
@@ -627,7 +643,7 @@ class SSEStreamGenerator:
             # Main event loop — polls for sentiment + timeseries changes
             # NOTE: Does NOT emit metrics events (config streams only get
             # heartbeats + filtered sentiment_update + filtered partial_bucket)
-            async for poll_result in self._poll_service.poll_loop():
+            async for poll_result in self._poll_results():
                 current_time = time.time()
 
                 # Send heartbeat if interval passed
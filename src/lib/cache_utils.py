@@ -1,21 +1,33 @@
 """Shared cache utilities for TTL jitter, statistics tracking, and metric emission.
 
 Provides lightweight helpers used across all 12 caches in the application.
-Each cache retains its own interface — these utilities standardize the
-common patterns (jitter, stats, metrics) without imposing a base class.
+The jitter, stats and metrics helpers standardize the common patterns for
+caches that keep their own storage.
+
+TTLCache is the shared storage primitive for the simple key/value caches
+(API adapters, dashboard responses): O(1) get/set/evict, jittered TTL,
+optional byte bound, and built-in CacheStats registration. Caches that
+need more (e.g. ResponseCache, which adds serialized bodies and ETags)
+subclass it.
 """
 
 import logging
 import os
 import random
+import sys
 import threading
 import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterator
 from dataclasses import dataclass, field
+from typing import Any, NamedTuple
 
 logger = logging.getLogger(__name__)
 
 CACHE_JITTER_PCT = float(os.environ.get("CACHE_JITTER_PCT", "0.1"))
 CACHE_METRICS_FLUSH_INTERVAL = int(os.environ.get("CACHE_METRICS_FLUSH_INTERVAL", "60"))
+# How long get_or_load() waits on another caller's loader before loading itself
+CACHE_LOAD_WAIT_SECONDS = float(os.environ.get("CACHE_LOAD_WAIT_SECONDS", "30"))
 
 
 def jittered_ttl(base_ttl: float, jitter_pct: float | None = None) -> float:
@@ -188,6 +200,313 @@ class CacheMetricEmitter:
             logger.debug("Failed to emit cache metrics to CloudWatch", exc_info=True)
 
 
+class CacheEntry(NamedTuple):
+    """A stored value with its insertion time, jittered TTL and size.
+
+    Field order keeps the (timestamp, value, ttl) tuple layout the
+    per-module dict caches used before TTLCache.
+    """
+
+    stored_at: float
+    value: Any
+    ttl: float
+    size: int = 0
+
+
+def _default_sizeof(value: Any) -> int:
+    """Approximate value size in bytes for max_bytes accounting."""
+    if isinstance(value, str | bytes | bytearray):
+        return len(value)
+    return sys.getsizeof(value)
+
+
+@dataclass(eq=False)
+class _Flight:
+    """An in-progress get_or_load() call that other callers can wait on."""
+
+    done: threading.Event = field(default_factory=threading.Event)
+    value: Any = None
+    error: BaseException | None = None
+
+
+class TTLCache:
+    """Thread-safe TTL + LRU cache with O(1) get, set and evict.
+
+    Entries live in an OrderedDict in recency order, so the least recently
+    used entry is always at the front. Each entry gets its own jittered TTL
+    at insert time; expired entries are dropped lazily on read.
+
+    Hits, misses and evictions are recorded on a CacheStats registered with
+    the global CacheMetricEmitter under ``name``.
+
+    get_or_load() adds single-flight loading: concurrent misses for one key
+    share a single loader call instead of each hitting the upstream API.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_entries: int,
+        ttl: float = 0,
+        max_bytes: int | None = None,
+        sizeof: Callable[[Any], int] | None = None,
+        on_evict: Callable[[Hashable], None] | None = None,
+        stale_ttl: float = 0,
+        load_wait: float | None = None,
+    ) -> None:
+        """Initialize cache.
+
+        Args:
+            name: Cache name for CacheStats / CloudWatch dimension.
+            max_entries: Maximum number of entries before LRU eviction.
+            ttl: Default base TTL in seconds (jittered per entry).
+                0 means entries never expire.
+            max_bytes: Optional bound on the summed size of all values.
+            sizeof: Size function for max_bytes. Defaults to len() for
+                str/bytes and sys.getsizeof() otherwise.
+            on_evict: Called with the key of each entry evicted for space.
+            stale_ttl: Stale-while-revalidate window in seconds. Expired
+                entries younger than ttl + stale_ttl are still served by
+                get_or_load() while one caller refreshes them.
+            load_wait: Seconds get_or_load() waits for another caller's
+                loader before calling loader itself. Defaults to
+                CACHE_LOAD_WAIT_SECONDS.
+        """
+        self.name = name
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.load_wait = CACHE_LOAD_WAIT_SECONDS if load_wait is None else load_wait
+        self.max_bytes = max_bytes
+        self._sizeof = sizeof or _default_sizeof
+        self._on_evict = on_evict
+        self._entries: OrderedDict[Hashable, CacheEntry] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._flights: dict[Hashable, _Flight] = {}
+        self.stats = CacheStats(name=name)
+        get_global_emitter().register(self.stats)
+
+    def get(self, key: Hashable) -> Any | None:
+        """Return a fresh value and mark it most recently used, else None."""
+        entry = self.get_entry(key)
+        return entry.value if entry is not None else None
+
+    def get_entry(self, key: Hashable) -> CacheEntry | None:
+        """Like get(), but return the full CacheEntry."""
+        with self._lock:
+            entry, fresh = self._lookup(key)
+        if not fresh:
+            self.stats.record_miss()
+            return None
+        self.stats.record_hit()
+        return entry
+
+    def get_or_load(
+        self,
+        key: Hashable,
+        loader: Callable[[], Any],
+        ttl: float | None = None,
+        cache_if: Callable[[Any], bool] | None = None,
+    ) -> Any:
+        """Return the cached value, calling loader at most once per key.
+
+        On a miss the first caller runs loader(); concurrent callers for the
+        same key block until it finishes and share its result (or its
+        exception) instead of issuing their own upstream call. A caller that
+        waits longer than load_wait stops waiting and calls loader itself,
+        so one hung loader cannot block every caller.
+
+        Within the stale_ttl window an expired value is returned at once to
+        every caller except the one refreshing it. The refresh runs in that
+        caller's thread rather than in the background, because Lambda
+        freezes background threads between invocations. If the refresh
+        fails, the stale value is returned and the failure is recorded as a
+        refresh failure.
+
+        Args:
+            key: Cache key.
+            loader: Zero-argument function fetching the value.
+            ttl: Base TTL for the loaded value; defaults to the cache's ttl.
+            cache_if: Predicate deciding whether a loaded value is stored
+                (e.g. ``bool`` to skip caching empty responses).
+
+        Returns:
+            The cached or freshly loaded value.
+        """
+        with self._lock:
+            entry, fresh = self._lookup(key)
+            if fresh:
+                self.stats.record_hit()
+                return entry.value
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+            elif entry is not None:
+                # Stale hit: someone else is already refreshing
+                self.stats.record_hit()
+                return entry.value
+
+        if not leader:
+            if flight.done.wait(self.load_wait):
+                self.stats.record_hit()
+                if flight.error is not None:
+                    raise flight.error
+                return flight.value
+            logger.warning(
+                "Timed out waiting for cache load, loading directly",
+                extra={"cache": self.name, "wait_seconds": self.load_wait},
+            )
+            self.stats.record_miss()
+            value = loader()
+            if cache_if is None or cache_if(value):
+                self.set(key, value, ttl)
+            return value
+
+        self.stats.record_miss()
+        try:
+            value = loader()
+        except Exception as e:
+            if entry is None:
+                flight.error = e
+                raise
+            self.stats.record_refresh_failure()
+            logger.warning(
+                "Cache refresh failed, serving stale value",
+                extra={"cache": self.name, "error": str(e)},
+            )
+            flight.value = entry.value
+            return entry.value
+        except BaseException as e:
+            flight.error = e
+            raise
+        else:
+            flight.value = value
+            if cache_if is None or cache_if(value):
+                self.set(key, value, ttl)
+            return value
+        finally:
+            with self._lock:
+                self._flights.pop(key, None)
+            flight.done.set()
+
+    def set(self, key: Hashable, value: Any, ttl: float | None = None) -> CacheEntry:
+        """Store a value, evicting least recently used entries if full.
+
+        A value larger than max_bytes on its own is not stored (any previous
+        value for the key is dropped), rather than evicting everything else.
+
+        Args:
+            key: Cache key.
+            value: Value to store.
+            ttl: Base TTL in seconds for this entry; defaults to the
+                cache's ttl. Jittered via jittered_ttl().
+
+        Returns:
+            The entry (not stored if larger than max_bytes).
+        """
+        base_ttl = self.ttl if ttl is None else ttl
+        size = self._sizeof(value) if self.max_bytes is not None else 0
+        entry = CacheEntry(
+            stored_at=time.time(),
+            value=value,
+            ttl=jittered_ttl(base_ttl) if base_ttl > 0 else 0,
+            size=size,
+        )
+
+        evicted: list[Hashable] = []
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            if self.max_bytes is not None and size > self.max_bytes:
+                logger.warning(
+                    "Value exceeds cache max_bytes, not cached",
+                    extra={"cache": self.name, "size": size},
+                )
+                return entry
+            while self._entries and (
+                len(self._entries) >= self.max_entries
+                or (self.max_bytes is not None and self._bytes + size > self.max_bytes)
+            ):
+                oldest_key = next(iter(self._entries))
+                self._remove(oldest_key)
+                evicted.append(oldest_key)
+            self._entries[key] = entry
+            self._bytes += size
+
+        for evicted_key in evicted:
+            self.stats.record_eviction()
+            if self._on_evict is not None:
+                self._on_evict(evicted_key)
+        return entry
+
+    def invalidate(self, prefix: str | None = None) -> int:
+        """Remove all entries, or only string keys starting with prefix.
+
+        Returns:
+            Number of entries removed.
+        """
+        with self._lock:
+            if prefix is None:
+                count = len(self._entries)
+                self._entries.clear()
+                self._bytes = 0
+                return count
+            keys = [
+                k for k in self._entries if isinstance(k, str) and k.startswith(prefix)
+            ]
+            for key in keys:
+                self._remove(key)
+            return len(keys)
+
+    def clear(self) -> None:
+        """Remove all entries. Stats are left untouched."""
+        self.invalidate()
+
+    @property
+    def total_bytes(self) -> int:
+        """Summed size of stored values (0 unless max_bytes is set)."""
+        return self._bytes
+
+    def _lookup(self, key: Hashable) -> tuple[CacheEntry | None, bool]:
+        """Return (entry, is_fresh) for key. Caller holds _lock.
+
+        Fresh entries are marked most recently used. Expired entries inside
+        the stale window are returned with is_fresh=False; older ones are
+        removed.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None, False
+        age = time.time() - entry.stored_at
+        if entry.ttl <= 0 or age < entry.ttl:
+            self._entries.move_to_end(key)
+            return entry, True
+        if age < entry.ttl + self.stale_ttl:
+            return entry, False
+        self._remove(key)
+        return None, False
+
+    def _remove(self, key: Hashable) -> None:
+        """Delete an entry and release its bytes. Caller holds _lock."""
+        self._bytes -= self._entries.pop(key).size
+
+    def __getitem__(self, key: Hashable) -> CacheEntry:
+        """Peek at an entry without TTL checks, stats or recency update."""
+        return self._entries[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[Hashable]:
+        with self._lock:
+            return iter(list(self._entries))
+
+
 # Global emitter singleton
 _global_emitter: CacheMetricEmitter | None = None
 _emitter_lock = threading.Lock()
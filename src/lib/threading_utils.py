@@ -7,6 +7,7 @@ Feature 1010: Parallel Ingestion with Cross-Source Deduplication
 
 import queue
 import threading
+import time
 from collections.abc import Iterator
 from contextlib import contextmanager
 from typing import Any, TypeVar
@@ -236,6 +237,92 @@ class ThreadSafeDict:
             return list(self._data.keys())
 
 
+class TokenBucket:
+    """Thread-safe token bucket rate limiter.
+
+    Tokens refill continuously at ``rate`` per second up to ``capacity``,
+    so short bursts up to capacity are allowed while the long-run rate
+    stays bounded.
+
+    Usage:
+        bucket = TokenBucket(rate=1.0, capacity=30)
+
+        # In worker threads, before each outbound call:
+        if not bucket.acquire(timeout=10):
+            raise RateLimitError(...)
+    """
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        """Initialize a full bucket.
+
+        Args:
+            rate: Tokens added per second; 0 means the bucket never refills
+            capacity: Maximum tokens (burst size)
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        """Add tokens for elapsed time. Caller holds _lock."""
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+    def try_acquire(self, tokens: float = 1) -> bool:
+        """Take tokens if available without waiting.
+
+        Args:
+            tokens: Number of tokens to take
+
+        Returns:
+            True if the tokens were taken
+        """
+        with self._lock:
+            self._refill()
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return True
+            return False
+
+    def acquire(self, tokens: float = 1, timeout: float | None = None) -> bool:
+        """Take tokens, sleeping until they are available.
+
+        Args:
+            tokens: Number of tokens to take
+            timeout: Maximum seconds to wait (None = wait indefinitely)
+
+        Returns:
+            True if the tokens were taken, False on timeout
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return True
+                if self.rate <= 0:
+                    return False  # Never refills: waiting cannot help
+                wait = (tokens - self._tokens) / self.rate
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining < wait:
+                    return False
+            time.sleep(wait)
+
+    @property
+    def available(self) -> float:
+        """Tokens currently available."""
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+
 @contextmanager
 def thread_safe_operation(lock: threading.Lock) -> Iterator[None]:
     """Context manager for thread-safe operations.
@@ -9,13 +9,21 @@ This module provides utilities for:
 - DynamoDB key design ([CS-002, CS-004])
 """
 
-from src.lib.timeseries.aggregation import aggregate_ohlc
+from src.lib.timeseries.aggregation import (
+    SENTIMENT_LABELS,
+    aggregate_ohlc,
+    aggregate_ohlc_columnar,
+)
 from src.lib.timeseries.bucket import calculate_bucket_progress, floor_to_bucket
 from src.lib.timeseries.cache import CacheStats, ResolutionCache, get_global_cache
 from src.lib.timeseries.fanout import (
+    TAG_RESOLUTIONS,
     generate_fanout_items,
+    tag_bucket_pk,
     write_fanout,
+    write_fanout_atomic,
     write_fanout_with_update,
+    write_tag_fanout,
 )
 from src.lib.timeseries.models import (
     OHLCBucket,
@@ -36,9 +44,16 @@ __all__ = [
     "floor_to_bucket",
     "calculate_bucket_progress",
     "aggregate_ohlc",
+    "aggregate_ohlc_columnar",
+    "SENTIMENT_LABELS",
     "generate_fanout_items",
     "write_fanout",
     "write_fanout_with_update",
+    "write_fanout_atomic",
+    # Tag buckets
+    "TAG_RESOLUTIONS",
+    "tag_bucket_pk",
+    "write_tag_fanout",
     # Cache utilities [CS-005, CS-006]
     "ResolutionCache",
     "CacheStats",
@@ -4,12 +4,35 @@ OHLC aggregation logic for sentiment data.
 Canonical References:
 - [CS-011] Netflix Tech Blog: OHLC for non-financial metrics
 - [CS-012] ACM Queue 2017: Time-Series Databases aggregation patterns
+
+Two entry points share the same semantics:
+- aggregate_ohlc: row-oriented, takes SentimentScore models
+- aggregate_ohlc_columnar: column-oriented, takes parallel arrays of epoch
+  timestamps, values and label codes (no per-point model construction)
+
+Both run in a single O(n) pass. Open is the earliest point and close the
+latest; ties on timestamp keep input order (first in = open, last in = close),
+matching a stable sort by timestamp.
 """
 
-from collections import Counter
+from collections.abc import Sequence
+from typing import Any
 
 from src.lib.timeseries.models import OHLCBucket, SentimentScore
 
+try:
+    import numpy as np
+except ImportError:  # numpy not packaged in every Lambda
+    np = None
+
+# Label vocabulary for label codes. Code i maps to SENTIMENT_LABELS[i];
+# any negative code means "no label" and is excluded from label_counts.
+SENTIMENT_LABELS: tuple[str, ...] = ("positive", "neutral", "negative")
+NO_LABEL = -1
+
+# Below this size the pure-Python pass beats NumPy array conversion overhead
+NUMPY_MIN_POINTS = 2048
+
 
 def aggregate_ohlc(scores: list[SentimentScore]) -> OHLCBucket:
     """
@@ -30,23 +53,131 @@ def aggregate_ohlc(scores: list[SentimentScore]) -> OHLCBucket:
     if not scores:
         raise ValueError("Cannot aggregate empty score list")
 
-    # Sort by timestamp for correct open/close determination
-    sorted_scores = sorted(scores, key=lambda s: (s.timestamp, scores.index(s)))
+    label_counts: dict[str, int] = {}
+    for s in scores:
+        if s.label:
+            label_counts[s.label] = label_counts.get(s.label, 0) + 1
+
+    return _aggregate_single_pass(
+        [s.timestamp for s in scores],
+        [s.value for s in scores],
+        label_counts,
+    )
+
+
+def aggregate_ohlc_columnar(
+    timestamps: Sequence[float] | Any,
+    values: Sequence[float] | Any,
+    label_codes: Sequence[int] | Any | None = None,
+    labels: Sequence[str] = SENTIMENT_LABELS,
+) -> OHLCBucket:
+    """
+    Aggregate parallel columns of sentiment points into an OHLC bucket.
+
+    Accepts plain sequences or NumPy arrays. Inputs with at least
+    NUMPY_MIN_POINTS points take a vectorized NumPy path when NumPy is
+    installed; smaller inputs use a pure-Python single pass.
 
-    values = [s.value for s in sorted_scores]
+    Args:
+        timestamps: Epoch seconds per point
+        values: Sentiment score per point
+        label_codes: Index into ``labels`` per point (NO_LABEL for none)
+        labels: Label vocabulary for decoding label_codes
 
-    # Count labels
-    labels = [s.label for s in sorted_scores if s.label]
-    label_counts = dict(Counter(labels))
+    Returns:
+        OHLCBucket: Aggregated OHLC data
 
-    total_sum = sum(values)
+    Raises:
+        ValueError: If columns are empty or have mismatched lengths
+    """
     count = len(values)
+    if count == 0:
+        raise ValueError("Cannot aggregate empty score list")
+    if len(timestamps) != count or (
+        label_codes is not None and len(label_codes) != count
+    ):
+        raise ValueError("timestamps, values and label_codes must be equal length")
+
+    if np is not None and count >= NUMPY_MIN_POINTS:
+        return _aggregate_numpy(timestamps, values, label_codes, labels)
+
+    label_counts: dict[str, int] = {}
+    if label_codes is not None:
+        tallies = [0] * len(labels)
+        for code in label_codes:
+            if code >= 0:
+                tallies[code] += 1
+        label_counts = {
+            labels[i]: tally for i, tally in enumerate(tallies) if tally > 0
+        }
+
+    return _aggregate_single_pass(timestamps, values, label_counts)
+
+
+def _aggregate_single_pass(
+    timestamps: Sequence[Any],
+    values: Sequence[float],
+    label_counts: dict[str, int],
+) -> OHLCBucket:
+    """Compute OHLC/count/sum in one pass; timestamps only need to be ordered."""
+    first_ts = last_ts = timestamps[0]
+    open_value = close_value = high = low = values[0]
+    total_sum = 0.0
+
+    for ts, value in zip(timestamps, values, strict=True):
+        if ts < first_ts:
+            first_ts, open_value = ts, value
+        if ts >= last_ts:
+            last_ts, close_value = ts, value
+        if value > high:
+            high = value
+        elif value < low:
+            low = value
+        total_sum += value
+
+    count = len(values)
+    return OHLCBucket(
+        open=open_value,
+        high=high,
+        low=low,
+        close=close_value,
+        count=count,
+        sum=total_sum,
+        avg=total_sum / count,
+        label_counts=label_counts,
+    )
+
+
+def _aggregate_numpy(
+    timestamps: Any,
+    values: Any,
+    label_codes: Any | None,
+    labels: Sequence[str],
+) -> OHLCBucket:
+    """Vectorized equivalent of _aggregate_single_pass for large inputs."""
+    ts = np.asarray(timestamps, dtype=np.float64)
+    vals = np.asarray(values, dtype=np.float64)
+    count = int(vals.size)
+
+    # argmin returns the first occurrence; for close we need the last
+    # occurrence of the max timestamp, so search the reversed array.
+    open_idx = int(np.argmin(ts))
+    close_idx = count - 1 - int(np.argmax(ts[::-1]))
+    total_sum = float(vals.sum())
+
+    label_counts: dict[str, int] = {}
+    if label_codes is not None:
+        codes = np.asarray(label_codes, dtype=np.int64)
+        tallies = np.bincount(codes[codes >= 0], minlength=len(labels))
+        label_counts = {
+            labels[i]: int(tally) for i, tally in enumerate(tallies) if tally > 0
+        }
 
     return OHLCBucket(
-        open=sorted_scores[0].value,
-        high=max(values),
-        low=min(values),
-        close=sorted_scores[-1].value,
+        open=float(vals[open_idx]),
+        high=float(vals.max()),
+        low=float(vals.min()),
+        close=float(vals[close_idx]),
         count=count,
         sum=total_sum,
         avg=total_sum / count,
@@ -9,10 +9,18 @@ Canonical References:
 
 This module fans out a single sentiment score into 6 resolution buckets (1m/5m/15m/30m/1h/24h)
 using BatchWriteItem for efficiency.
+
+write_fanout_atomic folds the full OHLC/label/source merge for all 6 buckets into one
+BatchGetItem plus one TransactWriteItems, instead of the 4-5 UpdateItems per resolution
+issued by write_fanout_with_update.
+
+write_tag_fanout maintains TAG#{tag}#{resolution} buckets holding only label counts, so
+tag-level trends read one row per bucket instead of every article.
 """
 
 import logging
 from datetime import datetime
+from decimal import Context, Decimal
 from typing import Any
 
 from aws_lambda_powertools import Tracer
@@ -449,3 +457,342 @@ def write_fanout_with_update(
                 except Exception:
                     logger.debug("Metric emission failed", exc_info=True)
                 raise
+
+
+# Optimistic-concurrency retries when another writer touches a bucket between
+# our read and our conditional write
+ATOMIC_FANOUT_MAX_RETRIES = 5
+
+# DynamoDB numbers carry up to 38 significant digits; match that when summing
+_DYNAMODB_DECIMAL = Context(prec=38)
+
+
+def _bucket_key(
+    ticker: str, resolution: Resolution, bucket_timestamp: datetime
+) -> dict:
+    return {
+        "PK": {"S": f"{ticker}#{resolution.value}"},
+        "SK": {"S": bucket_timestamp.isoformat()},
+    }
+
+
+def _merge_bucket_item(
+    existing: dict[str, Any] | None,
+    key: dict[str, Any],
+    score: SentimentScore,
+    ttl: int,
+) -> dict[str, Any]:
+    """
+    Fold a score into a bucket item, reproducing write_fanout_with_update semantics.
+
+    open is kept from the first write, close is the latest write, high/low are
+    max/min, count/sum are incremented, sources are appended (duplicates kept,
+    matching list_append) and label_counts is incremented for the score's label.
+    """
+    value = Decimal(str(score.value))
+    item: dict[str, Any] = dict(existing) if existing else dict(key)
+
+    if existing is None:
+        item["open"] = {"N": str(score.value)}
+        item["high"] = {"N": str(score.value)}
+        item["low"] = {"N": str(score.value)}
+        item["count"] = {"N": "1"}
+        item["sum"] = {"N": str(score.value)}
+    else:
+        if "open" not in item:
+            item["open"] = {"N": str(score.value)}
+        if "high" not in item or Decimal(item["high"]["N"]) < value:
+            item["high"] = {"N": str(score.value)}
+        if "low" not in item or Decimal(item["low"]["N"]) > value:
+            item["low"] = {"N": str(score.value)}
+        count = int(item.get("count", {}).get("N", "0"))
+        item["count"] = {"N": str(count + 1)}
+        current_sum = Decimal(item.get("sum", {}).get("N", "0"))
+        item["sum"] = {"N": str(_DYNAMODB_DECIMAL.add(current_sum, value))}
+
+    item["close"] = {"N": str(score.value)}
+    item["is_partial"] = {"BOOL": True}
+    item["ttl"] = {"N": str(ttl)}
+
+    sources = list(item.get("sources", {}).get("L", []))
+    if score.source:
+        sources.append({"S": score.source})
+    item["sources"] = {"L": sources}
+
+    label_counts = dict(item.get("label_counts", {}).get("M", {}))
+    if score.label:
+        current = int(label_counts.get(score.label, {}).get("N", "0"))
+        label_counts[score.label] = {"N": str(current + 1)}
+    item["label_counts"] = {"M": label_counts}
+
+    return item
+
+
+def _read_buckets(
+    dynamodb: Any, table_name: str, keys: list[dict[str, Any]]
+) -> dict[tuple[str, str], dict[str, Any]]:
+    """Read all bucket items for one score with a single (strongly consistent) BatchGetItem."""
+    found: dict[tuple[str, str], dict[str, Any]] = {}
+    request: dict[str, Any] = {table_name: {"Keys": keys, "ConsistentRead": True}}
+    retry_count = 0
+
+    while request:
+        response = dynamodb.batch_get_item(RequestItems=request)
+        for item in response.get("Responses", {}).get(table_name, []):
+            found[(item["PK"]["S"], item["SK"]["S"])] = item
+        request = response.get("UnprocessedKeys") or {}
+        retry_count += 1
+        if request and retry_count > 3:
+            raise RuntimeError(
+                f"BatchGetItem left unprocessed fanout keys for {table_name}"
+            )
+
+    return found
+
+
+def _is_write_conflict(error: ClientError) -> bool:
+    """True when a transaction was cancelled because a bucket changed underneath us."""
+    if error.response.get("Error", {}).get("Code") != "TransactionCanceledException":
+        return False
+    reasons = error.response.get("CancellationReasons") or []
+    return not reasons or any(
+        reason.get("Code") in ("ConditionalCheckFailed", "TransactionConflict")
+        for reason in reasons
+    )
+
+
+def write_fanout_atomic(
+    dynamodb: Any,
+    table_name: str,
+    score: SentimentScore,
+) -> None:
+    """
+    Write a sentiment score to all 6 resolution buckets in a single conditional write.
+
+    Reads the 6 current bucket items with one BatchGetItem, merges the score
+    in memory, and writes all buckets back with one TransactWriteItems. Each
+    Put is guarded by the bucket's ``count`` (which every write increments),
+    so ``count`` doubles as an optimistic version and no extra attribute is
+    stored. On conflict the read-merge-write loop is retried.
+
+    Produces the same final bucket state as write_fanout_with_update in
+    2 round trips instead of up to 30.
+
+    Canonical: [CS-001] "Pre-aggregate at write time for known query patterns"
+
+    Args:
+        dynamodb: boto3 DynamoDB client
+        table_name: Target table name
+        score: Sentiment score to write
+
+    Raises:
+        ValueError: If score.ticker is None
+        ClientError: On DynamoDB errors, or when retries are exhausted
+        RuntimeError: If BatchGetItem keeps returning UnprocessedKeys
+    """
+    if not score.ticker:
+        raise ValueError("Sentiment score must have a ticker for fanout")
+
+    buckets = []
+    for resolution in Resolution:
+        bucket_timestamp = floor_to_bucket(score.timestamp, resolution)
+        ttl = int(bucket_timestamp.timestamp()) + resolution.ttl_seconds
+        buckets.append((_bucket_key(score.ticker, resolution, bucket_timestamp), ttl))
+
+    attempt = 0
+    while True:
+        attempt += 1
+        try:
+            existing = _read_buckets(dynamodb, table_name, [key for key, _ in buckets])
+
+            transact_items = []
+            for key, ttl in buckets:
+                current = existing.get((key["PK"]["S"], key["SK"]["S"]))
+                put: dict[str, Any] = {
+                    "TableName": table_name,
+                    "Item": _merge_bucket_item(current, key, score, ttl),
+                }
+                if current is None:
+                    put["ConditionExpression"] = "attribute_not_exists(PK)"
+                else:
+                    put["ConditionExpression"] = "#count = :expected_count"
+                    put["ExpressionAttributeNames"] = {"#count": "count"}
+                    put["ExpressionAttributeValues"] = {
+                        ":expected_count": current.get("count", {"N": "0"})
+                    }
+                transact_items.append({"Put": put})
+
+            dynamodb.transact_write_items(TransactItems=transact_items)
+            return
+
+        except ClientError as e:
+            if _is_write_conflict(e):
+                try:
+                    emit_metric(
+                        name="ConditionalCheck/Count",
+                        value=1,
+                        unit="Count",
+                        dimensions={"FailurePath": "fanout_atomic_conflict"},
+                        namespace="SentimentAnalyzer/Reliability",
+                    )
+                except Exception:
+                    logger.debug("Metric emission failed", exc_info=True)
+                if attempt <= ATOMIC_FANOUT_MAX_RETRIES:
+                    logger.debug(
+                        "Fanout bucket changed during write, retrying",
+                        extra={"ticker": score.ticker, "attempt": attempt},
+                    )
+                    continue
+
+            logger.error(
+                "Atomic fanout write failed",
+                extra={
+                    "error_code": e.response.get("Error", {}).get("Code"),
+                    "ticker": score.ticker,
+                    "attempts": attempt,
+                },
+            )
+            try:
+                with tracer.provider.in_subsegment("fanout_atomic_write") as subseg:
+                    subseg.put_annotation("error", True)
+                    subseg.add_exception(e)
+            except Exception:
+                logger.debug("X-Ray subsegment failed", exc_info=True)
+            try:
+                emit_metric(
+                    name="SilentFailure/Count",
+                    value=1,
+                    unit="Count",
+                    dimensions={"FailurePath": "fanout_atomic_write"},
+                    namespace="SentimentAnalyzer/Reliability",
+                )
+            except Exception:
+                logger.debug("Metric emission failed", exc_info=True)
+            raise
+
+
+# Tag buckets back label histograms (trends, mood ring), read hourly up to the
+# 7-day 1h retention and daily beyond it
+TAG_RESOLUTIONS = (Resolution.ONE_HOUR, Resolution.TWENTY_FOUR_HOURS)
+
+
+def tag_bucket_pk(tag: str, resolution: Resolution) -> str:
+    """
+    Partition key of a tag bucket: TAG#{tag}#{resolution}.
+
+    The TAG# prefix keeps tags apart from {ticker}#{resolution} buckets in the
+    same table.
+    """
+    return f"TAG#{tag}#{resolution.value}"
+
+
+def _is_conditional_failure(error: ClientError) -> bool:
+    return (
+        error.response.get("Error", {}).get("Code") == "ConditionalCheckFailedException"
+    )
+
+
+def _add_tag_label(
+    dynamodb: Any, table_name: str, key: dict[str, Any], label: str, ttl: int
+) -> None:
+    """Count one label into a tag bucket, creating the bucket on first write."""
+    increment: dict[str, Any] = {
+        "TableName": table_name,
+        "Key": key,
+        "UpdateExpression": "ADD #count :one, label_counts.#label :one",
+        # A nested ADD needs label_counts to exist already
+        "ConditionExpression": "attribute_exists(label_counts)",
+        "ExpressionAttributeNames": {"#count": "count", "#label": label},
+        "ExpressionAttributeValues": {":one": {"N": "1"}},
+    }
+    try:
+        dynamodb.update_item(**increment)
+        return
+    except ClientError as e:
+        if not _is_conditional_failure(e):
+            raise
+
+    try:
+        dynamodb.update_item(
+            TableName=table_name,
+            Key=key,
+            UpdateExpression="SET label_counts = :labels, #ttl = :ttl ADD #count :one",
+            ConditionExpression="attribute_not_exists(label_counts)",
+            ExpressionAttributeNames={"#count": "count", "#ttl": "ttl"},
+            ExpressionAttributeValues={
+                ":labels": {"M": {label: {"N": "1"}}},
+                ":one": {"N": "1"},
+                ":ttl": {"N": str(ttl)},
+            },
+        )
+    except ClientError as e:
+        if not _is_conditional_failure(e):
+            raise
+        # Another writer created the bucket between our two calls
+        dynamodb.update_item(**increment)
+
+
+def write_tag_fanout(
+    dynamodb: Any,
+    table_name: str,
+    tags: list[str],
+    timestamp: datetime,
+    label: str,
+) -> int:
+    """
+    Count a labelled article into the 1h and 24h buckets of each of its tags.
+
+    Tag buckets hold only ``count`` and ``label_counts``; tag views need the
+    label histogram, not OHLC. Each bucket costs one UpdateItem once it
+    exists, and two for its first article.
+
+    Canonical: [CS-001] "Pre-aggregate at write time for known query patterns"
+
+    Args:
+        dynamodb: boto3 DynamoDB client
+        table_name: Target table name
+        tags: The article's tags (blank and repeated tags are skipped)
+        timestamp: Article timestamp
+        label: Sentiment label (positive/neutral/negative)
+
+    Returns:
+        Number of buckets written
+
+    Raises:
+        ClientError: On DynamoDB errors
+    """
+    written = 0
+    for tag in dict.fromkeys(t.strip() for t in tags):
+        if not tag:
+            continue
+        for resolution in TAG_RESOLUTIONS:
+            bucket_timestamp = floor_to_bucket(timestamp, resolution)
+            ttl = int(bucket_timestamp.timestamp()) + resolution.ttl_seconds
+            key = {
+                "PK": {"S": tag_bucket_pk(tag, resolution)},
+                "SK": {"S": bucket_timestamp.isoformat()},
+            }
+            try:
+                _add_tag_label(dynamodb, table_name, key, label, ttl)
+            except ClientError as e:
+                logger.error(
+                    "Tag fanout write failed",
+                    extra={
+                        "error_code": e.response.get("Error", {}).get("Code"),
+                        "tag": tag,
+                        "resolution": resolution.value,
+                    },
+                )
+                try:
+                    emit_metric(
+                        name="SilentFailure/Count",
+                        value=1,
+                        unit="Count",
+                        dimensions={"FailurePath": "fanout_tag_write"},
+                        namespace="SentimentAnalyzer/Reliability",
+                    )
+                except Exception:
+                    logger.debug("Metric emission failed", exc_info=True)
+                raise
+            written += 1
+    return written
@@ -0,0 +1 @@
+"""Performance benchmarks (marker: benchmark, not blocking)."""
@@ -0,0 +1,74 @@
+"""
+Benchmark: sentiment-price correlation for a year of 5-minute buckets.
+
+Compares correlate_batch on its pure-Python path (one pass per ticker)
+against the NumPy path (all tickers at once on padded matrices), and
+checks both give the same statistics.
+
+Run with: pytest tests/benchmarks/test_correlation_benchmark.py -s
+"""
+
+import random
+import time
+
+import pytest
+
+from src.lambdas.shared import correlation
+from src.lambdas.shared.correlation import AlignedSeries, correlate_batch
+
+pytestmark = pytest.mark.benchmark
+
+# 252 trading days x 78 five-minute bars per session
+POINTS_PER_YEAR = 252 * 78
+TICKER_COUNTS = [1, 10]
+
+
+def _batch(tickers: int) -> dict[str, AlignedSeries]:
+    rng = random.Random(tickers)
+    batch = {}
+    for t in range(tickers):
+        # Tickers with gaps have fewer aligned buckets
+        n = POINTS_PER_YEAR - rng.randrange(0, 500)
+        sentiment = [rng.uniform(-1, 1) for _ in range(n)]
+        batch[f"T{t}"] = AlignedSeries(
+            timestamps=[float(i * 300) for i in range(n)],
+            sentiment=sentiment,
+            returns=[s * 0.001 + rng.gauss(0, 0.002) for s in sentiment],
+        )
+    return batch
+
+
+def _best_of(fn, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+@pytest.mark.parametrize("tickers", TICKER_COUNTS)
+def test_correlation_throughput(tickers: int, monkeypatch) -> None:
+    if correlation.np is None:
+        pytest.skip("numpy not installed")
+    batch = _batch(tickers)
+
+    vectorized = correlate_batch(batch)
+    numpy_seconds = _best_of(lambda: correlate_batch(batch))
+
+    monkeypatch.setattr(correlation, "np", None)
+    reference = correlate_batch(batch)
+    python_seconds = _best_of(lambda: correlate_batch(batch), repeat=1)
+
+    for ticker, expected in reference.items():
+        assert vectorized[ticker].pearson == pytest.approx(expected.pearson)
+        assert vectorized[ticker].spearman == pytest.approx(expected.spearman)
+        assert vectorized[ticker].best_lag == expected.best_lag
+
+    points = sum(len(s) for s in batch.values())
+    print(
+        f"\n{tickers:>3} tickers, {points:,} buckets: "
+        f"pure python {python_seconds * 1000:9.1f} ms, "
+        f"numpy batch {numpy_seconds * 1000:8.1f} ms "
+        f"({python_seconds / numpy_seconds:.0f}x)"
+    )
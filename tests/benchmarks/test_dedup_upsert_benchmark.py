@@ -0,0 +1,109 @@
+"""
+Benchmark: ingestion dedup upserts, per article vs bulk.
+
+Replays a re-poll (most articles already stored) through
+upsert_article_with_source one article at a time and through
+upsert_articles_bulk against moto, reporting articles/s and DynamoDB
+round trips per article, and checking both give the same outcomes.
+
+moto runs in-process, so absolute rates understate the gap against real
+DynamoDB where every round trip costs network latency.
+
+Run with: pytest tests/benchmarks/test_dedup_upsert_benchmark.py -s
+"""
+
+import time
+from datetime import UTC, datetime
+
+import boto3
+import pytest
+from moto import mock_aws
+
+from src.lambdas.ingestion.dedup import (
+    ArticleUpsert,
+    build_source_attribution,
+    clear_seen_cache,
+    generate_dedup_key,
+    upsert_article_with_source,
+    upsert_articles_bulk,
+)
+
+pytestmark = pytest.mark.benchmark
+
+
+def _articles(n: int, offset: int = 0) -> list[ArticleUpsert]:
+    articles = []
+    for i in range(offset, offset + n):
+        headline = f"Company {i} reports quarterly results"
+        articles.append(
+            ArticleUpsert(
+                dedup_key=generate_dedup_key(headline, "2025-12-21"),
+                timestamp="2025-12-21T10:30:00Z",
+                source="tiingo",
+                attribution=build_source_attribution(
+                    source="tiingo",
+                    article_id=str(i),
+                    url=f"https://tiingo.com/{i}",
+                    crawl_timestamp=datetime.now(UTC),
+                    original_headline=headline,
+                ),
+                item_data={"headline": headline, "status": "pending"},
+            )
+        )
+    return articles
+
+
+def _create_table(dynamodb, name: str):
+    return dynamodb.create_table(
+        TableName=name,
+        KeySchema=[
+            {"AttributeName": "source_id", "KeyType": "HASH"},
+            {"AttributeName": "timestamp", "KeyType": "RANGE"},
+        ],
+        AttributeDefinitions=[
+            {"AttributeName": "source_id", "AttributeType": "S"},
+            {"AttributeName": "timestamp", "AttributeType": "S"},
+        ],
+        BillingMode="PAY_PER_REQUEST",
+    )
+
+
+def _upsert_each(table, articles: list[ArticleUpsert]) -> list[str]:
+    return [upsert_article_with_source(table, *article) for article in articles]
+
+
+@pytest.mark.parametrize("duplicate_rate", [0.5, 0.9])
+@mock_aws
+def test_repoll_upserts_per_second(duplicate_rate: float) -> None:
+    n = 200
+    dynamodb = boto3.resource("dynamodb", region_name="us-east-1")
+    calls = {"count": 0}
+    dynamodb.meta.client.meta.events.register(
+        "before-call.dynamodb.*",
+        lambda **kwargs: calls.__setitem__("count", calls["count"] + 1),
+    )
+    stored = int(n * duplicate_rate)
+    # A re-poll: the first `stored` articles were ingested on the last poll
+    repoll = _articles(n)
+    results = {}
+
+    for name, upsert in (("each", _upsert_each), ("bulk", upsert_articles_bulk)):
+        table = _create_table(dynamodb, name)
+        upsert(table, repoll[:stored])
+        if name == "bulk":
+            clear_seen_cache()  # a cold container: existence comes from DynamoDB
+        calls["count"] = 0
+        start = time.perf_counter()
+        outcomes = upsert(table, repoll)
+        elapsed = time.perf_counter() - start
+        results[name] = (outcomes, calls["count"] / n)
+        print(
+            f"{name:<5} dup={duplicate_rate:.0%}  {n / elapsed:8.1f} articles/s  "
+            f"{calls['count'] / n:5.2f} round trips/article"
+        )
+
+    assert results["bulk"][0] == results["each"][0]
+    # Every per-article upsert costs at least one round trip, duplicates more
+    assert results["each"][1] >= 1.0
+    # Duplicates cost a share of a BatchGetItem; only new articles are written
+    assert results["bulk"][1] < 1 - duplicate_rate + 0.05
@@ -0,0 +1,112 @@
+"""
+Benchmark: time-series fanout writes per second, before and after.
+
+Writes the same stream of scores through write_fanout_with_update (up to
+5 UpdateItems per resolution) and write_fanout_atomic (one BatchGetItem +
+one TransactWriteItems) against moto, reporting scores/s and DynamoDB
+round trips per score, and checking both leave identical buckets.
+
+moto runs in-process, so absolute rates understate the gap against real
+DynamoDB where every round trip costs network latency.
+
+Run with: pytest tests/benchmarks/test_fanout_benchmark.py -s
+"""
+
+import random
+import time
+from datetime import UTC, datetime, timedelta
+
+import boto3
+import pytest
+from moto import mock_aws
+
+from src.lib.timeseries import (
+    SentimentScore,
+    write_fanout_atomic,
+    write_fanout_with_update,
+)
+
+pytestmark = pytest.mark.benchmark
+
+LABELS = ["positive", "neutral", "negative"]
+SOURCES = ["tiingo", "finnhub"]
+
+
+def _scores(n: int) -> list[SentimentScore]:
+    rng = random.Random(n)
+    start = datetime(2025, 12, 21, 14, 30, tzinfo=UTC)
+    return [
+        SentimentScore(
+            ticker=rng.choice(["TSLA", "AAPL"]),
+            value=round(rng.uniform(-1.0, 1.0), 4),
+            label=rng.choice(LABELS),
+            source=rng.choice(SOURCES),
+            timestamp=start + timedelta(seconds=rng.randrange(0, 1800)),
+        )
+        for _ in range(n)
+    ]
+
+
+def _create_table(client, name: str) -> None:
+    client.create_table(
+        TableName=name,
+        KeySchema=[
+            {"AttributeName": "PK", "KeyType": "HASH"},
+            {"AttributeName": "SK", "KeyType": "RANGE"},
+        ],
+        AttributeDefinitions=[
+            {"AttributeName": "PK", "AttributeType": "S"},
+            {"AttributeName": "SK", "AttributeType": "S"},
+        ],
+        BillingMode="PAY_PER_REQUEST",
+    )
+
+
+def _snapshot(client, table: str) -> dict:
+    items = client.scan(TableName=table)["Items"]
+    return {
+        (i["PK"]["S"], i["SK"]["S"]): (
+            float(i["open"]["N"]),
+            float(i["high"]["N"]),
+            float(i["low"]["N"]),
+            float(i["close"]["N"]),
+            int(i["count"]["N"]),
+            round(float(i["sum"]["N"]), 6),
+            {k: int(v["N"]) for k, v in i["label_counts"]["M"].items()},
+            [s["S"] for s in i["sources"]["L"]],
+        )
+        for i in items
+    }
+
+
+@pytest.mark.parametrize("n", [20, 100])
+@mock_aws
+def test_fanout_writes_per_second(n: int) -> None:
+    client = boto3.client("dynamodb", region_name="us-east-1")
+    calls = {"count": 0}
+    client.meta.events.register(
+        "before-call.dynamodb.*",
+        lambda **kwargs: calls.__setitem__("count", calls["count"] + 1),
+    )
+    scores = _scores(n)
+    results = {}
+
+    for name, writer in (
+        ("update", write_fanout_with_update),
+        ("atomic", write_fanout_atomic),
+    ):
+        _create_table(client, name)
+        calls["count"] = 0
+        start = time.perf_counter()
+        for score in scores:
+            writer(client, name, score)
+        elapsed = time.perf_counter() - start
+        results[name] = (n / elapsed, calls["count"] / n)
+        print(
+            f"{name:<7} n={n:>4}  {n / elapsed:8.1f} scores/s  "
+            f"{calls['count'] / n:5.1f} round trips/score"
+        )
+
+    assert _snapshot(client, "atomic") == _snapshot(client, "update")
+    assert results["atomic"][1] == 2.0
+    assert results["atomic"][1] < results["update"][1]
@@ -0,0 +1,97 @@
+"""
+Benchmark: OHLC aggregation throughput from 10 to 1,000,000 scores.
+
+Compares the row-oriented aggregate_ohlc (one SentimentScore per point)
+against aggregate_ohlc_columnar on both its pure-Python and NumPy paths.
+
+Run with: pytest tests/benchmarks/test_ohlc_aggregation_benchmark.py -s
+"""
+
+import random
+import time
+from datetime import UTC, datetime
+
+import pytest
+
+from src.lib.timeseries import aggregation
+from src.lib.timeseries.aggregation import aggregate_ohlc, aggregate_ohlc_columnar
+from src.lib.timeseries.models import SentimentScore
+
+pytestmark = pytest.mark.benchmark
+
+SIZES = [10, 1_000, 100_000, 1_000_000]
+# Building a pydantic model per point dominates the row path; cap it so the
+# benchmark stays runnable while still showing the trend.
+ROW_PATH_MAX = 100_000
+BASE_EPOCH = datetime(2025, 12, 21, tzinfo=UTC).timestamp()
+
+
+def _columns(n: int) -> tuple[list[float], list[float], list[int]]:
+    rng = random.Random(n)
+    timestamps = [BASE_EPOCH + rng.uniform(0, 86400) for _ in range(n)]
+    values = [rng.uniform(-1.0, 1.0) for _ in range(n)]
+    codes = [rng.randrange(-1, 3) for _ in range(n)]
+    return timestamps, values, codes
+
+
+def _best_of(fn, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _report(label: str, n: int, seconds: float) -> None:
+    rate = n / seconds if seconds > 0 else float("inf")
+    print(f"{label:<22} n={n:>9,}  {seconds * 1000:10.2f} ms  {rate:14,.0f} pts/s")
+
+
+@pytest.mark.parametrize("n", SIZES)
+def test_columnar_aggregation_throughput(n: int, monkeypatch) -> None:
+    timestamps, values, codes = _columns(n)
+
+    result = aggregate_ohlc_columnar(timestamps, values, codes)
+    assert result.count == n
+    _report(
+        "columnar",
+        n,
+        _best_of(lambda: aggregate_ohlc_columnar(timestamps, values, codes)),
+    )
+
+    if aggregation.np is not None:
+        ts_arr = aggregation.np.asarray(timestamps)
+        val_arr = aggregation.np.asarray(values)
+        code_arr = aggregation.np.asarray(codes)
+        _report(
+            "columnar (ndarray in)",
+            n,
+            _best_of(lambda: aggregate_ohlc_columnar(ts_arr, val_arr, code_arr)),
+        )
+
+    monkeypatch.setattr(aggregation, "np", None)
+    _report(
+        "columnar (pure python)",
+        n,
+        _best_of(lambda: aggregate_ohlc_columnar(timestamps, values, codes)),
+    )
+
+
+@pytest.mark.parametrize("n", [s for s in SIZES if s <= ROW_PATH_MAX])
+def test_row_aggregation_throughput(n: int) -> None:
+    timestamps, values, codes = _columns(n)
+    scores = [
+        SentimentScore(
+            value=v,
+            timestamp=datetime.fromtimestamp(ts, tz=UTC),
+            label=aggregation.SENTIMENT_LABELS[c] if c >= 0 else None,
+        )
+        for ts, v, c in zip(timestamps, values, codes, strict=True)
+    ]
+
+    result = aggregate_ohlc(scores)
+    assert result.count == n
+    _report(
+        "row (SentimentScore)", n, _best_of(lambda: aggregate_ohlc(scores), repeat=1)
+    )
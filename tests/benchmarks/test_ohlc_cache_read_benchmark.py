@@ -0,0 +1,92 @@
+"""
+Benchmark: OHLC cache read-path parsing for a 1Y 5-minute range.
+
+Compares the previous per-row path (one CachedCandle model per DynamoDB
+item, then sort) against parsing straight into CandleColumns, and the
+cost of building the dashboard's PriceCandle list from each.
+
+Network time is excluded; against real DynamoDB the segmented reads also
+overlap ~20 sequential 1 MB pages across MAX_QUERY_SEGMENTS connections.
+
+Run with: pytest tests/benchmarks/test_ohlc_cache_read_benchmark.py -s
+"""
+
+import time
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from src.lambdas.shared.cache.ohlc_cache import (
+    CachedCandle,
+    CandleColumns,
+    _append_items,
+    _build_sk,
+    _parse_sk,
+)
+from src.lambdas.shared.models import OHLCResolution, PriceCandle
+
+pytestmark = pytest.mark.benchmark
+
+# 252 trading days x 78 five-minute candles
+ONE_YEAR_5M = 252 * 78
+
+
+def _items(n: int) -> list[dict]:
+    start = datetime(2025, 1, 2, 14, 30, tzinfo=UTC)
+    return [
+        {
+            "SK": {"S": _build_sk("5", start + timedelta(minutes=5 * i))},
+            "open": {"N": "195.5000"},
+            "high": {"N": "196.0000"},
+            "low": {"N": "195.2500"},
+            "close": {"N": "195.7500"},
+            "volume": {"N": "1234567"},
+        }
+        for i in range(n)
+    ]
+
+
+def _per_row(items: list[dict]) -> list[PriceCandle]:
+    candles = []
+    for item in items:
+        res, ts = _parse_sk(item["SK"]["S"])
+        candles.append(
+            CachedCandle(
+                timestamp=ts,
+                open=float(item["open"]["N"]),
+                high=float(item["high"]["N"]),
+                low=float(item["low"]["N"]),
+                close=float(item["close"]["N"]),
+                volume=int(item.get("volume", {}).get("N", 0)),
+                source="tiingo",
+                resolution=res,
+            )
+        )
+    candles.sort(key=lambda c: c.timestamp)
+    return [
+        PriceCandle.from_cached_candle(c, OHLCResolution.FIVE_MINUTES) for c in candles
+    ]
+
+
+def _columnar(items: list[dict]) -> list[PriceCandle]:
+    columns = CandleColumns(source="tiingo", resolution="5")
+    _append_items(columns, items)
+    return PriceCandle.from_cached_columns(columns, OHLCResolution.FIVE_MINUTES)
+
+
+def test_one_year_intraday_parse():
+    items = _items(ONE_YEAR_5M)
+
+    start = time.perf_counter()
+    before = _per_row(items)
+    before_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    after = _columnar(items)
+    after_ms = (time.perf_counter() - start) * 1000
+
+    print(
+        f"\n{ONE_YEAR_5M} candles: per-row {before_ms:.0f} ms, "
+        f"columnar {after_ms:.0f} ms ({before_ms / after_ms:.1f}x)"
+    )
+    assert after == before
@@ -0,0 +1,104 @@
+"""
+Benchmark: SSE poll cycles vs concurrent connections, before and after.
+
+Simulates N concurrent SSE connections, each on its own thread and event
+loop as in the Lambda handler, for a fixed number of poll intervals.
+Before: every connection runs its own PollingService.poll_loop(), so
+DynamoDB polls grow linearly with connections. After: connections
+subscribe to one PollHub, so polls stay at one per interval.
+
+Run with: pytest tests/benchmarks/test_sse_poll_hub_benchmark.py -s
+"""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+sys.path.insert(
+    0,
+    os.path.join(
+        os.path.dirname(__file__), "..", "..", "src", "lambdas", "sse_streaming"
+    ),
+)
+
+from models import MetricsEventData
+from poll_hub import PollHub
+from polling import PollResult
+
+pytestmark = pytest.mark.benchmark
+
+POLL_INTERVAL = 0.05
+CYCLES = 5
+
+
+class CountingPollingService:
+    """Stands in for PollingService, counting DynamoDB poll cycles."""
+
+    poll_interval = POLL_INTERVAL
+
+    def __init__(self):
+        self.polls = 0
+        self._lock = threading.Lock()
+
+    async def poll(self) -> PollResult:
+        with self._lock:
+            self.polls += 1
+        return PollResult(
+            metrics=MetricsEventData(total=0, positive=0, neutral=0, negative=0),
+            metrics_changed=True,
+            per_ticker={},
+            timeseries_buckets={},
+        )
+
+    async def poll_loop(self):
+        while True:
+            yield await self.poll()
+            await asyncio.sleep(self.poll_interval)
+
+
+def _run_connections(connections: int, make_stream) -> float:
+    async def consume():
+        received = 0
+        async for _ in make_stream():
+            received += 1
+            if received == CYCLES:
+                break
+
+    threads = [
+        threading.Thread(target=asyncio.run, args=(consume(),))
+        for _ in range(connections)
+    ]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return time.perf_counter() - start
+
+
+@pytest.mark.parametrize("connections", [1, 10, 100, 500])
+def test_poll_count_vs_connections(connections):
+    per_connection = CountingPollingService()
+    before_s = _run_connections(connections, per_connection.poll_loop)
+
+    shared = CountingPollingService()
+    hub = PollHub(shared)
+    try:
+        after_s = _run_connections(connections, hub.subscribe)
+    finally:
+        hub.close(timeout=1)
+
+    print(
+        f"\n{connections:>4} connections: "
+        f"per-connection polls={per_connection.polls:>5} ({before_s:.2f}s)  "
+        f"shared hub polls={shared.polls:>3} ({after_s:.2f}s)"
+    )
+
+    assert per_connection.polls == connections * CYCLES
+    # Late subscribers may need a couple of extra intervals, but the hub's
+    # poll count must not scale with the number of connections.
+    assert shared.polls <= CYCLES * 3
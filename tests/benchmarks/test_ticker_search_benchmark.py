@@ -0,0 +1,121 @@
+"""
+Benchmark: ticker autocomplete search, linear scan vs index.
+
+Replays keystroke-by-keystroke autocomplete queries through the previous
+three-pass linear search and the index built by TickerCache, reporting
+queries/s and checking both return the same ranked results.
+
+The bundled ticker file (infrastructure/data/us-symbols.json) is padded
+with generated symbols to the ~8K the production list holds, so the
+linear scan pays its real cost.
+
+Run with: pytest tests/benchmarks/test_ticker_search_benchmark.py -s
+"""
+
+import itertools
+import json
+import random
+import string
+import time
+from pathlib import Path
+
+import pytest
+
+from src.lambdas.shared.cache.ticker_cache import TickerCache, TickerInfo
+
+pytestmark = pytest.mark.benchmark
+
+TICKER_FILE = Path("infrastructure/data/us-symbols.json")
+UNIVERSE_SIZE = 8000
+
+# What users type, one keystroke at a time
+TYPED = ["AAPL", "tesla", "micro", "NVDA", "bank of", "JPM", "goog", "energy", "qz"]
+
+WORDS = [
+    "Global",
+    "American",
+    "Capital",
+    "Energy",
+    "Holdings",
+    "Bancorp",
+    "Therapeutics",
+    "Systems",
+    "Pharmaceuticals",
+    "Industries",
+    "Financial",
+    "Technologies",
+    "Resources",
+    "Realty",
+    "Partners",
+]
+
+
+def _ticker_data() -> dict:
+    data = json.loads(TICKER_FILE.read_text())
+    rng = random.Random(UNIVERSE_SIZE)
+    symbols = data["symbols"]
+    for length in itertools.cycle(range(1, 6)):
+        if len(symbols) >= UNIVERSE_SIZE:
+            break
+        symbol = "".join(rng.choices(string.ascii_uppercase, k=length))
+        if symbol in symbols:
+            continue
+        name = " ".join(rng.sample(WORDS, 2)) + rng.choice([" Inc.", " Corp", ""])
+        symbols[symbol] = {
+            "name": name,
+            "exchange": rng.choice(["NYSE", "NASDAQ", "AMEX"]),
+            "is_active": rng.random() > 0.05,
+        }
+    return data
+
+
+def _linear_search(cache: TickerCache, query: str, limit: int) -> list[TickerInfo]:
+    """The three-pass search TickerCache used before the index."""
+    query_upper = query.upper()
+    query_lower = query.lower()
+    results = []
+    if query_upper in cache.symbols:
+        ticker = cache.symbols[query_upper]
+        if ticker.is_active:
+            results.append(ticker)
+    for symbol, ticker in cache.symbols.items():
+        if ticker.is_active and symbol.startswith(query_upper):
+            if ticker not in results:
+                results.append(ticker)
+                if len(results) >= limit:
+                    return results
+    for ticker in cache.symbols.values():
+        if ticker.is_active and query_lower in ticker.name.lower():
+            if ticker not in results:
+                results.append(ticker)
+                if len(results) >= limit:
+                    return results
+    return results[:limit]
+
+
+def test_autocomplete_queries_per_second() -> None:
+    start = time.perf_counter()
+    cache = TickerCache._from_json(_ticker_data())
+    build_ms = (time.perf_counter() - start) * 1000
+    queries = [word[:i] for word in TYPED for i in range(1, len(word) + 1)]
+    rounds = 20
+    rates = {}
+
+    for name, search in (
+        ("linear", lambda q: _linear_search(cache, q, 10)),
+        ("index", lambda q: cache.search(q, 10)),
+    ):
+        start = time.perf_counter()
+        for _ in range(rounds):
+            for query in queries:
+                search(query)
+        elapsed = time.perf_counter() - start
+        rates[name] = rounds * len(queries) / elapsed
+        print(f"{name:<6} {len(cache.symbols)} symbols  {rates[name]:10.0f} queries/s")
+    print(f"load + index build {build_ms:.1f} ms")
+
+    for query in queries:
+        assert [t.symbol for t in cache.search(query, 10)] == [
+            t.symbol for t in _linear_search(cache, query, 10)
+        ], query
+    assert rates["index"] > rates["linear"] * 5
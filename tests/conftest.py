@@ -365,12 +365,20 @@ def clear_all_caches():
     _safe_clear("src.lambdas.shared.quota_tracker", "clear_quota_cache")
     _safe_clear("src.lambdas.shared.circuit_breaker", "clear_cache")
     _safe_clear("src.lambdas.shared.cache.ticker_cache", "clear_ticker_cache")
+    _safe_clear("src.lambdas.shared.cache.ohlc_cache", "clear_client_cache")
     _safe_clear("src.lambdas.shared.secrets", "clear_cache")
     _safe_clear("src.lambdas.shared.adapters.tiingo", "clear_cache")
     _safe_clear("src.lambdas.shared.adapters.finnhub", "clear_cache")
+    _safe_clear("src.lambdas.shared.adapters.finnhub", "reset_rate_limiter")
     _safe_clear("src.lambdas.dashboard.metrics", "clear_metrics_cache")
     _safe_clear("src.lambdas.dashboard.sentiment", "clear_sentiment_cache")
+    _safe_clear("src.lambdas.dashboard.timeseries", "reset_global_service")
     _safe_clear("src.lambdas.dashboard.configurations", "clear_config_cache")
+    _safe_clear("src.lambdas.shared.alert_index", "invalidate_alert_index")
+    _safe_clear("src.lambdas.dashboard.volatility", "clear_correlation_cache")
+    _safe_clear("src.lambdas.dashboard.tag_windows", "clear_tag_window_cache")
+    _safe_clear("src.lambdas.ingestion.dedup", "clear_seen_cache")
+    _safe_clear("src.lambdas.shared.auth.session_activity", "clear_session_activity")
     _safe_clear("src.lib.cache_utils", "reset_global_emitter")
 
 
@@ -1,7 +1,8 @@
 """Sentiment Endpoints Integration Tests.
 
 Integration-lite tests for the sentiment overview and history endpoints.
-These tests mock the timeseries query layer (query_timeseries) to validate
+These tests mock the timeseries query layer (query_timeseries and
+query_latest_timeseries) to validate
 the full aggregation and response-building logic in isolation from DynamoDB.
 
 Test cases:
@@ -13,7 +14,7 @@ Test cases:
 For On-Call Engineers:
     If tests fail, check:
     1. SentimentResponse model field changes (config_id, tickers, cache_status)
-    2. query_timeseries return type (TimeseriesResponse dataclass)
+    2. query_timeseries / query_latest_timeseries return types (TimeseriesResponse)
     3. Source filtering logic in get_ticker_sentiment_history
 """
 
@@ -105,24 +106,20 @@ def _make_dynamo_table_mock(
 class TestOverviewReturnsRealData:
     """Verify get_sentiment_by_configuration aggregates data from timeseries buckets."""
 
-    @patch("src.lambdas.dashboard.timeseries.query_timeseries")
+    @patch("src.lambdas.dashboard.timeseries.query_latest_timeseries")
     def test_overview_returns_real_data_integration(self, mock_query):
         """Create config with tickers AAPL/GOOGL, populate buckets, verify non-empty sentiment."""
         clear_sentiment_cache()
 
-        # Arrange: mock query_timeseries to return buckets for each ticker
-        def query_side_effect(ticker, resolution, **kwargs):
-            if ticker == "AAPL":
-                bucket = _make_bucket(
-                    "AAPL", avg=0.72, count=10, sources=["tiingo", "finnhub"]
-                )
-                return _make_timeseries_response("AAPL", buckets=[bucket])
-            elif ticker == "GOOGL":
-                bucket = _make_bucket("GOOGL", avg=-0.15, count=8, sources=["tiingo"])
-                return _make_timeseries_response("GOOGL", buckets=[bucket])
-            return _make_timeseries_response(ticker)
-
-        mock_query.side_effect = query_side_effect
+        # Arrange: mock query_latest_timeseries to return buckets for each ticker
+        aapl_bucket = _make_bucket(
+            "AAPL", avg=0.72, count=10, sources=["tiingo", "finnhub"]
+        )
+        googl_bucket = _make_bucket("GOOGL", avg=-0.15, count=8, sources=["tiingo"])
+        mock_query.return_value = {
+            "AAPL": _make_timeseries_response("AAPL", buckets=[aapl_bucket]),
+            "GOOGL": _make_timeseries_response("GOOGL", buckets=[googl_bucket]),
+        }
 
         # Act
         response = get_sentiment_by_configuration(
@@ -149,8 +146,10 @@ class TestOverviewReturnsRealData:
         assert googl_data.sentiment["aggregated"].score == -0.15
         assert googl_data.sentiment["aggregated"].label == "neutral"
 
-        # Verify query was called for each ticker
-        assert mock_query.call_count == 2
+        # Verify all tickers were read with one batched call
+        mock_query.assert_called_once_with(
+            ["AAPL", "GOOGL"], Resolution.TWENTY_FOUR_HOURS
+        )
 
 
 # =============================================================================
@@ -245,20 +244,19 @@ class TestHistoryWithSourceFilter:
 class TestGracefulDegradationMissingTicker:
     """Verify overview gracefully handles tickers with no data."""
 
-    @patch("src.lambdas.dashboard.timeseries.query_timeseries")
+    @patch("src.lambdas.dashboard.timeseries.query_latest_timeseries")
     def test_graceful_degradation_missing_ticker(self, mock_query):
         """Config has AAPL and UNKNOWN. Only AAPL has data. Verify UNKNOWN returns empty."""
         clear_sentiment_cache()
 
         # Arrange: AAPL has data, UNKNOWN returns empty buckets
-        def query_side_effect(ticker, resolution, **kwargs):
-            if ticker == "AAPL":
-                bucket = _make_bucket("AAPL", avg=0.65, count=12)
-                return _make_timeseries_response("AAPL", buckets=[bucket])
-            # UNKNOWN and any other ticker: no data
-            return _make_timeseries_response(ticker, buckets=[], partial_bucket=None)
-
-        mock_query.side_effect = query_side_effect
+        bucket = _make_bucket("AAPL", avg=0.65, count=12)
+        mock_query.return_value = {
+            "AAPL": _make_timeseries_response("AAPL", buckets=[bucket]),
+            "UNKNOWN": _make_timeseries_response(
+                "UNKNOWN", buckets=[], partial_bucket=None
+            ),
+        }
 
         # Act
         response = get_sentiment_by_configuration(
@@ -281,11 +279,14 @@ class TestGracefulDegradationMissingTicker:
         unknown = next(t for t in response.tickers if t.symbol == "UNKNOWN")
         assert len(unknown.sentiment) == 0
 
-    @patch("src.lambdas.dashboard.timeseries.query_timeseries")
-    def test_graceful_degradation_query_exception(self, mock_query):
-        """If query_timeseries raises for one ticker, the other still returns data."""
+    @patch("src.lambdas.dashboard.timeseries.TimeseriesQueryService.query")
+    @patch("src.lambdas.dashboard.timeseries.TimeseriesQueryService._batch_get")
+    def test_graceful_degradation_query_exception(self, mock_batch_get, mock_query):
+        """If the fallback query raises for one ticker, the other still returns data."""
         clear_sentiment_cache()
 
+        mock_batch_get.return_value = []
+
         def query_side_effect(ticker, resolution, **kwargs):
             if ticker == "AAPL":
                 bucket = _make_bucket("AAPL", avg=0.50, count=5)
@@ -321,19 +322,19 @@ class TestGracefulDegradationMissingTicker:
 class TestOverviewPerformance:
     """Verify the overview endpoint completes within acceptable time for 20 tickers."""
 
-    @patch("src.lambdas.dashboard.timeseries.query_timeseries")
+    @patch("src.lambdas.dashboard.timeseries.query_latest_timeseries")
     def test_overview_performance_20_tickers(self, mock_query):
         """Create config with 20 tickers, populate minimal data, assert < 2s."""
         clear_sentiment_cache()
 
         # Arrange: 20 tickers, each returning a small response quickly
         tickers = [f"TICK{i:02d}" for i in range(20)]
-
-        def query_side_effect(ticker, resolution, **kwargs):
-            bucket = _make_bucket(ticker, avg=0.10, count=2)
-            return _make_timeseries_response(ticker, buckets=[bucket])
-
-        mock_query.side_effect = query_side_effect
+        mock_query.return_value = {
+            ticker: _make_timeseries_response(
+                ticker, buckets=[_make_bucket(ticker, avg=0.10, count=2)]
+            )
+            for ticker in tickers
+        }
 
         # Act: time the call
         start = time.monotonic()
@@ -4,7 +4,6 @@ Tests the module-level caching infrastructure that prevents 429 rate limit
 errors when users rapidly switch resolution buckets.
 """
 
-import time
 from datetime import date
 from unittest.mock import patch
 
@@ -163,13 +162,12 @@ class TestOHLCCacheGetSet:
         test_data = {"ticker": "AAPL", "candles": []}
         cache_key = "ohlc:AAPL:1:2024-01-01:2024-01-31"
 
-        _set_cached_ohlc(cache_key, test_data)
-
-        # Mock time to simulate expiry (1-minute TTL is 300s)
-        with patch("src.lambdas.dashboard.ohlc.time.time") as mock_time:
-            # First call at T=0, second call at T=301 (past 5 min TTL)
-            ohlc_module._ohlc_cache[cache_key] = (1000.0, test_data)
-            mock_time.return_value = 1000.0 + 301  # Past 1-minute TTL (300s)
+        # Mock time to simulate expiry (1-minute TTL is 300s, +/-10% jitter)
+        with patch("src.lib.cache_utils.time.time") as mock_time:
+            # Stored at T=1000, read at T=1331 (past jittered 5 min TTL)
+            mock_time.return_value = 1000.0
+            _set_cached_ohlc(cache_key, test_data, "1")
+            mock_time.return_value = 1000.0 + 331  # Past 1-minute TTL (300s)
 
             result = _get_cached_ohlc(cache_key, "1")
             assert result is None
@@ -216,11 +214,11 @@ class TestOHLCCacheEviction:
         import src.lambdas.dashboard.ohlc as ohlc_module
 
         # Fill cache with MAX_ENTRIES items
-        with patch.object(ohlc_module, "OHLC_CACHE_MAX_ENTRIES", 3):
+        with patch.object(ohlc_module._ohlc_cache, "max_entries", 3):
             # Add 3 entries
             for i in range(3):
                 key = f"ohlc:AAPL:{i}:2024-01-01:2024-01-31"
-                ohlc_module._ohlc_cache[key] = (1000.0 + i, {"index": i})
+                ohlc_module._set_cached_ohlc(key, {"index": i})
 
             # Add 4th entry - should evict oldest (index 0)
             ohlc_module._set_cached_ohlc(
@@ -268,14 +266,8 @@ class TestOHLCCacheInvalidation:
         import src.lambdas.dashboard.ohlc as ohlc_module
 
         # Add some entries
-        ohlc_module._ohlc_cache["ohlc:AAPL:D:2024-01-01:2024-01-31"] = (
-            time.time(),
-            {"ticker": "AAPL"},
-        )
-        ohlc_module._ohlc_cache["ohlc:MSFT:D:2024-01-01:2024-01-31"] = (
-            time.time(),
-            {"ticker": "MSFT"},
-        )
+        _set_cached_ohlc("ohlc:AAPL:D:2024-01-01:2024-01-31", {"ticker": "AAPL"})
+        _set_cached_ohlc("ohlc:MSFT:D:2024-01-01:2024-01-31", {"ticker": "MSFT"})
 
         count = invalidate_ohlc_cache()
 
@@ -287,18 +279,9 @@ class TestOHLCCacheInvalidation:
         import src.lambdas.dashboard.ohlc as ohlc_module
 
         # Add entries for different tickers
-        ohlc_module._ohlc_cache["ohlc:AAPL:D:2024-01-01:2024-01-31"] = (
-            time.time(),
-            {"ticker": "AAPL"},
-        )
-        ohlc_module._ohlc_cache["ohlc:AAPL:5:2024-01-01:2024-01-31"] = (
-            time.time(),
-            {"ticker": "AAPL"},
-        )
-        ohlc_module._ohlc_cache["ohlc:MSFT:D:2024-01-01:2024-01-31"] = (
-            time.time(),
-            {"ticker": "MSFT"},
-        )
+        _set_cached_ohlc("ohlc:AAPL:D:2024-01-01:2024-01-31", {"ticker": "AAPL"})
+        _set_cached_ohlc("ohlc:AAPL:5:2024-01-01:2024-01-31", {"ticker": "AAPL"})
+        _set_cached_ohlc("ohlc:MSFT:D:2024-01-01:2024-01-31", {"ticker": "MSFT"})
 
         count = invalidate_ohlc_cache("AAPL")
 
@@ -311,10 +294,7 @@ class TestOHLCCacheInvalidation:
         """Ticker invalidation should be case-insensitive."""
         import src.lambdas.dashboard.ohlc as ohlc_module
 
-        ohlc_module._ohlc_cache["ohlc:AAPL:D:2024-01-01:2024-01-31"] = (
-            time.time(),
-            {"ticker": "AAPL"},
-        )
+        _set_cached_ohlc("ohlc:AAPL:D:2024-01-01:2024-01-31", {"ticker": "AAPL"})
 
         count = invalidate_ohlc_cache("aapl")  # lowercase
 
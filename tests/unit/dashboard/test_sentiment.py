@@ -2,6 +2,7 @@
 
 from unittest.mock import MagicMock, patch
 
+import orjson
 import pytest
 
 from src.lambdas.dashboard.sentiment import (
@@ -13,6 +14,7 @@ from src.lambdas.dashboard.sentiment import (
     clear_sentiment_cache,
     get_heatmap_data,
     get_sentiment_by_configuration,
+    get_sentiment_entry,
 )
 from src.lib.timeseries.models import Resolution
 
@@ -67,14 +69,14 @@ class TestGetSentimentByConfiguration:
         assert response.next_refresh_at is not None
         assert response.next_refresh_at.endswith("Z")
 
-    @patch("src.lambdas.dashboard.timeseries.query_timeseries")
-    def test_queries_timeseries_for_each_ticker(self, mock_query):
-        """Should call query_timeseries once per ticker."""
+    @patch("src.lambdas.dashboard.timeseries.query_latest_timeseries")
+    def test_queries_timeseries_once_for_all_tickers(self, mock_query):
+        """Should read every ticker with one batched timeseries call."""
         mock_bucket = MagicMock(avg=0.5, count=3, timestamp="2025-01-01T00:00:00Z")
         mock_response = MagicMock()
         mock_response.buckets = [mock_bucket]
         mock_response.partial_bucket = None
-        mock_query.return_value = mock_response
+        mock_query.return_value = {"AAPL": mock_response, "MSFT": mock_response}
 
         get_sentiment_by_configuration(
             config_id="test-config",
@@ -82,15 +84,14 @@ class TestGetSentimentByConfiguration:
             skip_cache=True,
         )
 
-        assert mock_query.call_count == 2
+        mock_query.assert_called_once_with(
+            ["AAPL", "MSFT"], Resolution.TWENTY_FOUR_HOURS
+        )
 
-    @patch("src.lambdas.dashboard.timeseries.query_timeseries")
+    @patch("src.lambdas.dashboard.timeseries.query_latest_timeseries")
     def test_passes_resolution_to_timeseries(self, mock_query):
-        """Should pass resolution parameter to query_timeseries."""
-        mock_response = MagicMock()
-        mock_response.buckets = []
-        mock_response.partial_bucket = None
-        mock_query.return_value = mock_response
+        """Should pass resolution parameter to query_latest_timeseries."""
+        mock_query.return_value = {}
 
         get_sentiment_by_configuration(
             config_id="test-config",
@@ -99,18 +100,11 @@ class TestGetSentimentByConfiguration:
             skip_cache=True,
         )
 
-        mock_query.assert_called_once_with(
-            ticker="AAPL",
-            resolution=Resolution.ONE_HOUR,
-            # buckets[-1] is read as the current value, so this must request the
-            # newest buckets rather than the oldest. See
-            # tests/unit/test_timeseries_oldest_first_regression.py
-            latest=True,
-        )
+        mock_query.assert_called_once_with(["AAPL"], Resolution.ONE_HOUR)
 
-    @patch("src.lambdas.dashboard.timeseries.query_timeseries")
+    @patch("src.lambdas.dashboard.timeseries.query_latest_timeseries")
     def test_handles_timeseries_errors_gracefully(self, mock_query):
-        """Should handle query_timeseries errors without crashing."""
+        """Should handle query_latest_timeseries errors without crashing."""
         mock_query.side_effect = Exception("DynamoDB timeout")
 
         # Should not raise
@@ -124,14 +118,14 @@ class TestGetSentimentByConfiguration:
         assert len(response.tickers) == 1
         assert len(response.tickers[0].sentiment) == 0
 
-    @patch("src.lambdas.dashboard.timeseries.query_timeseries")
+    @patch("src.lambdas.dashboard.timeseries.query_latest_timeseries")
     def test_maps_bucket_to_aggregated_sentiment(self, mock_query):
         """Should map timeseries bucket to 'aggregated' SourceSentiment."""
         mock_bucket = MagicMock(avg=0.7, count=10, timestamp="2025-01-01T00:00:00Z")
         mock_response = MagicMock()
         mock_response.buckets = [mock_bucket]
         mock_response.partial_bucket = None
-        mock_query.return_value = mock_response
+        mock_query.return_value = {"AAPL": mock_response}
 
         response = get_sentiment_by_configuration(
             config_id="test-config",
@@ -147,6 +141,19 @@ class TestGetSentimentByConfiguration:
         assert source.confidence == 0.8
         assert source.updated_at == "2025-01-01T00:00:00Z"
 
+    @patch("src.lambdas.dashboard.timeseries.query_latest_timeseries")
+    def test_entry_body_matches_json_response(self, mock_query):
+        """The cached body MUST be what json_response(model_dump()) sends."""
+        mock_bucket = MagicMock(avg=0.7, count=10, timestamp="2025-01-01T00:00:00Z")
+        mock_response = MagicMock()
+        mock_response.buckets = [mock_bucket]
+        mock_response.partial_bucket = None
+        mock_query.return_value = {"AAPL": mock_response}
+
+        entry = get_sentiment_entry(config_id="test-config", tickers=["AAPL"])
+
+        assert entry.body == orjson.dumps(entry.payload.model_dump()).decode()
+
 
 class TestGetHeatmapData:
     """Tests for get_heatmap_data function."""
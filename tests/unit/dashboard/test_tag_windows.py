@@ -0,0 +1,220 @@
+"""Unit tests for the shared tag-window reader."""
+
+import calendar
+import threading
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.lambdas.dashboard.tag_windows import (
+    count_tag_labels,
+    map_tags,
+    read_tag_bins,
+)
+
+HOUR = 3600
+
+
+def _epoch(ts: str) -> int:
+    return calendar.timegm(
+        (int(ts[0:4]), int(ts[5:7]), int(ts[8:10]), int(ts[11:13]), int(ts[14:16]))
+        + (0,)
+    )
+
+
+def _bucket(sk: str, **label_counts: int) -> dict:
+    return {"SK": sk, "label_counts": {k: Decimal(v) for k, v in label_counts.items()}}
+
+
+def _key_values(call) -> tuple[str, list[str]]:
+    """The partition key and sort key bounds of a bucket query."""
+    pk, sk = call.kwargs["KeyConditionExpression"].get_expression()["values"]
+    return pk.get_expression()["values"][1], list(sk.get_expression()["values"][1:])
+
+
+class TestReadTagBins:
+    """Tests for read_tag_bins()."""
+
+    def test_hourly_buckets_sum_into_aligned_bins(self):
+        """6h bins start at 00/06/12/18 UTC and sum their hourly buckets."""
+        table = MagicMock()
+        table.query.return_value = {
+            "Items": [
+                _bucket("2025-11-24T06:00:00+00:00", positive=2),
+                _bucket("2025-11-24T11:00:00+00:00", negative=1, neutral=1),
+                _bucket("2025-11-24T12:00:00+00:00", neutral=1, unknown=4),
+                _bucket("not-a-timestamp", positive=1),
+            ]
+        }
+        now = _epoch("2025-11-24T13:30")
+
+        bins = read_tag_bins(table, "AI", 6 * HOUR, now - 24 * HOUR, now)
+
+        assert bins == {
+            _epoch("2025-11-24T06:00"): (2, 1, 1),
+            _epoch("2025-11-24T12:00"): (0, 1, 0),
+        }
+        pk, _ = _key_values(table.query.call_args)
+        assert pk == "TAG#AI#1h"
+
+    def test_daily_bins_read_daily_buckets(self):
+        """1d bins read the 24h buckets."""
+        table = MagicMock()
+        table.query.return_value = {
+            "Items": [_bucket("2025-11-23T00:00:00+00:00", positive=5)]
+        }
+        now = _epoch("2025-11-24T13:30")
+
+        bins = read_tag_bins(table, "AI", 24 * HOUR, now - 48 * HOUR, now)
+
+        assert bins == {_epoch("2025-11-23T00:00"): (5, 0, 0)}
+        pk, _ = _key_values(table.query.call_args)
+        assert pk == "TAG#AI#24h"
+
+    def test_projects_sort_key_and_label_counts(self):
+        """Only the bucket start and label counts are read."""
+        table = MagicMock()
+        table.query.return_value = {"Items": []}
+        now = _epoch("2025-11-24T13:30")
+
+        read_tag_bins(table, "AI", HOUR, now - 2 * HOUR, now)
+
+        kwargs = table.query.call_args.kwargs
+        assert "IndexName" not in kwargs
+        assert kwargs["ProjectionExpression"] == "SK, label_counts"
+
+    def test_finished_bins_are_cached(self):
+        """A repeat read only queries from the still-open bin."""
+        table = MagicMock()
+        table.query.return_value = {
+            "Items": [
+                _bucket("2025-11-24T11:00:00+00:00", positive=1),
+                _bucket("2025-11-24T13:00:00+00:00", negative=1),
+            ]
+        }
+        now = _epoch("2025-11-24T13:30")
+        read_tag_bins(table, "AI", HOUR, now - 3 * HOUR, now)
+
+        table.query.return_value = {
+            "Items": [_bucket("2025-11-24T13:00:00+00:00", negative=2)]
+        }
+        bins = read_tag_bins(table, "AI", HOUR, now - 3 * HOUR, now + 15 * 60)
+
+        _, bounds = _key_values(table.query.call_args_list[1])
+        assert bounds == ["2025-11-24T13:00:00+00:00"]
+        assert bins == {
+            _epoch("2025-11-24T11:00"): (1, 0, 0),
+            _epoch("2025-11-24T13:00"): (0, 0, 2),
+        }
+
+    def test_cache_not_used_for_earlier_start(self):
+        """A range starting before the cached bins queries from its start."""
+        table = MagicMock()
+        table.query.return_value = {"Items": []}
+        now = _epoch("2025-11-24T13:30")
+        read_tag_bins(table, "AI", HOUR, now - 2 * HOUR, now)
+
+        read_tag_bins(table, "AI", HOUR, now - 5 * HOUR, now)
+
+        _, bounds = _key_values(table.query.call_args_list[1])
+        assert bounds == ["2025-11-24T08:00:00+00:00"]
+
+
+class TestCountTagLabels:
+    """Tests for count_tag_labels()."""
+
+    def test_recent_window_reads_hours_it_touches(self):
+        """A window within the hourly retention reads whole hourly buckets."""
+        table = MagicMock()
+        table.query.return_value = {
+            "Items": [
+                _bucket("2026-01-01T09:00:00+00:00", positive=2, neutral=1),
+                _bucket("2026-01-01T10:00:00+00:00", negative=Decimal(3)),
+            ]
+        }
+        start = datetime.now(UTC) - timedelta(hours=5)
+        end = start + timedelta(hours=4)
+
+        counts = count_tag_labels(
+            table, "AI", start.isoformat(), end.isoformat().replace("+00:00", "Z")
+        )
+
+        assert counts == (2, 1, 3)
+        pk, bounds = _key_values(table.query.call_args)
+        assert pk == "TAG#AI#1h"
+        assert bounds == [
+            start.replace(minute=0, second=0, microsecond=0).isoformat(),
+            end.replace(minute=0, second=0, microsecond=0).isoformat(),
+        ]
+
+    def test_old_window_reads_daily_buckets(self):
+        """A window starting before the hourly retention reads days."""
+        table = MagicMock()
+        table.query.return_value = {"Items": []}
+
+        count_tag_labels(table, "AI", "2025-11-24T06:30:00Z", "2025-11-25T18:00:00Z")
+
+        pk, bounds = _key_values(table.query.call_args)
+        assert pk == "TAG#AI#24h"
+        assert bounds == ["2025-11-24T00:00:00+00:00", "2025-11-25T00:00:00+00:00"]
+
+    def test_invalid_timestamp_raises(self):
+        """Timestamps must be ISO8601."""
+        with pytest.raises(ValueError):
+            count_tag_labels(MagicMock(), "AI", "yesterday", "2025-11-25T00:00:00Z")
+
+    def test_past_window_is_cached(self):
+        """A window that has ended is read once."""
+        table = MagicMock()
+        table.query.return_value = {
+            "Items": [_bucket("2025-11-24T00:00:00+00:00", positive=1)],
+        }
+
+        first = count_tag_labels(
+            table, "AI", "2025-11-24T00:00:00Z", "2025-11-24T23:59:59Z"
+        )
+        second = count_tag_labels(
+            table, "AI", "2025-11-24T00:00:00Z", "2025-11-24T23:59:59Z"
+        )
+
+        assert first == second == (1, 0, 0)
+        table.query.assert_called_once()
+
+    def test_open_window_is_not_cached(self):
+        """A window ending in the future is read every time."""
+        table = MagicMock()
+        table.query.return_value = {"Items": []}
+
+        for _ in range(2):
+            count_tag_labels(
+                table, "AI", "2025-11-24T00:00:00Z", "2999-01-01T00:00:00Z"
+            )
+
+        assert table.query.call_count == 2
+
+
+class TestMapTags:
+    """Tests for map_tags()."""
+
+    def test_reads_tags_concurrently_in_order(self):
+        """Every tag is read at once; results keep tag order."""
+        barrier = threading.Barrier(3, timeout=5)
+
+        def read(tag):
+            barrier.wait()
+            return tag.lower()
+
+        assert map_tags(["C", "A", "B"], read) == {"C": "c", "A": "a", "B": "b"}
+
+    def test_error_is_raised(self):
+        """A failing tag's exception propagates."""
+
+        def read(tag):
+            if tag == "bad":
+                raise RuntimeError("query failed")
+            return tag
+
+        with pytest.raises(RuntimeError, match="query failed"):
+            map_tags(["ok", "bad"], read)
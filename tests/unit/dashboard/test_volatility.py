@@ -1,8 +1,11 @@
 """Unit tests for volatility endpoints (T058-T059)."""
 
 from datetime import UTC, datetime
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
+import pytest
+
+from src.lambdas.dashboard.timeseries import SentimentBucketResponse, TimeseriesResponse
 from src.lambdas.dashboard.volatility import (
     CorrelationResponse,
     VolatilityResponse,
@@ -10,11 +13,25 @@ from src.lambdas.dashboard.volatility import (
     get_volatility_by_configuration,
 )
 from src.lambdas.shared.adapters.base import OHLCCandle
+from src.lambdas.shared.cache.ohlc_cache import CandleColumns
+from src.lib.timeseries import Resolution
 
 
 class TestGetVolatilityByConfiguration:
     """Tests for get_volatility_by_configuration function."""
 
+    @pytest.fixture(autouse=True)
+    def ohlc_cache(self):
+        """Stub the persistent OHLC cache (empty unless a test fills it)."""
+        with (
+            patch(
+                "src.lambdas.shared.ohlc_fetcher.get_cached_candle_columns",
+                return_value=CandleColumns(source="tiingo", resolution="D"),
+            ) as mock_read,
+            patch("src.lambdas.shared.ohlc_fetcher.put_cached_candles") as mock_write,
+        ):
+            yield mock_read, mock_write
+
     def test_returns_volatility_response(self):
         """Should return VolatilityResponse."""
         response = get_volatility_by_configuration(
@@ -132,6 +149,36 @@ class TestGetVolatilityByConfiguration:
         atr = response.tickers[0].atr
         assert atr.value == 0.0  # Placeholder
 
+    def test_serves_from_persistent_cache(self, ohlc_cache):
+        """Should use cached candles without calling the adapters."""
+        mock_read, _ = ohlc_cache
+        mock_read.return_value = _candle_columns(_create_ohlc_data(20))
+        mock_tiingo = MagicMock()
+
+        response = get_volatility_by_configuration(
+            config_id="test-config",
+            tickers=["AAPL"],
+            tiingo_adapter=mock_tiingo,
+        )
+
+        mock_tiingo.get_ohlc.assert_not_called()
+        assert response.tickers[0].atr.value > 0.0
+
+    def test_writes_tiingo_candles_through(self, ohlc_cache):
+        """Should persist live Tiingo candles for the next request."""
+        _, mock_write = ohlc_cache
+        mock_tiingo = MagicMock()
+        mock_tiingo.get_ohlc.return_value = _create_ohlc_data(20)
+
+        get_volatility_by_configuration(
+            config_id="test-config",
+            tickers=["AAPL", "MSFT"],
+            tiingo_adapter=mock_tiingo,
+        )
+
+        assert mock_write.call_count == 2
+        assert mock_tiingo.get_ohlc.call_count == 2
+
     def test_sets_updated_at_timestamp(self):
         """Should set updated_at timestamp."""
         response = get_volatility_by_configuration(
@@ -242,6 +289,159 @@ class TestGetCorrelationData:
         assert correlation.volatility_trend == "↓"
 
 
+class TestGetCorrelationDataWithResolution:
+    """Tests for data-driven correlation statistics."""
+
+    @pytest.fixture
+    def loaders(self):
+        """Patch the sentiment and candle loaders with 40 hourly buckets.
+
+        Each bucket's sentiment is proportional to its price return, and
+        sentiment rises over the period.
+        """
+        start = 1_700_000_000 - 1_700_000_000 % 3600
+        returns = [((i * 7) % 11 - 5) / 1000 + i / 10000 for i in range(40)]
+        closes = [100.0]
+        for r in returns:
+            closes.append(closes[-1] * (1 + r))
+        timestamps = [start + i * 3600 for i in range(41)]
+
+        def sentiment(tickers, resolution, start_time, end_time):
+            return {
+                t: TimeseriesResponse(
+                    ticker=t,
+                    resolution=resolution.value,
+                    buckets=[
+                        _sentiment_bucket(t, ts, r * 50)
+                        for ts, r in zip(timestamps[1:], returns, strict=True)
+                    ],
+                    partial_bucket=None,
+                    cache_hit=False,
+                    query_time_ms=0.0,
+                )
+                for t in tickers
+            }
+
+        def candles(ticker, source, resolution, start_time, end_time):
+            columns = CandleColumns(source=source, resolution=resolution)
+            columns.timestamps.extend(timestamps)
+            columns.close.extend(closes)
+            return columns
+
+        with (
+            patch(
+                "src.lambdas.dashboard.volatility.query_timeseries_batch",
+                side_effect=sentiment,
+            ) as mock_sentiment,
+            patch(
+                "src.lambdas.dashboard.volatility.get_cached_candle_columns",
+                side_effect=candles,
+            ) as mock_candles,
+        ):
+            yield mock_sentiment, mock_candles
+
+    def test_computes_statistics(self, loaders):
+        """Should report correlation of sentiment with price returns."""
+        response = get_correlation_data(
+            config_id="test-config",
+            tickers=["AAPL"],
+            resolution=Resolution.ONE_HOUR,
+        )
+
+        correlation = response.tickers[0].correlation
+        assert correlation.resolution == "1h"
+        assert correlation.sample_size == 40
+        assert correlation.pearson == 1.0
+        assert correlation.spearman == 1.0
+        assert correlation.rolling_pearson == 1.0
+        assert correlation.best_lag == 0
+        assert correlation.sentiment_trend == "↑"
+
+    def test_reads_candles_at_matching_resolution(self, loaders):
+        """Should read cached candles at the sentiment resolution."""
+        _, mock_candles = loaders
+
+        get_correlation_data(
+            config_id="test-config",
+            tickers=["AAPL", "MSFT"],
+            resolution=Resolution.ONE_HOUR,
+        )
+
+        assert mock_candles.call_count == 2
+        assert {c.kwargs["resolution"] for c in mock_candles.call_args_list} == {"60"}
+
+    def test_caches_per_ticker_and_resolution(self, loaders):
+        """Should reuse cached statistics and load only new tickers."""
+        mock_sentiment, _ = loaders
+        get_correlation_data(
+            config_id="test-config", tickers=["AAPL"], resolution=Resolution.ONE_HOUR
+        )
+
+        get_correlation_data(
+            config_id="test-config",
+            tickers=["AAPL", "MSFT"],
+            resolution=Resolution.ONE_HOUR,
+        )
+
+        assert mock_sentiment.call_count == 2
+        assert mock_sentiment.call_args.args[0] == ["MSFT"]
+
+    def test_explicit_trends_override_computed(self, loaders):
+        """Should prefer trend arrows given by the caller."""
+        response = get_correlation_data(
+            config_id="test-config",
+            tickers=["AAPL"],
+            sentiment_trends={"AAPL": "↓"},
+            volatility_trends={"AAPL": "↓"},
+            resolution=Resolution.ONE_HOUR,
+        )
+
+        correlation = response.tickers[0].correlation
+        assert correlation.interpretation == "negative_convergence"
+        assert correlation.pearson == 1.0
+
+    def test_candle_failure_leaves_ticker_without_statistics(self, loaders):
+        """Should fall back to stable trends when candles cannot be read."""
+        _, mock_candles = loaders
+        mock_candles.side_effect = Exception("throttled")
+
+        response = get_correlation_data(
+            config_id="test-config", tickers=["AAPL"], resolution=Resolution.ONE_HOUR
+        )
+
+        correlation = response.tickers[0].correlation
+        assert correlation.sample_size == 0
+        assert correlation.pearson is None
+        assert correlation.interpretation == "stable"
+
+    def test_empty_load_is_not_cached(self, loaders):
+        """Should retry a ticker whose sentiment came back empty."""
+        mock_sentiment, _ = loaders
+        loaded = mock_sentiment.side_effect
+        mock_sentiment.side_effect = lambda tickers, *args: {
+            t: TimeseriesResponse(
+                ticker=t,
+                resolution="1h",
+                buckets=[],
+                partial_bucket=None,
+                cache_hit=False,
+                query_time_ms=0.0,
+            )
+            for t in tickers
+        }
+        get_correlation_data(
+            config_id="test-config", tickers=["AAPL"], resolution=Resolution.ONE_HOUR
+        )
+
+        mock_sentiment.side_effect = loaded
+        response = get_correlation_data(
+            config_id="test-config", tickers=["AAPL"], resolution=Resolution.ONE_HOUR
+        )
+
+        assert mock_sentiment.call_count == 2
+        assert response.tickers[0].correlation.sample_size == 40
+
+
 # Helper functions
 
 
@@ -269,3 +469,34 @@ def _create_ohlc_data(days: int) -> list[OHLCCandle]:
         )
 
     return candles
+
+
+def _sentiment_bucket(ticker: str, ts: int, avg: float) -> SentimentBucketResponse:
+    """Create a complete hourly sentiment bucket."""
+    return SentimentBucketResponse(
+        ticker=ticker,
+        resolution="1h",
+        timestamp=datetime.fromtimestamp(ts, UTC).isoformat(),
+        open=avg,
+        high=avg,
+        low=avg,
+        close=avg,
+        count=1,
+        avg=avg,
+        label_counts={},
+        is_partial=False,
+    )
+
+
+def _candle_columns(candles: list[OHLCCandle]) -> CandleColumns:
+    """Build cached daily columns ending at the last completed session."""
+    columns = CandleColumns(source="tiingo", resolution="D")
+    last = datetime.now(UTC).timestamp()
+    for i, candle in enumerate(candles):
+        columns.timestamps.append(last - (len(candles) - 1 - i) * 86400)
+        columns.open.append(candle.open)
+        columns.high.append(candle.high)
+        columns.low.append(candle.low)
+        columns.close.append(candle.close)
+        columns.volume.append(candle.volume or 0)
+    return columns
@@ -0,0 +1,137 @@
+"""Unit tests for the streaming ingestion pipeline.
+
+Tests IngestionPipeline stages (normalize → store → publish) with injected
+stage functions.
+"""
+
+import threading
+
+import pytest
+
+from src.lambdas.ingestion.pipeline import IngestionPipeline
+
+
+def _message(article: str) -> dict:
+    return {"source_type": "tiingo", "body": {"source_id": article}}
+
+
+def _store_all_new(upserts: list[str]) -> list[dict]:
+    return [_message(upsert) for upsert in upserts]
+
+
+class TestIngestionPipeline:
+    """Tests for IngestionPipeline.run()."""
+
+    def test_publishes_in_batches_of_ten(self):
+        """New articles are published in SNS batches of at most 10."""
+        batches: list[list[dict]] = []
+        lock = threading.Lock()
+
+        def publish(messages):
+            with lock:
+                batches.append(messages)
+            return len(messages)
+
+        pipeline = IngestionPipeline(
+            normalize=lambda articles, source: list(articles),
+            store=_store_all_new,
+            publish=publish,
+            chunk_size=7,
+        )
+        articles = [f"a{i}" for i in range(25)]
+
+        result = pipeline.run([("tiingo", articles)])
+
+        assert result.new_items == 25
+        assert result.published == 25
+        assert sorted(len(batch) for batch in batches) == [5, 10, 10]
+        assert sorted(m["body"]["source_id"] for b in batches for m in b) == sorted(
+            articles
+        )
+        assert result.first_publish_ms is not None
+        assert set(result.stage_ms) == {"fetch", "normalize", "store", "publish"}
+
+    def test_publishes_before_later_sources_are_fetched(self):
+        """The first batch goes out while the next source is still fetching."""
+        first_published = threading.Event()
+
+        def publish(messages):
+            first_published.set()
+            return len(messages)
+
+        def sources():
+            yield "tiingo", [f"t{i}" for i in range(10)]
+            # Fetch of the second source waits on the first publish
+            assert first_published.wait(timeout=5)
+            yield "finnhub", [f"f{i}" for i in range(3)]
+
+        pipeline = IngestionPipeline(
+            normalize=lambda articles, source: list(articles),
+            store=_store_all_new,
+            publish=publish,
+        )
+
+        result = pipeline.run(sources())
+
+        assert result.published == 13
+
+    def test_counts_duplicates_and_calls_on_stored(self):
+        """Duplicates are counted and not published; on_stored sees every outcome."""
+        outcomes: list = []
+
+        pipeline = IngestionPipeline(
+            normalize=lambda articles, source: list(articles),
+            store=lambda upserts: [
+                _message(u) if u.startswith("new") else None for u in upserts
+            ],
+            publish=len,
+            on_stored=outcomes.append,
+            store_workers=1,
+        )
+
+        result = pipeline.run([("finnhub", ["new1", "dup1", "new2", "dup2"])])
+
+        assert result.new_items == 2
+        assert result.duplicates_skipped == 2
+        assert result.published == 2
+        assert outcomes.count(None) == 2
+
+    def test_store_error_is_raised_after_draining(self):
+        """A failing chunk does not stop the others; the error is re-raised."""
+        published: list[dict] = []
+
+        def store(upserts):
+            if "bad" in upserts:
+                raise RuntimeError("dynamodb down")
+            return _store_all_new(upserts)
+
+        def publish(messages):
+            published.extend(messages)
+            return len(messages)
+
+        pipeline = IngestionPipeline(
+            normalize=lambda articles, source: list(articles),
+            store=store,
+            publish=publish,
+            chunk_size=1,
+            queue_maxsize=1,
+        )
+
+        with pytest.raises(RuntimeError, match="dynamodb down"):
+            pipeline.run([("tiingo", ["a", "bad", "b", "c"])])
+
+        assert sorted(m["body"]["source_id"] for m in published) == ["a", "b", "c"]
+
+    def test_empty_sources(self):
+        """No sources means nothing stored or published."""
+        pipeline = IngestionPipeline(
+            normalize=lambda articles, source: list(articles),
+            store=_store_all_new,
+            publish=len,
+        )
+
+        result = pipeline.run([])
+
+        assert result.new_items == 0
+        assert result.published == 0
+        assert result.first_publish_ms is None
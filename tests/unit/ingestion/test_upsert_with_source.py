@@ -6,15 +6,18 @@ Feature 1010: Parallel Ingestion with Cross-Source Deduplication
 """
 
 from datetime import UTC, datetime
+from unittest.mock import patch
 
 import boto3
 import pytest
 from moto import mock_aws
 
 from src.lambdas.ingestion.dedup import (
+    ArticleUpsert,
     build_source_attribution,
     generate_dedup_key,
     upsert_article_with_source,
+    upsert_articles_bulk,
 )
 
 
@@ -335,3 +338,88 @@ class TestDedupKeyIntegration:
         # Both records exist
         scan = dynamodb_table.scan()
         assert scan["Count"] == 2
+
+
+def _upsert(headline: str, source: str, article_id: str = "1") -> ArticleUpsert:
+    return ArticleUpsert(
+        dedup_key=generate_dedup_key(headline, "2025-12-21"),
+        timestamp="2025-12-21T10:30:00Z",
+        source=source,
+        attribution=build_source_attribution(
+            source=source,
+            article_id=article_id,
+            url=f"https://{source}.com/{article_id}",
+            crawl_timestamp=datetime.now(UTC),
+            original_headline=headline,
+        ),
+        item_data={"headline": headline, "status": "pending"},
+    )
+
+
+class TestUpsertArticlesBulk:
+    """Tests for the bulk dedup upsert path."""
+
+    def test_outcomes_match_sequential_upserts(self, dynamodb_table):
+        """Produces the same outcome per article as upsert_article_with_source."""
+        upsert_articles_bulk(dynamodb_table, [_upsert("Old Story", "tiingo")])
+
+        results = upsert_articles_bulk(
+            dynamodb_table,
+            [
+                _upsert("Old Story", "tiingo"),  # already stored
+                _upsert("Old Story", "finnhub"),  # new source on stored item
+                _upsert("New Story", "tiingo"),
+                _upsert("New Story", "tiingo", article_id="2"),  # same source again
+                _upsert("New Story", "finnhub"),  # second source, same batch
+            ],
+        )
+
+        assert results == ["duplicate", "updated", "created", "duplicate", "updated"]
+        new_item = dynamodb_table.get_item(
+            Key={
+                "source_id": f"dedup:{generate_dedup_key('New Story', '2025-12-21')}",
+                "timestamp": "2025-12-21T10:30:00Z",
+            }
+        )["Item"]
+        assert new_item["sources"] == ["tiingo", "finnhub"]
+        assert set(new_item["source_attribution"]) == {"tiingo", "finnhub"}
+        assert new_item["headline"] == "New Story"
+
+    def test_repoll_of_duplicates_writes_nothing(self, dynamodb_table):
+        """A batch of already stored articles issues no writes."""
+        batch = [_upsert(f"Story {i}", "tiingo") for i in range(5)]
+        upsert_articles_bulk(dynamodb_table, batch)
+
+        with (
+            patch.object(dynamodb_table, "put_item") as mock_put,
+            patch.object(dynamodb_table, "update_item") as mock_update,
+        ):
+            results = upsert_articles_bulk(dynamodb_table, batch)
+
+        assert results == ["duplicate"] * 5
+        mock_put.assert_not_called()
+        mock_update.assert_not_called()
+
+    def test_stale_seen_cache_falls_back_per_article(self, dynamodb_table):
+        """A source added by another writer is detected by the write condition."""
+        upsert_articles_bulk(dynamodb_table, [_upsert("Story", "tiingo")])
+        # Another invocation adds finnhub; this container's cache misses it
+        upsert_article_with_source(dynamodb_table, *_upsert("Story", "finnhub"))
+
+        results = upsert_articles_bulk(dynamodb_table, [_upsert("Story", "finnhub")])
+
+        assert results == ["duplicate"]
+
+    def test_unresolved_keys_use_per_article_path(self, dynamodb_table):
+        """Keys BatchGetItem cannot resolve still get correct outcomes."""
+        with patch.object(
+            dynamodb_table.meta.client,
+            "batch_get_item",
+            side_effect=Exception("throttled"),
+        ):
+            results = upsert_articles_bulk(
+                dynamodb_table,
+                [_upsert("Story", "tiingo"), _upsert("Story", "finnhub")],
+            )
+
+        assert results == ["created", "updated"]
@@ -722,10 +722,10 @@ class TestLambdaHandler:
                 "src.lambdas.ingestion.handler.FinnhubAdapter",
                 return_value=mock_finnhub,
             ),
-            # Feature 1010: Mock upsert_article_with_source instead of put_item_if_not_exists
+            # Mock the bulk dedup upsert (one call per source batch)
             patch(
-                "src.lambdas.ingestion.handler.upsert_article_with_source",
-                return_value="created",
+                "src.lambdas.ingestion.handler.upsert_articles_bulk",
+                side_effect=lambda table, upserts: ["created"] * len(upserts),
             ),
             patch(
                 "src.lambdas.ingestion.handler._get_sns_client",
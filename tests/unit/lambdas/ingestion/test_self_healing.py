@@ -12,6 +12,7 @@ Test organization:
 - TestRunSelfHealingCheck: Tests for the main orchestration function
 """
 
+import functools
 from datetime import UTC, datetime, timedelta
 from unittest.mock import MagicMock, patch
 
@@ -22,9 +23,26 @@ import pytest
 def mock_table():
     """Create a mock DynamoDB table resource."""
     table = MagicMock()
+    table.name = "test-sentiment-items"
     return table
 
 
+def _batch_get_returns(table, *items):
+    """Make BatchGetItem on the mock table return the given items."""
+    table.meta.client.batch_get_item.return_value = {
+        "Responses": {table.name: [item for item in items if item]}
+    }
+
+
+def _requested_keys(table):
+    """Keys sent in every BatchGetItem call on the mock table."""
+    return [
+        key
+        for call in table.meta.client.batch_get_item.call_args_list
+        for key in call.kwargs["RequestItems"][table.name]["Keys"]
+    ]
+
+
 @pytest.fixture
 def mock_sns_client():
     """Create a mock SNS client."""
@@ -159,34 +177,38 @@ class TestGetFullItems:
         """T010: Excludes items that already have sentiment attribute."""
         from src.lambdas.ingestion.self_healing import get_full_items
 
-        mock_table.get_item.return_value = {"Item": sample_analyzed_item}
+        _batch_get_returns(mock_table, sample_analyzed_item)
 
         item_keys = [{"source_id": "finnhub:99999", "timestamp": "2025-12-13T09:00:00"}]
         result = get_full_items(mock_table, item_keys)
 
         # Should be empty because item has sentiment
         assert result == []
-        # Verify GetItem called with composite key
-        mock_table.get_item.assert_called_once()
-        call_args = mock_table.get_item.call_args
-        assert call_args.kwargs["Key"]["source_id"] == "finnhub:99999"
-        assert call_args.kwargs["Key"]["timestamp"] == "2025-12-13T09:00:00"
+        # Verify BatchGetItem called with composite key
+        mock_table.meta.client.batch_get_item.assert_called_once()
+        assert _requested_keys(mock_table) == [
+            {"source_id": "finnhub:99999", "timestamp": "2025-12-13T09:00:00"}
+        ]
 
     def test_includes_items_without_sentiment(self, mock_table, sample_full_item):
         """Returns items that don't have sentiment attribute."""
         from src.lambdas.ingestion.self_healing import get_full_items
 
-        mock_table.get_item.return_value = {"Item": sample_full_item}
+        _batch_get_returns(mock_table, sample_full_item)
 
         item_keys = [{"source_id": "finnhub:12345", "timestamp": "2025-12-13T09:00:00"}]
         result = get_full_items(mock_table, item_keys)
 
         assert len(result) == 1
         assert result[0]["source_id"] == "finnhub:12345"
-        # Verify GetItem called with composite key
-        call_args = mock_table.get_item.call_args
-        assert call_args.kwargs["Key"]["source_id"] == "finnhub:12345"
-        assert call_args.kwargs["Key"]["timestamp"] == "2025-12-13T09:00:00"
+        # Verify BatchGetItem called with composite key and projection
+        assert _requested_keys(mock_table) == [
+            {"source_id": "finnhub:12345", "timestamp": "2025-12-13T09:00:00"}
+        ]
+        request = mock_table.meta.client.batch_get_item.call_args.kwargs[
+            "RequestItems"
+        ][mock_table.name]
+        assert "text_for_analysis" in request["ProjectionExpression"]
 
     def test_returns_empty_for_empty_input(self, mock_table):
         """Returns empty list for empty input."""
@@ -195,13 +217,13 @@ class TestGetFullItems:
         result = get_full_items(mock_table, [])
 
         assert result == []
-        mock_table.get_item.assert_not_called()
+        mock_table.meta.client.batch_get_item.assert_not_called()
 
     def test_handles_missing_items_gracefully(self, mock_table):
         """Continues processing when some items are not found."""
         from src.lambdas.ingestion.self_healing import get_full_items
 
-        mock_table.get_item.return_value = {"Item": None}
+        _batch_get_returns(mock_table)
 
         item_keys = [{"source_id": "missing:123", "timestamp": "2025-12-13T09:00:00"}]
         result = get_full_items(mock_table, item_keys)
@@ -217,7 +239,7 @@ class TestGetFullItems:
         result = get_full_items(mock_table, item_keys)
 
         assert result == []
-        mock_table.get_item.assert_not_called()
+        mock_table.meta.client.batch_get_item.assert_not_called()
 
     def test_skips_items_missing_source_id(self, mock_table):
         """Skips items that are missing the source_id key."""
@@ -228,7 +250,63 @@ class TestGetFullItems:
         result = get_full_items(mock_table, item_keys)
 
         assert result == []
-        mock_table.get_item.assert_not_called()
+        mock_table.meta.client.batch_get_item.assert_not_called()
+
+    def test_fetches_keys_in_chunks(self, mock_table):
+        """Splits keys into BatchGetItem chunks, dropping duplicate keys."""
+        from src.lambdas.ingestion.self_healing import iter_full_item_batches
+
+        _batch_get_returns(mock_table)
+        item_keys = [
+            {"source_id": f"finnhub:{i}", "timestamp": "2025-12-13T09:00:00"}
+            for i in range(5)
+        ]
+
+        batches = list(
+            iter_full_item_batches(mock_table, item_keys + item_keys[:1], chunk_size=2)
+        )
+
+        assert len(batches) == 3
+        assert mock_table.meta.client.batch_get_item.call_count == 3
+        assert _requested_keys(mock_table) == item_keys
+
+    def test_retries_unprocessed_keys(self, mock_table, sample_full_item):
+        """Retries UnprocessedKeys until the chunk is complete."""
+        from src.lambdas.ingestion.self_healing import get_full_items
+
+        key = {"source_id": "finnhub:12345", "timestamp": "2025-12-13T09:00:00"}
+        mock_table.meta.client.batch_get_item.side_effect = [
+            {
+                "Responses": {mock_table.name: []},
+                "UnprocessedKeys": {mock_table.name: {"Keys": [key]}},
+            },
+            {"Responses": {mock_table.name: [sample_full_item]}},
+        ]
+
+        with patch("src.lambdas.ingestion.self_healing.time.sleep") as mock_sleep:
+            result = get_full_items(mock_table, [key])
+
+        assert result == [sample_full_item]
+        mock_sleep.assert_called_once()
+
+    def test_failed_chunk_is_skipped(self, mock_table, sample_full_item):
+        """A failing chunk is logged; other chunks are still returned."""
+        from src.lambdas.ingestion.self_healing import iter_full_item_batches
+
+        mock_table.meta.client.batch_get_item.side_effect = [
+            Exception("throttled"),
+            {"Responses": {mock_table.name: [sample_full_item]}},
+        ]
+        item_keys = [
+            {"source_id": "finnhub:1", "timestamp": "2025-12-13T09:00:00"},
+            {"source_id": "finnhub:12345", "timestamp": "2025-12-13T09:00:00"},
+        ]
+
+        batches = list(
+            iter_full_item_batches(mock_table, item_keys, chunk_size=1, max_workers=1)
+        )
+
+        assert [item for batch in batches for item in batch] == [sample_full_item]
 
 
 class TestRepublishItemsToSns:
@@ -363,7 +441,7 @@ class TestRunSelfHealingCheck:
         from src.lambdas.ingestion.self_healing import run_self_healing_check
 
         mock_table.query.return_value = {"Items": [sample_stale_item]}
-        mock_table.get_item.return_value = {"Item": sample_full_item}
+        _batch_get_returns(mock_table, sample_full_item)
         mock_sns_client.publish_batch.return_value = {
             "Successful": [{"Id": "0", "MessageId": "msg-123"}],
             "Failed": [],
@@ -388,7 +466,7 @@ class TestRunSelfHealingCheck:
         from src.lambdas.ingestion.self_healing import run_self_healing_check
 
         mock_table.query.return_value = {"Items": [sample_stale_item]}
-        mock_table.get_item.return_value = {"Item": sample_full_item}
+        _batch_get_returns(mock_table, sample_full_item)
         mock_sns_client.publish_batch.return_value = {
             "Successful": [{"Id": "0", "MessageId": "msg-123"}],
             "Failed": [],
@@ -414,7 +492,7 @@ class TestRunSelfHealingCheck:
         from src.lambdas.ingestion.self_healing import run_self_healing_check
 
         mock_table.query.return_value = {"Items": [sample_stale_item]}
-        mock_table.get_item.return_value = {"Item": sample_full_item}
+        _batch_get_returns(mock_table, sample_full_item)
         mock_sns_client.publish_batch.return_value = {
             "Successful": [{"Id": "0", "MessageId": "msg-123"}],
             "Failed": [],
@@ -433,6 +511,42 @@ class TestRunSelfHealingCheck:
             assert "SelfHealingItemsRepublished" in metric_names
             assert "SelfHealingExecutionTime" in metric_names
 
+    def test_republishes_each_chunk(
+        self, mock_table, mock_sns_client, sample_full_item
+    ):
+        """Each hydrated chunk is published in its own SNS batch."""
+        from src.lambdas.ingestion.self_healing import run_self_healing_check
+
+        stale = [
+            {"source_id": f"finnhub:{i}", "status": "pending", "timestamp": "t"}
+            for i in range(3)
+        ]
+        mock_table.query.return_value = {"Items": stale}
+        _batch_get_returns(mock_table, sample_full_item)
+        mock_sns_client.publish_batch.return_value = {
+            "Successful": [{"Id": "0", "MessageId": "msg-123"}],
+            "Failed": [],
+        }
+
+        from src.lambdas.ingestion import self_healing
+
+        one_per_chunk = functools.partial(
+            self_healing.iter_full_item_batches, chunk_size=1
+        )
+        with (
+            patch.object(self_healing, "iter_full_item_batches", one_per_chunk),
+            patch("src.lambdas.ingestion.self_healing.emit_metric"),
+        ):
+            result = run_self_healing_check(
+                table=mock_table,
+                sns_client=mock_sns_client,
+                sns_topic_arn="arn:aws:sns:us-east-1:123456789:test-topic",
+            )
+
+        assert result.items_found == 3
+        assert result.items_republished == 3
+        assert mock_sns_client.publish_batch.call_count == 3
+
     def test_handles_errors_gracefully(self, mock_table, mock_sns_client):
         """T021: Self-healing errors don't propagate to caller."""
         from src.lambdas.ingestion.self_healing import run_self_healing_check
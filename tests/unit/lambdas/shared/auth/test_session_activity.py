@@ -0,0 +1,251 @@
+"""Unit tests for write-behind session activity tracking.
+
+Tests the validated-session cache and coalesced last_active/expiry
+writes used by validate_session.
+"""
+
+import os
+import uuid
+from datetime import UTC, datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+import jwt
+import pytest
+from botocore.exceptions import ClientError
+
+from src.lambdas.dashboard.handler import lambda_handler
+from src.lambdas.shared.errors.session_errors import SessionRevokedException
+from src.lambdas.shared.middleware.auth_middleware import JWTClaim
+from src.lambdas.shared.models.user import User
+from tests.conftest import make_event
+
+TEST_JWT_SECRET = "test-secret-key-do-not-use-in-production"
+
+
+@pytest.fixture
+def user_table():
+    """Mock users table holding one valid session."""
+    now = datetime.now(UTC)
+    user = User(
+        user_id=str(uuid.uuid4()),
+        auth_type="anonymous",
+        created_at=now - timedelta(days=1),
+        last_active_at=now - timedelta(hours=1),
+        session_expires_at=now + timedelta(days=20),
+        revocation_id=2,
+    )
+    table = MagicMock()
+    table.get_item.return_value = {"Item": user.to_dynamodb_item()}
+    return table, user
+
+
+def _claim(user_id: str, rev: int | None) -> JWTClaim:
+    now = datetime.now(UTC)
+    return JWTClaim(
+        subject=user_id,
+        expiration=now + timedelta(minutes=15),
+        issued_at=now,
+        rev=rev,
+    )
+
+
+def _bearer(user_id: str, rev: int) -> dict[str, str]:
+    now = datetime.now(UTC)
+    token = jwt.encode(
+        {
+            "sub": user_id,
+            "exp": now + timedelta(minutes=15),
+            "iat": now,
+            "nbf": now,
+            "iss": "sentiment-analyzer",
+            "aud": "sentiment-analyzer-api",
+            "roles": ["free"],
+            "rev": rev,
+        },
+        TEST_JWT_SECRET,
+        algorithm="HS256",
+    )
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.mark.unit
+class TestValidatedSessionCache:
+    """Repeated validations within the TTL skip DynamoDB."""
+
+    def test_second_validation_uses_cache(self, user_table):
+        from src.lambdas.dashboard.auth import validate_session
+
+        table, user = user_table
+
+        first = validate_session(table, user.user_id)
+        second = validate_session(table, user.user_id)
+
+        assert first.valid is True
+        assert second.valid is True
+        table.get_item.assert_called_once()
+        # Only the first touch is written inside the interval
+        table.update_item.assert_called_once()
+
+    def test_revocation_id_checked_on_cache_hit(self, user_table):
+        from src.lambdas.dashboard.auth import validate_session
+
+        table, user = user_table
+        validate_session(table, user.user_id, jwt_claim=_claim(user.user_id, 2))
+
+        # Same rev, but the cached user has since been found at rev 2 while
+        # this token claims 1: reject without reading DynamoDB again
+        with (
+            patch(
+                "src.lambdas.shared.auth.session_activity.get_cached_session",
+                return_value=MagicMock(
+                    session_expires_at=datetime.now(UTC) + timedelta(days=1),
+                    revocation_id=2,
+                ),
+            ),
+            pytest.raises(SessionRevokedException),
+        ):
+            validate_session(table, user.user_id, jwt_claim=_claim(user.user_id, 1))
+
+        table.get_item.assert_called_once()
+
+    def test_stale_rev_rejected_on_miss(self, user_table):
+        from src.lambdas.dashboard.auth import validate_session
+
+        table, user = user_table
+
+        with pytest.raises(SessionRevokedException):
+            validate_session(table, user.user_id, jwt_claim=_claim(user.user_id, 1))
+
+        table.update_item.assert_not_called()
+
+    def test_sign_out_invalidates_cache(self, user_table):
+        from src.lambdas.dashboard.auth import sign_out, validate_session
+
+        table, user = user_table
+        validate_session(table, user.user_id)
+
+        sign_out(table, user.user_id, "token")
+        validate_session(table, user.user_id)
+
+        assert table.get_item.call_count == 2
+
+
+@pytest.mark.unit
+class TestCoalescedTouches:
+    """Touches are written at most once per user per interval."""
+
+    def test_flush_waits_for_interval(self, user_table):
+        from src.lambdas.dashboard.auth import validate_session
+        from src.lambdas.shared.auth.session_activity import flush_session_activity
+
+        table, user = user_table
+        validate_session(table, user.user_id)
+        validate_session(table, user.user_id)
+
+        assert flush_session_activity() == 0
+        table.update_item.assert_called_once()
+
+        with patch(
+            "src.lambdas.shared.auth.session_activity.SESSION_WRITE_INTERVAL_SECONDS",
+            0,
+        ):
+            assert flush_session_activity() == 1
+        assert table.update_item.call_count == 2
+
+    def test_merges_extension_into_pending_touch(self, user_table):
+        from src.lambdas.dashboard.auth import validate_session
+        from src.lambdas.shared.auth.session_activity import flush_session_activity
+
+        table, user = user_table
+        validate_session(table, user.user_id)
+        result = validate_session(table, user.user_id, extend_on_valid=True)
+        validate_session(table, user.user_id)
+
+        flush_session_activity(force=True)
+
+        call_kwargs = table.update_item.call_args.kwargs
+        assert "session_expires_at = :expires" in call_kwargs["UpdateExpression"]
+        assert "ConditionExpression" in call_kwargs
+        assert result.expires_at.startswith(
+            call_kwargs["ExpressionAttributeValues"][":expires"][:10]
+        )
+
+    def test_extension_of_ended_session_is_skipped(self, user_table):
+        from src.lambdas.dashboard.auth import validate_session
+
+        table, user = user_table
+        table.update_item.side_effect = ClientError(
+            {"Error": {"Code": "ConditionalCheckFailedException"}}, "UpdateItem"
+        )
+
+        result = validate_session(table, user.user_id, extend_on_valid=True)
+
+        # Validation still succeeds; the cached session is dropped
+        assert result.valid is True
+        validate_session(table, user.user_id)
+        assert table.get_item.call_count == 2
+
+    def test_touch_of_deleted_session_is_skipped(self, user_table):
+        from src.lambdas.dashboard.auth import validate_session
+
+        table, user = user_table
+        table.update_item.side_effect = ClientError(
+            {"Error": {"Code": "ConditionalCheckFailedException"}}, "UpdateItem"
+        )
+
+        result = validate_session(table, user.user_id)
+
+        # The activity write never recreates a deleted item without a TTL
+        call_kwargs = table.update_item.call_args.kwargs
+        assert call_kwargs["ConditionExpression"] == "attribute_exists(PK)"
+        assert result.valid is True
+        validate_session(table, user.user_id)
+        assert table.get_item.call_count == 2
+
+
+@pytest.mark.unit
+class TestRouterSessionValidation:
+    """The router passes the request's JWT claim into validate_session."""
+
+    def test_stale_rev_rejected_after_warm_cache(self, user_table, mock_lambda_context):
+        table, user = user_table
+        listing = MagicMock()
+        listing.model_dump.return_value = {"configurations": []}
+
+        with (
+            patch.dict(
+                os.environ,
+                {
+                    "JWT_SECRET": TEST_JWT_SECRET,
+                    "JWT_AUDIENCE": "sentiment-analyzer-api",
+                },
+            ),
+            patch(
+                "src.lambdas.dashboard.router_v2.get_users_table",
+                return_value=table,
+            ),
+            patch(
+                "src.lambdas.dashboard.router_v2.config_service.list_configurations",
+                return_value=listing,
+            ),
+        ):
+            current = lambda_handler(
+                make_event(
+                    method="GET",
+                    path="/api/v2/configurations",
+                    headers=_bearer(user.user_id, 2),
+                ),
+                mock_lambda_context,
+            )
+            # Same session is warm, but this token predates a rotation
+            stale = lambda_handler(
+                make_event(
+                    method="GET",
+                    path="/api/v2/configurations",
+                    headers=_bearer(user.user_id, 1),
+                ),
+                mock_lambda_context,
+            )
+
+        assert current["statusCode"] == 200
+        assert stale["statusCode"] == 403
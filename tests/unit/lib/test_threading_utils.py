@@ -17,6 +17,7 @@ from src.lib.threading_utils import (
     ThreadSafeCounter,
     ThreadSafeDict,
     ThreadSafeQueue,
+    TokenBucket,
     create_lock,
     create_rlock,
     thread_safe_operation,
@@ -327,3 +328,58 @@ class TestLockHelpers:
         acquired = lock.acquire(blocking=False)
         assert acquired
         lock.release()
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket rate limiter."""
+
+    def test_allows_burst_up_to_capacity(self):
+        """A full bucket allows capacity requests, then refuses."""
+        bucket = TokenBucket(rate=0.001, capacity=5)
+
+        assert all(bucket.try_acquire() for _ in range(5))
+        assert not bucket.try_acquire()
+
+    def test_refills_over_time(self):
+        """Tokens refill at the configured rate."""
+        bucket = TokenBucket(rate=100, capacity=1)
+        assert bucket.try_acquire()
+        assert not bucket.try_acquire()
+
+        time.sleep(0.03)
+
+        assert bucket.try_acquire()
+
+    def test_acquire_waits_for_token(self):
+        """acquire() blocks until a token is available."""
+        bucket = TokenBucket(rate=20, capacity=1)
+        bucket.try_acquire()
+
+        start = time.monotonic()
+        assert bucket.acquire(timeout=1)
+        assert time.monotonic() - start >= 0.03
+
+    def test_zero_rate_never_refills(self):
+        """A zero-rate bucket spends its capacity, then refuses without waiting."""
+        bucket = TokenBucket(rate=0, capacity=1)
+
+        assert bucket.acquire(timeout=1)
+        start = time.monotonic()
+        assert not bucket.acquire(timeout=1)
+        assert time.monotonic() - start < 0.5
+
+    def test_acquire_times_out(self):
+        """acquire() returns False if no token frees up within timeout."""
+        bucket = TokenBucket(rate=0.01, capacity=1)
+        bucket.try_acquire()
+
+        assert not bucket.acquire(timeout=0.01)
+
+    def test_concurrent_acquires_never_exceed_capacity(self):
+        """Concurrent try_acquire() calls hand out at most capacity tokens."""
+        bucket = TokenBucket(rate=0.001, capacity=50)
+
+        with ThreadPoolExecutor(max_workers=10) as pool:
+            results = list(pool.map(lambda _: bucket.try_acquire(), range(200)))
+
+        assert sum(results) == 50
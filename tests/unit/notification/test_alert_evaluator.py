@@ -14,9 +14,10 @@ from src.lambdas.notification.alert_evaluator import (
     EvaluateAlertsRequest,
     EvaluateAlertsResponse,
     SentimentUpdate,
-    _check_email_quota,
+    TickerAlertIndex,
+    _check_email_quotas,
     _evaluate_threshold,
-    _find_alerts_by_ticker,
+    _find_ticker_index,
     _increment_global_quota,
     _increment_user_quota,
     _is_in_cooldown,
@@ -24,6 +25,7 @@ from src.lambdas.notification.alert_evaluator import (
     _update_alert_triggered,
     evaluate_alerts_for_ticker,
     get_email_quota_status,
+    invalidate_alert_index,
     verify_internal_auth,
 )
 from src.lambdas.shared.models.alert_rule import AlertRule
@@ -131,44 +133,8 @@ class TestIsInCooldown:
         assert _is_in_cooldown(sample_alert) is False
 
 
-class TestCheckEmailQuota:
-    """Tests for _check_email_quota helper."""
-
-    def test_returns_true_under_quota(self, mock_table, user_id):
-        """Returns True when user is under quota."""
-        mock_table.get_item.return_value = {"Item": {"count": 5}}
-
-        result = _check_email_quota(mock_table, user_id)
-
-        assert result is True
-
-    def test_returns_false_at_quota(self, mock_table, user_id):
-        """Returns False when user is at quota."""
-        mock_table.get_item.return_value = {"Item": {"count": 10}}
-
-        result = _check_email_quota(mock_table, user_id)
-
-        assert result is False
-
-    def test_returns_true_no_record(self, mock_table, user_id):
-        """Returns True when no quota record exists."""
-        mock_table.get_item.return_value = {}
-
-        result = _check_email_quota(mock_table, user_id)
-
-        assert result is True
-
-    def test_returns_true_on_error(self, mock_table, user_id):
-        """Returns True (allows) on error."""
-        mock_table.get_item.side_effect = Exception("DB error")
-
-        result = _check_email_quota(mock_table, user_id)
-
-        assert result is True
-
-
-class TestFindAlertsByTicker:
-    """Tests for _find_alerts_by_ticker helper.
+class TestFindTickerIndex:
+    """Tests for _find_ticker_index helper.
 
     (502-gsi-query-optimization: Updated to mock table.query instead of table.scan)
     """
@@ -177,7 +143,7 @@ class TestFindAlertsByTicker:
         """Finds alerts for ticker using by_entity_status GSI."""
         mock_table.query.return_value = {"Items": [sample_alert_item]}
 
-        alerts = _find_alerts_by_ticker(mock_table, "AAPL")
+        alerts = _find_ticker_index(mock_table, "AAPL").rules
 
         assert len(alerts) == 1
         assert alerts[0].ticker == "AAPL"
@@ -190,10 +156,98 @@ class TestFindAlertsByTicker:
         """Returns empty list when no alerts."""
         mock_table.query.return_value = {"Items": []}
 
-        alerts = _find_alerts_by_ticker(mock_table, "TSLA")
+        alerts = _find_ticker_index(mock_table, "TSLA").rules
 
         assert len(alerts) == 0
 
+    def test_index_is_reused_until_invalidated(self, mock_table, sample_alert_item):
+        """Evaluations reuse the warm index instead of querying every time."""
+        mock_table.query.return_value = {"Items": [sample_alert_item]}
+
+        _find_ticker_index(mock_table, "AAPL")
+        _find_ticker_index(mock_table, "MSFT")
+        assert mock_table.query.call_count == 1
+
+        invalidate_alert_index()
+        _find_ticker_index(mock_table, "AAPL")
+        assert mock_table.query.call_count == 2
+
+    def test_load_failure_returns_empty(self, mock_table):
+        """Returns empty list when the index cannot be loaded."""
+        mock_table.query.side_effect = Exception("DynamoDB error")
+
+        assert _find_ticker_index(mock_table, "AAPL").rules == []
+
+
+def _rule(sample_alert, threshold, direction, alert_type="sentiment_threshold"):
+    return sample_alert.model_copy(
+        update={
+            "alert_id": str(uuid.uuid4()),
+            "threshold_value": threshold,
+            "threshold_direction": direction,
+            "alert_type": alert_type,
+        }
+    )
+
+
+class TestTickerAlertIndex:
+    """Tests for the sorted threshold index."""
+
+    def test_crossed_matches_evaluate_threshold(self, sample_alert):
+        """Binary search returns exactly the rules _evaluate_threshold fires."""
+        rules = [
+            _rule(sample_alert, t, d)
+            for t in (-0.6, -0.3, 0.0, 0.3, 0.6)
+            for d in ("above", "below")
+        ]
+        index = TickerAlertIndex(rules)
+
+        for value in (-0.9, -0.6, -0.1, 0.0, 0.3, 0.9):
+            expected = {
+                r.alert_id
+                for r in rules
+                if _evaluate_threshold(value, r.threshold_value, r.threshold_direction)
+            }
+            crossed = index.crossed("sentiment_threshold", value)
+            assert {r.alert_id for r in crossed} == expected
+
+    def test_separates_alert_types(self, sample_alert):
+        """Volatility rules are not returned for sentiment values."""
+        index = TickerAlertIndex(
+            [_rule(sample_alert, 5.0, "above", "volatility_threshold")]
+        )
+
+        assert index.crossed("sentiment_threshold", 7.0) == []
+        assert len(index.crossed("volatility_threshold", 7.0)) == 1
+
+    def test_excludes_disabled_rules(self, sample_alert):
+        """Disabled rules are not indexed."""
+        sample_alert.status = DISABLED
+
+        assert TickerAlertIndex([sample_alert]).rules == []
+
+
+class TestCheckEmailQuotas:
+    """Tests for batched quota reads."""
+
+    def test_reads_all_users_in_one_batch(self, mock_table):
+        """Remaining quota comes from a single BatchGetItem."""
+        mock_table.name = "test-table"
+        mock_table.meta.client.batch_get_item.return_value = {
+            "Responses": {"test-table": [{"PK": "USER_QUOTA#u1", "count": 10}]}
+        }
+
+        remaining = _check_email_quotas(mock_table, {"u1", "u2"})
+
+        assert remaining == {"u1": 0, "u2": 10}
+        mock_table.meta.client.batch_get_item.assert_called_once()
+
+    def test_allows_on_error(self, mock_table):
+        """Defaults to full quota when the read fails."""
+        mock_table.meta.client.batch_get_item.side_effect = Exception("boom")
+
+        assert _check_email_quotas(mock_table, {"u1"}) == {"u1": 10}
+
 
 class TestQueueNotification:
     """Tests for _queue_notification helper."""
@@ -259,8 +313,8 @@ class TestEvaluateAlertsForTicker:
     """Tests for evaluate_alerts_for_ticker function."""
 
     @patch("src.lambdas.notification.alert_evaluator.tracer")
-    @patch("src.lambdas.notification.alert_evaluator._find_alerts_by_ticker")
-    @patch("src.lambdas.notification.alert_evaluator._check_email_quota")
+    @patch("src.lambdas.notification.alert_evaluator._find_ticker_index")
+    @patch("src.lambdas.notification.alert_evaluator._check_email_quotas")
     @patch("src.lambdas.notification.alert_evaluator._queue_notification")
     @patch("src.lambdas.notification.alert_evaluator._update_alert_triggered")
     def test_evaluates_and_triggers_sentiment_alert(
@@ -274,8 +328,8 @@ class TestEvaluateAlertsForTicker:
         sample_alert,
     ):
         """Evaluates sentiment alert and triggers when crossed."""
-        mock_find.return_value = [sample_alert]
-        mock_quota.return_value = True
+        mock_find.return_value = TickerAlertIndex([sample_alert])
+        mock_quota.return_value = {sample_alert.user_id: 10}
         mock_queue.return_value = str(uuid.uuid4())
 
         result = evaluate_alerts_for_ticker(
@@ -290,41 +344,41 @@ class TestEvaluateAlertsForTicker:
         assert result.notifications_queued == 1
 
     @patch("src.lambdas.notification.alert_evaluator.tracer")
-    @patch("src.lambdas.notification.alert_evaluator._find_alerts_by_ticker")
+    @patch("src.lambdas.notification.alert_evaluator._find_ticker_index")
     def test_skips_disabled_alerts(
         self, mock_find, mock_tracer, mock_table, sample_alert
     ):
         """Skips disabled alerts."""
         sample_alert.is_enabled = False
         sample_alert.status = DISABLED
-        mock_find.return_value = [sample_alert]
+        mock_find.return_value = TickerAlertIndex([sample_alert])
 
         result = evaluate_alerts_for_ticker(mock_table, "AAPL", sentiment_score=-0.5)
 
         assert result.triggered == 0
 
     @patch("src.lambdas.notification.alert_evaluator.tracer")
-    @patch("src.lambdas.notification.alert_evaluator._find_alerts_by_ticker")
+    @patch("src.lambdas.notification.alert_evaluator._find_ticker_index")
     def test_skips_alerts_in_cooldown(
         self, mock_find, mock_tracer, mock_table, sample_alert
     ):
         """Skips alerts in cooldown."""
         sample_alert.last_triggered_at = datetime.now(UTC) - timedelta(minutes=30)
-        mock_find.return_value = [sample_alert]
+        mock_find.return_value = TickerAlertIndex([sample_alert])
 
         result = evaluate_alerts_for_ticker(mock_table, "AAPL", sentiment_score=-0.5)
 
         assert result.triggered == 0
 
     @patch("src.lambdas.notification.alert_evaluator.tracer")
-    @patch("src.lambdas.notification.alert_evaluator._find_alerts_by_ticker")
-    @patch("src.lambdas.notification.alert_evaluator._check_email_quota")
+    @patch("src.lambdas.notification.alert_evaluator._find_ticker_index")
+    @patch("src.lambdas.notification.alert_evaluator._check_email_quotas")
     def test_respects_email_quota(
         self, mock_quota, mock_find, mock_tracer, mock_table, sample_alert
     ):
         """Doesn't queue notification when quota exceeded."""
-        mock_find.return_value = [sample_alert]
-        mock_quota.return_value = False  # Quota exceeded
+        mock_find.return_value = TickerAlertIndex([sample_alert])
+        mock_quota.return_value = {sample_alert.user_id: 0}  # Quota exceeded
 
         result = evaluate_alerts_for_ticker(mock_table, "AAPL", sentiment_score=-0.5)
 
@@ -332,7 +386,7 @@ class TestEvaluateAlertsForTicker:
         assert result.notifications_queued == 0
 
     @patch("src.lambdas.notification.alert_evaluator.tracer")
-    @patch("src.lambdas.notification.alert_evaluator._find_alerts_by_ticker")
+    @patch("src.lambdas.notification.alert_evaluator._find_ticker_index")
     def test_evaluates_volatility_alert(
         self, mock_find, mock_tracer, mock_table, sample_alert
     ):
@@ -340,19 +394,19 @@ class TestEvaluateAlertsForTicker:
         sample_alert.alert_type = "volatility_threshold"
         sample_alert.threshold_value = 5.0
         sample_alert.threshold_direction = "above"
-        mock_find.return_value = [sample_alert]
+        mock_find.return_value = TickerAlertIndex([sample_alert])
 
         result = evaluate_alerts_for_ticker(mock_table, "AAPL", volatility_atr=7.0)
 
         assert result.triggered == 1
 
     @patch("src.lambdas.notification.alert_evaluator.tracer")
-    @patch("src.lambdas.notification.alert_evaluator._find_alerts_by_ticker")
+    @patch("src.lambdas.notification.alert_evaluator._find_ticker_index")
     def test_no_trigger_when_not_crossed(
         self, mock_find, mock_tracer, mock_table, sample_alert
     ):
         """Doesn't trigger when threshold not crossed."""
-        mock_find.return_value = [sample_alert]
+        mock_find.return_value = TickerAlertIndex([sample_alert])
 
         result = evaluate_alerts_for_ticker(
             mock_table,
@@ -361,6 +415,77 @@ class TestEvaluateAlertsForTicker:
         )
 
         assert result.triggered == 0
+        assert result.evaluated == 1
+        assert len(result.details) == 1
+        assert result.details[0].triggered is False
+        assert result.details[0].current_value == 0.5
+        assert result.details[0].notification_id is None
+
+    @patch("src.lambdas.notification.alert_evaluator.tracer")
+    @patch("src.lambdas.notification.alert_evaluator._find_ticker_index")
+    @patch("src.lambdas.notification.alert_evaluator._check_email_quotas")
+    @patch("src.lambdas.notification.alert_evaluator._queue_notification")
+    @patch("src.lambdas.notification.alert_evaluator._update_alert_triggered")
+    def test_details_list_every_evaluated_alert(
+        self,
+        mock_update,
+        mock_queue,
+        mock_quota,
+        mock_find,
+        mock_tracer,
+        mock_table,
+        sample_alert,
+    ):
+        """Details cover fired and non-fired alerts but not those in cooldown."""
+        fired = _rule(sample_alert, -0.3, "below")
+        quiet = _rule(sample_alert, -0.9, "below")
+        cooling = _rule(sample_alert, -0.1, "below")
+        cooling.last_triggered_at = datetime.now(UTC) - timedelta(minutes=30)
+        mock_find.return_value = TickerAlertIndex([fired, quiet, cooling])
+        mock_quota.return_value = {sample_alert.user_id: 10}
+        mock_queue.return_value = "n-1"
+
+        result = evaluate_alerts_for_ticker(mock_table, "AAPL", sentiment_score=-0.5)
+
+        by_id = {d.alert_id: d for d in result.details}
+        assert set(by_id) == {fired.alert_id, quiet.alert_id}
+        assert by_id[fired.alert_id].triggered is True
+        assert by_id[fired.alert_id].notification_id == "n-1"
+        assert by_id[quiet.alert_id].triggered is False
+        assert by_id[quiet.alert_id].current_value == -0.5
+        assert result.triggered == 1
+
+    @patch("src.lambdas.notification.alert_evaluator.tracer")
+    @patch("src.lambdas.notification.alert_evaluator._find_ticker_index")
+    @patch("src.lambdas.notification.alert_evaluator._check_email_quotas")
+    @patch("src.lambdas.notification.alert_evaluator._queue_notification")
+    @patch("src.lambdas.notification.alert_evaluator._update_alert_triggered")
+    def test_quota_shared_across_a_users_alerts(
+        self,
+        mock_update,
+        mock_queue,
+        mock_quota,
+        mock_find,
+        mock_tracer,
+        mock_table,
+        sample_alert,
+    ):
+        """Quota is read once per evaluation and spent across alerts;
+        triggered rules enter cooldown in the warm index."""
+        rules = [_rule(sample_alert, t, "below") for t in (-0.1, -0.2, -0.3)]
+        mock_find.return_value = TickerAlertIndex(rules)
+        mock_quota.return_value = {sample_alert.user_id: 2}
+        mock_queue.return_value = str(uuid.uuid4())
+
+        result = evaluate_alerts_for_ticker(mock_table, "AAPL", sentiment_score=-0.5)
+
+        assert result.triggered == 3
+        assert result.notifications_queued == 2
+        mock_quota.assert_called_once_with(mock_table, {sample_alert.user_id})
+
+        again = evaluate_alerts_for_ticker(mock_table, "AAPL", sentiment_score=-0.5)
+        assert again.notifications_queued == 0
+        assert again.triggered == 1  # only the rule that had no quota
 
 
 class TestGetEmailQuotaStatus:
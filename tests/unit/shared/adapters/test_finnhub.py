@@ -1,5 +1,8 @@
 """Unit tests for Finnhub adapter."""
 
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from unittest.mock import MagicMock, patch
 
@@ -8,6 +11,7 @@ import pytest
 
 from src.lambdas.shared.adapters.base import AdapterError, RateLimitError
 from src.lambdas.shared.adapters.finnhub import FinnhubAdapter, clear_cache
+from src.lib.threading_utils import TokenBucket
 
 
 @pytest.fixture(autouse=True)
@@ -111,6 +115,74 @@ class TestFinnhubGetNews:
         assert mock_get.call_count == 3
         assert len(result) == 3
 
+    def test_get_news_fetches_tickers_concurrently(
+        self, finnhub_adapter: FinnhubAdapter
+    ):
+        """Per-ticker requests overlap and results keep ticker order."""
+        tickers = [f"T{i}" for i in range(8)]
+
+        def slow_get(endpoint, params):
+            time.sleep(0.1)
+            response = MagicMock()
+            response.status_code = 200
+            response.is_success = True
+            response.json.return_value = [
+                {"id": params["symbol"], "headline": "News", "datetime": 1705330200}
+            ]
+            return response
+
+        with patch.object(finnhub_adapter.client, "get", side_effect=slow_get):
+            start = time.perf_counter()
+            result = finnhub_adapter.get_news(tickers)
+            elapsed = time.perf_counter() - start
+
+        assert [a.tickers[0] for a in result] == tickers
+        # Sequential would take 0.8s
+        assert elapsed < 0.5
+
+    def test_get_news_local_rate_limit(self, finnhub_adapter: FinnhubAdapter):
+        """Requests beyond the token bucket raise RateLimitError."""
+        import src.lambdas.shared.adapters.finnhub as finnhub_module
+
+        empty_bucket = TokenBucket(rate=0.001, capacity=1)
+        empty_bucket.try_acquire()
+
+        with (
+            patch.object(finnhub_module, "_finnhub_rate_limiter", empty_bucket),
+            patch.object(finnhub_module, "FINNHUB_RATE_LIMIT_WAIT_SECONDS", 0.01),
+            patch.object(finnhub_adapter.client, "get") as mock_get,
+        ):
+            with pytest.raises(RateLimitError, match="local rate limit"):
+                finnhub_adapter.get_news(["AAPL"])
+
+        mock_get.assert_not_called()
+
+    def test_get_news_returns_tickers_fetched_before_rate_limit(
+        self, finnhub_adapter: FinnhubAdapter
+    ):
+        """Hitting the token bucket part-way keeps the articles already fetched."""
+        import src.lambdas.shared.adapters.finnhub as finnhub_module
+
+        def get(endpoint, params):
+            response = MagicMock()
+            response.status_code = 200
+            response.is_success = True
+            response.json.return_value = [
+                {"id": params["symbol"], "headline": "News", "datetime": 1705330200}
+            ]
+            return response
+
+        with (
+            patch.object(
+                finnhub_module, "_finnhub_rate_limiter", TokenBucket(rate=0, capacity=2)
+            ),
+            patch.object(finnhub_module, "FINNHUB_RATE_LIMIT_WAIT_SECONDS", 0.01),
+            patch.object(finnhub_adapter.client, "get", side_effect=get),
+        ):
+            result = finnhub_adapter.get_news(["AAPL", "MSFT", "GOOGL", "AMZN"])
+
+        assert len(result) == 2
+
     def test_get_news_rate_limit_error(self, finnhub_adapter: FinnhubAdapter):
         """Test rate limit error handling."""
         mock_response = MagicMock()
@@ -191,6 +263,37 @@ class TestFinnhubGetSentiment:
         assert result.buzz_score == 0.95
         assert result.sector_average_score == 0.52
 
+    def test_concurrent_misses_share_one_request(self, finnhub_adapter: FinnhubAdapter):
+        """Concurrent callers for the same ticker issue one HTTP request."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.is_success = True
+        mock_response.json.return_value = {
+            "sentiment": {"bearishPercent": 0.2, "bullishPercent": 0.6},
+        }
+        in_flight = threading.Event()
+        release = threading.Event()
+
+        def slow_get(*args, **kwargs):
+            in_flight.set()
+            release.wait(timeout=5)
+            return mock_response
+
+        with patch.object(
+            finnhub_adapter.client, "get", side_effect=slow_get
+        ) as mock_get:
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                first = pool.submit(finnhub_adapter.get_sentiment, "AAPL")
+                in_flight.wait(timeout=5)
+                rest = [
+                    pool.submit(finnhub_adapter.get_sentiment, "AAPL") for _ in range(7)
+                ]
+                release.set()
+                results = [f.result(timeout=5) for f in [first, *rest]]
+
+        assert mock_get.call_count == 1
+        assert all(r.bullish_percent == 0.6 for r in results)
+
     def test_get_sentiment_no_data(self, finnhub_adapter: FinnhubAdapter):
         """Test sentiment fetch with no data."""
         mock_response = MagicMock()
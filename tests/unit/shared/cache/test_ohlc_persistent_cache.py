@@ -14,12 +14,16 @@ from moto import mock_aws
 
 from src.lambdas.shared.cache.ohlc_cache import (
     BATCH_WRITE_MAX_RETRIES,
+    MAX_QUERY_SEGMENTS,
     CachedCandle,
     OHLCCacheResult,
     _build_pk,
     _build_sk,
+    _get_dynamodb_client,
     _parse_sk,
+    _split_range,
     candles_to_cached,
+    get_cached_candle_columns,
     get_cached_candles,
     is_market_open,
     put_cached_candles,
@@ -766,3 +770,105 @@ class TestBatchWriteRetry:
             assert (
                 mock_client.batch_write_item.call_count == BATCH_WRITE_MAX_RETRIES + 1
             )
+
+
+class TestReadPath:
+    """Test paginated, segmented, columnar cache reads."""
+
+    def _item(self, ts: datetime, price: float) -> dict:
+        return {
+            "SK": {"S": _build_sk("5m", ts)},
+            "open": {"N": str(price)},
+            "high": {"N": str(price + 1)},
+            "low": {"N": str(price - 1)},
+            "close": {"N": str(price)},
+            "volume": {"N": "100"},
+        }
+
+    def test_client_is_reused(self, env_vars):
+        """_get_dynamodb_client returns the same client across calls."""
+        assert _get_dynamodb_client() is _get_dynamodb_client()
+
+    def test_follows_last_evaluated_key(self, env_vars):
+        """All pages are read, not just the first 1 MB."""
+        first = datetime(2025, 12, 1, 14, 30, tzinfo=UTC)
+        second = first + timedelta(minutes=5)
+        mock_client = MagicMock()
+        mock_client.query.side_effect = [
+            {"Items": [self._item(first, 10.0)], "LastEvaluatedKey": {"PK": "x"}},
+            {"Items": [self._item(second, 11.0)]},
+        ]
+
+        with patch(
+            "src.lambdas.shared.cache.ohlc_cache._get_dynamodb_client",
+            return_value=mock_client,
+        ):
+            columns = get_cached_candle_columns(
+                "AAPL", "tiingo", "5m", first, first + timedelta(days=1)
+            )
+
+        assert mock_client.query.call_count == 2
+        assert mock_client.query.call_args_list[1][1]["ExclusiveStartKey"] == {
+            "PK": "x"
+        }
+        assert list(columns.close) == [10.0, 11.0]
+        assert list(columns.timestamps) == [first.timestamp(), second.timestamp()]
+
+    def test_split_range_segments_are_disjoint_and_cover_range(self):
+        """Long intraday ranges split into ordered, non-overlapping SK ranges."""
+        start = datetime(2025, 1, 1, tzinfo=UTC)
+        end = datetime(2025, 12, 31, 23, 59, 59, tzinfo=UTC)
+
+        segments = _split_range("5m", start, end)
+
+        assert len(segments) == MAX_QUERY_SEGMENTS
+        assert segments[0][0] == start
+        assert segments[-1][1] == end
+        for (_, seg_end), (next_start, _) in zip(segments, segments[1:], strict=False):
+            assert next_start - seg_end == timedelta(seconds=1)
+
+    def test_split_range_keeps_short_and_daily_ranges_whole(self):
+        start = datetime(2025, 1, 1, tzinfo=UTC)
+
+        assert len(_split_range("5m", start, start + timedelta(days=7))) == 1
+        assert len(_split_range("D", start, start + timedelta(days=365))) == 1
+
+    @mock_aws
+    def test_segmented_read_returns_all_candles_in_order(self, env_vars):
+        """A multi-segment read returns the same candles as written, sorted."""
+        client = boto3.client("dynamodb", region_name="us-east-1")
+        client.create_table(
+            TableName="test-ohlc-cache",
+            KeySchema=[
+                {"AttributeName": "PK", "KeyType": "HASH"},
+                {"AttributeName": "SK", "KeyType": "RANGE"},
+            ],
+            AttributeDefinitions=[
+                {"AttributeName": "PK", "AttributeType": "S"},
+                {"AttributeName": "SK", "AttributeType": "S"},
+            ],
+            BillingMode="PAY_PER_REQUEST",
+        )
+        start = datetime(2025, 1, 2, 14, 30, tzinfo=UTC)
+        candles = [
+            CachedCandle(
+                timestamp=start + timedelta(hours=7 * i),
+                open=100.0 + i,
+                high=101.0 + i,
+                low=99.0 + i,
+                close=100.5 + i,
+                volume=i,
+                source="tiingo",
+                resolution="60",
+            )
+            for i in range(300)
+        ]
+        put_cached_candles("AAPL", "tiingo", "60", candles)
+
+        end = start + timedelta(days=100)
+        assert len(_split_range("60", start, end)) > 1
+        result = get_cached_candles("AAPL", "tiingo", "60", start, end)
+
+        assert result.cache_hit is True
+        assert [c.timestamp for c in result.candles] == [c.timestamp for c in candles]
+        assert [c.close for c in result.candles] == [c.close for c in candles]
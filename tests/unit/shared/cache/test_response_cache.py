@@ -0,0 +1,123 @@
+"""Unit tests for the pre-serialized ETag response cache."""
+
+from unittest.mock import patch
+
+import orjson
+
+from src.lambdas.shared.cache.response_cache import (
+    ResponseCache,
+    cached_json_response,
+    etag_matches,
+    make_etag,
+)
+
+
+def _event(if_none_match: str | None = None) -> dict:
+    headers = {"If-None-Match": if_none_match} if if_none_match else {}
+    return {"headers": headers}
+
+
+class TestResponseCache:
+    """Tests for TTL + LRU storage."""
+
+    def test_put_serializes_once(self):
+        cache = ResponseCache(name="test", max_entries=4)
+        payload = {"ticker": "AAPL", "count": 2}
+
+        entry = cache.put("k", payload, ttl=60)
+
+        assert orjson.loads(entry.body) == payload
+        assert entry.etag == make_etag(entry.body)
+        assert cache.get("k") is entry
+
+    def test_expired_entry_is_removed(self):
+        cache = ResponseCache(name="test", max_entries=4)
+        with patch("src.lib.cache_utils.time.time") as mock_time:
+            mock_time.return_value = 1000.0
+            cache.put("k", {}, ttl=60)
+            mock_time.return_value = 1067.0  # past 60s TTL + 10% jitter
+
+            assert cache.get("k") is None
+        assert "k" not in cache
+
+    def test_evicts_least_recently_used(self):
+        evicted = []
+        cache = ResponseCache(name="test", max_entries=2, on_evict=evicted.append)
+        cache.put("a", 1, ttl=60)
+        cache.put("b", 2, ttl=60)
+        cache.get("a")  # "b" is now least recently used
+
+        cache.put("c", 3, ttl=60)
+
+        assert evicted == ["b"]
+        assert list(cache) == ["a", "c"]
+
+    def test_replacing_key_does_not_evict(self):
+        evicted = []
+        cache = ResponseCache(name="test", max_entries=2, on_evict=evicted.append)
+        cache.put("a", 1, ttl=60)
+        cache.put("b", 2, ttl=60)
+
+        cache.put("a", 10, ttl=60)
+
+        assert evicted == []
+        assert cache.get("a").payload == 10
+
+    def test_max_bytes_counts_body_and_payload(self):
+        cache = ResponseCache(name="test", max_entries=10, max_bytes=60)
+        first = cache.put("a", {"v": "x" * 10})
+        cache.put("b", {"v": "y" * 10})
+
+        assert "a" not in cache
+        assert cache.total_bytes == 2 * len(first.body)
+
+    def test_invalidate_by_prefix(self):
+        cache = ResponseCache(name="test", max_entries=4)
+        cache.put("ohlc:AAPL:D", 1, ttl=60)
+        cache.put("ohlc:AAPL:5", 2, ttl=60)
+        cache.put("ohlc:MSFT:D", 3, ttl=60)
+
+        assert cache.invalidate("ohlc:AAPL:") == 2
+        assert list(cache) == ["ohlc:MSFT:D"]
+        assert cache.invalidate() == 1
+        assert len(cache) == 0
+
+
+class TestEtagMatches:
+    """Tests for If-None-Match comparison."""
+
+    def test_exact_match(self):
+        assert etag_matches('"abc"', '"abc"')
+
+    def test_list_and_weak_match(self):
+        assert etag_matches('"x", W/"abc"', '"abc"')
+
+    def test_wildcard(self):
+        assert etag_matches("*", '"abc"')
+
+    def test_no_match(self):
+        assert not etag_matches('"other"', '"abc"')
+        assert not etag_matches(None, '"abc"')
+
+
+class TestCachedJsonResponse:
+    """Tests for 200/304 response building."""
+
+    def test_returns_body_with_etag(self):
+        entry = ResponseCache(name="test", max_entries=1).put("k", {"a": 1}, ttl=60)
+
+        response = cached_json_response(entry, _event(), {"X-Cache-Source": "x"})
+
+        assert response.status_code == 200
+        assert response.body == entry.body
+        assert response.headers["ETag"] == entry.etag
+        assert response.headers["X-Cache-Source"] == "x"
+
+    def test_returns_304_when_etag_matches(self):
+        entry = ResponseCache(name="test", max_entries=1).put("k", {"a": 1}, ttl=60)
+
+        response = cached_json_response(entry, _event(entry.etag))
+
+        assert response.status_code == 304
+        assert response.body == ""
+        assert response.headers["ETag"] == entry.etag
@@ -1,6 +1,7 @@
 """Unit tests for rate limiting middleware (T164)."""
 
-from unittest.mock import MagicMock
+from datetime import UTC, datetime
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -8,12 +9,26 @@ from src.lambdas.shared.middleware.rate_limit import (
     DEFAULT_RATE_LIMITS,
     RateLimitExceeded,
     RateLimitResult,
+    _window_sk,
     check_rate_limit,
+    clear_rate_limit_state,
+    flush_rate_limit_counters,
     get_client_ip,
     get_rate_limit_headers,
 )
 
 
+def _window_counts(mock_table, previous=0, current=0, window_seconds=3600):
+    """Make the window-counter query return the given counts."""
+    index = int(datetime.now(UTC).timestamp() // window_seconds)
+    items = []
+    if previous:
+        items.append({"SK": _window_sk(index - 1), "request_count": previous})
+    if current:
+        items.append({"SK": _window_sk(index), "request_count": current})
+    mock_table.query.return_value = {"Items": items}
+
+
 class TestGetClientIp:
     """Tests for get_client_ip function."""
 
@@ -88,26 +103,37 @@ class TestGetClientIp:
 class TestCheckRateLimit:
     """Tests for check_rate_limit function."""
 
+    @pytest.fixture(autouse=True)
+    def reset_state(self):
+        """Start each test with no local buckets or pending counters."""
+        clear_rate_limit_state()
+        yield
+        clear_rate_limit_state()
+
     @pytest.fixture
     def mock_table(self):
         """Create mock DynamoDB table."""
         return MagicMock()
 
     def test_allows_within_limit(self, mock_table):
-        """Allows requests within limit."""
+        """Allows requests within limit and flushes one counter ADD."""
         mock_table.query.return_value = {"Items": []}
 
         result = check_rate_limit(mock_table, "1.2.3.4", "config_create")
 
         assert result.allowed is True
         assert result.remaining >= 0
-        mock_table.put_item.assert_called_once()
+        assert flush_rate_limit_counters() == 1
+        call_args = mock_table.update_item.call_args[1]
+        assert "ADD request_count :count" in call_args["UpdateExpression"]
+        assert call_args["ExpressionAttributeValues"][":count"] == 1
+        mock_table.put_item.assert_not_called()
 
     def test_blocks_when_limit_exceeded(self, mock_table):
         """Blocks requests when limit exceeded."""
-        # Return items equal to the limit
+        # Current window already holds the limit
         limit = DEFAULT_RATE_LIMITS["config_create"]["limit"]
-        mock_table.query.return_value = {"Items": [{"id": i} for i in range(limit)]}
+        _window_counts(mock_table, current=limit)
 
         result = check_rate_limit(mock_table, "1.2.3.4", "config_create")
 
@@ -115,9 +141,86 @@ class TestCheckRateLimit:
         assert result.remaining == 0
         assert result.retry_after is not None
 
+    def test_weights_previous_window(self, mock_table):
+        """The previous window counts by its overlap with the sliding window."""
+        with patch(
+            "src.lambdas.shared.middleware.rate_limit.datetime"
+        ) as mock_datetime:
+            # 15s into the current window: 75% of the previous one overlaps
+            mock_datetime.now.return_value = datetime.fromtimestamp(
+                60 * 1_000_000 + 15, tz=UTC
+            )
+            mock_table.query.return_value = {
+                "Items": [{"SK": "WINDOW#000000999999", "request_count": 100}]
+            }
+            result = check_rate_limit(mock_table, "1.2.3.4", "default", custom_limit=80)
+
+        assert result.allowed is True
+        assert result.remaining == 80 - 75 - 1
+        values = mock_table.query.call_args.kwargs["ExpressionAttributeValues"]
+        assert values[":prev"] == "WINDOW#000000999999"
+        assert values[":curr"] == "WINDOW#000001000000"
+
+    def test_window_keys_sort_numerically(self):
+        """BETWEEN on SK must still cover both windows when a digit is added."""
+        assert _window_sk(999_999) < _window_sk(1_000_000)
+        assert _window_sk(9) < _window_sk(10) < _window_sk(11)
+
+    def test_denied_client_skips_dynamodb(self, mock_table):
+        """After a denial the client is denied locally until it can pass."""
+        limit = DEFAULT_RATE_LIMITS["config_create"]["limit"]
+        _window_counts(mock_table, current=limit)
+
+        check_rate_limit(mock_table, "1.2.3.4", "config_create")
+        result = check_rate_limit(mock_table, "1.2.3.4", "config_create")
+
+        assert result.allowed is False
+        mock_table.query.assert_called_once()
+
+    def test_local_bucket_absorbs_flood(self, mock_table):
+        """Requests beyond the limit in one environment never reach DynamoDB."""
+        mock_table.query.return_value = {"Items": []}
+
+        results = [
+            check_rate_limit(mock_table, "1.2.3.4", "default", custom_limit=3)
+            for _ in range(10)
+        ]
+
+        assert [r.allowed for r in results] == [True] * 3 + [False] * 7
+        assert mock_table.query.call_count == 3
+
+    def test_pending_requests_count_before_flush(self, mock_table):
+        """Unflushed requests in this environment count toward the limit."""
+        mock_table.query.return_value = {"Items": []}
+
+        with patch(
+            "src.lambdas.shared.middleware.rate_limit._get_local_limit"
+        ) as mock_local:
+            # Bypass the local bucket to exercise the counter estimate
+            mock_local.return_value.denied_until = 0
+            mock_local.return_value.bucket.available = 100
+            results = [
+                check_rate_limit(mock_table, "1.2.3.4", "default", custom_limit=2)
+                for _ in range(3)
+            ]
+
+        assert [r.allowed for r in results] == [True, True, False]
+
+    def test_coalesces_counter_writes(self, mock_table):
+        """Requests from one client flush as a single ADD."""
+        mock_table.query.return_value = {"Items": []}
+
+        for _ in range(3):
+            check_rate_limit(mock_table, "1.2.3.4", "default")
+        flush_rate_limit_counters()
+
+        mock_table.update_item.assert_called_once()
+        call_args = mock_table.update_item.call_args[1]
+        assert call_args["ExpressionAttributeValues"][":count"] == 3
+
     def test_uses_custom_limit(self, mock_table):
         """Uses custom limit when provided."""
-        mock_table.query.return_value = {"Items": [{"id": "1"}, {"id": "2"}]}
+        _window_counts(mock_table, current=2, window_seconds=60)
 
         result = check_rate_limit(mock_table, "1.2.3.4", "default", custom_limit=2)
 
@@ -156,6 +259,15 @@ class TestCheckRateLimit:
 
         assert result.allowed is True
 
+    def test_flush_error_is_logged(self, mock_table):
+        """A failed counter write is dropped, not raised."""
+        mock_table.query.return_value = {"Items": []}
+        mock_table.update_item.side_effect = Exception("DB error")
+
+        check_rate_limit(mock_table, "1.2.3.4", "config_create")
+
+        assert flush_rate_limit_counters() == 0
+
     def test_default_action_fallback(self, mock_table):
         """Uses default limits for unknown action."""
         mock_table.query.return_value = {"Items": []}
@@ -0,0 +1,210 @@
+"""Unit tests for the sentiment-price correlation engine."""
+
+import math
+import random
+
+import pytest
+
+from src.lambdas.shared import correlation
+from src.lambdas.shared.correlation import (
+    AlignedSeries,
+    align_sentiment_returns,
+    correlate_batch,
+)
+
+
+def _series(sentiment: list[float], returns: list[float]) -> AlignedSeries:
+    return AlignedSeries(
+        timestamps=[float(i * 300) for i in range(len(sentiment))],
+        sentiment=list(sentiment),
+        returns=list(returns),
+    )
+
+
+def _drop(series: AlignedSeries, every: int) -> AlignedSeries:
+    """Remove every `every`-th bucket, leaving gaps in the grid."""
+    keep = [i for i in range(len(series)) if i % every != every - 1]
+    return AlignedSeries(
+        timestamps=[series.timestamps[i] for i in keep],
+        sentiment=[series.sentiment[i] for i in keep],
+        returns=[series.returns[i] for i in keep],
+        bucket_seconds=300,
+    )
+
+
+def _random_series(n: int, seed: int) -> AlignedSeries:
+    rng = random.Random(seed)
+    sentiment = [rng.uniform(-1, 1) for _ in range(n)]
+    returns = [s * 0.01 + rng.gauss(0, 0.01) for s in sentiment]
+    return _series(sentiment, returns)
+
+
+@pytest.fixture(params=["numpy", "python"])
+def backend(request, monkeypatch):
+    """Run a test on both the NumPy and the pure-Python path."""
+    if request.param == "python":
+        monkeypatch.setattr(correlation, "np", None)
+    elif correlation.np is None:
+        pytest.skip("numpy not installed")
+    return request.param
+
+
+class TestAlignSentimentReturns:
+    """Tests for joining sentiment buckets with price returns."""
+
+    def test_joins_on_bucket_start(self):
+        aligned = align_sentiment_returns(
+            sentiment_timestamps=[600.0, 0.0, 300.0, 900.0],
+            sentiment_values=[0.3, 0.1, 0.2, 0.4],
+            price_timestamps=[0.0, 300.0, 610.0],
+            closes=[100.0, 110.0, 99.0],
+            bucket_seconds=300,
+        )
+
+        # First candle has no previous close; bucket 900 has no candle
+        assert aligned.timestamps == [300.0, 600.0]
+        assert aligned.sentiment == [0.2, 0.3]
+        assert aligned.returns == pytest.approx([0.1, -0.1])
+        assert aligned.grid_positions() == [0, 1]
+
+    def test_empty_inputs(self):
+        assert len(align_sentiment_returns([], [], [], [], 60)) == 0
+
+
+class TestCorrelateBatch:
+    """Tests for correlation statistics on both backends."""
+
+    def test_perfect_correlation(self, backend):
+        sentiment = [math.sin(i / 3) for i in range(40)]
+        series = _series(sentiment, [s * 0.02 for s in sentiment])
+
+        stats = correlate_batch({"AAPL": series})["AAPL"]
+
+        assert stats.sample_size == 40
+        assert stats.pearson == pytest.approx(1.0)
+        assert stats.spearman == pytest.approx(1.0)
+        assert stats.best_lag == 0
+
+    def test_spearman_is_rank_based(self, backend):
+        sentiment = [float(i) for i in range(20)]
+        series = _series(sentiment, [math.exp(s / 2) for s in sentiment])
+
+        stats = correlate_batch({"AAPL": series})["AAPL"]
+
+        assert stats.pearson < 0.9
+        assert stats.spearman == pytest.approx(1.0)
+
+    def test_spearman_averages_tied_ranks(self, backend):
+        sentiment = [1.0, 1.0, 2.0, 3.0] * 5
+        returns = [0.1, 0.2, 0.3, 0.4] * 5
+
+        stats = correlate_batch({"AAPL": _series(sentiment, returns)})["AAPL"]
+
+        assert stats.spearman == pytest.approx(0.9486832980505138)
+
+    def test_detects_sentiment_leading_returns(self, backend):
+        rng = random.Random(7)
+        sentiment = [rng.uniform(-1, 1) for _ in range(60)]
+        returns = [0.0, 0.0] + [s * 0.01 for s in sentiment[:-2]]
+
+        stats = correlate_batch({"AAPL": _series(sentiment, returns)})["AAPL"]
+
+        assert stats.best_lag == 2
+        assert stats.best_lag_correlation == pytest.approx(1.0)
+        assert set(stats.lag_correlations) == set(range(-5, 6))
+
+    def test_too_few_samples_give_none(self, backend):
+        stats = correlate_batch({"AAPL": _random_series(5, seed=1)})["AAPL"]
+
+        assert stats.pearson is None
+        assert stats.spearman is None
+        assert stats.best_lag is None
+        assert stats.sentiment_trend == "stable"
+
+    def test_constant_series_gives_none(self, backend):
+        series = _series([0.5] * 30, [0.01 * (i % 3) for i in range(30)])
+
+        stats = correlate_batch({"AAPL": series})["AAPL"]
+
+        assert stats.pearson is None
+        assert stats.spearman is None
+
+    def test_rolling_window(self, backend):
+        stats = correlate_batch({"AAPL": _random_series(30, seed=3)}, window=10)["AAPL"]
+
+        assert len(stats.rolling_pearson) == 21
+        assert all(r is not None and -1 <= r <= 1 for r in stats.rolling_pearson)
+
+    def test_lags_count_buckets_across_gaps(self, backend):
+        rng = random.Random(11)
+        sentiment = [rng.uniform(-1, 1) for _ in range(80)]
+        returns = [0.0] + [s * 0.01 for s in sentiment[:-1]]
+        series = _drop(_series(sentiment, returns), every=7)
+
+        stats = correlate_batch({"AAPL": series})["AAPL"]
+
+        assert stats.sample_size == len(series)
+        assert stats.best_lag == 1
+        assert stats.best_lag_correlation == pytest.approx(1.0)
+
+    def test_rolling_window_skips_gaps(self, backend):
+        series = _drop(_random_series(30, seed=3), every=16)
+
+        stats = correlate_batch({"AAPL": series}, window=10)["AAPL"]
+
+        # One entry per grid bucket; windows covering bucket 15 are undefined
+        assert len(stats.rolling_pearson) == 21
+        assert stats.rolling_pearson[6:16] == [None] * 10
+        assert all(r is not None for r in stats.rolling_pearson[:6])
+        assert all(r is not None for r in stats.rolling_pearson[16:])
+
+    def test_trends(self, backend):
+        sentiment = [-0.5 + i * 0.025 for i in range(40)]
+        returns = [(0.001 if i < 20 else 0.01) * (-1) ** i for i in range(40)]
+
+        stats = correlate_batch({"AAPL": _series(sentiment, returns)})["AAPL"]
+
+        assert stats.sentiment_trend == "increasing"
+        assert stats.volatility_trend == "increasing"
+
+    def test_rejects_short_window(self):
+        with pytest.raises(ValueError):
+            correlate_batch({"AAPL": _random_series(30, seed=1)}, window=1)
+
+
+class TestBackendParity:
+    """The NumPy batch path must match the pure-Python path."""
+
+    def test_uneven_batch_matches_python(self, monkeypatch):
+        if correlation.np is None:
+            pytest.skip("numpy not installed")
+        batch = {
+            "AAPL": _random_series(200, seed=1),
+            "MSFT": _random_series(37, seed=2),
+            "TSLA": _random_series(4, seed=3),
+            "NVDA": AlignedSeries(),
+            "AMZN": _drop(_random_series(90, seed=4), every=5),
+        }
+
+        vectorized = correlate_batch(batch)
+        monkeypatch.setattr(correlation, "np", None)
+        reference = correlate_batch(batch)
+
+        for ticker, expected in reference.items():
+            actual = vectorized[ticker]
+            assert actual.sample_size == expected.sample_size
+            assert actual.best_lag == expected.best_lag
+            assert actual.sentiment_trend == expected.sentiment_trend
+            assert actual.volatility_trend == expected.volatility_trend
+            for got, want in [
+                (actual.pearson, expected.pearson),
+                (actual.spearman, expected.spearman),
+                *zip(actual.rolling_pearson, expected.rolling_pearson, strict=True),
+                *(
+                    (actual.lag_correlations[lag], r)
+                    for lag, r in expected.lag_correlations.items()
+                ),
+            ]:
+                assert (got is None) == (want is None)
+                if want is not None:
+                    assert got == pytest.approx(want, abs=1e-9)
@@ -0,0 +1,172 @@
+"""Unit tests for materialized dashboard metric counters."""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+import boto3
+import pytest
+from moto import mock_aws
+
+from src.lambdas.shared.metric_counters import (
+    CounterBatch,
+    read_window_counts,
+    ticker_counts,
+    window_keys,
+)
+
+
+@pytest.fixture
+def counters_table():
+    with mock_aws():
+        dynamodb = boto3.resource("dynamodb", region_name="us-east-1")
+        table = dynamodb.create_table(
+            TableName="test-sentiment-timeseries",
+            KeySchema=[
+                {"AttributeName": "PK", "KeyType": "HASH"},
+                {"AttributeName": "SK", "KeyType": "RANGE"},
+            ],
+            AttributeDefinitions=[
+                {"AttributeName": "PK", "AttributeType": "S"},
+                {"AttributeName": "SK", "AttributeType": "S"},
+            ],
+            BillingMode="PAY_PER_REQUEST",
+        )
+        yield table
+
+
+class TestWindowKeys:
+    """Tests for counter row selection."""
+
+    def test_partial_first_hour_uses_minute_rows(self):
+        end = datetime(2026, 10, 16, 14, 20, 30, tzinfo=UTC)
+
+        keys = window_keys(end - timedelta(hours=1), end)
+
+        assert keys[0] == "COUNTER#m#2026-10-16T13:20"
+        assert keys[39] == "COUNTER#m#2026-10-16T13:59"
+        assert keys[40:] == ["COUNTER#h#2026-10-16T14"]
+
+    def test_hour_aligned_start_uses_hour_rows(self):
+        end = datetime(2026, 10, 16, 14, 20, tzinfo=UTC)
+
+        keys = window_keys(datetime(2026, 10, 16, 12, tzinfo=UTC), end)
+
+        assert keys == [
+            "COUNTER#h#2026-10-16T12",
+            "COUNTER#h#2026-10-16T13",
+            "COUNTER#h#2026-10-16T14",
+        ]
+
+    def test_window_within_one_hour(self):
+        start = datetime(2026, 10, 16, 14, 5, tzinfo=UTC)
+
+        keys = window_keys(start, start + timedelta(minutes=3))
+
+        assert keys == [
+            "COUNTER#m#2026-10-16T14:05",
+            "COUNTER#m#2026-10-16T14:06",
+            "COUNTER#m#2026-10-16T14:07",
+        ]
+
+    def test_key_count_is_bounded_by_window_not_items(self):
+        end = datetime(2026, 10, 16, 14, 20, 30, tzinfo=UTC)
+
+        assert len(window_keys(end - timedelta(hours=168), end)) <= 60 + 169
+
+
+class TestCounterBatch:
+    """Tests for in-memory accumulation and flushing."""
+
+    def test_merges_increments_per_row(self):
+        now = datetime.now(UTC).replace(second=10)
+        batch = CounterBatch()
+        batch.record_ingested(now, ["AAPL"])
+        batch.record_ingested(now.replace(second=40), ["AAPL", "MSFT"])
+        table = MagicMock()
+
+        assert batch.flush(table) == 2  # one minute row + one hour row
+        kwargs = table.update_item.call_args_list[0].kwargs
+        adds = {
+            kwargs["ExpressionAttributeNames"][name]: kwargs[
+                "ExpressionAttributeValues"
+            ][name.replace("#", ":")]
+            for name in kwargs["ExpressionAttributeNames"]
+            if name != "#ttl"
+        }
+        assert adds == {"ingested": 2, "ticker:AAPL": 2, "ticker:MSFT": 1}
+        assert len(batch) == 0
+
+    def test_skips_timestamps_past_retention(self):
+        batch = CounterBatch()
+        batch.record_analyzed(datetime.now(UTC) - timedelta(days=30), "positive")
+        batch.record_analyzed("not-a-timestamp", "positive")
+
+        assert len(batch) == 0
+
+    def test_flush_failure_is_logged_not_raised(self, caplog):
+        batch = CounterBatch()
+        batch.record_analyzed(datetime.now(UTC), "negative")
+        table = MagicMock()
+        table.update_item.side_effect = Exception("throttled")
+
+        assert batch.flush(table) == 0
+        assert "Failed to flush metric counters" in caplog.text
+
+    def test_flush_without_table_drops_increments(self):
+        batch = CounterBatch()
+        batch.record_analyzed(datetime.now(UTC), "negative")
+
+        assert batch.flush(None) == 0
+        assert len(batch) == 0
+
+
+class TestReadWindowCounts:
+    """Tests for summing counter rows over windows."""
+
+    def test_round_trip(self, counters_table):
+        now = datetime.now(UTC)
+        batch = CounterBatch()
+        batch.record_ingested(now - timedelta(minutes=5), ["AAPL"])
+        batch.record_analyzed(now - timedelta(minutes=5), "positive")
+        batch.record_ingested(now - timedelta(hours=3), ["MSFT"])
+        batch.record_analyzed(now - timedelta(hours=3), "negative")
+        batch.flush(counters_table)
+
+        counts = read_window_counts(
+            counters_table,
+            {"1h": timedelta(hours=1), "24h": timedelta(hours=24)},
+            now=now,
+        )
+
+        assert counts["1h"]["ingested"] == 1
+        assert counts["1h"]["positive"] == 1
+        assert counts["1h"]["negative"] == 0
+        assert counts["24h"]["ingested"] == 2
+        assert counts["24h"]["analyzed"] == 2
+        assert ticker_counts(counts["24h"]) == {"AAPL": 1, "MSFT": 1}
+
+    def test_rows_use_timeseries_keys(self, counters_table):
+        now = datetime.now(UTC)
+        batch = CounterBatch()
+        batch.record_analyzed(now, "positive")
+        batch.flush(counters_table)
+
+        item = counters_table.get_item(
+            Key={"PK": f"COUNTER#m#{now:%Y-%m-%dT%H:%M}", "SK": "COUNTS"}
+        )["Item"]
+        assert item["positive"] == 1
+        assert "ttl" in item
+
+    def test_unprocessed_keys_exhausted_raises(self):
+        table = MagicMock()
+        table.name = "items"
+        table.meta.client.batch_get_item.return_value = {
+            "Responses": {"items": []},
+            "UnprocessedKeys": {"items": {"Keys": [{}]}},
+        }
+
+        with (
+            patch("src.lambdas.shared.metric_counters.time.sleep"),
+            pytest.raises(RuntimeError),
+        ):
+            read_window_counts(table, {"1h": timedelta(hours=1)})
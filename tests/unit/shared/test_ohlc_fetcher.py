@@ -0,0 +1,216 @@
+"""Unit tests for the concurrent multi-ticker OHLC fetcher."""
+
+import threading
+import time
+from datetime import UTC, datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.lambdas.shared.adapters.base import OHLCCandle
+from src.lambdas.shared.cache.ohlc_cache import CandleColumns
+from src.lambdas.shared.ohlc_fetcher import (
+    _last_completed_session,
+    fetch_daily_ohlc_batch,
+)
+
+END = datetime.now(UTC)
+START = END - timedelta(days=30)
+
+
+def _candles(n: int = 3, close: float = 100.0) -> list[OHLCCandle]:
+    return [
+        OHLCCandle(
+            date=END - timedelta(days=n - i),
+            open=close,
+            high=close + 1,
+            low=close - 1,
+            close=close,
+            volume=1000,
+        )
+        for i in range(n)
+    ]
+
+
+def _columns(last: datetime, n: int = 3) -> CandleColumns:
+    columns = CandleColumns(source="tiingo", resolution="D")
+    for i in range(n):
+        columns.timestamps.append((last - timedelta(days=n - 1 - i)).timestamp())
+        columns.open.append(1.0)
+        columns.high.append(2.0)
+        columns.low.append(0.5)
+        columns.close.append(1.5)
+        columns.volume.append(10)
+    return columns
+
+
+@pytest.fixture
+def release():
+    """Event that blocks slow fake adapters until the test ends."""
+    event = threading.Event()
+    yield event
+    event.set()
+
+
+@pytest.fixture(autouse=True)
+def ohlc_cache():
+    """Stub the persistent OHLC cache (empty unless a test fills it)."""
+    with (
+        patch(
+            "src.lambdas.shared.ohlc_fetcher.get_cached_candle_columns",
+            return_value=CandleColumns(source="tiingo", resolution="D"),
+        ) as mock_read,
+        patch("src.lambdas.shared.ohlc_fetcher.put_cached_candles") as mock_write,
+    ):
+        yield mock_read, mock_write
+
+
+def _slow_adapter(release: threading.Event, candles=None) -> MagicMock:
+    def get_ohlc(ticker, start_date=None, end_date=None):
+        release.wait(5)
+        return candles or []
+
+    adapter = MagicMock()
+    adapter.get_ohlc.side_effect = get_ohlc
+    return adapter
+
+
+class TestCacheRead:
+    """Tests for serving from the persistent cache."""
+
+    def test_fresh_cache_skips_upstream(self, ohlc_cache):
+        mock_read, _ = ohlc_cache
+        mock_read.return_value = _columns(END)
+        tiingo = MagicMock()
+
+        result = fetch_daily_ohlc_batch(["AAPL"], START, END, tiingo_adapter=tiingo)
+
+        assert len(result["AAPL"]) == 3
+        tiingo.get_ohlc.assert_not_called()
+
+    def test_stale_cache_fetches_live(self, ohlc_cache):
+        mock_read, mock_write = ohlc_cache
+        mock_read.return_value = _columns(END - timedelta(days=10))
+        tiingo = MagicMock()
+        tiingo.get_ohlc.return_value = _candles()
+
+        result = fetch_daily_ohlc_batch(["AAPL"], START, END, tiingo_adapter=tiingo)
+
+        assert result["AAPL"] == _candles()
+        mock_write.assert_called_once()
+
+    def test_too_few_cached_candles_fetches_live(self, ohlc_cache):
+        mock_read, _ = ohlc_cache
+        mock_read.return_value = _columns(END, n=3)
+        tiingo = MagicMock()
+        tiingo.get_ohlc.return_value = _candles(20)
+
+        result = fetch_daily_ohlc_batch(
+            ["AAPL"], START, END, tiingo_adapter=tiingo, min_candles=14
+        )
+
+        assert len(result["AAPL"]) == 20
+
+    def test_last_completed_session_skips_weekend(self):
+        monday = datetime(2026, 10, 12).date()
+
+        assert _last_completed_session(monday).isoformat() == "2026-10-09"
+
+
+class TestHedging:
+    """Tests for Tiingo/Finnhub hedging and the deadline."""
+
+    def test_slow_tiingo_is_hedged_with_finnhub(self, release, ohlc_cache):
+        _, mock_write = ohlc_cache
+        tiingo = _slow_adapter(release)
+        finnhub = MagicMock()
+        finnhub.get_ohlc.return_value = _candles(close=50.0)
+
+        start = time.monotonic()
+        result = fetch_daily_ohlc_batch(
+            ["AAPL"],
+            START,
+            END,
+            tiingo_adapter=tiingo,
+            finnhub_adapter=finnhub,
+            hedge_after=0.05,
+            deadline=2,
+        )
+
+        assert time.monotonic() - start < 1
+        assert result["AAPL"][0].close == 50.0
+        mock_write.assert_not_called()  # only Tiingo data is cached
+
+    def test_failed_tiingo_falls_back_without_waiting(self):
+        tiingo = MagicMock()
+        tiingo.get_ohlc.side_effect = Exception("Tiingo error")
+        finnhub = MagicMock()
+        finnhub.get_ohlc.return_value = _candles()
+
+        start = time.monotonic()
+        result = fetch_daily_ohlc_batch(
+            ["AAPL"],
+            START,
+            END,
+            tiingo_adapter=tiingo,
+            finnhub_adapter=finnhub,
+            hedge_after=5,
+        )
+
+        assert time.monotonic() - start < 1
+        assert "AAPL" in result
+
+    def test_fast_tiingo_is_not_hedged(self):
+        tiingo = MagicMock()
+        tiingo.get_ohlc.return_value = _candles()
+        finnhub = MagicMock()
+
+        fetch_daily_ohlc_batch(
+            ["AAPL", "MSFT"],
+            START,
+            END,
+            tiingo_adapter=tiingo,
+            finnhub_adapter=finnhub,
+            hedge_after=5,
+        )
+
+        finnhub.get_ohlc.assert_not_called()
+
+    def test_deadline_bounds_latency(self, release):
+        start = time.monotonic()
+        result = fetch_daily_ohlc_batch(
+            ["AAPL", "MSFT"],
+            START,
+            END,
+            tiingo_adapter=_slow_adapter(release, _candles()),
+            finnhub_adapter=_slow_adapter(release, _candles()),
+            hedge_after=0.01,
+            deadline=0.2,
+        )
+
+        assert time.monotonic() - start < 1
+        assert result == {}
+
+    def test_parallelism_is_bounded(self):
+        lock = threading.Lock()
+        active = [0, 0]  # current, peak
+
+        def get_ohlc(ticker, start_date=None, end_date=None):
+            with lock:
+                active[0] += 1
+                active[1] = max(active[1], active[0])
+            time.sleep(0.02)
+            with lock:
+                active[0] -= 1
+            return _candles()
+
+        tiingo = MagicMock()
+        tiingo.get_ohlc.side_effect = get_ohlc
+        tickers = [f"T{i}" for i in range(12)]
+
+        result = fetch_daily_ohlc_batch(
+            tickers, START, END, tiingo_adapter=tiingo, max_workers=3
+        )
+
+        assert set(result) == set(tickers)
+        assert 1 < active[1] <= 3
@@ -252,6 +252,47 @@ class TestTickerCacheSearch:
         results = ticker_cache.search("ZZZZZ")
         assert len(results) == 0
 
+    def test_search_ranks_symbol_before_name_matches(self, ticker_cache: TickerCache):
+        """Symbol prefix matches rank ahead of name matches, without repeats."""
+        results = ticker_cache.search("m")
+        # MSFT, META by symbol prefix; JPM by name ("JPMorgan")
+        assert [r.symbol for r in results] == ["MSFT", "META", "JPM"]
+
+    def test_search_name_matches_in_list_order(self, ticker_cache: TickerCache):
+        """Name matches keep ticker list order."""
+        results = ticker_cache.search("co")
+        assert [r.symbol for r in results] == ["MSFT", "JPM"]
+
+    def test_search_short_name_query(self, ticker_cache: TickerCache):
+        """Two-character queries match inside company names."""
+        results = ticker_cache.search("rg")
+        assert [r.symbol for r in results] == ["JPM"]
+
+    def test_search_matches_linear_scan(self):
+        """Indexed search returns what a full scan of the ticker file would."""
+        cache = TickerCache.load_from_file("infrastructure/data/us-symbols.json")
+
+        def linear_search(query: str, limit: int) -> list[str]:
+            active = [t for t in cache.symbols.values() if t.is_active]
+            results = []
+            exact = cache.symbols.get(query.upper())
+            if exact is not None and exact.is_active:
+                results.append(exact.symbol)
+            for t in active:
+                if t.symbol.startswith(query.upper()) and t.symbol not in results:
+                    results.append(t.symbol)
+            for t in active:
+                if query.lower() in t.name.lower() and t.symbol not in results:
+                    results.append(t.symbol)
+            return results[:limit]
+
+        queries = ["", "a", "AA", "app", "Corp", "inc.", "goog", "T", "xyz", "ma"]
+        for query in queries:
+            for limit in (1, 5, 10):
+                assert [r.symbol for r in cache.search(query, limit)] == (
+                    linear_search(query, limit)
+                ), query
+
 
 class TestTickerCacheValidate:
     """Tests for TickerCache validate functionality."""
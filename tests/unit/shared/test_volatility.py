@@ -1,14 +1,19 @@
 """Unit tests for ATR volatility calculator."""
 
+import random
 from datetime import UTC, datetime, timedelta
+from unittest.mock import patch
 
 import pytest
 
 from src.lambdas.shared.adapters.base import OHLCCandle
 from src.lambdas.shared.volatility import (
     ATRResult,
+    atr_series,
+    atr_series_batch,
     calculate_atr,
     calculate_atr_result,
+    calculate_atr_results,
     calculate_true_range,
     classify_volatility,
 )
@@ -347,6 +352,113 @@ class TestCalculateATRResult:
         assert result is None
 
 
+def random_walk(n: int, seed: int) -> list[OHLCCandle]:
+    """Helper to create n candles with gaps and varying ranges."""
+    rng = random.Random(seed)
+    candles = []
+    close = 100.0
+    for i in range(n):
+        open_ = close + rng.uniform(-3, 3)
+        high = open_ + rng.uniform(0, 4)
+        low = open_ - rng.uniform(0, 4)
+        close = rng.uniform(low, high)
+        candles.append(make_candle(high, low, close, open_=open_, days_ago=n - i))
+    return candles
+
+
+class TestATRSeries:
+    """Tests for the rolling ATR series engine."""
+
+    def test_series_matches_recomputed_prefixes(self):
+        """Every series value equals a fresh ATR over the matching prefix."""
+        candles = random_walk(40, seed=1)
+
+        series = atr_series(candles, period=14)
+
+        assert len(series) == 40 - 14 + 1
+        for k, value in enumerate(series):
+            expected = calculate_true_range_sma(candles[: 14 + k], 14)
+            assert value == pytest.approx(expected)
+
+    def test_wilder_smoothing(self):
+        """Wilder seeds with the SMA then smooths each new true range."""
+        candles = [make_candle(110, 100, 105) for _ in range(3)]
+        candles.append(make_candle(125, 105, 120))  # TR = 20
+
+        series = atr_series(candles, period=3, smoothing="wilder")
+
+        assert series == pytest.approx([10.0, (10.0 * 2 + 20.0) / 3])
+
+    def test_insufficient_candles_returns_empty(self):
+        assert atr_series([make_candle(110, 100, 105)], period=14) == []
+
+    def test_rejects_unknown_smoothing(self):
+        with pytest.raises(ValueError):
+            atr_series(random_walk(20, seed=2), smoothing="ema")
+
+    @pytest.mark.parametrize("smoothing", ["sma", "wilder"])
+    def test_batch_matches_single_ticker(self, smoothing):
+        """Tickers of different lengths share one padded pass."""
+        by_ticker = {
+            "AAPL": random_walk(30, seed=3),
+            "MSFT": random_walk(19, seed=4),
+            "NEW": random_walk(5, seed=5),
+        }
+
+        batch = atr_series_batch(by_ticker, period=14, smoothing=smoothing)
+
+        for ticker, candles in by_ticker.items():
+            assert batch[ticker] == pytest.approx(atr_series(candles, 14, smoothing))
+        assert batch["NEW"] == []
+
+    @pytest.mark.parametrize("smoothing", ["sma", "wilder"])
+    def test_pure_python_fallback_matches_numpy(self, smoothing):
+        candles = random_walk(50, seed=6)
+        vectorized = atr_series(candles, 14, smoothing)
+
+        with patch("src.lambdas.shared.volatility.np", None):
+            fallback = atr_series(candles, 14, smoothing)
+
+        assert fallback == pytest.approx(vectorized)
+
+
+def calculate_true_range_sma(candles: list[OHLCCandle], period: int) -> float:
+    """Reference ATR: mean of the last `period` true ranges."""
+    trs = [
+        calculate_true_range(c.high, c.low, candles[i - 1].close if i else None)
+        for i, c in enumerate(candles)
+    ]
+    return sum(trs[-period:]) / period
+
+
+class TestCalculateATRResults:
+    """Tests for previous/trend values read from the series."""
+
+    def test_previous_atr_is_atr_of_prior_candle(self):
+        candles = random_walk(30, seed=7)
+
+        result = calculate_atr_result("AAPL", candles, period=14)
+
+        assert result.previous_atr == pytest.approx(
+            calculate_atr(candles[:-1], 14), abs=1e-4
+        )
+
+    def test_no_previous_atr_with_exactly_period_candles(self):
+        result = calculate_atr_result("AAPL", random_walk(14, seed=8), period=14)
+
+        assert result.previous_atr is None
+
+    def test_batch_results_match_single(self):
+        by_ticker = {"AAPL": random_walk(30, seed=9), "MSFT": random_walk(3, seed=10)}
+
+        results = calculate_atr_results(by_ticker, period=14)
+
+        single = calculate_atr_result("AAPL", by_ticker["AAPL"], period=14)
+        assert results["AAPL"].atr == single.atr
+        assert results["AAPL"].trend == single.trend
+        assert results["MSFT"] is None
+
+
 class TestClassifyVolatility:
     """Tests for classify_volatility function."""
 
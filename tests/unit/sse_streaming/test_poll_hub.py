@@ -0,0 +1,179 @@
+"""Unit tests for the shared SSE poll hub."""
+
+import asyncio
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+
+def _result(total: int, metrics_changed: bool = False):
+    from models import MetricsEventData
+    from polling import PollResult
+
+    return PollResult(
+        metrics=MetricsEventData(total=total, positive=0, neutral=0, negative=0),
+        metrics_changed=metrics_changed,
+        per_ticker={},
+        timeseries_buckets={},
+    )
+
+
+class FakePollingService:
+    """Polling service stub returning an increasing total each cycle."""
+
+    def __init__(self, poll_interval: float = 0.01):
+        self.poll_interval = poll_interval
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    async def poll(self):
+        with self._lock:
+            self.calls += 1
+            return _result(self.calls, metrics_changed=True)
+
+
+@pytest.fixture
+def hub():
+    from poll_hub import PollHub
+
+    hub = PollHub(FakePollingService())
+    yield hub
+    hub.close(timeout=1)
+
+
+async def _take(hub, n: int) -> list:
+    results = []
+    async for result in hub.subscribe():
+        results.append(result)
+        if len(results) == n:
+            break
+    return results
+
+
+class TestOffer:
+    """Tests for bounded per-subscriber queues."""
+
+    def test_drops_oldest_when_full(self):
+        from poll_hub import _offer
+
+        queue = asyncio.Queue(maxsize=2)
+        for total in (1, 2, 3):
+            _offer(queue, _result(total))
+
+        assert [queue.get_nowait().metrics.total for _ in range(2)] == [2, 3]
+
+    def test_carries_forward_metrics_changed(self):
+        from poll_hub import _offer
+
+        queue = asyncio.Queue(maxsize=1)
+        _offer(queue, _result(1, metrics_changed=True))
+        _offer(queue, _result(2, metrics_changed=False))
+
+        result = queue.get_nowait()
+        assert result.metrics.total == 2
+        assert result.metrics_changed is True
+
+
+class TestPollHub:
+    """Tests for PollHub fan-out."""
+
+    def test_single_subscriber_receives_results(self, hub):
+        results = asyncio.run(_take(hub, 3))
+
+        assert [r.metrics.total for r in results] == [1, 2, 3]
+
+    def test_concurrent_subscribers_share_polls(self, hub):
+        """Subscribers on separate threads/event loops share one poller."""
+        connections = 10
+        received: list[list] = [[] for _ in range(connections)]
+        ready = threading.Barrier(connections)
+
+        async def consume(i: int):
+            ready.wait()
+            received[i] = await _take(hub, 3)
+
+        threads = [
+            threading.Thread(target=asyncio.run, args=(consume(i),))
+            for i in range(connections)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(timeout=5)
+
+        assert all(len(r) == 3 for r in received)
+        # One poll per interval regardless of connection count
+        assert hub.poll_count < connections * 3
+
+    def test_unsubscribes_on_close(self, hub):
+        asyncio.run(_take(hub, 1))
+
+        assert hub.subscriber_count == 0
+
+    def test_late_subscriber_gets_latest_with_metrics_changed(self):
+        from poll_hub import PollHub
+
+        service = MagicMock()
+        service.poll_interval = 60
+        service.poll = MagicMock(side_effect=lambda: _coro(_result(7)))
+        hub = PollHub(service)
+        try:
+            hub._latest = _result(5)
+
+            async def first():
+                async for result in hub.subscribe():
+                    return result
+
+            result = asyncio.run(first())
+        finally:
+            hub.close(timeout=1)
+
+        assert result.metrics.total == 5
+        assert result.metrics_changed is True
+
+    def test_poll_errors_do_not_stop_hub(self):
+        from poll_hub import PollHub
+
+        service = FakePollingService()
+        real_poll = service.poll
+        failures = iter([RuntimeError("DynamoDB unavailable")])
+
+        async def flaky_poll():
+            error = next(failures, None)
+            if error:
+                raise error
+            return await real_poll()
+
+        service.poll = flaky_poll
+        hub = PollHub(service)
+        try:
+            results = asyncio.run(_take(hub, 2))
+        finally:
+            hub.close(timeout=1)
+
+        assert [r.metrics.total for r in results] == [1, 2]
+
+
+async def _coro(value):
+    return value
+
+
+class TestStreamGeneratorWiring:
+    """SSEStreamGenerator reads from the hub instead of polling itself."""
+
+    def test_uses_injected_hub(self):
+        from stream import SSEStreamGenerator
+
+        hub = MagicMock()
+        generator = SSEStreamGenerator(conn_manager=MagicMock(), poll_hub=hub)
+
+        assert generator._poll_results() is hub.subscribe.return_value
+
+    def test_explicit_poll_service_bypasses_hub(self):
+        from stream import SSEStreamGenerator
+
+        service = MagicMock()
+        generator = SSEStreamGenerator(conn_manager=MagicMock(), poll_service=service)
+
+        assert generator._poll_results() is service.poll_loop.return_value
@@ -306,3 +306,197 @@ class TestMetricsChange:
         )
 
         assert service._metrics_changed(old, new) is True
+
+
+def _sentiment_item(source_id, timestamp, sentiment, score, tickers, ttl=None):
+    item = {
+        "source_id": source_id,
+        "timestamp": timestamp,
+        "sentiment": sentiment,
+        "score": Decimal(score),
+        "matched_tickers": tickers,
+    }
+    if ttl is not None:
+        item["ttl_timestamp"] = ttl
+    return item
+
+
+class TestWindowAggregates:
+    """Tests for incremental running aggregates."""
+
+    @pytest.fixture
+    def items(self):
+        return [
+            _sentiment_item("a1", "2025-12-02T10:00:00Z", "positive", "0.8", ["AAPL"]),
+            _sentiment_item(
+                "a2", "2025-12-02T10:01:00Z", "negative", "-0.6", ["AAPL", "MSFT"]
+            ),
+            _sentiment_item("a3", "2025-12-02T10:02:00Z", "neutral", "0.1", ["MSFT"]),
+            _sentiment_item("a4", "2025-12-02T10:03:00Z", "positive", "0.4", ["MSFT"]),
+        ]
+
+    def test_matches_full_aggregation(self, items):
+        """Running aggregates equal the full-read aggregation of the same items."""
+        from src.lambdas.sse_streaming.polling import PollingService, WindowAggregates
+
+        service = PollingService(table_name="test-table")
+        window = WindowAggregates()
+        for item in items:
+            window.add(item)
+
+        # A full poll reads positive, neutral, then negative partitions
+        items = sorted(
+            items,
+            key=lambda i: ("positive", "neutral", "negative").index(i["sentiment"]),
+        )
+        expected = service._aggregate_metrics(items)
+        metrics = window.metrics()
+        assert (metrics.total, metrics.positive, metrics.neutral, metrics.negative) == (
+            expected.total,
+            expected.positive,
+            expected.neutral,
+            expected.negative,
+        )
+        assert metrics.by_tag == expected.by_tag
+        assert window.per_ticker() == service._compute_per_ticker_aggregates(items)
+
+    def test_re_adding_item_is_noop(self, items):
+        from src.lambdas.sse_streaming.polling import WindowAggregates
+
+        window = WindowAggregates()
+        for item in items + items:
+            window.add(item)
+
+        assert window.metrics().total == 4
+        assert window.per_ticker()["AAPL"].count == 2
+
+    def test_relabelled_item_replaces_contribution(self, items):
+        from src.lambdas.sse_streaming.polling import WindowAggregates
+
+        window = WindowAggregates()
+        for item in items:
+            window.add(item)
+        window.add({**items[0], "sentiment": "negative", "score": Decimal("-0.2")})
+
+        metrics = window.metrics()
+        assert metrics.positive == 1
+        assert metrics.negative == 2
+        assert window.per_ticker()["AAPL"].score == pytest.approx(-0.4)
+
+    def test_expire_retracts_aged_out_items(self):
+        from src.lambdas.sse_streaming.polling import WindowAggregates
+
+        window = WindowAggregates()
+        window.add(
+            _sentiment_item(
+                "a1", "2025-12-02T10:00:00Z", "positive", "0.8", ["AAPL"], ttl=100
+            )
+        )
+        window.add(
+            _sentiment_item(
+                "a2", "2025-12-02T10:01:00Z", "neutral", "0.1", ["MSFT"], ttl=200
+            )
+        )
+
+        assert window.expire(now=150) == 1
+        assert window.metrics().total == 1
+        assert window.metrics().by_tag == {"MSFT": 1}
+        assert "AAPL" not in window.per_ticker()
+
+    def test_watermark_tracks_latest_timestamp(self, items):
+        from datetime import UTC, datetime
+
+        from src.lambdas.sse_streaming.polling import WindowAggregates
+
+        window = WindowAggregates()
+        for item in reversed(items):
+            window.add(item)
+
+        assert window.watermark == datetime(2025, 12, 2, 10, 3, tzinfo=UTC)
+
+    def test_watermark_capped_at_now(self):
+        from datetime import UTC, datetime, timedelta
+
+        from src.lambdas.sse_streaming.polling import WindowAggregates
+
+        future = (datetime.now(UTC) + timedelta(days=1)).isoformat()
+        window = WindowAggregates()
+        window.add(_sentiment_item("a1", future, "positive", "0.8", ["AAPL"]))
+
+        assert window.watermark <= datetime.now(UTC)
+
+
+class TestIncrementalPoll:
+    """Tests for incremental (watermark) polling mode."""
+
+    @pytest.mark.asyncio
+    async def test_second_poll_queries_only_new_items(self):
+        from src.lambdas.sse_streaming.polling import PollingService
+
+        first = _sentiment_item(
+            "a1", "2025-12-02T10:00:00Z", "positive", "0.8", ["AAPL"]
+        )
+        second = _sentiment_item(
+            "a2", "2025-12-02T10:05:00Z", "negative", "-0.5", ["AAPL"]
+        )
+
+        def query(**kwargs):
+            sentiment = kwargs["ExpressionAttributeValues"][":sentiment"]
+            if ":since" in kwargs["ExpressionAttributeValues"]:
+                return {"Items": [second] if sentiment == "negative" else []}
+            return {"Items": [first] if sentiment == "positive" else []}
+
+        mock_table = MagicMock()
+        mock_table.query.side_effect = query
+        service = PollingService(table_name="test-table", incremental=True)
+        service._table = mock_table
+
+        first_result = await service.poll()
+        second_result = await service.poll()
+
+        incremental_calls = mock_table.query.call_args_list[3:]
+        assert len(incremental_calls) == 3
+        for call in incremental_calls:
+            kwargs = call[1]
+            assert "#ts > :since" in kwargs["KeyConditionExpression"]
+            assert kwargs["ExpressionAttributeNames"] == {"#ts": "timestamp"}
+            # Watermark minus the default 300s lookback
+            assert (
+                kwargs["ExpressionAttributeValues"][":since"] == "2025-12-02T09:55:00"
+            )
+
+        assert first_result.metrics.total == 1
+        assert second_result.metrics.total == 2
+        assert second_result.metrics_changed is True
+        assert second_result.per_ticker["AAPL"].count == 2
+
+    @pytest.mark.asyncio
+    async def test_full_resync_after_interval(self):
+        from src.lambdas.sse_streaming import polling
+        from src.lambdas.sse_streaming.polling import PollingService
+
+        mock_table = MagicMock()
+        mock_table.query.return_value = {
+            "Items": [
+                _sentiment_item(
+                    "a1", "2025-12-02T10:00:00Z", "positive", "0.8", ["AAPL"]
+                )
+            ]
+        }
+        service = PollingService(table_name="test-table", incremental=True)
+        service._table = mock_table
+
+        with patch.object(polling, "FULL_RESYNC_SECONDS", 0):
+            await service.poll()
+            await service.poll()
+
+        for call in mock_table.query.call_args_list:
+            assert ":since" not in call[1]["ExpressionAttributeValues"]
+
+    def test_incremental_defaults_to_env(self):
+        from src.lambdas.sse_streaming.polling import PollingService
+
+        with patch.dict("os.environ", {"SSE_INCREMENTAL_POLL": "true"}):
+            assert PollingService(table_name="test-table")._incremental is True
+        with patch.dict("os.environ", {"SSE_INCREMENTAL_POLL": "false"}):
+            assert PollingService(table_name="test-table")._incremental is False
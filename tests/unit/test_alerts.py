@@ -464,6 +464,20 @@ class TestDeleteAlert:
         assert result is True
         mock_table.delete_item.assert_called_once()
 
+    @patch("src.lambdas.dashboard.alerts.tracer")
+    def test_drops_warm_alert_index(
+        self, mock_xray, mock_table, user_id, sample_alert_item
+    ):
+        """Deleting a rule drops the evaluator's alert index."""
+        mock_table.get_item.return_value = {"Item": sample_alert_item}
+
+        with patch(
+            "src.lambdas.dashboard.alerts.invalidate_alert_index"
+        ) as mock_invalidate:
+            delete_alert(mock_table, user_id, sample_alert_item["alert_id"])
+
+        mock_invalidate.assert_called_once()
+
     @patch("src.lambdas.dashboard.alerts.tracer")
     def test_returns_false_for_not_found(self, mock_xray, mock_table, user_id):
         """Returns False when alert not found."""
@@ -31,6 +31,7 @@ from moto import mock_aws
 from src.lambdas.analysis.handler import (
     _emit_analysis_metrics,
     _update_item_with_sentiment,
+    _write_timeseries_fanout,
     lambda_handler,
 )
 
@@ -426,6 +427,193 @@ class TestLambdaHandler:
         return table
 
 
+class TestBatchProcessing:
+    """Tests for multi-record (SQS / batched SNS) events."""
+
+    SOURCE_IDS = ["article#batch1", "article#batch2", "article#batch3"]
+    TIMESTAMP = "2025-11-17T14:30:15.000Z"
+
+    def _setup_table(self):
+        dynamodb = boto3.resource("dynamodb", region_name="us-east-1")
+        dynamodb.create_table(
+            TableName="test-sentiment-items",
+            KeySchema=[
+                {"AttributeName": "source_id", "KeyType": "HASH"},
+                {"AttributeName": "timestamp", "KeyType": "RANGE"},
+            ],
+            AttributeDefinitions=[
+                {"AttributeName": "source_id", "AttributeType": "S"},
+                {"AttributeName": "timestamp", "AttributeType": "S"},
+            ],
+            BillingMode="PAY_PER_REQUEST",
+        )
+        table = dynamodb.Table("test-sentiment-items")
+        for source_id in self.SOURCE_IDS:
+            table.put_item(
+                Item={
+                    "source_id": source_id,
+                    "timestamp": self.TIMESTAMP,
+                    "status": "pending",
+                }
+            )
+        return table
+
+    def _message(self, source_id: str) -> dict:
+        return {
+            "source_id": source_id,
+            "timestamp": self.TIMESTAMP,
+            "text_for_analysis": f"text for {source_id}",
+            "model_version": "v1.0.0",
+        }
+
+    def _sqs_event(self, bodies: list[str]) -> dict:
+        return {
+            "Records": [
+                {"messageId": f"msg-{i}", "eventSource": "aws:sqs", "body": body}
+                for i, body in enumerate(bodies)
+            ]
+        }
+
+    @mock_aws
+    def test_sqs_batch_reports_partial_failures(self, env_vars, mock_context):
+        """Valid records are analyzed together; malformed ones are reported."""
+        table = self._setup_table()
+        bodies = [json.dumps(self._message(sid)) for sid in self.SOURCE_IDS[:2]]
+        bodies.append(json.dumps({"source_id": "article#broken"}))
+
+        with (
+            patch("src.lambdas.analysis.handler.load_model"),
+            patch("src.lambdas.analysis.handler.analyze_sentiment_batch") as mock_batch,
+            patch(
+                "src.lambdas.analysis.handler.get_model_load_time_ms",
+                return_value=0,
+            ),
+            patch("src.lambdas.analysis.handler.emit_metric"),
+            patch("src.lambdas.analysis.handler.emit_metrics_batch"),
+        ):
+            mock_batch.return_value = [("positive", 0.91), ("negative", 0.77)]
+            result = lambda_handler(self._sqs_event(bodies), mock_context)
+
+        mock_batch.assert_called_once_with(
+            ["text for article#batch1", "text for article#batch2"]
+        )
+        assert result["batchItemFailures"] == [{"itemIdentifier": "msg-2"}]
+        assert result["body"]["processed"] == 2
+        item = table.get_item(
+            Key={"source_id": "article#batch2", "timestamp": self.TIMESTAMP}
+        )["Item"]
+        assert item["status"] == "analyzed"
+        assert item["sentiment"] == "negative"
+
+    @mock_aws
+    def test_sns_envelope_in_sqs_body_unwrapped(self, env_vars, mock_context):
+        """SNS → SQS deliveries without raw delivery are unwrapped."""
+        self._setup_table()
+        envelope = {
+            "Type": "Notification",
+            "Message": json.dumps(self._message(self.SOURCE_IDS[0])),
+        }
+        event = self._sqs_event([json.dumps(envelope)])
+
+        with (
+            patch("src.lambdas.analysis.handler.load_model"),
+            patch(
+                "src.lambdas.analysis.handler.analyze_sentiment_batch",
+                return_value=[("neutral", 0.51)],
+            ),
+            patch(
+                "src.lambdas.analysis.handler.get_model_load_time_ms",
+                return_value=0,
+            ),
+            patch("src.lambdas.analysis.handler.emit_metric"),
+            patch("src.lambdas.analysis.handler.emit_metrics_batch"),
+        ):
+            result = lambda_handler(event, mock_context)
+
+        assert result["batchItemFailures"] == []
+        assert result["body"]["results"][0]["source_id"] == self.SOURCE_IDS[0]
+
+    @mock_aws
+    def test_inference_error_fails_whole_batch(self, env_vars, mock_context):
+        """Inference failure reports every parsed record for redelivery."""
+        from src.lambdas.analysis.sentiment import InferenceError
+
+        self._setup_table()
+        bodies = [json.dumps(self._message(sid)) for sid in self.SOURCE_IDS]
+
+        with (
+            patch("src.lambdas.analysis.handler.load_model"),
+            patch(
+                "src.lambdas.analysis.handler.analyze_sentiment_batch",
+                side_effect=InferenceError("boom"),
+            ),
+            patch(
+                "src.lambdas.analysis.handler.get_model_load_time_ms",
+                return_value=0,
+            ),
+            patch("src.lambdas.analysis.handler.emit_metric"),
+            patch("src.lambdas.analysis.handler.emit_metrics_batch"),
+        ):
+            result = lambda_handler(self._sqs_event(bodies), mock_context)
+
+        assert [f["itemIdentifier"] for f in result["batchItemFailures"]] == [
+            "msg-0",
+            "msg-1",
+            "msg-2",
+        ]
+        assert result["body"]["processed"] == 0
+
+    @mock_aws
+    def test_table_error_fails_whole_batch(self, env_vars, mock_context):
+        """A table lookup failure reports every parsed record for redelivery."""
+        bodies = [json.dumps(self._message(sid)) for sid in self.SOURCE_IDS]
+
+        with (
+            patch("src.lambdas.analysis.handler.load_model"),
+            patch(
+                "src.lambdas.analysis.handler.analyze_sentiment_batch",
+                return_value=[("neutral", 0.5)] * 3,
+            ),
+            patch(
+                "src.lambdas.analysis.handler.get_model_load_time_ms",
+                return_value=0,
+            ),
+            patch(
+                "src.lambdas.analysis.handler.get_table",
+                side_effect=RuntimeError("no table"),
+            ),
+            patch("src.lambdas.analysis.handler.emit_metric"),
+            patch("src.lambdas.analysis.handler.emit_metrics_batch"),
+        ):
+            result = lambda_handler(self._sqs_event(bodies), mock_context)
+
+        assert [f["itemIdentifier"] for f in result["batchItemFailures"]] == [
+            "msg-0",
+            "msg-1",
+            "msg-2",
+        ]
+        assert result["body"]["processed"] == 0
+
+    def test_batch_metrics_emitted_once(self):
+        """Batch metrics aggregate counts and report per-article latency."""
+        from src.lambdas.analysis.handler import _emit_batch_metrics
+
+        results = [
+            {"sentiment": "positive", "updated": True},
+            {"sentiment": "positive", "updated": False},
+            {"sentiment": "neutral", "updated": True},
+        ]
+        with patch("src.lambdas.analysis.handler.emit_metrics_batch") as mock_batch:
+            _emit_batch_metrics(results, inference_time_ms=90.0)
+
+        metrics = {m["name"]: m["value"] for m in mock_batch.call_args[0][0]}
+        assert metrics["SentimentAnalysisCount"] == 3
+        assert metrics["InferenceLatencyMs"] == 30.0
+        assert metrics["PositiveSentimentCount"] == 2
+        assert metrics["NeutralSentimentCount"] == 1
+        assert metrics["ItemsAnalyzed"] == 2
+
+
 class TestUpdateItemWithSentiment:
     """Tests for _update_item_with_sentiment function."""
 
@@ -648,3 +836,62 @@ class TestSNSMessageParsing:
 
         # Verify text was passed to analyze
         mock_analyze.assert_called_once_with("Custom text for testing")
+
+
+class TestWriteTimeseriesFanout:
+    """Tests for _write_timeseries_fanout tag buckets."""
+
+    def test_tags_written_without_tickers(self, monkeypatch):
+        """Tagged articles count into tag buckets even with no tickers."""
+        monkeypatch.setenv("TIMESERIES_TABLE", "test-timeseries")
+        client = MagicMock()
+
+        with (
+            patch(
+                "src.lambdas.analysis.handler._get_dynamodb_client",
+                return_value=client,
+            ),
+            patch("src.lambdas.analysis.handler.write_fanout") as mock_fanout,
+            patch(
+                "src.lambdas.analysis.handler.write_tag_fanout", return_value=4
+            ) as mock_tag_fanout,
+            patch("src.lambdas.analysis.handler.emit_metric") as mock_emit,
+        ):
+            _write_timeseries_fanout(
+                tickers=[],
+                score=0.9,
+                sentiment="positive",
+                timestamp="2025-11-17T14:30:15.000Z",
+                source_id="article#abc",
+                tags=["AI", "technology"],
+            )
+
+        mock_fanout.assert_not_called()
+        args = mock_tag_fanout.call_args.args
+        assert args[:3] == (client, "test-timeseries", ["AI", "technology"])
+        assert args[3].isoformat() == "2025-11-17T14:30:15+00:00"
+        assert args[4] == "positive"
+        mock_emit.assert_called_once_with("TimeseriesTagFanoutCount", 4)
+
+    def test_tag_failure_is_counted_not_raised(self, monkeypatch):
+        """A failed tag write is logged and counted, like a ticker write."""
+        monkeypatch.setenv("TIMESERIES_TABLE", "test-timeseries")
+
+        with (
+            patch("src.lambdas.analysis.handler._get_dynamodb_client"),
+            patch(
+                "src.lambdas.analysis.handler.write_tag_fanout",
+                side_effect=RuntimeError("throttled"),
+            ),
+            patch("src.lambdas.analysis.handler.emit_metric") as mock_emit,
+        ):
+            _write_timeseries_fanout(
+                tickers=[],
+                score=0.1,
+                sentiment="negative",
+                timestamp="2025-11-17T14:30:15.000Z",
+                source_id="article#abc",
+                tags=["AI"],
+            )
+
+        mock_emit.assert_called_once_with("TimeseriesFanoutErrors", 1)
@@ -7,6 +7,7 @@ Tests cover:
 - get_articles_by_tags: Articles with sentiment filtering
 """
 
+from decimal import Decimal
 from unittest.mock import MagicMock
 
 import pytest
@@ -18,6 +19,11 @@ from src.lambdas.dashboard.api_v2 import (
 )
 
 
+def _bucket(sk: str, **label_counts: int) -> dict:
+    """A TAG#{tag}#{resolution} bucket row as the resource API returns it."""
+    return {"SK": sk, "label_counts": {k: Decimal(v) for k, v in label_counts.items()}}
+
+
 class TestGetSentimentByTags:
     """Tests for get_sentiment_by_tags function."""
 
@@ -26,21 +32,9 @@ class TestGetSentimentByTags:
         mock_table = MagicMock()
         mock_table.query.return_value = {
             "Items": [
-                {
-                    "tag": "AI",
-                    "sentiment": "positive",
-                    "timestamp": "2025-11-24T10:00:00Z",
-                },
-                {
-                    "tag": "AI",
-                    "sentiment": "positive",
-                    "timestamp": "2025-11-24T11:00:00Z",
-                },
-                {
-                    "tag": "AI",
-                    "sentiment": "neutral",
-                    "timestamp": "2025-11-24T12:00:00Z",
-                },
+                _bucket("2025-11-24T10:00:00+00:00", positive=1),
+                _bucket("2025-11-24T11:00:00+00:00", positive=1),
+                _bucket("2025-11-24T12:00:00+00:00", neutral=1),
             ]
         }
 
@@ -65,25 +59,13 @@ class TestGetSentimentByTags:
         mock_table.query.side_effect = [
             {
                 "Items": [
-                    {
-                        "tag": "AI",
-                        "sentiment": "positive",
-                        "timestamp": "2025-11-24T10:00:00Z",
-                    },
-                    {
-                        "tag": "AI",
-                        "sentiment": "positive",
-                        "timestamp": "2025-11-24T11:00:00Z",
-                    },
+                    _bucket("2025-11-24T10:00:00+00:00", positive=1),
+                    _bucket("2025-11-24T11:00:00+00:00", positive=1),
                 ]
             },
             {
                 "Items": [
-                    {
-                        "tag": "climate",
-                        "sentiment": "negative",
-                        "timestamp": "2025-11-24T10:00:00Z",
-                    },
+                    _bucket("2025-11-24T10:00:00+00:00", negative=1),
                 ]
             },
         ]
@@ -144,26 +126,10 @@ class TestGetSentimentByTags:
         mock_table = MagicMock()
         mock_table.query.return_value = {
             "Items": [
-                {
-                    "tag": "AI",
-                    "sentiment": "positive",
-                    "timestamp": "2025-11-24T10:00:00Z",
-                },
-                {
-                    "tag": "AI",
-                    "sentiment": "positive",
-                    "timestamp": "2025-11-24T11:00:00Z",
-                },
-                {
-                    "tag": "AI",
-                    "sentiment": "positive",
-                    "timestamp": "2025-11-24T12:00:00Z",
-                },
-                {
-                    "tag": "AI",
-                    "sentiment": "neutral",
-                    "timestamp": "2025-11-24T13:00:00Z",
-                },
+                _bucket("2025-11-24T10:00:00+00:00", positive=1),
+                _bucket("2025-11-24T11:00:00+00:00", positive=1),
+                _bucket("2025-11-24T12:00:00+00:00", positive=1),
+                _bucket("2025-11-24T13:00:00+00:00", neutral=1),
             ]
         }
 
@@ -181,21 +147,9 @@ class TestGetSentimentByTags:
         mock_table = MagicMock()
         mock_table.query.return_value = {
             "Items": [
-                {
-                    "tag": "AI",
-                    "sentiment": "negative",
-                    "timestamp": "2025-11-24T10:00:00Z",
-                },
-                {
-                    "tag": "AI",
-                    "sentiment": "negative",
-                    "timestamp": "2025-11-24T11:00:00Z",
-                },
-                {
-                    "tag": "AI",
-                    "sentiment": "neutral",
-                    "timestamp": "2025-11-24T12:00:00Z",
-                },
+                _bucket("2025-11-24T10:00:00+00:00", negative=1),
+                _bucket("2025-11-24T11:00:00+00:00", negative=1),
+                _bucket("2025-11-24T12:00:00+00:00", neutral=1),
             ]
         }
 
@@ -213,23 +167,11 @@ class TestGetSentimentByTags:
         mock_table = MagicMock()
         mock_table.query.side_effect = [
             {
-                "Items": [
-                    {
-                        "tag": "AI",
-                        "sentiment": "positive",
-                        "timestamp": "2025-11-24T10:00:00Z",
-                    }
-                ],
+                "Items": [_bucket("2025-11-24T10:00:00+00:00", positive=1)],
                 "LastEvaluatedKey": {"pk": "some-key"},
             },
             {
-                "Items": [
-                    {
-                        "tag": "AI",
-                        "sentiment": "negative",
-                        "timestamp": "2025-11-24T11:00:00Z",
-                    }
-                ],
+                "Items": [_bucket("2025-11-24T11:00:00+00:00", negative=1)],
             },
         ]
 
@@ -252,21 +194,8 @@ class TestGetTrendData:
         mock_table = MagicMock()
         mock_table.query.return_value = {
             "Items": [
-                {
-                    "tag": "AI",
-                    "sentiment": "positive",
-                    "timestamp": "2025-11-24T10:30:00+00:00",
-                },
-                {
-                    "tag": "AI",
-                    "sentiment": "negative",
-                    "timestamp": "2025-11-24T10:45:00+00:00",
-                },
-                {
-                    "tag": "AI",
-                    "sentiment": "positive",
-                    "timestamp": "2025-11-24T11:30:00+00:00",
-                },
+                _bucket("2025-11-24T10:00:00+00:00", positive=1, negative=1),
+                _bucket("2025-11-24T11:00:00+00:00", positive=1),
             ]
         }
 
@@ -331,16 +260,7 @@ class TestGetTrendData:
         # All positive should give score close to 1.0
         mock_table.query.return_value = {
             "Items": [
-                {
-                    "tag": "AI",
-                    "sentiment": "positive",
-                    "timestamp": "2025-11-24T10:30:00+00:00",
-                },
-                {
-                    "tag": "AI",
-                    "sentiment": "positive",
-                    "timestamp": "2025-11-24T10:45:00+00:00",
-                },
+                _bucket("2025-11-24T10:00:00+00:00", positive=2),
             ]
         }
 
@@ -97,8 +97,14 @@ class TestSentimentJitter:
     def test_stored_ttl_is_jittered(self):
         import src.lambdas.dashboard.sentiment as mod
 
-        mock_response = MagicMock()
-        mod._set_cached_sentiment("test-key", mock_response)
+        response = mod.SentimentResponse(
+            config_id="config-1",
+            tickers=[],
+            last_updated="2024-01-01T00:00:00Z",
+            next_refresh_at="2024-01-01T00:05:00Z",
+            cache_status="fresh",
+        )
+        mod._set_cached_sentiment("test-key", response)
 
         entry = mod._sentiment_cache["test-key"]
         assert len(entry) >= 3, "Entry missing jittered TTL field"
@@ -1,13 +1,16 @@
-"""Unit tests for src/lib/cache_utils.py — jitter, CacheStats, CacheMetricEmitter."""
+"""Unit tests for src/lib/cache_utils.py — jitter, CacheStats, CacheMetricEmitter, TTLCache."""
 
 import random
 import threading
+from unittest.mock import patch
 
 import pytest
 
 from src.lib.cache_utils import (
     CacheMetricEmitter,
     CacheStats,
+    TTLCache,
+    get_global_emitter,
     jittered_ttl,
     validate_non_empty,
 )
@@ -270,3 +273,265 @@ class TestCacheMetricEmitter:
         emitter.register(stats)
         assert emitter.get_stats("test") is stats
         assert emitter.get_stats("nonexistent") is None
+
+
+class TestTTLCache:
+    """Tests for TTLCache class."""
+
+    def test_get_set(self):
+        cache = TTLCache(name="test", max_entries=4, ttl=60)
+        cache.set("a", {"x": 1})
+        assert cache.get("a") == {"x": 1}
+        assert cache.get("missing") is None
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 1
+
+    def test_ttl_is_jittered_per_entry(self):
+        cache = TTLCache(name="test", max_entries=4, ttl=60)
+        entry = cache.set("a", 1)
+        assert 54.0 <= entry.ttl <= 66.0
+        assert 270.0 <= cache.set("b", 2, ttl=300).ttl <= 330.0
+
+    def test_expired_entry_is_a_miss(self):
+        cache = TTLCache(name="test", max_entries=4, ttl=60)
+        with patch("src.lib.cache_utils.time.time") as mock_time:
+            mock_time.return_value = 1000.0
+            cache.set("a", 1)
+            mock_time.return_value = 1000.0 + 67
+
+            assert cache.get("a") is None
+        assert "a" not in cache
+
+    def test_zero_ttl_never_expires(self):
+        cache = TTLCache(name="test", max_entries=4)
+        with patch("src.lib.cache_utils.time.time") as mock_time:
+            mock_time.return_value = 1000.0
+            cache.set("a", 1)
+            mock_time.return_value = 1000.0 + 10**9
+
+            assert cache.get("a") == 1
+
+    def test_evicts_least_recently_used(self):
+        evicted = []
+        cache = TTLCache(name="test", max_entries=2, on_evict=evicted.append)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")  # "b" is now least recently used
+
+        cache.set("c", 3)
+
+        assert evicted == ["b"]
+        assert list(cache) == ["a", "c"]
+        assert cache.stats.evictions == 1
+
+    def test_max_bytes_evicts_until_under_bound(self):
+        cache = TTLCache(name="test", max_entries=100, max_bytes=10)
+        cache.set("a", "xxxx")
+        cache.set("b", "xxxx")
+
+        cache.set("c", "xxxxxx")
+
+        assert list(cache) == ["b", "c"]
+        assert cache.total_bytes == 10
+
+    def test_value_over_max_bytes_is_not_stored(self):
+        cache = TTLCache(name="test", max_entries=100, max_bytes=10)
+        cache.set("a", "xxxx")
+        cache.set("b", "old")
+
+        cache.set("b", "x" * 11)
+
+        assert list(cache) == ["a"]
+        assert cache.total_bytes == 4
+
+    def test_replace_releases_bytes(self):
+        cache = TTLCache(name="test", max_entries=100, max_bytes=10)
+        cache.set("a", "xxxxxxxx")
+        cache.set("a", "xx")
+        assert cache.total_bytes == 2
+
+    def test_invalidate_by_prefix(self):
+        cache = TTLCache(name="test", max_entries=4)
+        cache.set("ohlc:AAPL:D", 1)
+        cache.set("ohlc:MSFT:D", 2)
+
+        assert cache.invalidate("ohlc:AAPL:") == 1
+        assert list(cache) == ["ohlc:MSFT:D"]
+        assert cache.invalidate() == 1
+
+    def test_registers_stats_with_global_emitter(self):
+        cache = TTLCache(name="ttl_cache_test", max_entries=1)
+        assert get_global_emitter().get_stats("ttl_cache_test") is cache.stats
+
+    def test_thread_safety(self):
+        cache = TTLCache(name="test", max_entries=50, max_bytes=200)
+
+        def worker(n: int):
+            for i in range(500):
+                cache.set(f"{n}:{i % 80}", "x" * (i % 7))
+                cache.get(f"{n}:{(i * 7) % 80}")
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(cache) <= 50
+        assert cache.total_bytes == sum(cache[k].size for k in cache)
+        assert cache.total_bytes <= 200
+
+
+class TestTTLCacheGetOrLoad:
+    """Tests for TTLCache.get_or_load() single-flight loading."""
+
+    def test_loads_once_then_hits(self):
+        cache = TTLCache(name="test", max_entries=4, ttl=60)
+        calls = []
+
+        def loader():
+            calls.append(1)
+            return "value"
+
+        assert cache.get_or_load("k", loader) == "value"
+        assert cache.get_or_load("k", loader) == "value"
+        assert len(calls) == 1
+
+    def test_concurrent_misses_share_one_load(self):
+        cache = TTLCache(name="test", max_entries=4, ttl=60)
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def loader():
+            calls.append(1)
+            started.set()
+            release.wait(timeout=5)
+            return "value"
+
+        results = []
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(cache.get_or_load("k", loader))
+            )
+            for _ in range(10)
+        ]
+        threads[0].start()
+        started.wait(timeout=5)
+        for t in threads[1:]:
+            t.start()
+        release.set()
+        for t in threads:
+            t.join(timeout=5)
+
+        assert len(calls) == 1
+        assert results == ["value"] * 10
+
+    def test_loader_error_propagates_to_waiters_and_is_not_cached(self):
+        cache = TTLCache(name="test", max_entries=4, ttl=60)
+        started = threading.Event()
+        release = threading.Event()
+
+        def loader():
+            started.set()
+            release.wait(timeout=5)
+            raise RuntimeError("upstream down")
+
+        errors = []
+
+        def call():
+            try:
+                cache.get_or_load("k", loader)
+            except RuntimeError as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=call) for _ in range(3)]
+        threads[0].start()
+        started.wait(timeout=5)
+        for t in threads[1:]:
+            t.start()
+        release.set()
+        for t in threads:
+            t.join(timeout=5)
+
+        assert len(errors) == 3
+        assert "k" not in cache
+        assert cache.get_or_load("k", lambda: "recovered") == "recovered"
+
+    def test_waiter_loads_itself_after_load_wait(self):
+        cache = TTLCache(name="test", max_entries=4, ttl=60, load_wait=0.05)
+        started = threading.Event()
+        release = threading.Event()
+
+        def hung_loader():
+            started.set()
+            release.wait(timeout=5)
+            return "late"
+
+        leader = threading.Thread(target=lambda: cache.get_or_load("k", hung_loader))
+        leader.start()
+        started.wait(timeout=5)
+        try:
+            assert cache.get_or_load("k", lambda: "direct") == "direct"
+            assert cache.get("k") == "direct"
+        finally:
+            release.set()
+            leader.join(timeout=5)
+
+    def test_cache_if_skips_storing(self):
+        cache = TTLCache(name="test", max_entries=4, ttl=60)
+        assert cache.get_or_load("k", lambda: [], cache_if=bool) == []
+        assert "k" not in cache
+
+    def test_stale_value_served_while_refreshing(self):
+        cache = TTLCache(name="test", max_entries=4, ttl=60, stale_ttl=120)
+        with patch("src.lib.cache_utils.time.time") as mock_time:
+            mock_time.return_value = 1000.0
+            cache.set("k", "old")
+            mock_time.return_value = 1000.0 + 100  # expired, inside stale window
+
+            started = threading.Event()
+            release = threading.Event()
+
+            def loader():
+                started.set()
+                release.wait(timeout=5)
+                return "new"
+
+            results = []
+            leader = threading.Thread(
+                target=lambda: results.append(cache.get_or_load("k", loader))
+            )
+            leader.start()
+            started.wait(timeout=5)
+
+            assert cache.get_or_load("k", loader) == "old"
+
+            release.set()
+            leader.join(timeout=5)
+
+        assert results == ["new"]
+
+    def test_stale_value_served_when_refresh_fails(self):
+        cache = TTLCache(name="test", max_entries=4, ttl=60, stale_ttl=120)
+
+        def failing():
+            raise RuntimeError("upstream down")
+
+        with patch("src.lib.cache_utils.time.time") as mock_time:
+            mock_time.return_value = 1000.0
+            cache.set("k", "old")
+            mock_time.return_value = 1000.0 + 100
+
+            assert cache.get_or_load("k", failing) == "old"
+
+        assert cache.stats.refresh_failures == 1
+
+    def test_past_stale_window_is_a_miss(self):
+        cache = TTLCache(name="test", max_entries=4, ttl=60, stale_ttl=120)
+        with patch("src.lib.cache_utils.time.time") as mock_time:
+            mock_time.return_value = 1000.0
+            cache.set("k", "old")
+            mock_time.return_value = 1000.0 + 300
+
+            assert cache.get_or_load("k", lambda: "new") == "new"
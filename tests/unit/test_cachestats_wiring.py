@@ -131,8 +131,14 @@ class TestSentimentCacheStats:
         mod.clear_sentiment_cache()
         mod._sentiment_cw_stats.hits = 0
 
-        mock_response = MagicMock()
-        mod._set_cached_sentiment("test-key", mock_response)
+        response = mod.SentimentResponse(
+            config_id="config-1",
+            tickers=[],
+            last_updated="2024-01-01T00:00:00Z",
+            next_refresh_at="2024-01-01T00:05:00Z",
+            cache_status="fresh",
+        )
+        mod._set_cached_sentiment("test-key", response)
         mod._get_cached_sentiment("test-key")  # Hit
 
         assert mod._sentiment_cw_stats.hits >= 1
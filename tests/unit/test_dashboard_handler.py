@@ -28,7 +28,7 @@ import jwt
 import pytest
 from moto import mock_aws
 
-from src.lambdas.dashboard.handler import lambda_handler
+from src.lambdas.dashboard.handler import TIMESERIES_TABLE, lambda_handler
 from tests.conftest import get_response_header, make_event
 
 # Set default env vars for tests (only if not already set by CI)
@@ -113,6 +113,26 @@ def create_test_table():
     return table
 
 
+def create_timeseries_table():
+    """Create the time-series table holding the v2 tag buckets."""
+    dynamodb = boto3.resource("dynamodb", region_name="us-east-1")
+
+    table = dynamodb.create_table(
+        TableName=TIMESERIES_TABLE,
+        KeySchema=[
+            {"AttributeName": "PK", "KeyType": "HASH"},
+            {"AttributeName": "SK", "KeyType": "RANGE"},
+        ],
+        AttributeDefinitions=[
+            {"AttributeName": "PK", "AttributeType": "S"},
+            {"AttributeName": "SK", "AttributeType": "S"},
+        ],
+        BillingMode="PAY_PER_REQUEST",
+    )
+    table.wait_until_exists()
+    return table
+
+
 def seed_test_data(table):
     """Seed the table with test items.
 
@@ -260,6 +280,7 @@ class TestAuthentication:
     def test_valid_session_id(self, mock_lambda_context, auth_headers):
         """Test request with valid X-User-ID succeeds."""
         create_test_table()
+        create_timeseries_table()
 
         event = make_event(
             method="GET",
@@ -274,6 +295,7 @@ class TestAuthentication:
     def test_bearer_token_works(self, mock_lambda_context):
         """Test request with Bearer token containing user ID works."""
         create_test_table()
+        create_timeseries_table()
 
         # Bearer token is also accepted for session auth
         event = make_event(
@@ -567,6 +589,20 @@ class TestLambdaHandler:
 
         assert app is not None
 
+    @mock_aws
+    def test_flushes_rate_limit_counters(self, mock_lambda_context):
+        """Pending rate limit counters are written before the handler returns."""
+        create_test_table()
+
+        with patch(
+            "src.lambdas.shared.middleware.rate_limit.flush_rate_limit_counters"
+        ) as mock_flush:
+            lambda_handler(
+                make_event(method="GET", path="/health"), mock_lambda_context
+            )
+
+        mock_flush.assert_called_once()
+
 
 class TestSecurityMitigations:
     """
@@ -665,6 +701,7 @@ class TestSecurityMitigations:
         Feature 1039: Session auth via X-User-ID header.
         """
         create_test_table()
+        create_timeseries_table()
 
         event = make_event(
             method="GET",
@@ -1747,6 +1784,7 @@ class TestSessionAuth:
     ):
         """Test session auth with Bearer UUID token succeeds."""
         create_test_table()
+        create_timeseries_table()
 
         event = make_event(
             method="GET",
@@ -1777,6 +1815,7 @@ class TestSessionAuth:
     def test_session_auth_with_bearer_token(self, mock_lambda_context):
         """Test session auth with Bearer token containing user ID."""
         create_test_table()
+        create_timeseries_table()
 
         event = make_event(
             method="GET",
@@ -19,6 +19,7 @@ For Developers:
 
 from datetime import UTC, datetime, timedelta
 from decimal import Decimal
+from unittest.mock import patch
 
 import boto3
 import pytest
@@ -28,13 +29,11 @@ from src.lambdas.dashboard.metrics import (
     MAX_RECENT_ITEMS,
     aggregate_dashboard_metrics,
     calculate_ingestion_rate,
-    calculate_sentiment_distribution,
-    calculate_tag_distribution,
     clear_metrics_cache,
-    get_items_by_sentiment,
     get_recent_items,
     sanitize_item_for_response,
 )
+from src.lambdas.shared.metric_counters import CounterBatch
 
 
 @pytest.fixture
@@ -96,6 +95,26 @@ def dynamodb_table():
         yield table
 
 
+@pytest.fixture
+def counters_table(dynamodb_table):
+    """Mocked timeseries table holding the metric counter rows."""
+    dynamodb = boto3.resource("dynamodb", region_name="us-east-1")
+    table = dynamodb.create_table(
+        TableName="test-sentiment-timeseries",
+        KeySchema=[
+            {"AttributeName": "PK", "KeyType": "HASH"},
+            {"AttributeName": "SK", "KeyType": "RANGE"},
+        ],
+        AttributeDefinitions=[
+            {"AttributeName": "PK", "AttributeType": "S"},
+            {"AttributeName": "SK", "AttributeType": "S"},
+        ],
+        BillingMode="PAY_PER_REQUEST",
+    )
+    with patch("src.lambdas.dashboard.metrics.get_counters_table", return_value=table):
+        yield table
+
+
 @pytest.fixture
 def sample_items():
     """Generate sample items for testing."""
@@ -110,6 +129,7 @@ def sample_items():
             "score": Decimal("0.95"),
             "status": "analyzed",
             "tags": ["tech", "ai"],
+            "matched_tickers": ["AAPL", "NVDA"],
             "source": "techcrunch",
         },
         {
@@ -120,6 +140,7 @@ def sample_items():
             "score": Decimal("0.55"),
             "status": "analyzed",
             "tags": ["tech"],
+            "matched_tickers": ["AAPL"],
             "source": "reuters",
         },
         {
@@ -130,6 +151,7 @@ def sample_items():
             "score": Decimal("0.85"),
             "status": "analyzed",
             "tags": ["business", "finance"],
+            "matched_tickers": ["JPM"],
             "source": "bloomberg",
         },
         {
@@ -140,6 +162,7 @@ def sample_items():
             "score": Decimal("0.78"),
             "status": "analyzed",
             "tags": ["ai"],
+            "matched_tickers": ["NVDA"],
             "source": "wired",
         },
         {
@@ -148,6 +171,7 @@ def sample_items():
             "title": "Pending Article",
             "status": "pending",
             "tags": ["tech"],
+            "matched_tickers": ["AAPL"],
             "source": "verge",
         },
     ]
@@ -161,162 +185,14 @@ def seed_table(table, items):
         table.put_item(Item=item)
 
 
-class TestCalculateSentimentDistribution:
-    """Tests for calculate_sentiment_distribution function."""
-
-    def test_basic_distribution(self):
-        """Test basic sentiment counting."""
-        items = [
-            {"sentiment": "positive"},
-            {"sentiment": "positive"},
-            {"sentiment": "neutral"},
-            {"sentiment": "negative"},
-        ]
-
-        result = calculate_sentiment_distribution(items)
-
-        assert result == {
-            "positive": 2,
-            "neutral": 1,
-            "negative": 1,
-        }
-
-    def test_empty_list(self):
-        """Test with empty item list."""
-        result = calculate_sentiment_distribution([])
-
-        assert result == {
-            "positive": 0,
-            "neutral": 0,
-            "negative": 0,
-        }
-
-    def test_missing_sentiment_field(self):
-        """Test items without sentiment field are skipped."""
-        items = [
-            {"sentiment": "positive"},
-            {"title": "No sentiment"},
-            {"sentiment": "negative"},
-        ]
-
-        result = calculate_sentiment_distribution(items)
-
-        assert result == {
-            "positive": 1,
-            "neutral": 0,
-            "negative": 1,
-        }
-
-    def test_case_insensitive(self):
-        """Test sentiment values are case-insensitive."""
-        items = [
-            {"sentiment": "POSITIVE"},
-            {"sentiment": "Neutral"},
-            {"sentiment": "negative"},
-        ]
-
-        result = calculate_sentiment_distribution(items)
-
-        assert result == {
-            "positive": 1,
-            "neutral": 1,
-            "negative": 1,
-        }
-
-    def test_invalid_sentiment_logged(self, caplog):
-        """Test that invalid sentiment values are logged.
-
-        Note: In test environment, expected warnings are logged at DEBUG level
-        to prevent log pollution (see src.lib.logging_utils).
-        """
-        items = [
-            {"sentiment": "positive", "source_id": "test1"},
-            {"sentiment": "invalid", "source_id": "test2"},
-        ]
-
-        with caplog.at_level("DEBUG"):
-            result = calculate_sentiment_distribution(items)
-
-        assert result["positive"] == 1
-        assert "Unexpected sentiment value" in caplog.text
-
-
-class TestCalculateTagDistribution:
-    """Tests for calculate_tag_distribution function."""
-
-    def test_basic_distribution(self):
-        """Test basic tag counting."""
-        items = [
-            {"tags": ["tech", "ai"]},
-            {"tags": ["tech", "business"]},
-            {"tags": ["ai"]},
-        ]
-
-        result = calculate_tag_distribution(items)
-
-        assert result == {
-            "tech": 2,
-            "ai": 2,
-            "business": 1,
-        }
-
-    def test_sorted_by_count_descending(self):
-        """Test tags are sorted by count descending."""
-        items = [
-            {"tags": ["rare"]},
-            {"tags": ["common", "common2"]},
-            {"tags": ["common"]},
-            {"tags": ["common"]},
-        ]
-
-        result = calculate_tag_distribution(items)
-        keys = list(result.keys())
-
-        assert keys[0] == "common"
-        assert result["common"] == 3
-
-    def test_empty_list(self):
-        """Test with empty item list."""
-        result = calculate_tag_distribution([])
-        assert result == {}
-
-    def test_missing_tags_field(self):
-        """Test items without tags field are skipped."""
-        items = [
-            {"tags": ["tech"]},
-            {"title": "No tags"},
-        ]
-
-        result = calculate_tag_distribution(items)
-        assert result == {"tech": 1}
-
-    def test_empty_tags_list(self):
-        """Test items with empty tags list."""
-        items = [
-            {"tags": ["tech"]},
-            {"tags": []},
-        ]
-
-        result = calculate_tag_distribution(items)
-        assert result == {"tech": 1}
-
-    def test_ignores_empty_string_tags(self):
-        """Test empty string tags are ignored."""
-        items = [
-            {"tags": ["tech", "", "ai"]},
-        ]
-
-        result = calculate_tag_distribution(items)
-        assert result == {"tech": 1, "ai": 1}
-
-    def test_non_string_tags_ignored(self):
-        """Test non-string tags are ignored."""
-        items = [
-            {"tags": ["tech", 123, None]},
-        ]
-
-        result = calculate_tag_distribution(items)
-        assert result == {"tech": 1}
+def seed_counters(table, items):
+    """Record items in the metric counters as ingestion and analysis would."""
+    counters = CounterBatch()
+    for item in items:
+        counters.record_ingested(item["timestamp"], item.get("matched_tickers", []))
+        if item.get("status") == "analyzed":
+            counters.record_analyzed(item["timestamp"], item.get("sentiment", ""))
+    counters.flush(table)
 
 
 class TestGetRecentItems:
@@ -368,65 +244,10 @@ class TestGetRecentItems:
         assert len(result) <= MAX_RECENT_ITEMS
 
 
-class TestGetItemsBySentiment:
-    """Tests for get_items_by_sentiment function."""
-
-    def test_filters_by_sentiment(self, dynamodb_table, sample_items):
-        """Test filtering by sentiment value."""
-        seed_table(dynamodb_table, sample_items)
-
-        result = get_items_by_sentiment(dynamodb_table, "positive", hours=24)
-
-        assert len(result) == 2
-        for item in result:
-            assert item["sentiment"] == "positive"
-
-    def test_invalid_sentiment_raises_error(self, dynamodb_table):
-        """Test invalid sentiment value raises ValueError."""
-        with pytest.raises(ValueError, match="Invalid sentiment"):
-            get_items_by_sentiment(dynamodb_table, "invalid", hours=24)
-
-    def test_case_insensitive(self, dynamodb_table, sample_items):
-        """Test sentiment filter is case-insensitive."""
-        seed_table(dynamodb_table, sample_items)
-
-        result = get_items_by_sentiment(dynamodb_table, "NEGATIVE", hours=24)
-
-        assert len(result) == 1
-        assert result[0]["sentiment"] == "negative"
-
-    def test_time_window(self, dynamodb_table):
-        """Test time window filtering."""
-        now = datetime.now(UTC)
-
-        # Create items at different times
-        old_item = {
-            "source_id": "article#old",
-            "timestamp": (now - timedelta(hours=48)).isoformat(),
-            "sentiment": "positive",
-            "status": "analyzed",
-        }
-        recent_item = {
-            "source_id": "article#recent",
-            "timestamp": (now - timedelta(hours=1)).isoformat(),
-            "sentiment": "positive",
-            "status": "analyzed",
-        }
-
-        dynamodb_table.put_item(Item=old_item)
-        dynamodb_table.put_item(Item=recent_item)
-
-        # Query with 24-hour window
-        result = get_items_by_sentiment(dynamodb_table, "positive", hours=24)
-
-        assert len(result) == 1
-        assert result[0]["source_id"] == "article#recent"
-
-
 class TestCalculateIngestionRate:
     """Tests for calculate_ingestion_rate function."""
 
-    def test_calculates_rates(self, dynamodb_table):
+    def test_calculates_rates(self, dynamodb_table, counters_table):
         """Test rate calculation for different time windows."""
         now = datetime.now(UTC)
 
@@ -456,14 +277,14 @@ class TestCalculateIngestionRate:
             },
         ]
 
-        seed_table(dynamodb_table, items)
+        seed_counters(counters_table, items)
 
         result = calculate_ingestion_rate(dynamodb_table, hours=24)
 
         assert result["rate_last_hour"] == 2
         assert result["rate_last_24h"] == 4
 
-    def test_includes_pending_items(self, dynamodb_table):
+    def test_includes_pending_items(self, dynamodb_table, counters_table):
         """Test pending items are included in rate calculation."""
         now = datetime.now(UTC)
 
@@ -480,13 +301,13 @@ class TestCalculateIngestionRate:
             },
         ]
 
-        seed_table(dynamodb_table, items)
+        seed_counters(counters_table, items)
 
         result = calculate_ingestion_rate(dynamodb_table, hours=24)
 
         assert result["rate_last_hour"] == 2
 
-    def test_empty_table(self, dynamodb_table):
+    def test_empty_table(self, dynamodb_table, counters_table):
         """Test with empty table returns zeros."""
         result = calculate_ingestion_rate(dynamodb_table, hours=24)
 
@@ -497,9 +318,10 @@ class TestCalculateIngestionRate:
 class TestAggregateDashboardMetrics:
     """Tests for aggregate_dashboard_metrics function."""
 
-    def test_aggregates_all_metrics(self, dynamodb_table, sample_items):
+    def test_aggregates_all_metrics(self, dynamodb_table, counters_table, sample_items):
         """Test full metrics aggregation."""
         seed_table(dynamodb_table, sample_items)
+        seed_counters(counters_table, sample_items)
 
         result = aggregate_dashboard_metrics(dynamodb_table, hours=24)
 
@@ -519,14 +341,15 @@ class TestAggregateDashboardMetrics:
         assert result["neutral"] == 1
         assert result["negative"] == 1
 
-        # Check tag distribution
-        assert "tech" in result["by_tag"]
-        assert "ai" in result["by_tag"]
+        # Items per matched ticker, pending included
+        assert result["by_tag"] == {"AAPL": 3, "NVDA": 2, "JPM": 1}
+        assert result["rate_last_hour"] == 5
+        assert result["rate_last_24h"] == 5
 
         # Check recent items
         assert len(result["recent_items"]) == 4
 
-    def test_empty_table(self, dynamodb_table):
+    def test_empty_table(self, dynamodb_table, counters_table):
         """Test with empty table returns zeros."""
         result = aggregate_dashboard_metrics(dynamodb_table, hours=24)
 
@@ -584,42 +407,3 @@ class TestSanitizeItemForResponse:
         """Test with empty item returns empty dict."""
         result = sanitize_item_for_response({})
         assert result == {}
-
-
-class TestEdgeCases:
-    """Edge case tests for robustness."""
-
-    def test_large_tag_list(self):
-        """Test with many tags per item."""
-        items = [
-            {"tags": [f"tag{i}" for i in range(100)]},
-        ]
-
-        result = calculate_tag_distribution(items)
-
-        assert len(result) == 100
-        assert all(count == 1 for count in result.values())
-
-    def test_unicode_in_tags(self):
-        """Test tags with unicode characters."""
-        items = [
-            {"tags": ["日本語", "emoji🎉", "normal"]},
-        ]
-
-        result = calculate_tag_distribution(items)
-
-        assert result["日本語"] == 1
-        assert result["emoji🎉"] == 1
-        assert result["normal"] == 1
-
-    def test_decimal_score_values(self):
-        """Test Decimal values from DynamoDB are handled."""
-        items = [
-            {"sentiment": "positive", "score": Decimal("0.95")},
-            {"sentiment": "negative", "score": Decimal("0.85")},
-        ]
-
-        # Should not raise any errors
-        result = calculate_sentiment_distribution(items)
-        assert result["positive"] == 1
-        assert result["negative"] == 1
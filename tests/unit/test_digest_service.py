@@ -6,6 +6,7 @@ Tests cover:
 - DigestService._is_digest_due
 - DigestService.get_user_configurations
 - DigestService.get_ticker_sentiment_data
+- DigestService.prefetch_ticker_data (in-run memo)
 - DigestService.generate_digest
 - DigestService.build_digest_html
 - process_daily_digests orchestration
@@ -293,6 +294,74 @@ class TestDigestServiceGetTickerSentimentData:
         assert result["AAPL"]["current_sentiment"] == 0.0
         assert result["AAPL"]["error"] is True
 
+    def test_memoizes_tickers_within_run(self, mock_table):
+        """A ticker already fetched in this run is not queried again."""
+        service = DigestService(mock_table)
+        mock_table.query.return_value = {"Items": [{"sentiment_score": "0.5"}]}
+
+        first = service.get_ticker_sentiment_data(["AAPL", "MSFT"])
+        calls = mock_table.query.call_count
+        second = service.get_ticker_sentiment_data(["MSFT", "AAPL"])
+
+        assert mock_table.query.call_count == calls
+        assert second == first
+
+    def test_failed_ticker_is_retried(self, mock_table):
+        """A failed read is not memoized; the next request queries again."""
+        service = DigestService(mock_table)
+        mock_table.query.side_effect = Exception("throttled")
+        assert service.get_ticker_sentiment_data(["AAPL"])["AAPL"]["error"] is True
+
+        mock_table.query.side_effect = None
+        mock_table.query.return_value = {"Items": [{"sentiment_score": "0.5"}]}
+        result = service.get_ticker_sentiment_data(["AAPL"])
+
+        assert "error" not in result["AAPL"]
+        assert result["AAPL"]["current_sentiment"] == 0.5
+
+
+class TestDigestServicePrefetchTickerData:
+    """Tests for DigestService.prefetch_ticker_data."""
+
+    def test_fetches_each_ticker_once_across_users(
+        self, mock_table, sample_user, sample_digest_settings, sample_configuration
+    ):
+        """Users sharing tickers trigger one fetch per distinct ticker."""
+        service = DigestService(mock_table)
+        users = [(sample_user, sample_digest_settings)] * 3
+
+        with (
+            patch.object(
+                service, "get_user_configurations", return_value=[sample_configuration]
+            ),
+            patch.object(
+                service, "_fetch_ticker_sentiment", return_value={"article_count": 1}
+            ) as mock_fetch,
+        ):
+            count = service.prefetch_ticker_data(users)
+            digest = service.generate_digest(sample_user, sample_digest_settings)
+
+        assert count == 2
+        assert sorted(c.args[0] for c in mock_fetch.call_args_list) == [
+            "AAPL",
+            "GOOGL",
+        ]
+        assert set(digest.ticker_data) == {"AAPL", "GOOGL"}
+
+    def test_memoizes_configurations(
+        self, mock_table, user_id, sample_digest_settings, sample_configuration
+    ):
+        """Configurations loaded during prefetch are reused by generate_digest."""
+        service = DigestService(mock_table)
+        mock_table.query.return_value = {
+            "Items": [sample_configuration.to_dynamodb_item()]
+        }
+
+        service.get_user_configurations(user_id, sample_digest_settings)
+        service.get_user_configurations(user_id, sample_digest_settings)
+
+        assert mock_table.query.call_count == 1
+
 
 class TestDigestServiceGenerateDigest:
     """Tests for DigestService.generate_digest."""
@@ -514,6 +583,35 @@ class TestProcessDailyDigests:
         assert stats["failed"] == 1
         assert stats["sent"] == 0
 
+    @patch("src.lambdas.notification.digest_service.DigestService")
+    def test_prefetches_before_sending(
+        self,
+        mock_service_class,
+        mock_table,
+        sample_user,
+        sample_digest_settings,
+        sample_configuration,
+    ):
+        """Ticker data is prefetched once for all users, then each is sent."""
+        mock_service = MagicMock()
+        mock_service_class.return_value = mock_service
+        users = [(sample_user, sample_digest_settings)] * 5
+        mock_service.get_users_for_digest.return_value = users
+        mock_service.generate_digest.return_value = DigestData(
+            user=sample_user,
+            settings=sample_digest_settings,
+            configs=[sample_configuration],
+            ticker_data={"AAPL": {"current_sentiment": 0.5}},
+        )
+        mock_email_service = MagicMock()
+        mock_email_service.send_email.return_value = True
+
+        stats = process_daily_digests(mock_table, mock_email_service)
+
+        mock_service.prefetch_ticker_data.assert_called_once_with(users)
+        assert stats == {"processed": 5, "sent": 5, "skipped": 0, "failed": 0}
+        assert mock_email_service.send_email.call_count == 5
+
 
 class TestDigestServiceUpdateLastSent:
     """Tests for DigestService.update_last_sent."""
@@ -43,6 +43,7 @@ from src.lambdas.analysis.sentiment import (
     InferenceError,
     ModelLoadError,
     analyze_sentiment,
+    analyze_sentiment_batch,
     clear_model_cache,
     get_model_load_time_ms,
     is_model_loaded,
@@ -298,6 +299,61 @@ class TestAnalyzeSentiment:
             assert sentiment == "positive"
 
 
+class TestAnalyzeSentimentBatch:
+    """Tests for analyze_sentiment_batch function."""
+
+    def test_batch_preserves_order_and_mapping(self):
+        """Results map 1:1 to inputs with the same neutral threshold."""
+        with patch("src.lambdas.analysis.sentiment.load_model") as mock_load:
+            mock_pipeline = MagicMock()
+            mock_pipeline.return_value = [
+                {"label": "POSITIVE", "score": 0.95},
+                {"label": "NEGATIVE", "score": 0.55},
+                {"label": "NEGATIVE", "score": 0.81},
+            ]
+            mock_load.return_value = mock_pipeline
+
+            results = analyze_sentiment_batch(["great", "meh", "awful"], batch_size=8)
+
+        assert results == [
+            ("positive", 0.95),
+            ("neutral", 0.55),
+            ("negative", 0.81),
+        ]
+        mock_pipeline.assert_called_once_with(["great", "meh", "awful"], batch_size=8)
+
+    def test_empty_texts_skip_inference(self):
+        """Empty texts are neutral and never sent to the pipeline."""
+        with patch("src.lambdas.analysis.sentiment.load_model") as mock_load:
+            mock_pipeline = MagicMock()
+            mock_pipeline.return_value = [{"label": "POSITIVE", "score": 0.9}]
+            mock_load.return_value = mock_pipeline
+
+            results = analyze_sentiment_batch(["", "good news", ""])
+
+        assert results == [("neutral", 0.5), ("positive", 0.9), ("neutral", 0.5)]
+        assert mock_pipeline.call_args[0][0] == ["good news"]
+
+    def test_texts_truncated(self):
+        """Each text is truncated to MAX_TEXT_LENGTH before batching."""
+        with patch("src.lambdas.analysis.sentiment.load_model") as mock_load:
+            mock_pipeline = MagicMock()
+            mock_pipeline.return_value = [{"label": "POSITIVE", "score": 0.9}]
+            mock_load.return_value = mock_pipeline
+
+            analyze_sentiment_batch(["x" * 1000])
+
+        assert len(mock_pipeline.call_args[0][0][0]) == 512
+
+    def test_pipeline_failure_raises_inference_error(self):
+        with patch("src.lambdas.analysis.sentiment.load_model") as mock_load:
+            mock_pipeline = MagicMock(side_effect=RuntimeError("OOM"))
+            mock_load.return_value = mock_pipeline
+
+            with pytest.raises(InferenceError, match="OOM"):
+                analyze_sentiment_batch(["text"])
+
+
 class TestModelCacheHelpers:
     """Tests for cache helper functions."""
 
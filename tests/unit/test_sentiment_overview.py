@@ -2,10 +2,10 @@
 
 Tests the timeseries-based sentiment overview that:
 - Takes config_id, tickers, resolution (default TWENTY_FOUR_HOURS), skip_cache
-- Calls query_timeseries(ticker, resolution) for each ticker
+- Calls query_latest_timeseries(tickers, resolution) once for all tickers
 - Transforms SentimentBucketResponse -> SourceSentiment under "aggregated" key
 - Returns SentimentResponse with cache_status="fresh"
-- Wraps timeseries calls in try/except, logs warning on failure
+- Wraps the timeseries call in try/except, logs warning on failure
 """
 
 from unittest.mock import MagicMock, patch
@@ -60,14 +60,14 @@ class TestSentimentOverview:
     """Tests for the timeseries-based get_sentiment_by_configuration."""
 
     @freeze_time("2024-01-02T10:00:00Z")
-    @patch("src.lambdas.dashboard.timeseries.query_timeseries")
+    @patch("src.lambdas.dashboard.timeseries.query_latest_timeseries")
     def test_overview_returns_real_data(self, mock_query):
-        """Mock query_timeseries to return buckets for 2 tickers; verify
+        """Mock query_latest_timeseries to return buckets for 2 tickers; verify
         non-empty sentiment with 'aggregated' key."""
-        mock_query.side_effect = [
-            _make_timeseries_response("AAPL", buckets=[_make_bucket(avg=0.65)]),
-            _make_timeseries_response("MSFT", buckets=[_make_bucket(avg=0.40)]),
-        ]
+        mock_query.return_value = {
+            "AAPL": _make_timeseries_response("AAPL", buckets=[_make_bucket(avg=0.65)]),
+            "MSFT": _make_timeseries_response("MSFT", buckets=[_make_bucket(avg=0.40)]),
+        }
 
         response = get_sentiment_by_configuration(
             config_id="cfg-001",
@@ -90,14 +90,14 @@ class TestSentimentOverview:
             assert source.updated_at == "2024-01-02T00:00:00Z"
 
     @freeze_time("2024-01-02T10:00:00Z")
-    @patch("src.lambdas.dashboard.timeseries.query_timeseries")
+    @patch("src.lambdas.dashboard.timeseries.query_latest_timeseries")
     def test_overview_graceful_degradation(self, mock_query):
         """One ticker has data, one has empty response. Verify first has
         sentiment, second has empty dict."""
-        mock_query.side_effect = [
-            _make_timeseries_response("AAPL", buckets=[_make_bucket(avg=0.5)]),
-            _make_timeseries_response("FAIL", buckets=[]),
-        ]
+        mock_query.return_value = {
+            "AAPL": _make_timeseries_response("AAPL", buckets=[_make_bucket(avg=0.5)]),
+            "FAIL": _make_timeseries_response("FAIL", buckets=[]),
+        }
 
         response = get_sentiment_by_configuration(
             config_id="cfg-002",
@@ -114,13 +114,13 @@ class TestSentimentOverview:
         assert len(fail.sentiment) == 0
 
     @freeze_time("2024-01-02T10:00:00Z")
-    @patch("src.lambdas.dashboard.timeseries.query_timeseries")
+    @patch("src.lambdas.dashboard.timeseries.query_latest_timeseries")
     def test_overview_aggregated_score(self, mock_query):
         """Verify bucket.avg maps to score, score_to_label maps correctly."""
         # Positive score (>= 0.33)
-        mock_query.return_value = _make_timeseries_response(
-            "AAPL", buckets=[_make_bucket(avg=0.65)]
-        )
+        mock_query.return_value = {
+            "AAPL": _make_timeseries_response("AAPL", buckets=[_make_bucket(avg=0.65)])
+        }
 
         response = get_sentiment_by_configuration(
             config_id="cfg-003",
@@ -134,9 +134,9 @@ class TestSentimentOverview:
 
         # Reset cache and mock for negative score
         clear_sentiment_cache()
-        mock_query.return_value = _make_timeseries_response(
-            "BEAR", buckets=[_make_bucket(avg=-0.50)]
-        )
+        mock_query.return_value = {
+            "BEAR": _make_timeseries_response("BEAR", buckets=[_make_bucket(avg=-0.50)])
+        }
 
         response = get_sentiment_by_configuration(
             config_id="cfg-003b",
@@ -150,9 +150,9 @@ class TestSentimentOverview:
 
         # Neutral score (between -0.33 and 0.33)
         clear_sentiment_cache()
-        mock_query.return_value = _make_timeseries_response(
-            "NEUT", buckets=[_make_bucket(avg=0.10)]
-        )
+        mock_query.return_value = {
+            "NEUT": _make_timeseries_response("NEUT", buckets=[_make_bucket(avg=0.10)])
+        }
 
         response = get_sentiment_by_configuration(
             config_id="cfg-003c",
@@ -165,12 +165,12 @@ class TestSentimentOverview:
         assert source.label == "neutral"
 
     @freeze_time("2024-01-02T10:00:00Z")
-    @patch("src.lambdas.dashboard.timeseries.query_timeseries")
+    @patch("src.lambdas.dashboard.timeseries.query_latest_timeseries")
     def test_overview_resolution_parameter(self, mock_query):
-        """Verify resolution param is passed through to query_timeseries."""
-        mock_query.return_value = _make_timeseries_response(
-            "AAPL", buckets=[_make_bucket()]
-        )
+        """Verify resolution param is passed through to query_latest_timeseries."""
+        mock_query.return_value = {
+            "AAPL": _make_timeseries_response("AAPL", buckets=[_make_bucket()])
+        }
 
         get_sentiment_by_configuration(
             config_id="cfg-004",
@@ -179,22 +179,15 @@ class TestSentimentOverview:
             skip_cache=True,
         )
 
-        mock_query.assert_called_once_with(
-            ticker="AAPL",
-            resolution=Resolution.ONE_HOUR,
-            # This reader takes buckets[-1] as the current value, so it must ask
-            # for the newest buckets. Without latest=True the ascending scan plus
-            # the small fallback limit returns the oldest buckets ever recorded.
-            latest=True,
-        )
+        mock_query.assert_called_once_with(["AAPL"], Resolution.ONE_HOUR)
 
     @freeze_time("2024-01-02T10:00:00Z")
-    @patch("src.lambdas.dashboard.timeseries.query_timeseries")
+    @patch("src.lambdas.dashboard.timeseries.query_latest_timeseries")
     def test_overview_resolution_default(self, mock_query):
         """Verify default resolution is TWENTY_FOUR_HOURS when not specified."""
-        mock_query.return_value = _make_timeseries_response(
-            "AAPL", buckets=[_make_bucket()]
-        )
+        mock_query.return_value = {
+            "AAPL": _make_timeseries_response("AAPL", buckets=[_make_bucket()])
+        }
 
         get_sentiment_by_configuration(
             config_id="cfg-004b",
@@ -202,22 +195,18 @@ class TestSentimentOverview:
             skip_cache=True,
         )
 
-        mock_query.assert_called_once_with(
-            ticker="AAPL",
-            resolution=Resolution.TWENTY_FOUR_HOURS,
-            latest=True,
-        )
+        mock_query.assert_called_once_with(["AAPL"], Resolution.TWENTY_FOUR_HOURS)
 
     @freeze_time("2024-01-02T10:00:00Z")
-    @patch("src.lambdas.dashboard.timeseries.query_timeseries")
+    @patch("src.lambdas.dashboard.timeseries.query_latest_timeseries")
     def test_overview_cache_hit(self, mock_query):
         """First call populates cache, second call returns cached
-        (mock query_timeseries called once)."""
-        mock_query.return_value = _make_timeseries_response(
-            "AAPL", buckets=[_make_bucket(avg=0.65)]
-        )
+        (mock query_latest_timeseries called once)."""
+        mock_query.return_value = {
+            "AAPL": _make_timeseries_response("AAPL", buckets=[_make_bucket(avg=0.65)])
+        }
 
-        # First call: cache miss, calls query_timeseries
+        # First call: cache miss, calls query_latest_timeseries
         response1 = get_sentiment_by_configuration(
             config_id="cfg-005",
             tickers=["AAPL"],
@@ -226,7 +215,7 @@ class TestSentimentOverview:
         assert response1.cache_status == "fresh"
         assert mock_query.call_count == 1
 
-        # Second call: cache hit, should NOT call query_timeseries again
+        # Second call: cache hit, should NOT call query_latest_timeseries again
         response2 = get_sentiment_by_configuration(
             config_id="cfg-005",
             tickers=["AAPL"],
@@ -240,17 +229,15 @@ class TestSentimentOverview:
         assert response2.tickers[0].symbol == "AAPL"
 
     @freeze_time("2024-01-02T10:00:00Z")
-    @patch("src.lambdas.dashboard.timeseries.query_timeseries")
+    @patch("src.lambdas.dashboard.timeseries.query_latest_timeseries")
     def test_overview_partial_ticker_failure(self, mock_query):
-        """One ticker's query_timeseries raises an exception; verify that
-        ticker gets sentiment={} while others still get real data (Feature 1231)."""
-
-        def _side_effect(ticker, resolution=None, **kwargs):
-            if ticker == "FAIL":
-                raise Exception("DynamoDB throttle for FAIL")
-            return _make_timeseries_response(ticker, buckets=[_make_bucket(avg=0.45)])
-
-        mock_query.side_effect = _side_effect
+        """One ticker's fallback query failed, so it is missing from the batch
+        result; verify that ticker gets sentiment={} while others still get
+        real data (Feature 1231)."""
+        mock_query.return_value = {
+            ticker: _make_timeseries_response(ticker, buckets=[_make_bucket(avg=0.45)])
+            for ticker in ("AAPL", "MSFT")
+        }
 
         response = get_sentiment_by_configuration(
             config_id="cfg-partial",
@@ -275,9 +262,9 @@ class TestSentimentOverview:
         assert fail.sentiment == {}
 
     @freeze_time("2024-01-02T10:00:00Z")
-    @patch("src.lambdas.dashboard.timeseries.query_timeseries")
+    @patch("src.lambdas.dashboard.timeseries.query_latest_timeseries")
     def test_overview_db_error(self, mock_query):
-        """Mock query_timeseries to raise exception; verify empty sentiment
+        """Mock query_latest_timeseries to raise exception; verify empty sentiment
         (not crash)."""
         mock_query.side_effect = Exception("DynamoDB connection timeout")
 
@@ -6,11 +6,17 @@ Canonical Reference: [CS-011] Netflix on OHLC for non-financial, [CS-012] ACM Qu
 Tests MUST be written FIRST and FAIL before implementation.
 """
 
-from datetime import datetime
+from datetime import UTC, datetime
 
 import pytest
 
-from src.lib.timeseries.aggregation import aggregate_ohlc
+from src.lib.timeseries import aggregation
+from src.lib.timeseries.aggregation import (
+    NO_LABEL,
+    SENTIMENT_LABELS,
+    aggregate_ohlc,
+    aggregate_ohlc_columnar,
+)
 from src.lib.timeseries.models import SentimentScore
 
 
@@ -133,3 +139,61 @@ class TestOHLCAggregation:
         # Both have same timestamp, so order is stable (first in = open)
         assert result.open == 0.5
         assert result.close == 0.7
+
+
+class TestColumnarOHLCAggregation:
+    """aggregate_ohlc_columnar MUST match aggregate_ohlc on the same points."""
+
+    def test_matches_row_aggregation(self) -> None:
+        """Columnar and row-oriented paths produce identical buckets."""
+        base = parse_iso("2025-12-21T10:35:00Z").timestamp()
+        offsets = [30, 10, 20, 10, 40, 40]
+        values = [0.2, -0.4, 0.9, 0.1, -0.7, 0.3]
+        codes = [0, 2, 0, 1, NO_LABEL, 0]
+
+        scores = [
+            SentimentScore(
+                value=v,
+                timestamp=datetime.fromtimestamp(base + o, tz=UTC),
+                label=SENTIMENT_LABELS[c] if c >= 0 else None,
+            )
+            for o, v, c in zip(offsets, values, codes, strict=True)
+        ]
+        columnar = aggregate_ohlc_columnar([base + o for o in offsets], values, codes)
+
+        assert columnar == aggregate_ohlc(scores)
+        assert columnar.open == -0.4  # first of the tied earliest timestamps
+        assert columnar.close == 0.3  # last of the tied latest timestamps
+        assert columnar.label_counts == {"positive": 3, "neutral": 1, "negative": 1}
+
+    def test_label_codes_optional(self) -> None:
+        """Omitting label_codes yields empty label_counts."""
+        result = aggregate_ohlc_columnar([1.0, 2.0], [0.5, 0.7])
+        assert result.label_counts == {}
+        assert result.count == 2
+
+    def test_empty_columns_raise_value_error(self) -> None:
+        with pytest.raises(ValueError, match="Cannot aggregate empty"):
+            aggregate_ohlc_columnar([], [])
+
+    def test_mismatched_lengths_raise_value_error(self) -> None:
+        with pytest.raises(ValueError, match="equal length"):
+            aggregate_ohlc_columnar([1.0, 2.0], [0.5])
+
+    def test_numpy_path_matches_python_path(self, monkeypatch) -> None:
+        """Vectorized path MUST agree with the pure-Python pass."""
+        pytest.importorskip("numpy")
+        n = aggregation.NUMPY_MIN_POINTS * 2
+        timestamps = [float((i * 7919) % 997) for i in range(n)]
+        values = [((i * 31) % 200 - 100) / 100 for i in range(n)]
+        codes = [i % 4 - 1 for i in range(n)]
+
+        vectorized = aggregate_ohlc_columnar(timestamps, values, codes)
+        monkeypatch.setattr(aggregation, "np", None)
+        pure = aggregate_ohlc_columnar(timestamps, values, codes)
+
+        assert vectorized.model_dump(exclude={"sum", "avg"}) == pure.model_dump(
+            exclude={"sum", "avg"}
+        )
+        assert vectorized.sum == pytest.approx(pure.sum)
+        assert vectorized.avg == pytest.approx(pure.avg)
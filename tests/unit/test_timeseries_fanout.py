@@ -25,8 +25,11 @@ from src.lib.timeseries import (
     Resolution,
     SentimentScore,
     generate_fanout_items,
+    tag_bucket_pk,
     write_fanout,
+    write_fanout_atomic,
     write_fanout_with_update,
+    write_tag_fanout,
 )
 
 
@@ -461,3 +464,215 @@ class TestFanoutMetricEmission:
         )
         with pytest.raises(ClientError):
             write_fanout(mock_dynamodb, "t", self.SAMPLE_SCORE)
+
+
+class TestWriteFanoutAtomic:
+    """write_fanout_atomic MUST match write_fanout_with_update in 2 round trips."""
+
+    SCORES = [
+        SentimentScore(
+            ticker="AAPL",
+            value=0.5,
+            label="neutral",
+            source="tiingo",
+            timestamp=parse_iso("2025-12-21T10:35:30Z"),
+        ),
+        SentimentScore(
+            ticker="AAPL",
+            value=0.8,
+            label="positive",
+            source="finnhub",
+            timestamp=parse_iso("2025-12-21T10:35:45Z"),
+        ),
+        SentimentScore(
+            ticker="AAPL",
+            value=-0.35,
+            label="negative",
+            source="tiingo",
+            timestamp=parse_iso("2025-12-21T10:36:10Z"),
+        ),
+        SentimentScore(
+            ticker="AAPL",
+            value=0.1,
+            timestamp=parse_iso("2025-12-21T10:36:20Z"),
+        ),
+    ]
+
+    @staticmethod
+    def _create_table(dynamodb, name: str) -> None:
+        dynamodb.create_table(
+            TableName=name,
+            KeySchema=[
+                {"AttributeName": "PK", "KeyType": "HASH"},
+                {"AttributeName": "SK", "KeyType": "RANGE"},
+            ],
+            AttributeDefinitions=[
+                {"AttributeName": "PK", "AttributeType": "S"},
+                {"AttributeName": "SK", "AttributeType": "S"},
+            ],
+            BillingMode="PAY_PER_REQUEST",
+        )
+
+    @staticmethod
+    def _normalize(item: dict) -> dict:
+        normalized = dict(item)
+        for attr in ("open", "high", "low", "close", "count", "sum", "ttl"):
+            normalized[attr] = float(item[attr]["N"])
+        normalized["label_counts"] = {
+            k: int(v["N"]) for k, v in item["label_counts"]["M"].items()
+        }
+        return normalized
+
+    @mock_aws
+    def test_final_state_matches_update_writer(self):
+        dynamodb = boto3.client("dynamodb", region_name="us-east-1")
+        self._create_table(dynamodb, "legacy")
+        self._create_table(dynamodb, "atomic")
+
+        for score in self.SCORES:
+            write_fanout_with_update(dynamodb, "legacy", score)
+            write_fanout_atomic(dynamodb, "atomic", score)
+
+        legacy = dynamodb.scan(TableName="legacy")["Items"]
+        atomic = dynamodb.scan(TableName="atomic")["Items"]
+        assert len(atomic) == len(legacy) > 6
+
+        def by_key(items):
+            return {(i["PK"]["S"], i["SK"]["S"]): self._normalize(i) for i in items}
+
+        assert by_key(atomic) == by_key(legacy)
+
+    @mock_aws
+    def test_uses_two_round_trips_per_score(self):
+        dynamodb = boto3.client("dynamodb", region_name="us-east-1")
+        self._create_table(dynamodb, "atomic")
+        calls: list[str] = []
+        dynamodb.meta.events.register(
+            "before-call.dynamodb.*",
+            lambda model, **kwargs: calls.append(model.name),
+        )
+
+        write_fanout_atomic(dynamodb, "atomic", self.SCORES[0])
+        write_fanout_atomic(dynamodb, "atomic", self.SCORES[1])
+
+        assert calls == ["BatchGetItem", "TransactWriteItems"] * 2
+
+    @patch("src.lib.timeseries.fanout.emit_metric")
+    def test_conflict_rereads_and_retries(self, mock_emit):
+        mock_dynamodb = MagicMock()
+        mock_dynamodb.batch_get_item.return_value = {"Responses": {"t": []}}
+        mock_dynamodb.transact_write_items.side_effect = [
+            ClientError(
+                error_response={
+                    "Error": {"Code": "TransactionCanceledException", "Message": ""},
+                    "CancellationReasons": [{"Code": "ConditionalCheckFailed"}],
+                },
+                operation_name="TransactWriteItems",
+            ),
+            {},
+        ]
+
+        write_fanout_atomic(mock_dynamodb, "t", self.SCORES[0])
+
+        assert mock_dynamodb.batch_get_item.call_count == 2
+        assert mock_dynamodb.transact_write_items.call_count == 2
+        mock_emit.assert_called_once_with(
+            name="ConditionalCheck/Count",
+            value=1,
+            unit="Count",
+            dimensions={"FailurePath": "fanout_atomic_conflict"},
+            namespace="SentimentAnalyzer/Reliability",
+        )
+
+    @patch("src.lib.timeseries.fanout.emit_metric")
+    @patch("src.lib.timeseries.fanout.tracer")
+    def test_unexpected_error_emits_silent_failure(self, mock_tracer, mock_emit):
+        mock_dynamodb = MagicMock()
+        mock_dynamodb.batch_get_item.return_value = {"Responses": {"t": []}}
+        mock_dynamodb.transact_write_items.side_effect = ClientError(
+            error_response={"Error": {"Code": "ThrottlingException", "Message": ""}},
+            operation_name="TransactWriteItems",
+        )
+        mock_tracer.provider.in_subsegment.return_value.__enter__ = MagicMock()
+        mock_tracer.provider.in_subsegment.return_value.__exit__ = MagicMock(
+            return_value=False
+        )
+
+        with pytest.raises(ClientError):
+            write_fanout_atomic(mock_dynamodb, "t", self.SCORES[0])
+        mock_emit.assert_called_once_with(
+            name="SilentFailure/Count",
+            value=1,
+            unit="Count",
+            dimensions={"FailurePath": "fanout_atomic_write"},
+            namespace="SentimentAnalyzer/Reliability",
+        )
+
+
+class TestWriteTagFanout:
+    """write_tag_fanout MUST keep 1h and 24h label counts per tag."""
+
+    TIMESTAMP = parse_iso("2025-12-21T10:35:30Z")
+
+    @mock_aws
+    def test_counts_labels_per_tag_and_resolution(self):
+        dynamodb = boto3.client("dynamodb", region_name="us-east-1")
+        TestWriteFanoutAtomic._create_table(dynamodb, "t")
+
+        written = write_tag_fanout(
+            dynamodb, "t", ["AI", " AI", "climate", ""], self.TIMESTAMP, "positive"
+        )
+        write_tag_fanout(dynamodb, "t", ["AI"], self.TIMESTAMP, "negative")
+        write_tag_fanout(dynamodb, "t", ["AI"], self.TIMESTAMP, "positive")
+
+        assert written == 4
+        items = {
+            (i["PK"]["S"], i["SK"]["S"]): i
+            for i in dynamodb.scan(TableName="t")["Items"]
+        }
+        assert set(items) == {
+            ("TAG#AI#1h", "2025-12-21T10:00:00+00:00"),
+            ("TAG#AI#24h", "2025-12-21T00:00:00+00:00"),
+            ("TAG#climate#1h", "2025-12-21T10:00:00+00:00"),
+            ("TAG#climate#24h", "2025-12-21T00:00:00+00:00"),
+        }
+        hourly = items[("TAG#AI#1h", "2025-12-21T10:00:00+00:00")]
+        assert hourly["count"] == {"N": "3"}
+        assert hourly["label_counts"] == {
+            "M": {"positive": {"N": "2"}, "negative": {"N": "1"}}
+        }
+        bucket_epoch = int(parse_iso("2025-12-21T10:00:00Z").timestamp())
+        assert int(hourly["ttl"]["N"]) == bucket_epoch + 7 * 86400
+
+    def test_pk_is_prefixed(self):
+        assert tag_bucket_pk("AI", Resolution.ONE_HOUR) == "TAG#AI#1h"
+
+    def test_lost_create_race_retries_increment(self):
+        conditional = ClientError(
+            error_response={"Error": {"Code": "ConditionalCheckFailedException"}},
+            operation_name="UpdateItem",
+        )
+        mock_dynamodb = MagicMock()
+        # Per resolution: increment misses, create loses the race, increment lands
+        mock_dynamodb.update_item.side_effect = [conditional, conditional, {}] * 2
+
+        assert write_tag_fanout(mock_dynamodb, "t", ["AI"], self.TIMESTAMP, "neutral")
+        assert mock_dynamodb.update_item.call_count == 6
+
+    @patch("src.lib.timeseries.fanout.emit_metric")
+    def test_unexpected_error_emits_silent_failure(self, mock_emit):
+        mock_dynamodb = MagicMock()
+        mock_dynamodb.update_item.side_effect = ClientError(
+            error_response={"Error": {"Code": "ThrottlingException", "Message": ""}},
+            operation_name="UpdateItem",
+        )
+
+        with pytest.raises(ClientError):
+            write_tag_fanout(mock_dynamodb, "t", ["AI"], self.TIMESTAMP, "neutral")
+        mock_emit.assert_called_once_with(
+            name="SilentFailure/Count",
+            value=1,
+            unit="Count",
+            dimensions={"FailurePath": "fanout_tag_write"},
+            namespace="SentimentAnalyzer/Reliability",
+        )
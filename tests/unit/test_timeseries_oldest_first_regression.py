@@ -189,26 +189,27 @@ class TestCallSites:
         """
         from src.lambdas.dashboard import sentiment as sentiment_mod
 
-        captured: dict[str, Any] = {}
-
-        def fake_query(**kwargs: Any):
-            captured.update(kwargs)
-            resp = MagicMock()
-            resp.buckets = []
-            resp.partial_bucket = None
-            return resp
-
-        # sentiment.py imports query_timeseries inside the function body, so the
-        # name must be patched where it is defined rather than on this module.
-        with patch(
-            "src.lambdas.dashboard.timeseries.query_timeseries",
-            side_effect=fake_query,
+        resp = MagicMock()
+        resp.buckets = []
+        resp.partial_bucket = None
+
+        # The batched reader only falls back to query() for tickers without a
+        # complete recent bucket; an empty BatchGetItem forces that path.
+        with (
+            patch(
+                "src.lambdas.dashboard.timeseries.TimeseriesQueryService._batch_get",
+                return_value=[],
+            ),
+            patch(
+                "src.lambdas.dashboard.timeseries.TimeseriesQueryService.query",
+                return_value=resp,
+            ) as mock_query,
         ):
             sentiment_mod.get_sentiment_by_configuration(
                 config_id="cfg-1", tickers=["AAPL"], skip_cache=True
             )
 
-        assert captured.get("latest") is True, (
+        assert mock_query.call_args.kwargs.get("latest") is True, (
             "get_sentiment_by_configuration must pass latest=True; without it the "
             "dashboard reports the 7th-oldest day as the current sentiment"
         )
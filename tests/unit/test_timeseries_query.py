@@ -17,6 +17,7 @@ from unittest.mock import patch
 
 import boto3
 import pytest
+from botocore.exceptions import ClientError
 from freezegun import freeze_time
 from moto import mock_aws
 
@@ -480,3 +481,122 @@ class TestTimeseriesQueryEdgeCases:
 
         # Should return some reasonable number of buckets
         assert len(response.buckets) > 0
+
+
+class TestQueryLatestBatch:
+    """Tests for the batched current/previous bucket reader."""
+
+    NOW = "2025-12-21T10:57:00Z"
+    CURRENT = "2025-12-21T10:55:00+00:00"
+    PREVIOUS = "2025-12-21T10:50:00+00:00"
+
+    def _service(self, table_name: str) -> tuple[TimeseriesQueryService, Any]:
+        create_test_table(boto3.client("dynamodb", region_name="us-east-1"), table_name)
+        table = boto3.resource("dynamodb", region_name="us-east-1").Table(table_name)
+        return TimeseriesQueryService(table_name=table_name), table
+
+    @mock_aws
+    def test_reads_current_and_previous_without_query(
+        self, timeseries_table_name: str
+    ) -> None:
+        """Tickers with a complete recent bucket MUST NOT issue a Query."""
+        service, table = self._service(timeseries_table_name)
+        for ticker in ("AAPL", "MSFT"):
+            insert_bucket(table, ticker, "5m", self.PREVIOUS, is_partial=True)
+            insert_bucket(table, ticker, "5m", self.CURRENT, is_partial=True)
+
+        with (
+            freeze_time(self.NOW),
+            patch.object(service, "query", side_effect=AssertionError("no query")),
+        ):
+            results = service.query_latest_batch(
+                ["AAPL", "MSFT"], Resolution.FIVE_MINUTES
+            )
+
+        assert set(results) == {"AAPL", "MSFT"}
+        for response in results.values():
+            assert [b.timestamp for b in response.buckets] == [self.PREVIOUS]
+            assert response.partial_bucket.timestamp == self.CURRENT
+
+    @mock_aws
+    def test_falls_back_to_latest_query(self, timeseries_table_name: str) -> None:
+        """Without a complete recent bucket, the newest older bucket is used."""
+        service, table = self._service(timeseries_table_name)
+        insert_bucket(table, "AAPL", "5m", "2025-12-21T09:00:00+00:00")
+        insert_bucket(table, "AAPL", "5m", "2025-12-21T10:00:00+00:00")
+        insert_bucket(table, "AAPL", "5m", self.CURRENT, is_partial=True)
+
+        with freeze_time(self.NOW):
+            results = service.query_latest_batch(["AAPL"], Resolution.FIVE_MINUTES)
+
+        response = results["AAPL"]
+        assert response.buckets[-1].timestamp == "2025-12-21T10:00:00+00:00"
+        assert response.partial_bucket.timestamp == self.CURRENT
+
+    @mock_aws
+    def test_chunks_more_than_100_keys(self, timeseries_table_name: str) -> None:
+        """Tickers beyond one BatchGetItem request MUST all be read."""
+        service, table = self._service(timeseries_table_name)
+        tickers = [f"T{i:03d}" for i in range(120)]
+        for ticker in tickers:
+            insert_bucket(table, ticker, "5m", self.PREVIOUS)
+
+        with freeze_time(self.NOW):
+            results = service.query_latest_batch(tickers, Resolution.FIVE_MINUTES)
+
+        assert set(results) == set(tickers)
+        assert all(len(r.buckets) == 1 for r in results.values())
+
+    @mock_aws
+    def test_retries_unprocessed_keys(self, timeseries_table_name: str) -> None:
+        """UnprocessedKeys MUST be re-requested."""
+        service, table = self._service(timeseries_table_name)
+        insert_bucket(table, "AAPL", "5m", self.PREVIOUS)
+        real_batch_get = service._dynamodb.batch_get_item
+        calls = []
+
+        def throttled(RequestItems):
+            calls.append(RequestItems)
+            if len(calls) == 1:
+                return {"Responses": {}, "UnprocessedKeys": RequestItems}
+            return real_batch_get(RequestItems=RequestItems)
+
+        with (
+            freeze_time(self.NOW),
+            patch.object(service._dynamodb, "batch_get_item", side_effect=throttled),
+            patch("src.lambdas.dashboard.timeseries.time.sleep"),
+        ):
+            results = service.query_latest_batch(["AAPL"], Resolution.FIVE_MINUTES)
+
+        assert len(calls) == 2
+        assert results["AAPL"].buckets[0].timestamp == self.PREVIOUS
+
+    @mock_aws
+    def test_batch_error_falls_back_per_ticker(
+        self, timeseries_table_name: str
+    ) -> None:
+        """A failed BatchGetItem MUST NOT blank the tickers it covered."""
+        service, table = self._service(timeseries_table_name)
+        insert_bucket(table, "AAPL", "5m", self.PREVIOUS)
+        insert_bucket(table, "MSFT", "5m", self.PREVIOUS)
+        denied = ClientError(
+            {"Error": {"Code": "AccessDeniedException", "Message": "denied"}},
+            "BatchGetItem",
+        )
+
+        with (
+            freeze_time(self.NOW),
+            patch.object(service._dynamodb, "batch_get_item", side_effect=denied),
+        ):
+            results = service.query_latest_batch(
+                ["AAPL", "MSFT"], Resolution.FIVE_MINUTES
+            )
+
+        assert results["AAPL"].buckets[-1].timestamp == self.PREVIOUS
+        assert results["MSFT"].buckets[-1].timestamp == self.PREVIOUS
+
+    def test_empty_tickers(self, timeseries_table_name: str) -> None:
+        """No tickers MUST NOT touch DynamoDB."""
+        service = TimeseriesQueryService.__new__(TimeseriesQueryService)
+
+        assert service.query_latest_batch([], Resolution.FIVE_MINUTES) == {}